@@ -16,14 +16,14 @@ from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import ActorContext, require_admin_or_agent, require_org_member
 from app.core.time import utcnow
-from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.pagination import KeysetParams, keyset_params, paginate, paginate_keyset
+from app.db.session import async_read_session_maker, get_session
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.boards import Board
 from app.models.tasks import Task
 from app.schemas.activity_events import ActivityEventRead, ActivityTaskCommentFeedItemRead
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import CursorPage, DefaultLimitOffsetPage
 from app.services.organizations import (
     OrganizationContext,
     get_active_membership,
@@ -44,6 +44,7 @@ TASK_COMMENT_ROW_LEN = 4
 SESSION_DEP = Depends(get_session)
 ACTOR_DEP = Depends(require_admin_or_agent)
 ORG_MEMBER_DEP = Depends(require_org_member)
+PAGE_DEP = Depends(keyset_params)
 BOARD_ID_QUERY = Query(default=None)
 SINCE_QUERY = Query(default=None)
 _RUNTIME_TYPE_REFERENCES = (UUID,)
@@ -162,12 +163,13 @@ async def _fetch_task_comment_events(
     return _coerce_task_comment_rows(list(await session.exec(statement)))
 
 
-@router.get("", response_model=DefaultLimitOffsetPage[ActivityEventRead])
+@router.get("", response_model=CursorPage[ActivityEventRead])
 async def list_activity(
     session: AsyncSession = SESSION_DEP,
     actor: ActorContext = ACTOR_DEP,
-) -> LimitOffsetPage[ActivityEventRead]:
-    """List activity events visible to the calling actor."""
+    page: KeysetParams = PAGE_DEP,
+) -> CursorPage[ActivityEventRead]:
+    """List activity events (newest first) visible to the calling actor."""
     statement = select(ActivityEvent)
     if actor.actor_type == "agent" and actor.agent:
         statement = statement.where(ActivityEvent.agent_id == actor.agent.id)
@@ -183,8 +185,13 @@ async def list_activity(
                 Task,
                 col(ActivityEvent.task_id) == col(Task.id),
             ).where(col(Task.board_id).in_(board_ids))
-    statement = statement.order_by(desc(col(ActivityEvent.created_at)))
-    return await paginate(session, statement)
+    return await paginate_keyset(
+        session,
+        statement,
+        params=page,
+        sort_column=col(ActivityEvent.created_at),
+        id_column=col(ActivityEvent.id),
+    )
 
 
 @router.get(
@@ -241,6 +248,8 @@ async def stream_task_comment_feed(
     allowed_ids = set(board_ids)
     if board_id is not None and board_id not in allowed_ids:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+    # Return the auth/lookup connection to the pool; the stream polls on its own.
+    await db_session.close()
     seen_ids: set[UUID] = set()
     seen_queue: deque[UUID] = deque()
 
@@ -249,7 +258,7 @@ async def stream_task_comment_feed(
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as stream_session:
+            async with async_read_session_maker() as stream_session:
                 if board_id is not None:
                     rows = await _fetch_task_comment_events(
                         stream_session,
@@ -17,7 +17,7 @@ from app.api import board_onboarding as onboarding_api
 from app.api import tasks as tasks_api
 from app.api.deps import ActorContext, get_board_or_404, get_task_or_404
 from app.core.agent_auth import AgentAuthContext, get_agent_auth_context
-from app.db.pagination import paginate
+from app.db.pagination import KeysetParams, keyset_params, paginate
 from app.db.session import get_session
 from app.models.agents import Agent
 from app.models.boards import Board
@@ -45,10 +45,19 @@ from app.schemas.gateway_coordination import (
     GatewayMainAskUserResponse,
 )
 from app.schemas.health import AgentHealthStatusResponse
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import CursorPage, DefaultLimitOffsetPage
 from app.schemas.tags import TagRef
-from app.schemas.tasks import TaskCommentCreate, TaskCommentRead, TaskCreate, TaskRead, TaskUpdate
+from app.schemas.tasks import (
+    TaskBulkRead,
+    TaskBulkRequest,
+    TaskCommentCreate,
+    TaskCommentRead,
+    TaskCreate,
+    TaskRead,
+    TaskUpdate,
+)
 from app.services.activity_log import record_activity
+from app.services.agent_presence import agent_presence
 from app.services.openclaw.coordination_service import GatewayCoordinationService
 from app.services.openclaw.policies import OpenClawAuthorizationPolicy
 from app.services.openclaw.provisioning_db import AgentLifecycleService
@@ -74,6 +83,7 @@ SESSION_DEP = Depends(get_session)
 AGENT_CTX_DEP = Depends(get_agent_auth_context)
 BOARD_DEP = Depends(get_board_or_404)
 TASK_DEP = Depends(get_task_or_404)
+PAGE_DEP = Depends(keyset_params)
 BOARD_ID_QUERY = Query(default=None)
 TASK_STATUS_QUERY = Query(default=None, alias="status")
 IS_CHAT_QUERY = Query(default=None)
@@ -461,8 +471,9 @@ async def list_agents(
         statement = statement.where(Agent.board_id == board_id)
     statement = statement.order_by(col(Agent.created_at).desc())
 
-    def _transform(items: Sequence[Any]) -> Sequence[Any]:
+    async def _transform(items: Sequence[Any]) -> Sequence[Any]:
         agents = _coerce_agent_items(items)
+        await agent_presence.overlay(agents)
         return [
             AgentLifecycleService.to_agent_read(
                 AgentLifecycleService.with_computed_status(agent),
@@ -475,7 +486,7 @@ async def list_agents(
 
 @router.get(
     "/boards/{board_id}/tasks",
-    response_model=DefaultLimitOffsetPage[TaskRead],
+    response_model=CursorPage[TaskRead],
     tags=AGENT_BOARD_TAGS,
     openapi_extra=_agent_board_openapi_hints(
         intent="agent_board_task_discovery",
@@ -506,7 +517,8 @@ async def list_tasks(
     board: Board = BOARD_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
-) -> LimitOffsetPage[TaskRead]:
+    page: KeysetParams = PAGE_DEP,
+) -> CursorPage[TaskRead]:
     """List tasks on a board with status/assignment filters.
 
     Common patterns:
@@ -521,6 +533,7 @@ async def list_tasks(
         board=board,
         session=session,
         _actor=_actor(agent_ctx),
+        page=page,
     )
 
 
@@ -762,6 +775,105 @@ async def create_task(
     )
 
 
+@router.post(
+    "/boards/{board_id}/tasks/bulk",
+    response_model=TaskBulkRead,
+    tags=AGENT_LEAD_TAGS,
+    summary="Create and update many board tasks in one request as a lead agent",
+    description=(
+        "Create a batch of tasks and apply planning edits to existing tasks in one "
+        "transaction.\n\n"
+        "Use when a lead plans several subtasks at once. New tasks can depend on each "
+        "other through `ref`/`depends_on_refs`; each assignee receives one message "
+        "covering all of its tasks.\n"
+        "Status changes and comments stay on the single-task endpoints."
+    ),
+    operation_id="agent_lead_bulk_tasks",
+    responses={
+        200: {"description": "All tasks created and updated"},
+        403: {
+            "model": LLMErrorResponse,
+            "description": "Caller is not board lead or edited a field leads cannot change",
+        },
+        404: {
+            "model": LLMErrorResponse,
+            "description": "A task, dependency, tag or assignee does not exist",
+        },
+        409: {
+            "model": LLMErrorResponse,
+            "description": "Dependency cycle, blocked assignment or cross-board assignee",
+        },
+        422: {"model": LLMErrorResponse, "description": "Payload validation failed"},
+    },
+    openapi_extra={
+        "x-llm-intent": "delegate_work_batch",
+        "x-when-to-use": [
+            "Lead breaks a goal into several subtasks with dependencies between them",
+            "Lead reassigns or re-tags several existing tasks at once",
+        ],
+        "x-when-not-to-use": [
+            "Creating or editing a single task",
+            "Changing task status or adding a comment",
+        ],
+        "x-required-actor": "board_lead",
+        "x-prerequisites": [
+            "Authenticated lead token",
+            "board_id must be visible to lead",
+            "Optional tag/dependency/task IDs must exist on the board",
+        ],
+        "x-side-effects": [
+            "Creates task rows, dependency links and tag/custom field entries",
+            "Updates assignment, dependencies and tags of existing tasks",
+            "Sends one notification per assigned agent",
+            "Rejects the whole batch if any item fails validation",
+        ],
+        "x-negative-guidance": [
+            "Do not include status or comment in update items.",
+            "Do not reference a `ref` that is not defined in the same request.",
+        ],
+        "x-routing-policy": [
+            "Lead-only routing: use this when creating or re-planning several tasks together.",
+            "Fallback routing: use the single-task create or update endpoint for one task.",
+        ],
+        "x-routing-policy-examples": [
+            {
+                "input": {
+                    "intent": "lead plans ten dependent subtasks for a goal",
+                    "required_privilege": "board_lead",
+                },
+                "decision": "agent_lead_bulk_tasks",
+            },
+            {
+                "input": {
+                    "intent": "lead moves one reviewed task to done",
+                    "required_privilege": "board_lead",
+                },
+                "decision": "agent_boards_task_update",
+            },
+        ],
+    },
+)
+async def bulk_tasks(
+    payload: TaskBulkRequest,
+    board: Board = BOARD_DEP,
+    session: AsyncSession = SESSION_DEP,
+    agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
+) -> TaskBulkRead:
+    """Create and update tasks in one transaction as the board lead.
+
+    Lead-only endpoint. Update items accept `assigned_agent_id`,
+    `depends_on_task_ids`, `depends_on_refs`, and `tag_ids`.
+    """
+    _guard_board_access(agent_ctx, board)
+    _require_board_lead(agent_ctx)
+    return await tasks_api.apply_task_bulk(
+        session,
+        board=board,
+        payload=payload,
+        actor=_actor(agent_ctx),
+    )
+
+
 @router.patch(
     "/boards/{board_id}/tasks/{task_id}",
     response_model=TaskRead,
@@ -932,7 +1044,7 @@ async def create_task_comment(
 
 @router.get(
     "/boards/{board_id}/memory",
-    response_model=DefaultLimitOffsetPage[BoardMemoryRead],
+    response_model=CursorPage[BoardMemoryRead],
     tags=AGENT_BOARD_TAGS,
     openapi_extra=_agent_board_openapi_hints(
         intent="agent_board_memory_discovery",
@@ -956,7 +1068,8 @@ async def list_board_memory(
     board: Board = BOARD_DEP,
     session: AsyncSession = SESSION_DEP,
     agent_ctx: AgentAuthContext = AGENT_CTX_DEP,
-) -> LimitOffsetPage[BoardMemoryRead]:
+    page: KeysetParams = PAGE_DEP,
+) -> CursorPage[BoardMemoryRead]:
     """List board memory with optional chat filtering.
 
     Use `is_chat=false` for durable context and `is_chat=true` for board chat.
@@ -967,6 +1080,7 @@ async def list_board_memory(
         board=board,
         session=session,
         _actor=_actor(agent_ctx),
+        page=page,
     )
 
 
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from sqlalchemy import asc, func, or_
+from sqlalchemy import asc, or_
 from sqlmodel import col, select
 from sse_starlette.sse import EventSourceResponse
 
@@ -23,20 +23,20 @@ from app.api.deps import (
 from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.session import async_read_session_maker, get_session
 from app.models.agents import Agent
 from app.models.approvals import Approval
 from app.models.tasks import Task
 from app.schemas.approvals import ApprovalCreate, ApprovalRead, ApprovalStatus, ApprovalUpdate
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.services.activity_log import record_activity
+from app.services.approval_counts import approval_counts_cache
 from app.services.approval_task_links import (
     load_task_ids_by_approval,
     lock_tasks_for_approval,
     normalize_task_ids,
     pending_approval_conflicts_by_task,
     replace_approval_task_links,
-    task_counts_for_board,
 )
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 
@@ -325,11 +325,14 @@ async def list_approvals(
 async def stream_approvals(
     request: Request,
     board: Board = BOARD_READ_DEP,
+    session: AsyncSession = SESSION_DEP,
     _actor: ActorContext = ACTOR_DEP,
     since: str | None = SINCE_QUERY,
 ) -> EventSourceResponse:
     """Stream approval updates for a board using server-sent events."""
     since_dt = _parse_since(since) or utcnow()
+    # Return the auth/lookup connection to the pool; the stream polls on its own.
+    await session.close()
     last_seen = since_dt
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
@@ -337,28 +340,28 @@ async def stream_approvals(
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as session:
-                approvals = await _fetch_approval_events(session, board.id, last_seen)
-                approval_reads = await _approval_reads(session, approvals)
-                pending_approvals_count = int(
-                    (
-                        await session.exec(
-                            select(func.count(col(Approval.id)))
-                            .where(col(Approval.board_id) == board.id)
-                            .where(col(Approval.status) == "pending"),
-                        )
-                    ).one(),
-                )
-                task_ids = {
-                    task_id
-                    for approval_read in approval_reads
-                    for task_id in approval_read.task_ids
-                }
-                counts_by_task_id = await task_counts_for_board(
-                    session,
-                    board_id=board.id,
-                    task_ids=task_ids,
-                )
+            async with async_read_session_maker() as read_session:
+                approvals = await _fetch_approval_events(read_session, board.id, last_seen)
+                if not approvals:
+                    # Nothing changed since the last tick; skip all hydration queries.
+                    approval_reads: list[ApprovalRead] = []
+                    pending_approvals_count = 0
+                    counts_by_task_id: dict[UUID, tuple[int, int]] = {}
+                else:
+                    approval_reads = await _approval_reads(read_session, approvals)
+                    pending_approvals_count = await approval_counts_cache.pending_count(
+                        read_session,
+                        board_id=board.id,
+                    )
+                    counts_by_task_id = await approval_counts_cache.task_counts(
+                        read_session,
+                        board_id=board.id,
+                        task_ids={
+                            task_id
+                            for approval_read in approval_reads
+                            for task_id in approval_read.task_ids
+                        },
+                    )
             for approval, approval_read in zip(approvals, approval_reads, strict=True):
                 updated_at = _approval_updated_at(approval)
                 last_seen = max(updated_at, last_seen)
@@ -424,6 +427,7 @@ async def create_approval(
         task_ids=task_ids,
     )
     await session.commit()
+    approval_counts_cache.record_created(board.id, task_ids=task_ids, status=approval.status)
     await session.refresh(approval)
     title_by_id = await _task_titles_by_id(session, task_ids=set(task_ids))
     return _approval_to_read(
@@ -446,19 +450,19 @@ async def update_approval(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     updates = payload.model_dump(exclude_unset=True)
     prior_status = approval.status
+    approval_task_ids: list[UUID] = []
+    if "status" in updates and updates["status"] != prior_status:
+        task_ids_by_approval = await load_task_ids_by_approval(session, approval_ids=[approval.id])
+        approval_task_ids = task_ids_by_approval.get(approval.id) or []
+        if not approval_task_ids and approval.task_id is not None:
+            approval_task_ids = [approval.task_id]
     if "status" in updates:
         target_status = updates["status"]
         if target_status == "pending" and prior_status != "pending":
-            task_ids_by_approval = await load_task_ids_by_approval(
-                session, approval_ids=[approval.id]
-            )
-            approval_task_ids = task_ids_by_approval.get(approval.id)
-            if not approval_task_ids and approval.task_id is not None:
-                approval_task_ids = [approval.task_id]
             await _ensure_no_pending_approval_conflicts(
                 session,
                 board_id=board.id,
-                task_ids=approval_task_ids or [],
+                task_ids=approval_task_ids,
                 exclude_approval_id=approval.id,
             )
         approval.status = target_status
@@ -466,6 +470,12 @@ async def update_approval(
             approval.resolved_at = utcnow()
     session.add(approval)
     await session.commit()
+    approval_counts_cache.record_status_change(
+        board.id,
+        task_ids=approval_task_ids,
+        prior_status=prior_status,
+        status=approval.status,
+    )
     await session.refresh(approval)
     if approval.status in {"approved", "rejected"} and approval.status != prior_status:
         try:
@@ -25,7 +25,7 @@ from app.api.deps import (
 from app.core.config import settings
 from app.core.time import utcnow
 from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.session import async_read_session_maker, get_session
 from app.models.agents import Agent
 from app.models.board_group_memory import BoardGroupMemory
 from app.models.board_groups import BoardGroup
@@ -374,12 +374,15 @@ async def list_board_group_memory(
 async def stream_board_group_memory(
     request: Request,
     group: BoardGroup = GROUP_READ_DEP,
+    session: AsyncSession = SESSION_DEP,
     *,
     since: str | None = SINCE_QUERY,
     is_chat: bool | None = IS_CHAT_QUERY,
 ) -> EventSourceResponse:
     """Stream memory entries for a board group via server-sent events."""
     since_dt = _parse_since(since) or utcnow()
+    # Return the auth/lookup connection to the pool; the stream polls on its own.
+    await session.close()
     last_seen = since_dt
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
@@ -387,9 +390,9 @@ async def stream_board_group_memory(
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as s:
+            async with async_read_session_maker() as read_session:
                 memories = await _fetch_memory_events(
-                    s,
+                    read_session,
                     group.id,
                     last_seen,
                     is_chat=is_chat,
@@ -526,12 +529,15 @@ async def stream_board_group_memory_for_board(
     request: Request,
     *,
     board: Board = BOARD_READ_DEP,
+    session: AsyncSession = SESSION_DEP,
     since: str | None = SINCE_QUERY,
     is_chat: bool | None = IS_CHAT_QUERY,
 ) -> EventSourceResponse:
     """Stream linked-group memory via SSE for near-real-time coordination."""
     group_id = board.board_group_id
     since_dt = _parse_since(since) or utcnow()
+    # Return the auth/lookup connection to the pool; the stream polls on its own.
+    await session.close()
     last_seen = since_dt
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
@@ -542,9 +548,9 @@ async def stream_board_group_memory_for_board(
             if group_id is None:
                 await asyncio.sleep(2)
                 continue
-            async with async_session_maker() as session:
+            async with async_read_session_maker() as read_session:
                 memories = await _fetch_memory_events(
-                    session,
+                    read_session,
                     group_id,
                     last_seen,
                     is_chat=is_chat,
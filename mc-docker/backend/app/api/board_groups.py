@@ -6,7 +6,7 @@ import re
 from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy import func
 from sqlmodel import col, select
 
@@ -28,7 +28,7 @@ from app.schemas.board_groups import BoardGroupCreate, BoardGroupRead, BoardGrou
 from app.schemas.common import OkResponse
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.schemas.view_models import BoardGroupSnapshot
-from app.services.board_group_snapshot import build_group_snapshot
+from app.services.board_group_snapshot import build_group_snapshot, snapshot_etag
 from app.services.openclaw.constants import DEFAULT_HEARTBEAT_CONFIG
 from app.services.openclaw.gateway_rpc import OpenClawGatewayError
 from app.services.openclaw.provisioning import OpenClawGatewayProvisioner
@@ -143,16 +143,28 @@ async def get_board_group(
     )
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.get("/{group_id}/snapshot", response_model=BoardGroupSnapshot)
 async def get_board_group_snapshot(
     group_id: UUID,
+    request: Request,
+    response: Response,
     *,
     include_done: bool = False,
     per_board_task_limit: int = 5,
     session: AsyncSession = SESSION_DEP,
     ctx: OrganizationContext = ORG_MEMBER_DEP,
-) -> BoardGroupSnapshot:
-    """Get a snapshot across boards in a group."""
+) -> BoardGroupSnapshot | Response:
+    """Get a snapshot across boards in a group.
+
+    Responses carry an `ETag`; a matching `If-None-Match` gets `304 Not Modified`.
+    """
     group = await _require_group_access(
         session,
         group_id=group_id,
@@ -173,6 +185,11 @@ async def get_board_group_snapshot(
             await list_accessible_board_ids(session, member=ctx.member, write=False),
         )
         snapshot.boards = [item for item in snapshot.boards if item.board.id in allowed_ids]
+    etag = snapshot_etag(snapshot)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    response.headers.update(cache_headers)
     return snapshot
 
 
@@ -21,12 +21,12 @@ from app.api.deps import (
 )
 from app.core.config import settings
 from app.core.time import utcnow
-from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.pagination import KeysetParams, keyset_params, paginate_keyset
+from app.db.session import async_read_session_maker, get_session
 from app.models.agents import Agent
 from app.models.board_memory import BoardMemory
 from app.schemas.board_memory import BoardMemoryCreate, BoardMemoryRead
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import CursorPage
 from app.services.mentions import extract_mentions, matches_agent_mention
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
 from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
@@ -34,7 +34,6 @@ from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConf
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
-    from fastapi_pagination.limit_offset import LimitOffsetPage
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.models.boards import Board
@@ -48,6 +47,7 @@ BOARD_READ_DEP = Depends(get_board_for_actor_read)
 BOARD_WRITE_DEP = Depends(get_board_for_actor_write)
 SESSION_DEP = Depends(get_session)
 ACTOR_DEP = Depends(require_admin_or_agent)
+PAGE_DEP = Depends(keyset_params)
 _RUNTIME_TYPE_REFERENCES = (UUID,)
 
 
@@ -216,15 +216,16 @@ async def _notify_chat_targets(
             continue
 
 
-@router.get("", response_model=DefaultLimitOffsetPage[BoardMemoryRead])
+@router.get("", response_model=CursorPage[BoardMemoryRead])
 async def list_board_memory(
     *,
     is_chat: bool | None = IS_CHAT_QUERY,
     board: Board = BOARD_READ_DEP,
     session: AsyncSession = SESSION_DEP,
     _actor: ActorContext = ACTOR_DEP,
-) -> LimitOffsetPage[BoardMemoryRead]:
-    """List board memory entries, optionally filtering chat entries."""
+    page: KeysetParams = PAGE_DEP,
+) -> CursorPage[BoardMemoryRead]:
+    """List board memory entries (newest first), optionally filtering chat entries."""
     statement = (
         BoardMemory.objects.filter_by(board_id=board.id)
         # Old/invalid rows (empty/whitespace-only content) can exist; exclude them to
@@ -233,8 +234,13 @@ async def list_board_memory(
     )
     if is_chat is not None:
         statement = statement.filter(col(BoardMemory.is_chat) == is_chat)
-    statement = statement.order_by(col(BoardMemory.created_at).desc())
-    return await paginate(session, statement.statement)
+    return await paginate_keyset(
+        session,
+        statement.statement,
+        params=page,
+        sort_column=col(BoardMemory.created_at),
+        id_column=col(BoardMemory.id),
+    )
 
 
 @router.get("/stream")
@@ -242,12 +248,15 @@ async def stream_board_memory(
     request: Request,
     *,
     board: Board = BOARD_READ_DEP,
+    session: AsyncSession = SESSION_DEP,
     _actor: ActorContext = ACTOR_DEP,
     since: str | None = SINCE_QUERY,
     is_chat: bool | None = IS_CHAT_QUERY,
 ) -> EventSourceResponse:
     """Stream board memory events over server-sent events."""
     since_dt = _parse_since(since) or utcnow()
+    # Return the auth/lookup connection to the pool; the stream polls on its own.
+    await session.close()
     last_seen = since_dt
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
@@ -255,9 +264,9 @@ async def stream_board_memory(
         while True:
             if await request.is_disconnected():
                 break
-            async with async_session_maker() as session:
+            async with async_read_session_maker() as read_session:
                 memories = await _fetch_memory_events(
-                    session,
+                    read_session,
                     board.id,
                     last_seen,
                     is_chat=is_chat,
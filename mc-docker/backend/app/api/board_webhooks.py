@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlmodel import col, select
@@ -30,6 +29,14 @@ from app.schemas.board_webhooks import (
 from app.schemas.common import OkResponse
 from app.schemas.pagination import DefaultLimitOffsetPage
 from app.services.openclaw.gateway_dispatch import GatewayDispatchService
+from app.services.webhooks.ingest import (
+    QueuedWebhookIngest,
+    decode_payload,
+    enqueue_webhook_ingest,
+    payload_preview,
+    webhook_memory_content,
+    webhook_memory_tags,
+)
 from app.services.webhooks.queue import QueuedInboundDelivery, enqueue_webhook_delivery
 
 if TYPE_CHECKING:
@@ -136,30 +143,6 @@ async def _require_board_webhook_payload(
     return payload
 
 
-def _decode_payload(
-    raw_body: bytes,
-    *,
-    content_type: str | None,
-) -> dict[str, object] | list[object] | str | int | float | bool | None:
-    if not raw_body:
-        return {}
-
-    body_text = raw_body.decode("utf-8", errors="replace")
-    normalized_content_type = (content_type or "").lower()
-    should_parse_json = "application/json" in normalized_content_type
-    if not should_parse_json:
-        should_parse_json = body_text.startswith(("{", "[", '"')) or body_text in {"true", "false"}
-
-    if should_parse_json:
-        try:
-            parsed = json.loads(body_text)
-        except json.JSONDecodeError:
-            return body_text
-        if isinstance(parsed, (dict, list, str, int, float, bool)) or parsed is None:
-            return parsed
-    return body_text
-
-
 def _captured_headers(request: Request) -> dict[str, str] | None:
     captured: dict[str, str] = {}
     for header, value in request.headers.items():
@@ -169,37 +152,44 @@ def _captured_headers(request: Request) -> dict[str, str] | None:
     return captured or None
 
 
-def _payload_preview(
-    value: dict[str, object] | list[object] | str | int | float | bool | None,
-) -> str:
-    if isinstance(value, str):
-        preview = value
-    else:
-        try:
-            preview = json.dumps(value, indent=2, ensure_ascii=True)
-        except TypeError:
-            preview = str(value)
-    return preview
-
-
 def _webhook_memory_content(
     *,
     webhook: BoardWebhook,
     payload: BoardWebhookPayload,
 ) -> str:
-    preview = _payload_preview(payload.payload)
-    inspect_path = f"/api/v1/boards/{webhook.board_id}/webhooks/{webhook.id}/payloads/{payload.id}"
-    return (
-        "WEBHOOK PAYLOAD RECEIVED\n"
-        f"Webhook ID: {webhook.id}\n"
-        f"Payload ID: {payload.id}\n"
-        f"Instruction: {webhook.description}\n"
-        f"Inspect (admin API): {inspect_path}\n\n"
-        "Payload preview:\n"
-        f"{preview}"
+    return webhook_memory_content(
+        board_id=webhook.board_id,
+        webhook_id=webhook.id,
+        description=webhook.description,
+        payload_id=payload.id,
+        payload_value=payload.payload,
+    )
+
+
+def _payload_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+        detail=f"Webhook payload exceeds {settings.webhook_max_payload_bytes} bytes.",
     )
 
 
+def _reject_declared_oversize(request: Request) -> None:
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > settings.webhook_max_payload_bytes:
+        raise _payload_too_large()
+
+
+async def _read_body_limited(request: Request) -> bytes:
+    """Stream the request body, aborting as soon as it exceeds the size limit."""
+    limit = settings.webhook_max_payload_bytes
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > limit:
+            raise _payload_too_large()
+    return bytes(body)
+
+
 async def _notify_lead_on_webhook_payload(
     *,
     session: AsyncSession,
@@ -226,7 +216,7 @@ async def _notify_lead_on_webhook_payload(
     if config is None:
         return
 
-    payload_preview = _payload_preview(payload.payload)
+    preview = payload_preview(payload.payload)
     message = (
         "WEBHOOK EVENT RECEIVED\n"
         f"Board: {board.name}\n"
@@ -238,7 +228,7 @@ async def _notify_lead_on_webhook_payload(
         "2) Create/update tasks as needed.\n"
         f"3) Reference payload ID {payload.id} in task descriptions.\n\n"
         "Payload preview:\n"
-        f"{payload_preview}\n\n"
+        f"{preview}\n\n"
         "To inspect board memory entries:\n"
         f"GET /api/v1/agent/boards/{board.id}/memory?is_chat=false"
     )
@@ -434,6 +424,7 @@ async def ingest_board_webhook(
     session: AsyncSession = SESSION_DEP,
 ) -> BoardWebhookIngestResponse:
     """Open inbound webhook endpoint that stores payloads and nudges the board lead."""
+    _reject_declared_oversize(request)
     webhook = await _require_board_webhook(
         session,
         board_id=board.id,
@@ -456,27 +447,52 @@ async def ingest_board_webhook(
 
     content_type = request.headers.get("content-type")
     headers = _captured_headers(request)
-    payload_value = _decode_payload(
-        await request.body(),
-        content_type=content_type,
-    )
+    raw_body = await _read_body_limited(request)
+    source_ip = request.client.host if request.client else None
+    if settings.webhook_ingest_deferred:
+        payload_id = uuid4()
+        buffered = enqueue_webhook_ingest(
+            QueuedWebhookIngest(
+                board_id=board.id,
+                webhook_id=webhook.id,
+                payload_id=payload_id,
+                received_at=utcnow(),
+                body=raw_body.decode("utf-8", errors="replace"),
+                content_type=content_type,
+                headers=headers,
+                source_ip=source_ip,
+            ),
+        )
+        if buffered:
+            logger.info(
+                "webhook.ingest.buffered",
+                extra={
+                    "payload_id": str(payload_id),
+                    "board_id": str(board.id),
+                    "webhook_id": str(webhook.id),
+                    "bytes": len(raw_body),
+                },
+            )
+            return BoardWebhookIngestResponse(
+                board_id=board.id,
+                webhook_id=webhook.id,
+                payload_id=payload_id,
+            )
+
+    payload_value = decode_payload(raw_body, content_type=content_type)
     payload = BoardWebhookPayload(
         board_id=board.id,
         webhook_id=webhook.id,
         payload=payload_value,
         headers=headers,
-        source_ip=request.client.host if request.client else None,
+        source_ip=source_ip,
         content_type=content_type,
     )
     session.add(payload)
     memory = BoardMemory(
         board_id=board.id,
         content=_webhook_memory_content(webhook=webhook, payload=payload),
-        tags=[
-            "webhook",
-            f"webhook:{webhook.id}",
-            f"payload:{payload.id}",
-        ],
+        tags=webhook_memory_tags(webhook_id=webhook.id, payload_id=payload.id),
         source="webhook",
         is_chat=False,
     )
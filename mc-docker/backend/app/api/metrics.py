@@ -4,18 +4,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import DateTime, case
 from sqlalchemy import cast as sql_cast
-from sqlalchemy import func
+from sqlalchemy import func, or_
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.deps import require_org_member
 from app.core.time import utcnow
-from app.db.session import get_session
+from app.db.session import get_read_session
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.boards import Board
@@ -32,8 +33,12 @@ from app.schemas.metrics import (
     DashboardWipRangeSeries,
     DashboardWipSeriesSet,
 )
+from app.services.agent_presence import agent_presence
 from app.services.organizations import OrganizationContext, list_accessible_board_ids
 
+if TYPE_CHECKING:
+    from sqlalchemy.sql.elements import ColumnElement
+
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
 ERROR_EVENT_PATTERN = "%failed"
@@ -41,7 +46,7 @@ _RUNTIME_TYPE_REFERENCES = (UUID, AsyncSession)
 RANGE_QUERY = Query(default="24h")
 BOARD_ID_QUERY = Query(default=None)
 GROUP_ID_QUERY = Query(default=None)
-SESSION_DEP = Depends(get_session)
+SESSION_DEP = Depends(get_read_session)
 ORG_MEMBER_DEP = Depends(require_org_member)
 
 
@@ -358,16 +363,17 @@ async def _active_agents(
     range_spec: RangeSpec,
     board_ids: list[UUID],
 ) -> int:
-    statement = select(func.count()).where(
-        col(Agent.last_seen_at).is_not(None),
-        col(Agent.last_seen_at) >= range_spec.start,
-        col(Agent.last_seen_at) <= range_spec.end,
-    )
     if not board_ids:
         return 0
-    statement = statement.where(col(Agent.board_id).in_(board_ids))
-    result = (await session.exec(statement)).one()
-    return int(result)
+    seen_in_range: ColumnElement[bool] = col(Agent.last_seen_at).between(
+        range_spec.start, range_spec.end
+    )
+    # Buffered heartbeats may be fresher than the persisted column.
+    buffered = await agent_presence.seen_between(range_spec.start, range_spec.end)
+    if buffered:
+        seen_in_range = or_(seen_in_range, col(Agent.id).in_(buffered))
+    statement = select(func.count()).where(col(Agent.board_id).in_(board_ids)).where(seen_in_range)
+    return int((await session.exec(statement)).one())
 
 
 async def _tasks_in_progress(
@@ -21,6 +21,7 @@ from app.schemas.pagination import DefaultLimitOffsetPage
 from app.schemas.tags import TagCreate, TagRead, TagUpdate
 from app.services.organizations import OrganizationContext
 from app.services.tags import slugify_tag, task_counts_for_tags
+from app.services.task_hydration import task_hydration_cache
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -193,6 +194,8 @@ async def update_tag(
             exclude_tag_id=tag.id,
         )
     updates["updated_at"] = utcnow()
+    # Tag refs are embedded in task payloads on every board of the organization.
+    task_hydration_cache.invalidate_after_commit(session)
     updated = await crud.patch(session, tag, updates)
     return TagRead.model_validate(updated, from_attributes=True)
 
@@ -216,5 +219,6 @@ async def delete_tag(
         commit=False,
     )
     await session.delete(tag)
+    task_hydration_cache.invalidate_after_commit(session)
     await session.commit()
     return OkResponse()
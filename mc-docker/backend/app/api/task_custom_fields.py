@@ -27,6 +27,7 @@ from app.schemas.task_custom_fields import (
     validate_custom_field_definition,
 )
 from app.services.organizations import OrganizationContext
+from app.services.task_hydration import task_hydration_cache
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -200,6 +201,7 @@ async def create_org_custom_field(
                 task_custom_field_definition_id=definition.id,
             ),
         )
+        task_hydration_cache.invalidate_after_commit(session, board_id)
     try:
         await session.commit()
     except IntegrityError as err:
@@ -281,6 +283,8 @@ async def update_org_custom_field(
             )
     definition.updated_at = utcnow()
     session.add(definition)
+    # Defaults and keys show up in task payloads on every bound board.
+    task_hydration_cache.invalidate_after_commit(session)
 
     try:
         await session.commit()
@@ -338,6 +342,7 @@ async def delete_org_custom_field(
     )
     for binding in bindings:
         await session.delete(binding)
+        task_hydration_cache.invalidate_after_commit(session, binding.board_id)
     await session.delete(definition)
     await session.commit()
     return OkResponse()
@@ -5,14 +5,14 @@ from __future__ import annotations
 import asyncio
 import json
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, cast
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from sqlalchemy import asc, desc, or_
-from sqlmodel import col, select
+from sqlalchemy import asc, desc, insert, or_
+from sqlmodel import SQLModel, col, select
 from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import (
@@ -25,8 +25,8 @@ from app.api.deps import (
 )
 from app.core.time import utcnow
 from app.db import crud
-from app.db.pagination import paginate
-from app.db.session import async_session_maker, get_session
+from app.db.pagination import KeysetParams, keyset_params, paginate, paginate_keyset
+from app.db.session import async_read_session_maker, get_session
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.approval_task_links import ApprovalTaskLink
@@ -44,14 +44,24 @@ from app.models.tasks import Task
 from app.schemas.activity_events import ActivityEventRead
 from app.schemas.common import OkResponse
 from app.schemas.errors import BlockedTaskError
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import CursorPage, DefaultLimitOffsetPage
 from app.schemas.task_custom_fields import (
     TaskCustomFieldType,
     TaskCustomFieldValues,
     validate_custom_field_value,
 )
-from app.schemas.tasks import TaskCommentCreate, TaskCommentRead, TaskCreate, TaskRead, TaskUpdate
+from app.schemas.tasks import (
+    TaskBulkRead,
+    TaskBulkRequest,
+    TaskBulkUpdate,
+    TaskCommentCreate,
+    TaskCommentRead,
+    TaskCreate,
+    TaskRead,
+    TaskUpdate,
+)
 from app.services.activity_log import record_activity
+from app.services.approval_counts import approval_counts_cache
 from app.services.approval_task_links import (
     load_task_ids_by_approval,
     pending_approval_conflicts_by_task,
@@ -67,14 +77,17 @@ from app.services.tags import (
     replace_tags,
     validate_tag_ids,
 )
+from app.services.task_counts import task_counts_cache
 from app.services.task_dependencies import (
     blocked_by_dependency_ids,
     dependency_ids_by_task_id,
     dependency_status_by_id,
     dependent_task_ids,
     replace_task_dependencies,
+    validate_dependency_batch,
     validate_dependency_update,
 )
+from app.services.task_hydration import TaskHydration, task_hydration_cache
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Sequence
@@ -105,6 +118,7 @@ SINCE_QUERY = Query(default=None)
 STATUS_QUERY = Query(default=None, alias="status")
 BOARD_WRITE_DEP = Depends(get_board_for_user_write)
 SESSION_DEP = Depends(get_session)
+PAGE_DEP = Depends(keyset_params)
 ADMIN_AUTH_DEP = Depends(require_admin_auth)
 TASK_DEP = Depends(get_task_or_404)
 
@@ -850,17 +864,11 @@ async def _task_custom_field_rows_by_definition_id(
     return {row.task_custom_field_definition_id: row for row in rows}
 
 
-async def _set_task_custom_field_values_for_create(
-    session: AsyncSession,
+def _effective_create_custom_field_values(
     *,
-    board_id: UUID,
-    task_id: UUID,
     custom_field_values: TaskCustomFieldValues,
-) -> None:
-    definitions_by_key = await _organization_custom_field_definitions_for_board(
-        session,
-        board_id=board_id,
-    )
+    definitions_by_key: dict[str, _BoardCustomFieldDefinition],
+) -> TaskCustomFieldValues:
     _reject_unknown_custom_field_keys(
         custom_field_values=custom_field_values,
         definitions_by_key=definitions_by_key,
@@ -881,7 +889,24 @@ async def _set_task_custom_field_values_for_create(
         effective_values=effective_values,
         definitions_by_key=definitions_by_key,
     )
+    return effective_values
+
 
+async def _set_task_custom_field_values_for_create(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    task_id: UUID,
+    custom_field_values: TaskCustomFieldValues,
+) -> None:
+    definitions_by_key = await _organization_custom_field_definitions_for_board(
+        session,
+        board_id=board_id,
+    )
+    effective_values = _effective_create_custom_field_values(
+        custom_field_values=custom_field_values,
+        definitions_by_key=definitions_by_key,
+    )
     for field_key, definition in definitions_by_key.items():
         value = effective_values.get(field_key)
         if value is None:
@@ -920,6 +945,7 @@ async def _set_task_custom_field_values_for_update(
         task_id=task_id,
         definition_ids=list(definitions_by_id),
     )
+    task_hydration_cache.invalidate_after_commit(session, board_id)
 
     effective_values: TaskCustomFieldValues = {}
     for field_key, definition in definitions_by_key.items():
@@ -1022,16 +1048,11 @@ def _task_list_statement(
     return statement.order_by(col(Task.created_at).desc())
 
 
-async def _task_read_page(
-    *,
+async def _load_task_hydration(
     session: AsyncSession,
     board_id: UUID,
-    tasks: Sequence[Task],
-) -> list[TaskRead]:
-    if not tasks:
-        return []
-
-    task_ids = [task.id for task in tasks]
+    task_ids: list[UUID],
+) -> dict[UUID, TaskHydration]:
     tag_state_by_task_id = await load_tag_state(
         session,
         task_ids=task_ids,
@@ -1041,24 +1062,66 @@ async def _task_read_page(
         board_id=board_id,
         task_ids=task_ids,
     )
-    dep_ids: list[UUID] = []
-    for value in deps_map.values():
-        dep_ids.extend(value)
-    dep_status = await dependency_status_by_id(
+    custom_field_values_by_task_id = await _task_custom_field_values_by_task_id(
         session,
         board_id=board_id,
-        dependency_ids=list({*dep_ids}),
+        task_ids=task_ids,
     )
-    custom_field_values_by_task_id = await _task_custom_field_values_by_task_id(
+    return {
+        task_id: TaskHydration(
+            tag_state=tag_state_by_task_id.get(task_id, TagState()),
+            dependency_ids=deps_map.get(task_id, []),
+            custom_field_values=custom_field_values_by_task_id.get(task_id, {}),
+        )
+        for task_id in task_ids
+    }
+
+
+async def _task_hydration_state(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    task_ids: Sequence[UUID],
+) -> tuple[dict[UUID, TaskHydration], dict[UUID, str]]:
+    hydration_by_task_id = await task_hydration_cache.get_many(
         session,
         board_id=board_id,
         task_ids=task_ids,
+        loader=_load_task_hydration,
+    )
+    dep_ids = {
+        dep_id for hydration in hydration_by_task_id.values() for dep_id in hydration.dependency_ids
+    }
+    if not dep_ids:
+        return hydration_by_task_id, {}
+    dep_status = await dependency_status_by_id(
+        session,
+        board_id=board_id,
+        dependency_ids=list(dep_ids),
+    )
+    return hydration_by_task_id, dep_status
+
+
+async def _task_read_page(
+    *,
+    session: AsyncSession,
+    board_id: UUID,
+    tasks: Sequence[Task],
+) -> list[TaskRead]:
+    if not tasks:
+        return []
+
+    hydration_by_task_id, dep_status = await _task_hydration_state(
+        session,
+        board_id=board_id,
+        task_ids=[task.id for task in tasks],
     )
 
     output: list[TaskRead] = []
     for task in tasks:
-        tag_state = tag_state_by_task_id.get(task.id, TagState())
-        dep_list = deps_map.get(task.id, [])
+        hydration = hydration_by_task_id.get(task.id)
+        tag_state = hydration.tag_state if hydration is not None else TagState()
+        dep_list = list(hydration.dependency_ids) if hydration is not None else []
         blocked_by = blocked_by_dependency_ids(
             dependency_ids=dep_list,
             status_by_id=dep_status,
@@ -1069,11 +1132,13 @@ async def _task_read_page(
             TaskRead.model_validate(task, from_attributes=True).model_copy(
                 update={
                     "depends_on_task_ids": dep_list,
-                    "tag_ids": tag_state.tag_ids,
-                    "tags": tag_state.tags,
+                    "tag_ids": list(tag_state.tag_ids),
+                    "tags": list(tag_state.tags),
                     "blocked_by_task_ids": blocked_by,
                     "is_blocked": bool(blocked_by),
-                    "custom_field_values": custom_field_values_by_task_id.get(task.id, {}),
+                    "custom_field_values": (
+                        dict(hydration.custom_field_values) if hydration is not None else {}
+                    ),
                 },
             ),
         )
@@ -1097,32 +1162,17 @@ async def _stream_task_state(
     if not task_ids:
         return {}, {}, {}, {}
 
-    tag_state_by_task_id = await load_tag_state(
-        session,
-        task_ids=list({*task_ids}),
-    )
-    deps_map = await dependency_ids_by_task_id(
+    hydration_by_task_id, dep_status = await _task_hydration_state(
         session,
         board_id=board_id,
-        task_ids=list({*task_ids}),
+        task_ids=task_ids,
     )
-    dep_ids: list[UUID] = []
-    for value in deps_map.values():
-        dep_ids.extend(value)
-    custom_field_values_by_task_id = await _task_custom_field_values_by_task_id(
-        session,
-        board_id=board_id,
-        task_ids=list({*task_ids}),
+    return (
+        {task_id: item.dependency_ids for task_id, item in hydration_by_task_id.items()},
+        dep_status,
+        {task_id: item.tag_state for task_id, item in hydration_by_task_id.items()},
+        {task_id: item.custom_field_values for task_id, item in hydration_by_task_id.items()},
     )
-    if not dep_ids:
-        return deps_map, {}, tag_state_by_task_id, custom_field_values_by_task_id
-
-    dep_status = await dependency_status_by_id(
-        session,
-        board_id=board_id,
-        dependency_ids=list({*dep_ids}),
-    )
-    return deps_map, dep_status, tag_state_by_task_id, custom_field_values_by_task_id
 
 
 def _task_event_payload(
@@ -1188,7 +1238,7 @@ async def _task_event_generator(
         if await request.is_disconnected():
             break
 
-        async with async_session_maker() as session:
+        async with async_read_session_maker() as session:
             rows = await _fetch_task_events(session, board_id, last_seen)
             deps_map, dep_status, tag_state_by_task_id, custom_field_values_by_task_id = (
                 await _stream_task_state(
@@ -1224,11 +1274,14 @@ async def _task_event_generator(
 async def stream_tasks(
     request: Request,
     board: Board = BOARD_READ_DEP,
+    session: AsyncSession = SESSION_DEP,
     _actor: ActorContext = ACTOR_DEP,
     since: str | None = SINCE_QUERY,
 ) -> EventSourceResponse:
     """Stream task and task-comment events as SSE payloads."""
     since_dt = _parse_since(since) or utcnow()
+    # Return the auth/lookup connection to the pool; the stream polls on its own.
+    await session.close()
     return EventSourceResponse(
         _task_event_generator(
             request=request,
@@ -1239,7 +1292,7 @@ async def stream_tasks(
     )
 
 
-@router.get("", response_model=DefaultLimitOffsetPage[TaskRead])
+@router.get("", response_model=CursorPage[TaskRead])
 async def list_tasks(
     status_filter: str | None = STATUS_QUERY,
     assigned_agent_id: UUID | None = None,
@@ -1247,8 +1300,9 @@ async def list_tasks(
     board: Board = BOARD_READ_DEP,
     session: AsyncSession = SESSION_DEP,
     _actor: ActorContext = ACTOR_DEP,
-) -> LimitOffsetPage[TaskRead]:
-    """List board tasks with optional status and assignment filters."""
+    page: KeysetParams = PAGE_DEP,
+) -> CursorPage[TaskRead]:
+    """List board tasks (newest first) with optional status and assignment filters."""
     statement = _task_list_statement(
         board_id=board.id,
         status_filter=status_filter,
@@ -1264,7 +1318,14 @@ async def list_tasks(
             tasks=tasks,
         )
 
-    return await paginate(session, statement, transformer=_transform)
+    return await paginate_keyset(
+        session,
+        statement,
+        params=page,
+        sort_column=col(Task.created_at),
+        id_column=col(Task.id),
+        transformer=_transform,
+    )
 
 
 @router.post("", response_model=TaskRead, responses={409: {"model": BlockedTaskError}})
@@ -1358,6 +1419,522 @@ async def create_task(
     )
 
 
+_BULK_TASK_EDIT_FIELDS = {"title", "description", "priority", "due_at", "assigned_agent_id"}
+_LEAD_BULK_UPDATE_FIELDS = {
+    "assigned_agent_id",
+    "depends_on_task_ids",
+    "depends_on_refs",
+    "tag_ids",
+}
+# Heading -> (activity event on success, activity event on failure, call to action).
+_BULK_NOTIFY_SECTIONS: dict[str, tuple[str, str, str]] = {
+    "NEW TASKS ADDED": (
+        "task.lead_notified",
+        "task.lead_notify_failed",
+        "triage, assign, or plan next steps.",
+    ),
+    "TASKS BACK IN INBOX": (
+        "task.lead_unassigned_notified",
+        "task.lead_unassigned_notify_failed",
+        "assign a new owner or adjust the plan.",
+    ),
+    "TASKS ASSIGNED": (
+        "task.assignee_notified",
+        "task.assignee_notify_failed",
+        "open each task and begin work. Post updates as task comments.",
+    ),
+}
+
+
+@dataclass(slots=True)
+class _BulkTaskEdit:
+    task: Task
+    previous_status: str
+    previous_assigned: UUID | None
+    updates: dict[str, object]
+    depends_on_task_ids: list[UUID] | None
+    tag_ids: list[UUID] | None
+
+
+@dataclass(slots=True)
+class _BulkNotification:
+    agent: Agent
+    sections: dict[str, list[Task]] = field(default_factory=dict)
+
+
+def _require_lead_bulk_update_fields(items: Sequence[TaskBulkUpdate]) -> None:
+    requested_fields = {name for item in items for name in item.model_fields_set} - {"id"}
+    disallowed_fields = requested_fields - _LEAD_BULK_UPDATE_FIELDS
+    if not disallowed_fields:
+        return
+    disallowed = ", ".join(sorted(disallowed_fields))
+    allowed = ", ".join(sorted(_LEAD_BULK_UPDATE_FIELDS))
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=(
+            "Lead field gate failed: unsupported fields for board leads: "
+            f"{disallowed}. Allowed fields: {allowed}."
+        ),
+    )
+
+
+async def _bulk_update_targets(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    task_ids: Sequence[UUID],
+) -> dict[UUID, Task]:
+    if not task_ids:
+        return {}
+    tasks = {
+        task.id: task
+        for task in await session.exec(
+            select(Task).where(col(Task.board_id) == board_id, col(Task.id).in_(task_ids)),
+        )
+    }
+    missing = [task_id for task_id in task_ids if task_id not in tasks]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "message": "One or more tasks were not found on this board.",
+                "missing_task_ids": [str(value) for value in missing],
+            },
+        )
+    return tasks
+
+
+async def _bulk_assigned_agents(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    agent_ids: Sequence[UUID],
+    lead_actor: bool,
+) -> dict[UUID, Agent]:
+    unique_agent_ids = list(dict.fromkeys(agent_ids))
+    if not unique_agent_ids:
+        return {}
+    agents = {
+        agent.id: agent
+        for agent in await session.exec(select(Agent).where(col(Agent.id).in_(unique_agent_ids)))
+    }
+    for agent_id in unique_agent_ids:
+        agent = agents.get(agent_id)
+        if agent is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        if lead_actor and agent.is_board_lead:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Board leads cannot assign tasks to themselves.",
+            )
+        if agent.board_id and agent.board_id != board_id:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT)
+    return agents
+
+
+def _bulk_notification_message(board: Board, notification: _BulkNotification) -> str:
+    lines = ["TASK BATCH", f"Board: {board.name}"]
+    for heading, tasks in notification.sections.items():
+        lines.extend(["", f"{heading} ({len(tasks)})"])
+        for task in tasks:
+            lines.append(f"- {task.title} (Task ID: {task.id}, Status: {task.status})")
+            description = _truncate_snippet(task.description or "")
+            if description:
+                lines.append(f"  Description: {description}")
+        lines.append(f"Take action: {_BULK_NOTIFY_SECTIONS[heading][2]}")
+    return "\n".join(lines)
+
+
+async def _notify_bulk_task_changes(
+    session: AsyncSession,
+    *,
+    board: Board,
+    lead_actor: Agent | None,
+    created: Sequence[Task],
+    edits: Sequence[_BulkTaskEdit],
+    agents: dict[UUID, Agent],
+) -> None:
+    notifications: dict[UUID, _BulkNotification] = {}
+
+    def _add(agent: Agent, heading: str, task: Task) -> None:
+        notification = notifications.setdefault(agent.id, _BulkNotification(agent=agent))
+        notification.sections.setdefault(heading, []).append(task)
+
+    # Lead-created batches skip the lead notice, as the single-task lead path does.
+    if lead_actor is None:
+        lead = (
+            await Agent.objects.filter_by(board_id=board.id)
+            .filter(col(Agent.is_board_lead).is_(True))
+            .first(session)
+        )
+        if lead is not None:
+            for task in created:
+                _add(lead, "NEW TASKS ADDED", task)
+            for edit in edits:
+                if (
+                    edit.task.status == "inbox"
+                    and edit.task.assigned_agent_id is None
+                    and edit.previous_assigned is not None
+                ):
+                    _add(lead, "TASKS BACK IN INBOX", edit.task)
+    newly_assigned = [
+        *created,
+        *(edit.task for edit in edits if edit.task.assigned_agent_id != edit.previous_assigned),
+    ]
+    for task in newly_assigned:
+        assignee = agents.get(task.assigned_agent_id) if task.assigned_agent_id else None
+        if assignee is not None:
+            _add(assignee, "TASKS ASSIGNED", task)
+
+    pending = [item for item in notifications.values() if item.agent.openclaw_session_id]
+    if not pending:
+        return
+    dispatch = GatewayDispatchService(session)
+    config = await dispatch.optional_gateway_config_for_board(board)
+    if config is None:
+        return
+    for notification in pending:
+        agent = notification.agent
+        message = _bulk_notification_message(board, notification)
+        if agent.is_board_lead:
+            error = await _send_lead_task_message(
+                dispatch=dispatch,
+                session_key=agent.openclaw_session_id or "",
+                config=config,
+                message=message,
+            )
+        else:
+            error = await _send_agent_task_message(
+                dispatch=dispatch,
+                session_key=agent.openclaw_session_id or "",
+                config=config,
+                agent_name=agent.name,
+                message=message,
+            )
+        for heading, tasks in notification.sections.items():
+            notified_event, failed_event, _ = _BULK_NOTIFY_SECTIONS[heading]
+            for task in tasks:
+                record_activity(
+                    session,
+                    event_type=notified_event if error is None else failed_event,
+                    message=(
+                        f"Agent notified in task batch: {agent.name}."
+                        if error is None
+                        else f"Batch notify failed: {error}"
+                    ),
+                    agent_id=agent.id,
+                    task_id=task.id,
+                )
+    await session.commit()
+
+
+async def apply_task_bulk(
+    session: AsyncSession,
+    *,
+    board: Board,
+    payload: TaskBulkRequest,
+    actor: ActorContext,
+) -> TaskBulkRead:
+    """Validate and apply a bulk create/update request in one transaction.
+
+    Any invalid item rejects the whole batch. Rows are written with one
+    multi-row INSERT per table, and each affected agent gets one gateway
+    message covering all of its tasks.
+    """
+    lead = actor.agent if actor.actor_type == "agent" else None
+    if lead is not None:
+        _require_lead_bulk_update_fields(payload.update)
+
+    created: list[Task] = []
+    task_id_by_ref: dict[str, UUID] = {}
+    for create_item in payload.create:
+        task = Task.model_validate(
+            create_item.model_dump(
+                exclude={
+                    "ref",
+                    "depends_on_refs",
+                    "depends_on_task_ids",
+                    "tag_ids",
+                    "custom_field_values",
+                },
+            ),
+        )
+        task.board_id = board.id
+        if lead is not None:
+            task.auto_created = True
+            task.auto_reason = f"lead_agent:{lead.id}"
+        elif task.created_by_user_id is None and actor.user is not None:
+            task.created_by_user_id = actor.user.id
+        created.append(task)
+        if create_item.ref is not None:
+            task_id_by_ref[create_item.ref] = task.id
+
+    targets = await _bulk_update_targets(
+        session,
+        board_id=board.id,
+        task_ids=[item.id for item in payload.update],
+    )
+    edits: list[_BulkTaskEdit] = []
+    for update_item in payload.update:
+        target = targets[update_item.id]
+        depends_on_task_ids: list[UUID] | None = None
+        if {"depends_on_task_ids", "depends_on_refs"} & update_item.model_fields_set:
+            if target.status == "done":
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=("Cannot change task dependencies after a task is done."),
+                )
+            depends_on_task_ids = [
+                *(update_item.depends_on_task_ids or []),
+                *(task_id_by_ref[ref] for ref in update_item.depends_on_refs or []),
+            ]
+        edits.append(
+            _BulkTaskEdit(
+                task=target,
+                previous_status=target.status,
+                previous_assigned=target.assigned_agent_id,
+                updates=update_item.model_dump(
+                    include=_BULK_TASK_EDIT_FIELDS,
+                    exclude_unset=True,
+                ),
+                depends_on_task_ids=depends_on_task_ids,
+                tag_ids=update_item.tag_ids,
+            ),
+        )
+
+    # Validate the whole batch with set-based queries before writing anything.
+    pending_deps: dict[UUID, list[UUID]] = {
+        task.id: [
+            *item.depends_on_task_ids,
+            *(task_id_by_ref[ref] for ref in item.depends_on_refs),
+        ]
+        for task, item in zip(created, payload.create, strict=True)
+    }
+    for edit in edits:
+        if edit.depends_on_task_ids is not None:
+            pending_deps[edit.task.id] = edit.depends_on_task_ids
+    normalized_deps = await validate_dependency_batch(
+        session,
+        board_id=board.id,
+        depends_on_by_task_id=pending_deps,
+        new_task_ids=[task.id for task in created],
+    )
+    tag_ids_by_task_id: dict[UUID, list[UUID]] = {
+        task.id: list(dict.fromkeys(item.tag_ids))
+        for task, item in zip(created, payload.create, strict=True)
+    }
+    for edit in edits:
+        if edit.tag_ids is not None:
+            tag_ids_by_task_id[edit.task.id] = list(dict.fromkeys(edit.tag_ids))
+    await validate_tag_ids(
+        session,
+        organization_id=board.organization_id,
+        tag_ids=[tag_id for tag_ids in tag_ids_by_task_id.values() for tag_id in tag_ids],
+    )
+    assigned_by_task_id: dict[UUID, UUID | None] = {
+        task.id: task.assigned_agent_id for task in created
+    }
+    for edit in edits:
+        assigned_by_task_id[edit.task.id] = _optional_assigned_agent_id(
+            edit.updates.get("assigned_agent_id", edit.task.assigned_agent_id),
+        )
+    agents = await _bulk_assigned_agents(
+        session,
+        board_id=board.id,
+        agent_ids=[
+            *(task.assigned_agent_id for task in created if task.assigned_agent_id),
+            *(
+                agent_id
+                for edit in edits
+                if "assigned_agent_id" in edit.updates
+                and (agent_id := assigned_by_task_id[edit.task.id]) is not None
+            ),
+        ],
+        lead_actor=lead is not None,
+    )
+
+    # Blocked tasks cannot be assigned or moved past inbox, as in the single-task paths.
+    checked_edits = [
+        edit
+        for edit in edits
+        if edit.depends_on_task_ids is not None or "assigned_agent_id" in edit.updates
+    ]
+    effective_deps = await dependency_ids_by_task_id(
+        session,
+        board_id=board.id,
+        task_ids=[edit.task.id for edit in checked_edits if edit.depends_on_task_ids is None],
+    )
+    effective_deps.update(normalized_deps)
+    new_status_by_id = {task.id: task.status for task in created}
+    dep_status = await dependency_status_by_id(
+        session,
+        board_id=board.id,
+        dependency_ids=list(
+            {
+                dep_id
+                for dep_ids in effective_deps.values()
+                for dep_id in dep_ids
+                if dep_id not in new_status_by_id
+            },
+        ),
+    )
+    dep_status.update(new_status_by_id)
+    for task_status, task_id in [
+        *((task.status, task.id) for task in created),
+        *((edit.task.status, edit.task.id) for edit in checked_edits),
+    ]:
+        blocked_by = blocked_by_dependency_ids(
+            dependency_ids=effective_deps.get(task_id, []),
+            status_by_id=dep_status,
+        )
+        if (
+            blocked_by
+            and task_status != "done"
+            and (assigned_by_task_id[task_id] is not None or task_status != "inbox")
+        ):
+            raise _blocked_task_error(blocked_by)
+
+    definitions_by_key = (
+        await _organization_custom_field_definitions_for_board(session, board_id=board.id)
+        if created
+        else {}
+    )
+    custom_field_rows: list[dict[str, object]] = []
+    for task, item in zip(created, payload.create, strict=True):
+        effective_values = _effective_create_custom_field_values(
+            custom_field_values=dict(item.custom_field_values),
+            definitions_by_key=definitions_by_key,
+        )
+        custom_field_rows.extend(
+            TaskCustomFieldValue(
+                task_id=task.id,
+                task_custom_field_definition_id=definitions_by_key[field_key].id,
+                value=value,
+            ).model_dump()
+            for field_key, value in effective_values.items()
+            if value is not None
+        )
+
+    now = utcnow()
+    for edit in edits:
+        for key, value in edit.updates.items():
+            setattr(edit.task, key, value)
+        edit.task.updated_at = now
+        session.add(edit.task)
+    replaced_dep_task_ids = [edit.task.id for edit in edits if edit.depends_on_task_ids is not None]
+    if replaced_dep_task_ids:
+        await crud.delete_where(
+            session,
+            TaskDependency,
+            col(TaskDependency.board_id) == board.id,
+            col(TaskDependency.task_id).in_(replaced_dep_task_ids),
+        )
+    retagged_task_ids = [edit.task.id for edit in edits if edit.tag_ids is not None]
+    if retagged_task_ids:
+        await crud.delete_where(
+            session,
+            TagAssignment,
+            col(TagAssignment.task_id).in_(retagged_task_ids),
+        )
+    events = [
+        ActivityEvent(
+            event_type="task.created",
+            task_id=task.id,
+            message=(
+                f"Task created by lead: {task.title}."
+                if lead is not None
+                else f"Task created: {task.title}."
+            ),
+            agent_id=lead.id if lead is not None else None,
+        )
+        for task in created
+    ]
+    for edit in edits:
+        event_type, message = _task_event_details(edit.task, edit.previous_status)
+        events.append(
+            ActivityEvent(
+                event_type=event_type,
+                task_id=edit.task.id,
+                message=message,
+                agent_id=lead.id if lead is not None else None,
+            ),
+        )
+    rows_by_model: list[tuple[type[SQLModel], list[dict[str, object]]]] = [
+        (Task, [task.model_dump() for task in created]),
+        (
+            TaskDependency,
+            [
+                TaskDependency(
+                    board_id=board.id,
+                    task_id=task_id,
+                    depends_on_task_id=dep_id,
+                ).model_dump()
+                for task_id, dep_ids in normalized_deps.items()
+                for dep_id in dep_ids
+            ],
+        ),
+        (
+            TagAssignment,
+            [
+                TagAssignment(task_id=task_id, tag_id=tag_id).model_dump()
+                for task_id, tag_ids in tag_ids_by_task_id.items()
+                for tag_id in tag_ids
+            ],
+        ),
+        (TaskCustomFieldValue, custom_field_rows),
+        (ActivityEvent, [event.model_dump() for event in events]),
+    ]
+    tables = SQLModel.metadata.tables
+    for model, rows in rows_by_model:
+        if rows:
+            await session.exec(insert(tables[str(model.__tablename__)]).values(rows))
+    # Core inserts bypass the ORM flush hooks that keep these caches current.
+    task_hydration_cache.invalidate_after_commit(session, board.id)
+    if created:
+        task_counts_cache.invalidate_after_commit(session, board.id)
+    await session.commit()
+
+    await _notify_bulk_task_changes(
+        session,
+        board=board,
+        lead_actor=lead,
+        created=created,
+        edits=edits,
+        agents=agents,
+    )
+    return TaskBulkRead(
+        created=await _task_read_page(session=session, board_id=board.id, tasks=created),
+        updated=await _task_read_page(
+            session=session,
+            board_id=board.id,
+            tasks=[edit.task for edit in edits],
+        ),
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=TaskBulkRead,
+    responses={409: {"model": BlockedTaskError}},
+)
+async def bulk_tasks(
+    payload: TaskBulkRequest,
+    board: Board = BOARD_WRITE_DEP,
+    session: AsyncSession = SESSION_DEP,
+    auth: AuthContext = ADMIN_AUTH_DEP,
+) -> TaskBulkRead:
+    """Create and update many tasks in one transaction.
+
+    Items in `create` can depend on each other through `ref`/`depends_on_refs`.
+    """
+    return await apply_task_bulk(
+        session,
+        board=board,
+        payload=payload,
+        actor=ActorContext(actor_type="user", user=auth.user),
+    )
+
+
 @router.patch(
     "/{task_id}",
     response_model=TaskRead,
@@ -1488,6 +2065,10 @@ async def delete_task_and_related_records(
     )
     await session.delete(task)
     await session.commit()
+    if task.board_id is not None:
+        approval_counts_cache.invalidate(task.board_id)
+        # Other tasks on the board may have depended on the deleted one.
+        task_hydration_cache.invalidate(task.board_id)
 
 
 @router.delete("/{task_id}", response_model=OkResponse)
@@ -2023,6 +2604,7 @@ async def _apply_lead_task_update(
             task_id=update.task.id,
             tag_ids=normalized_tag_ids,
         )
+        task_hydration_cache.invalidate_after_commit(session, update.board_id)
     if update.custom_field_values_set:
         await _set_task_custom_field_values_for_update(
             session,
@@ -2378,6 +2960,7 @@ async def _finalize_updated_task(
             task_id=update.task.id,
             tag_ids=normalized or [],
         )
+        task_hydration_cache.invalidate_after_commit(session, update.board_id)
 
     if update.custom_field_values_set:
         await _set_task_custom_field_values_for_update(
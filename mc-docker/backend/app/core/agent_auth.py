@@ -7,7 +7,8 @@ Key ideas:
 - For convenience, some deployments may also allow `Authorization: Bearer <token>`
   for agents (controlled by caller/dependency).
 - To reduce write-amplification, we only touch `Agent.last_seen_at` at a fixed
-  interval and we avoid touching it for safe/read-only HTTP methods.
+  interval, and touches that leave the status unchanged are buffered in the
+  Redis presence store (`app.services.agent_presence`) instead of committed.
 
 This is intentionally separate from user authentication (Clerk/local bearer token)
 so we can evolve agent policy independently.
@@ -20,6 +21,7 @@ from datetime import timedelta
 from typing import TYPE_CHECKING, Literal
 
 from fastapi import Depends, Header, HTTPException, Request, status
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import col, select
 
 from app.core.agent_tokens import verify_agent_token
@@ -27,6 +29,7 @@ from app.core.logging import get_logger
 from app.core.time import utcnow
 from app.db.session import get_session
 from app.models.agents import Agent
+from app.services.agent_presence import agent_presence
 
 if TYPE_CHECKING:
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -35,6 +38,7 @@ logger = get_logger(__name__)
 
 _LAST_SEEN_TOUCH_INTERVAL = timedelta(seconds=30)
 _SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_BUFFERED_PRESENCE_STATUSES = frozenset({"online", "updating", "deleting"})
 SESSION_DEP = Depends(get_session)
 
 
@@ -93,6 +97,12 @@ async def _touch_agent_presence(
     if agent.last_seen_at is not None and now - agent.last_seen_at < _LAST_SEEN_TOUCH_INTERVAL:
         return
 
+    if agent.status in _BUFFERED_PRESENCE_STATUSES and await agent_presence.record(agent.id, now):
+        # Status is unchanged, so only last_seen moves: the flusher persists it.
+        # Keep the loaded row current without marking it dirty.
+        set_committed_value(agent, "last_seen_at", now)
+        return
+
     agent.last_seen_at = now
     agent.updated_at = now
     if agent.status not in {"updating", "deleting"}:
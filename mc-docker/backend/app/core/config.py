@@ -50,9 +50,21 @@ class Settings(BaseSettings):
     cors_origins: str = ""
     base_url: str = ""
 
+    # Optional read replica for SSE pollers and dashboard metrics. Empty means
+    # read traffic shares the primary engine.
+    database_read_url: str = ""
+
     # Database lifecycle
     db_auto_migrate: bool = False
 
+    # Database connection pool (ignored for SQLite). A recycle of 0 disables
+    # recycling; a statement timeout of 0 leaves the server default in place.
+    db_pool_size: int = Field(default=10, ge=1)
+    db_max_overflow: int = Field(default=20, ge=0)
+    db_pool_timeout_seconds: float = Field(default=30.0, gt=0)
+    db_pool_recycle_seconds: int = Field(default=1800, ge=0)
+    db_statement_timeout_ms: int = Field(default=0, ge=0)
+
     # RQ queueing / dispatch
     rq_redis_url: str = "redis://localhost:6379/0"
     rq_queue_name: str = "default"
@@ -61,15 +73,54 @@ class Settings(BaseSettings):
     rq_dispatch_retry_base_seconds: float = 10.0
     rq_dispatch_retry_max_seconds: float = 120.0
 
+    # Inbound webhooks. Bodies above the limit get 413 before being buffered.
+    # Deferred ingest pushes raw requests to Redis and the queue worker persists
+    # them in batches; when Redis is unavailable, ingest persists inline.
+    # Requests that fail to persist are retried with the dispatch backoff and
+    # moved to the ingest dead-letter list once the retries are used up.
+    webhook_max_payload_bytes: int = Field(default=1024 * 1024, ge=1)
+    webhook_ingest_deferred: bool = True
+    webhook_ingest_batch_size: int = Field(default=200, ge=1)
+    webhook_ingest_poll_seconds: float = Field(default=1.0, gt=0)
+    webhook_ingest_max_retries: int = Field(default=10, ge=0)
+
+    # Agent presence write-behind: touches that leave status unchanged are kept
+    # in Redis and flushed to the database on this interval. 0 writes directly.
+    agent_presence_flush_seconds: float = Field(default=10.0, ge=0)
+
+    # Task payload hydration cache (tags, custom field values, dependency ids),
+    # invalidated across replicas over Redis pub/sub. 0 disables the cache.
+    task_hydration_cache_ttl_seconds: float = Field(default=60.0, ge=0)
+
+    # `/readyz` dependency checks. Each check gets the timeout; the combined
+    # result is reused for the cache window. A gateway URL adds a TCP reachability check.
+    readiness_check_timeout_seconds: float = Field(default=1.0, gt=0)
+    readiness_cache_seconds: float = Field(default=5.0, ge=0)
+    readiness_gateway_url: str = ""
+
     # OpenClaw gateway runtime compatibility
     gateway_min_version: str = "2026.02.9"
 
+    # souls.directory client cache. An empty cache dir disables the on-disk cache.
+    souls_directory_cache_dir: str = str(BACKEND_ROOT / ".cache" / "souls-directory")
+    souls_directory_markdown_cache_size: int = Field(default=256, ge=1)
+    souls_directory_markdown_ttl_seconds: int = Field(default=60 * 60, ge=0)
+
     # Logging
     log_level: str = "INFO"
     log_format: str = "text"
     log_use_utc: bool = False
     request_log_slow_ms: int = Field(default=1000, ge=0)
     request_log_include_health: bool = False
+    # Records are handed to a background writer thread through a bounded queue;
+    # when the queue is full, new records are dropped and counted.
+    log_async: bool = True
+    log_queue_size: int = Field(default=10_000, ge=1)
+    # Fraction of DEBUG/TRACE records kept (1.0 keeps everything).
+    log_debug_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+
+    # Prometheus-format request/DB metrics served at `/metrics`.
+    metrics_enabled: bool = True
 
     @model_validator(mode="after")
     def _defaults(self) -> Self:
@@ -17,6 +17,8 @@ Design notes:
 - The request-id middleware is installed *outermost* so it runs even when other
   middleware returns early.
 - Health endpoints are excluded from request logs by default to reduce noise.
+- The same middleware feeds per-route latency and SQL statement counts into
+  `app.core.request_metrics` for the `/metrics` endpoint.
 """
 
 from __future__ import annotations
@@ -41,6 +43,12 @@ from app.core.logging import (
     set_request_id,
     set_request_route_context,
 )
+from app.core.request_metrics import (
+    UNMATCHED_ROUTE,
+    begin_request_db_stats,
+    end_request_db_stats,
+    metrics_registry,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from starlette.types import ASGIApp, Message, Receive, Scope, Send
@@ -63,6 +71,7 @@ class RequestIdMiddleware:
         self._header_name_bytes = header_name.lower().encode("latin-1")
         self._slow_request_ms = settings.request_log_slow_ms
         self._include_health_logs = settings.request_log_include_health
+        self._metrics_enabled = settings.metrics_enabled
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Inject request-id into request state and response headers."""
@@ -79,10 +88,13 @@ class RequestIdMiddleware:
         should_log = self._include_health_logs or path not in _HEALTH_CHECK_PATHS
         started_at = perf_counter()
         status_code: int | None = None
+        # Latency is measured to response start so long-lived streams do not skew it.
+        response_started_seconds: float | None = None
 
         request_id = self._get_or_create_request_id(scope)
         context_token = set_request_id(request_id)
         route_context_tokens = set_request_route_context(method, path)
+        db_stats, db_stats_token = begin_request_db_stats()
         if should_log:
             logger.log(
                 TRACE_LEVEL,
@@ -95,8 +107,9 @@ class RequestIdMiddleware:
             )
 
         async def send_with_request_id(message: Message) -> None:
-            nonlocal status_code
+            nonlocal status_code, response_started_seconds
             if message["type"] == "http.response.start":
+                response_started_seconds = perf_counter() - started_at
                 # Starlette uses `list[tuple[bytes, bytes]]` here.
                 headers: list[tuple[bytes, bytes]] = message.setdefault("headers", [])
                 if not any(key.lower() == self._header_name_bytes for key, _ in headers):
@@ -105,13 +118,15 @@ class RequestIdMiddleware:
                 status = message.get("status")
                 status_code = status if isinstance(status, int) else 500
                 if should_log:
-                    duration_ms = int((perf_counter() - started_at) * 1000)
+                    duration_ms = int(response_started_seconds * 1000)
                     extra = {
                         "method": method,
                         "path": path,
                         "status_code": status_code,
                         "duration_ms": duration_ms,
                         "client_ip": client_ip,
+                        "db_statements": db_stats.statements,
+                        "db_ms": int(db_stats.seconds * 1000),
                     }
                     if status_code >= 500:
                         logger.error("http.request.complete", extra=extra)
@@ -132,16 +147,27 @@ class RequestIdMiddleware:
         try:
             await self._app(scope, receive, send_with_request_id)
         finally:
+            if response_started_seconds is None:
+                response_started_seconds = perf_counter() - started_at
             if should_log and status_code is None:
                 logger.warning(
                     "http.request.incomplete",
                     extra={
                         "method": method,
                         "path": path,
-                        "duration_ms": int((perf_counter() - started_at) * 1000),
+                        "duration_ms": int(response_started_seconds * 1000),
                         "client_ip": client_ip,
                     },
                 )
+            if self._metrics_enabled:
+                metrics_registry.observe_request(
+                    method=method,
+                    route=_route_template(scope),
+                    status_code=status_code or 500,
+                    duration_seconds=response_started_seconds,
+                    db_stats=db_stats,
+                )
+            end_request_db_stats(db_stats_token)
             reset_request_route_context(route_context_tokens)
             reset_request_id(context_token)
 
@@ -164,6 +190,13 @@ class RequestIdMiddleware:
         return request_id
 
 
+def _route_template(scope: Scope) -> str:
+    # Label by the matched route template (not the raw path) to bound cardinality.
+    route = scope.get("route")
+    route_path = getattr(route, "path", None)
+    return route_path if isinstance(route_path, str) and route_path else UNMATCHED_ROUTE
+
+
 def install_error_handling(app: FastAPI) -> None:
     """Install middleware and exception handlers on the FastAPI app."""
     # Important: add request-id middleware last so it's the outermost middleware.
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import atexit
+import copy
+import importlib
+import itertools
 import json
 import logging
 import os
+import queue
 import sys
+import threading
 import time
+from collections.abc import Callable
 from contextvars import ContextVar, Token
 from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from types import TracebackType
 from typing import Any
 
@@ -23,6 +31,29 @@ _REQUEST_METHOD_CONTEXT: ContextVar[str | None] = ContextVar("request_method", d
 _REQUEST_PATH_CONTEXT: ContextVar[str | None] = ContextVar("request_path", default=None)
 
 
+def _load_orjson_dumps() -> Callable[..., bytes] | None:
+    """Return `orjson.dumps` when the optional dependency is installed."""
+    try:
+        module = importlib.import_module("orjson")
+    except ImportError:
+        return None
+    dumps = getattr(module, "dumps", None)
+    return dumps if callable(dumps) else None
+
+
+_ORJSON_DUMPS = _load_orjson_dumps()
+
+
+def _dumps_json(payload: dict[str, Any]) -> str:
+    if _ORJSON_DUMPS is not None:
+        try:
+            return _ORJSON_DUMPS(payload, default=str).decode("utf-8")
+        except TypeError:
+            # orjson rejects a few inputs (e.g. >64-bit ints) that json handles.
+            pass
+    return json.dumps(payload, separators=(",", ":"), default=str)
+
+
 def _coerce_exc_info(
     value: object,
 ) -> (
@@ -183,6 +214,93 @@ class AppLogFilter(logging.Filter):
         return True
 
 
+class DebugSamplingFilter(logging.Filter):
+    """Keep a fixed fraction of DEBUG/TRACE records, spread evenly over the stream."""
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the filter with a keep-fraction between 0 and 1."""
+        super().__init__()
+        self._rate = min(max(rate, 0.0), 1.0)
+        self._counter = itertools.count(1)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return whether a record survives sampling."""
+        if record.levelno > logging.DEBUG or self._rate >= 1.0:
+            return True
+        if self._rate <= 0.0:
+            return False
+        # Keep the n-th record whenever floor(n * rate) steps up, so exactly
+        # floor(n * rate) of the first n records are kept for any rate.
+        seen = next(self._counter)
+        return int(seen * self._rate) > int((seen - 1) * self._rate)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Non-blocking queue handler that drops and counts records when the queue is full.
+
+    The message and any exception text are rendered before enqueueing, so later
+    changes to mutable `args` or the exception cannot alter what gets logged;
+    formatter output and serialization run on the listener thread. Context-derived
+    fields must be attached by filters on this handler, which run on the logging
+    thread before enqueueing.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord]) -> None:
+        """Initialize the handler around a bounded queue."""
+        super().__init__(log_queue)
+        self._log_queue = log_queue
+        self._drop_lock = threading.Lock()
+        self.dropped = 0
+        self._unreported_drops = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy with `msg` interpolated and the exception rendered to `exc_text`."""
+        prepared = copy.copy(record)
+        prepared.message = record.getMessage()
+        prepared.msg = prepared.message
+        prepared.args = None
+        if record.exc_info:
+            prepared.exc_text = record.exc_text or self._exception_formatter.formatException(
+                record.exc_info,
+            )
+        prepared.exc_info = None
+        return prepared
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue without blocking, counting records dropped on overflow."""
+        try:
+            self._log_queue.put_nowait(record)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+                self._unreported_drops += 1
+            return
+        if self._unreported_drops:
+            self._report_drops(record)
+
+    def _report_drops(self, record: logging.LogRecord) -> None:
+        with self._drop_lock:
+            count, self._unreported_drops = self._unreported_drops, 0
+        notice = logging.LogRecord(
+            name=__name__,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg="logging.queue.dropped count=%s total=%s",
+            args=(count, self.dropped),
+            exc_info=None,
+        )
+        notice.app = getattr(record, "app", APP_NAME)
+        notice.version = getattr(record, "version", APP_VERSION)
+        try:
+            self._log_queue.put_nowait(notice)
+        except queue.Full:
+            with self._drop_lock:
+                self._unreported_drops += count
+
+
 class JsonFormatter(logging.Formatter):
     """Formatter that serializes log records as compact JSON."""
 
@@ -204,13 +322,15 @@ class JsonFormatter(logging.Formatter):
         }
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
         if record.stack_info:
             payload["stack"] = self.formatStack(record.stack_info)
         for key, value in record.__dict__.items():
             if key in _STANDARD_LOG_RECORD_ATTRS or key in payload:
                 continue
             payload[key] = value
-        return json.dumps(payload, separators=(",", ":"), default=str)
+        return _dumps_json(payload)
 
 
 class KeyValueFormatter(logging.Formatter):
@@ -235,6 +355,9 @@ class AppLogger:
     """Centralized logging setup utility for the backend process."""
 
     _configured = False
+    _listener: QueueListener | None = None
+    _queue_handler: BoundedQueueHandler | None = None
+    _atexit_registered = False
 
     @classmethod
     def _resolve_level(cls) -> tuple[str, int]:
@@ -253,9 +376,9 @@ class AppLogger:
             return
 
         level_name, level = cls._resolve_level()
+        cls.shutdown()
 
         handler = logging.StreamHandler(sys.stdout)
-        handler.addFilter(AppLogFilter(APP_NAME, APP_VERSION))
         format_name = (settings.log_format or "text").lower()
         if format_name == "json":
             formatter: logging.Formatter = JsonFormatter()
@@ -267,10 +390,24 @@ class AppLogger:
                 formatter.converter = time.gmtime
         handler.setFormatter(formatter)
 
+        root_handler: logging.Handler = handler
+        if settings.log_async:
+            queue_handler = BoundedQueueHandler(queue.Queue(maxsize=settings.log_queue_size))
+            cls._listener = QueueListener(queue_handler.queue, handler)
+            cls._listener.start()
+            cls._queue_handler = queue_handler
+            root_handler = queue_handler
+            if not cls._atexit_registered:
+                atexit.register(cls.shutdown)
+                cls._atexit_registered = True
+        root_handler.addFilter(AppLogFilter(APP_NAME, APP_VERSION))
+        if settings.log_debug_sample_rate < 1.0:
+            root_handler.addFilter(DebugSamplingFilter(settings.log_debug_sample_rate))
+
         root = logging.getLogger()
         root.setLevel(level)
         root.handlers.clear()
-        root.addHandler(handler)
+        root.addHandler(root_handler)
 
         # Uvicorn & HTTP clients
         for logger_name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
@@ -291,10 +428,11 @@ class AppLogger:
                 logger.disabled = True
 
         logging.getLogger(__name__).info(
-            "logging.configured level=%s format=%s use_utc=%s",
+            "logging.configured level=%s format=%s use_utc=%s async=%s",
             level_name,
             format_name,
             settings.log_use_utc,
+            settings.log_async,
         )
         logging.getLogger(__name__).debug(
             "logging.libraries uvicorn_level=%s sql_enabled=%s",
@@ -304,6 +442,32 @@ class AppLogger:
 
         cls._configured = True
 
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the background writer, flushing queued records.
+
+        Records logged afterwards are written synchronously by the listener's sink
+        handlers, which take over the queue handler's place and filters on the root.
+        """
+        listener, queue_handler = cls._listener, cls._queue_handler
+        cls._listener = None
+        cls._queue_handler = None
+        if listener is None:
+            return
+        listener.stop()
+        root = logging.getLogger()
+        if queue_handler is not None and queue_handler in root.handlers:
+            for sink in listener.handlers:
+                for log_filter in queue_handler.filters:
+                    sink.addFilter(log_filter)
+                root.addHandler(sink)
+            root.removeHandler(queue_handler)
+
+    @classmethod
+    def dropped_records(cls) -> int:
+        """Return how many records were dropped because the log queue was full."""
+        return cls._queue_handler.dropped if cls._queue_handler is not None else 0
+
     @classmethod
     def get_logger(cls, name: str | None = None) -> logging.Logger:
         """Return a logger, ensuring logging has been configured."""
@@ -320,3 +484,8 @@ def configure_logging() -> None:
 def get_logger(name: str | None = None) -> logging.Logger:
     """Return an app logger from the centralized logger configuration."""
     return AppLogger.get_logger(name)
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background log writer."""
+    AppLogger.shutdown()
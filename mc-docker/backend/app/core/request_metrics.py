@@ -0,0 +1,239 @@
+"""In-process HTTP latency and per-request database query metrics.
+
+`RequestIdMiddleware` opens a `RequestDbStats` scope for every HTTP request and
+records the request into the process-wide `metrics_registry` when it finishes.
+SQLAlchemy cursor events (see `instrument_engine`) add each executed statement
+and its wall time to the active scope. The registry renders Prometheus text
+exposition format for the `/metrics` endpoint.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Final
+
+from sqlalchemy import event
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Engine
+
+LATENCY_BUCKETS_SECONDS: Final[tuple[float, ...]] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+DB_STATEMENT_BUCKETS: Final[tuple[float, ...]] = (0, 1, 2, 5, 10, 20, 50, 100)
+UNMATCHED_ROUTE: Final[str] = "unmatched"
+_QUERY_START_KEY: Final[str] = "mc_query_started_at"
+
+
+@dataclass(slots=True)
+class RequestDbStats:
+    """Mutable SQL statement counters for a single request."""
+
+    statements: int = 0
+    seconds: float = 0.0
+
+
+_REQUEST_DB_STATS: ContextVar[RequestDbStats | None] = ContextVar(
+    "request_db_stats",
+    default=None,
+)
+
+
+def begin_request_db_stats() -> tuple[RequestDbStats, Token[RequestDbStats | None]]:
+    """Start collecting SQL statement counts for the current request context."""
+    stats = RequestDbStats()
+    return stats, _REQUEST_DB_STATS.set(stats)
+
+
+def end_request_db_stats(token: Token[RequestDbStats | None]) -> None:
+    """Stop collecting SQL statement counts for the current request context."""
+    _REQUEST_DB_STATS.reset(token)
+
+
+def current_request_db_stats() -> RequestDbStats | None:
+    """Return SQL counters for the active request, if any."""
+    return _REQUEST_DB_STATS.get()
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: object,
+    statement: str,
+    parameters: object,
+    context: object,
+    executemany: bool,
+) -> None:
+    _ = (cursor, statement, parameters, context, executemany)
+    conn.info.setdefault(_QUERY_START_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: object,
+    statement: str,
+    parameters: object,
+    context: object,
+    executemany: bool,
+) -> None:
+    _ = (cursor, statement, parameters, context, executemany)
+    starts = conn.info.get(_QUERY_START_KEY)
+    if not starts:
+        return
+    elapsed = perf_counter() - starts.pop()
+    stats = _REQUEST_DB_STATS.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += elapsed
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach statement counting hooks to a (sync) SQLAlchemy engine."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@dataclass(slots=True)
+class _Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int] = field(init=False)
+    total: float = 0.0
+    observations: int = 0
+
+    def __post_init__(self) -> None:
+        # One extra slot for the implicit +Inf bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.observations += 1
+
+
+_RequestKey = tuple[str, str, str]
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(pairs: dict[str, str]) -> str:
+    return ",".join(f'{key}="{_escape_label(value)}"' for key, value in pairs.items())
+
+
+def _format_bound(bound: float) -> str:
+    return f"{bound:g}"
+
+
+class MetricsRegistry:
+    """Thread-safe registry of per-route request latency and DB usage."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latency: dict[_RequestKey, _Histogram] = {}
+        self._db_statements: dict[_RequestKey, _Histogram] = {}
+        self._db_seconds: dict[_RequestKey, float] = {}
+
+    def observe_request(
+        self,
+        *,
+        method: str,
+        route: str,
+        status_code: int,
+        duration_seconds: float,
+        db_stats: RequestDbStats | None = None,
+    ) -> None:
+        """Record a completed HTTP request."""
+        key = (method, route, str(status_code))
+        with self._lock:
+            latency = self._latency.get(key)
+            if latency is None:
+                latency = self._latency[key] = _Histogram(LATENCY_BUCKETS_SECONDS)
+            latency.observe(duration_seconds)
+            if db_stats is None:
+                return
+            statements = self._db_statements.get(key)
+            if statements is None:
+                statements = self._db_statements[key] = _Histogram(DB_STATEMENT_BUCKETS)
+            statements.observe(db_stats.statements)
+            self._db_seconds[key] = self._db_seconds.get(key, 0.0) + db_stats.seconds
+
+    def reset(self) -> None:
+        """Drop all recorded series."""
+        with self._lock:
+            self._latency.clear()
+            self._db_statements.clear()
+            self._db_seconds.clear()
+
+    def render_prometheus(
+        self, *, extra_counters: dict[str, tuple[str, float]] | None = None
+    ) -> str:
+        """Render all series in Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            self._render_histograms(
+                lines,
+                name="http_request_duration_seconds",
+                help_text="HTTP request latency by route template and status.",
+                series=self._latency,
+            )
+            self._render_histograms(
+                lines,
+                name="http_request_db_statements",
+                help_text="SQL statements executed per HTTP request.",
+                series=self._db_statements,
+            )
+            lines.append(
+                "# HELP http_request_db_seconds_total Time spent executing SQL per route.",
+            )
+            lines.append("# TYPE http_request_db_seconds_total counter")
+            for key, seconds in sorted(self._db_seconds.items()):
+                lines.append(f"http_request_db_seconds_total{{{self._key_labels(key)}}} {seconds}")
+        for name, (help_text, value) in sorted((extra_counters or {}).items()):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _key_labels(key: _RequestKey) -> str:
+        method, route, status_code = key
+        return _labels({"method": method, "route": route, "status": status_code})
+
+    def _render_histograms(
+        self,
+        lines: list[str],
+        *,
+        name: str,
+        help_text: str,
+        series: dict[_RequestKey, _Histogram],
+    ) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for key, histogram in sorted(series.items()):
+            labels = self._key_labels(key)
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts, strict=False):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{_format_bound(bound)}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.observations}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.total}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.observations}")
+
+
+metrics_registry = MetricsRegistry()
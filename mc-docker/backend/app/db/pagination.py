@@ -1,20 +1,33 @@
-"""Typed wrapper around fastapi-pagination for backend query helpers."""
+"""Typed wrapper around fastapi-pagination plus keyset (cursor) paging helpers."""
 
 from __future__ import annotations
 
+import base64
+import inspect
+import json
 from collections.abc import Awaitable, Callable, Sequence
-from typing import TYPE_CHECKING, Any, TypeVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+from uuid import UUID
 
+from fastapi import HTTPException, Query, status
 from fastapi_pagination.ext.sqlalchemy import paginate as _paginate
+from sqlalchemy import desc, func, literal, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import select
 
-from app.schemas.pagination import DefaultLimitOffsetPage
+from app.schemas.pagination import CursorPage, DefaultLimitOffsetPage
 
 if TYPE_CHECKING:
     from fastapi_pagination.limit_offset import LimitOffsetPage
+    from sqlalchemy.orm import InstrumentedAttribute, Mapped
     from sqlmodel.ext.asyncio.session import AsyncSession
     from sqlmodel.sql.expression import Select, SelectOfScalar
 
 T = TypeVar("T")
+DEFAULT_PAGE_LIMIT = 200
+MAX_PAGE_LIMIT = 200
 
 Transformer = Callable[
     [Sequence[Any]],
@@ -31,3 +44,159 @@ async def paginate(
     """Execute a paginated query and cast to the project page type alias."""
     page = await _paginate(session, statement, transformer=transformer)
     return DefaultLimitOffsetPage[T].model_validate(page)
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetParams:
+    """Request paging parameters shared by offset and cursor list endpoints."""
+
+    limit: int = DEFAULT_PAGE_LIMIT
+    offset: int = 0
+    cursor: str | None = None
+    include_total: bool | None = None
+
+    @property
+    def wants_total(self) -> bool:
+        """Offset pages count by default; cursor pages only when asked."""
+        if self.include_total is not None:
+            return self.include_total
+        return self.cursor is None
+
+
+def keyset_params(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque `next_cursor` from a previous page; ignores `offset`.",
+    ),
+    include_total: bool | None = Query(
+        default=None,
+        description=(
+            "Return `total` (exact for offset pages; may be an estimate for cursor pages). "
+            "Defaults to true for offset pages and false for cursor pages."
+        ),
+    ),
+) -> KeysetParams:
+    """FastAPI dependency resolving list paging query parameters."""
+    return KeysetParams(limit=limit, offset=offset, cursor=cursor, include_total=include_total)
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """Encode a `(sort_value, id)` position as an opaque URL-safe token."""
+    raw = json.dumps([sort_value.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a token from `encode_cursor`, raising `ValueError` when malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_raw, id_raw = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(sort_raw), UUID(id_raw)
+    except (TypeError, ValueError, UnicodeError) as exc:
+        message = "Invalid pagination cursor."
+        raise ValueError(message) from exc
+
+
+async def _exact_count(session: AsyncSession, statement: Select[Any] | SelectOfScalar[Any]) -> int:
+    subquery = statement.order_by(None).subquery()
+    return int((await session.exec(select(func.count()).select_from(subquery))).one())
+
+
+async def _estimated_count(
+    session: AsyncSession,
+    statement: Select[Any] | SelectOfScalar[Any],
+) -> int | None:
+    """Return the Postgres planner row estimate for `statement`, if available."""
+    connection = await session.connection()
+    if connection.dialect.name != "postgresql":
+        return None
+    compiled = statement.order_by(None).compile(
+        dialect=connection.dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    try:
+        # A savepoint keeps a failed EXPLAIN from aborting the request transaction.
+        async with connection.begin_nested():
+            result = await connection.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {compiled}",
+                compiled.params,
+            )
+            plan = result.scalar_one()
+    except SQLAlchemyError:
+        return None
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return max(0, int(plan[0]["Plan"]["Plan Rows"]))
+
+
+async def paginate_keyset(
+    session: AsyncSession,
+    statement: SelectOfScalar[Any],
+    *,
+    params: KeysetParams,
+    sort_column: Mapped[datetime],
+    id_column: Mapped[UUID],
+    transformer: Transformer | None = None,
+) -> CursorPage[T]:
+    """Page `statement` newest-first by `(sort_column, id_column)`.
+
+    With `params.cursor` the page starts strictly after the encoded position
+    (a composite-index range scan instead of `OFFSET`); otherwise `offset`
+    applies as before. One extra row is fetched to decide whether to emit
+    `next_cursor`. Raises `HTTPException(422)` for malformed cursors.
+    """
+    sort_attr = cast("InstrumentedAttribute[datetime]", sort_column)
+    id_attr = cast("InstrumentedAttribute[UUID]", id_column)
+    page_statement = statement.order_by(None).order_by(desc(sort_attr), desc(id_attr))
+    if params.cursor is not None:
+        try:
+            sort_value, row_id = decode_cursor(params.cursor)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=str(exc),
+            ) from exc
+        page_statement = page_statement.where(
+            # Row-value comparison lets Postgres walk the composite index directly.
+            tuple_(sort_attr, id_attr)
+            < tuple_(
+                literal(sort_value, type_=sort_attr.type),
+                literal(row_id, type_=id_attr.type),
+            ),
+        )
+    elif params.offset:
+        page_statement = page_statement.offset(params.offset)
+
+    rows = list((await session.exec(page_statement.limit(params.limit + 1))).all())
+    has_more = len(rows) > params.limit
+    rows = rows[: params.limit]
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_attr.key), getattr(last, id_attr.key))
+
+    total: int | None = None
+    estimated = False
+    if params.wants_total:
+        if params.cursor is None:
+            total = await _exact_count(session, statement)
+        else:
+            total = await _estimated_count(session, statement)
+            estimated = total is not None
+            if total is None:
+                total = await _exact_count(session, statement)
+
+    items: Sequence[Any] = rows
+    if transformer is not None:
+        transformed = transformer(rows)
+        items = await transformed if inspect.isawaitable(transformed) else transformed
+    return CursorPage[T](
+        items=items,
+        total=total,
+        limit=params.limit,
+        offset=0 if params.cursor is not None else params.offset,
+        next_cursor=next_cursor,
+        total_is_estimate=estimated,
+    )
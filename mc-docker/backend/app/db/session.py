@@ -4,17 +4,19 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from alembic.config import Config
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app import models as _models
-from app.core.config import settings
+from app.core.config import Settings, settings
 from app.core.logging import get_logger
+from app.core.request_metrics import instrument_engine
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -32,15 +34,50 @@ def _normalize_database_url(database_url: str) -> str:
     return database_url
 
 
-async_engine: AsyncEngine = create_async_engine(
-    _normalize_database_url(settings.database_url),
-    pool_pre_ping=True,
+def _engine_options(database_url: str, config: Settings) -> dict[str, Any]:
+    options: dict[str, Any] = {"pool_pre_ping": True}
+    backend = make_url(database_url).get_backend_name()
+    if backend == "sqlite":
+        # SQLite uses single-connection/static pools that reject sizing arguments.
+        return options
+    options.update(
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_timeout=config.db_pool_timeout_seconds,
+        pool_recycle=config.db_pool_recycle_seconds or -1,
+    )
+    if backend == "postgresql" and config.db_statement_timeout_ms > 0:
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={config.db_statement_timeout_ms}",
+        }
+    return options
+
+
+def _create_engine(database_url: str) -> AsyncEngine:
+    normalized = _normalize_database_url(database_url)
+    engine = create_async_engine(normalized, **_engine_options(normalized, settings))
+    if settings.metrics_enabled:
+        instrument_engine(engine.sync_engine)
+    return engine
+
+
+async_engine: AsyncEngine = _create_engine(settings.database_url)
+# Read-only traffic (SSE pollers, dashboard metrics) goes to the replica when
+# one is configured, so long-lived streams never compete with writes for the
+# primary pool.
+read_engine: AsyncEngine = (
+    _create_engine(settings.database_read_url) if settings.database_read_url else async_engine
 )
 async_session_maker = async_sessionmaker(
     async_engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
+async_read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
 logger = get_logger(__name__)
 
 
@@ -75,19 +112,42 @@ async def init_db() -> None:
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+async def dispose_engines() -> None:
+    """Close pooled connections for the primary and read engines."""
+    await async_engine.dispose()
+    if read_engine is not async_engine:
+        await read_engine.dispose()
+
+
+async def _rollback_if_open(session: AsyncSession) -> None:
+    in_txn = False
+    try:
+        in_txn = bool(session.in_transaction())
+    except SQLAlchemyError:
+        logger.exception("Failed to inspect session transaction state.")
+    if in_txn:
+        try:
+            await session.rollback()
+        except SQLAlchemyError:
+            logger.exception("Failed to rollback session after request error.")
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Yield a request-scoped async DB session with safe rollback on errors."""
     async with async_session_maker() as session:
         try:
             yield session
         finally:
-            in_txn = False
-            try:
-                in_txn = bool(session.in_transaction())
-            except SQLAlchemyError:
-                logger.exception("Failed to inspect session transaction state.")
-            if in_txn:
-                try:
-                    await session.rollback()
-                except SQLAlchemyError:
-                    logger.exception("Failed to rollback session after request error.")
+            await _rollback_if_open(session)
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Yield a request-scoped session bound to the read replica, if configured.
+
+    Use only for read-only endpoints: replica data may lag the primary slightly.
+    """
+    async with async_read_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await _rollback_if_open(session)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+import asyncio
+import time
+from contextlib import asynccontextmanager, suppress
 from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, FastAPI, status
+from fastapi import APIRouter, FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import PlainTextResponse
 from fastapi_pagination import add_pagination
 
 from app.api.activity import router as activity_router
@@ -33,9 +36,14 @@ from app.api.tasks import router as tasks_router
 from app.api.users import router as users_router
 from app.core.config import settings
 from app.core.error_handling import install_error_handling
-from app.core.logging import configure_logging, get_logger
-from app.db.session import init_db
-from app.schemas.health import HealthStatusResponse
+from app.core.logging import AppLogger, configure_logging, get_logger, shutdown_logging
+from app.core.request_metrics import metrics_registry
+from app.db.session import async_session_maker, dispose_engines, init_db
+from app.schemas.health import HealthStatusResponse, ReadinessCheckResult, ReadinessStatusResponse
+from app.services.agent_presence import agent_presence, run_presence_flusher
+from app.services.readiness import readiness_probe
+from app.services.souls_directory import close_souls_directory_client
+from app.services.task_hydration import run_task_hydration_listener, task_hydration_cache
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -436,11 +444,31 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         settings.db_auto_migrate,
     )
     await init_db()
+    presence_flusher: asyncio.Task[None] | None = None
+    if agent_presence.flush_seconds > 0:
+        presence_flusher = asyncio.create_task(
+            run_presence_flusher(agent_presence, async_session_maker),
+        )
+    hydration_listener: asyncio.Task[None] | None = None
+    if task_hydration_cache.ttl_seconds > 0:
+        hydration_listener = asyncio.create_task(
+            run_task_hydration_listener(task_hydration_cache),
+        )
     logger.info("app.lifecycle.started")
     try:
         yield
     finally:
+        for background in (presence_flusher, hydration_listener):
+            if background is None:
+                continue
+            background.cancel()
+            with suppress(asyncio.CancelledError):
+                await background
+        await close_souls_directory_client()
+        await readiness_probe.aclose()
+        await dispose_engines()
         logger.info("app.lifecycle.stopped")
+        shutdown_logging()
 
 
 app = MissionControlFastAPI(
@@ -506,19 +534,78 @@ def healthz() -> HealthStatusResponse:
 @app.get(
     "/readyz",
     tags=["health"],
-    response_model=HealthStatusResponse,
+    response_model=ReadinessStatusResponse,
     summary="Readiness Check",
-    description="Readiness probe endpoint for service orchestration checks.",
+    description=(
+        "Readiness probe that checks database, Redis and (optionally) gateway reachability. "
+        "Redis is reported but does not fail the probe. Results are cached for a few seconds."
+    ),
     responses={
         status.HTTP_200_OK: {
             "description": "Service is ready.",
-            "content": {"application/json": {"example": {"ok": True}}},
-        }
+            "content": {
+                "application/json": {
+                    "example": {
+                        "ok": True,
+                        "checks": {
+                            "database": {
+                                "ok": True,
+                                "latency_ms": 1.8,
+                                "error": None,
+                                "critical": True,
+                            },
+                            "redis": {
+                                "ok": True,
+                                "latency_ms": 0.6,
+                                "error": None,
+                                "critical": False,
+                            },
+                        },
+                        "age_seconds": 0.0,
+                    },
+                },
+            },
+        },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "description": "At least one critical dependency check failed.",
+            "model": ReadinessStatusResponse,
+        },
     },
 )
-def readyz() -> HealthStatusResponse:
+async def readyz(response: Response) -> ReadinessStatusResponse:
     """Readiness probe endpoint for service orchestration checks."""
-    return HealthStatusResponse(ok=True)
+    report = await readiness_probe.report()
+    if not report.ok:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessStatusResponse(
+        ok=report.ok,
+        checks={
+            name: ReadinessCheckResult(
+                ok=result.ok,
+                latency_ms=result.latency_ms,
+                error=result.error,
+                critical=result.critical,
+            )
+            for name, result in report.checks.items()
+        },
+        age_seconds=round(time.monotonic() - report.checked_at, 3),
+    )
+
+
+@app.get("/metrics", include_in_schema=False, response_class=PlainTextResponse)
+def prometheus_metrics() -> PlainTextResponse:
+    """Expose per-route latency and SQL usage in Prometheus text format."""
+    if not settings.metrics_enabled:
+        return PlainTextResponse("", status_code=status.HTTP_404_NOT_FOUND)
+    body = metrics_registry.render_prometheus(
+        extra_counters={
+            "app_log_records_dropped_total": (
+                "Log records dropped because the log queue was full.",
+                AppLogger.dropped_records(),
+            ),
+        },
+    )
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
 
 
 api_v1 = APIRouter(prefix="/api/v1")
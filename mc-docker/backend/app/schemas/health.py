@@ -17,6 +17,43 @@ class HealthStatusResponse(SQLModel):
     )
 
 
+class ReadinessCheckResult(SQLModel):
+    """Outcome of one dependency check in the readiness probe."""
+
+    ok: bool = Field(
+        description="Whether the dependency answered within the check timeout.",
+        examples=[True],
+    )
+    latency_ms: float = Field(
+        description="Time spent on the check in milliseconds.",
+        examples=[1.8],
+    )
+    error: str | None = Field(
+        default=None,
+        description="Failure reason when the check did not pass.",
+        examples=["timed out after 1s"],
+    )
+    critical: bool = Field(
+        default=True,
+        description="Whether a failure of this check makes the service unready.",
+        examples=[True],
+    )
+
+
+class ReadinessStatusResponse(HealthStatusResponse):
+    """Readiness payload with per-dependency results."""
+
+    checks: dict[str, ReadinessCheckResult] = Field(
+        default_factory=dict,
+        description="Per-dependency results keyed by check name (`database`, `redis`, ...).",
+    )
+    age_seconds: float = Field(
+        default=0.0,
+        description="Age of the cached result; checks rerun after `READINESS_CACHE_SECONDS`.",
+        examples=[1.2],
+    )
+
+
 class AgentHealthStatusResponse(HealthStatusResponse):
     """Agent-authenticated liveness payload for agent route probes."""
 
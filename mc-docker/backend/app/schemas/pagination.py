@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from fastapi import Query
 from fastapi_pagination.customization import CustomizedPage, UseParamsFields
 from fastapi_pagination.limit_offset import LimitOffsetPage
+from pydantic import BaseModel, Field
 
 T = TypeVar("T")
 
@@ -26,3 +28,20 @@ else:
             offset=Query(0, ge=0),
         ),
     ]
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """List page supporting both offset and opaque keyset (cursor) pagination.
+
+    Offset requests keep the `LimitOffsetPage` shape (exact `total`). Cursor
+    requests skip the count unless asked, in which case `total` may be a planner
+    estimate (`total_is_estimate`). `next_cursor` is set whenever another page
+    exists and can be passed back as `cursor` in either mode.
+    """
+
+    items: Sequence[T]
+    total: int | None = Field(default=None, ge=0)
+    limit: int = Field(ge=1)
+    offset: int = Field(default=0, ge=0)
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
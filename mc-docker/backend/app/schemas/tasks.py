@@ -15,6 +15,7 @@ from app.schemas.task_custom_fields import TaskCustomFieldValues
 
 TaskStatus = Literal["inbox", "in_progress", "review", "done"]
 STATUS_REQUIRED_ERROR = "status is required"
+TASK_BULK_MAX_ITEMS = 200
 # Keep these symbols as runtime globals so Pydantic can resolve
 # deferred annotations reliably.
 RUNTIME_ANNOTATION_TYPES = (datetime, UUID, NonEmptyStr, TagRef)
@@ -87,6 +88,80 @@ class TaskRead(TaskBase):
     custom_field_values: TaskCustomFieldValues | None = None
 
 
+class TaskBulkCreate(TaskCreate):
+    """One task to create in a bulk request."""
+
+    ref: NonEmptyStr | None = Field(
+        default=None,
+        description="Client key other items in the same request can depend on.",
+    )
+    depends_on_refs: list[str] = Field(
+        default_factory=list,
+        description="`ref` values of tasks created in the same request.",
+    )
+
+
+class TaskBulkUpdate(SQLModel):
+    """Planning edits for one existing task in a bulk request.
+
+    Status transitions and comments stay on the single-task endpoint, which
+    applies the review and approval rules.
+    """
+
+    id: UUID
+    title: NonEmptyStr | None = None
+    description: str | None = None
+    priority: NonEmptyStr | None = None
+    due_at: datetime | None = None
+    assigned_agent_id: UUID | None = None
+    depends_on_task_ids: list[UUID] | None = None
+    depends_on_refs: list[str] | None = None
+    tag_ids: list[UUID] | None = None
+
+    @model_validator(mode="after")
+    def validate_required_fields(self) -> Self:
+        """Ensure explicitly supplied title and priority are not null."""
+        for name in ("title", "priority"):
+            if name in self.model_fields_set and getattr(self, name) is None:
+                raise ValueError(f"{name} cannot be null")
+        return self
+
+
+class TaskBulkRequest(SQLModel):
+    """Tasks to create and update in one transaction."""
+
+    create: list[TaskBulkCreate] = Field(default_factory=list, max_length=TASK_BULK_MAX_ITEMS)
+    update: list[TaskBulkUpdate] = Field(default_factory=list, max_length=TASK_BULK_MAX_ITEMS)
+
+    @model_validator(mode="after")
+    def validate_items(self) -> Self:
+        """Require at least one item, unique refs and ids, and known ref targets."""
+        if not self.create and not self.update:
+            raise ValueError("create or update must contain at least one task")
+        refs = [item.ref for item in self.create if item.ref is not None]
+        if len(refs) != len(set(refs)):
+            raise ValueError("ref values must be unique")
+        update_ids = [item.id for item in self.update]
+        if len(update_ids) != len(set(update_ids)):
+            raise ValueError("update ids must be unique")
+        known_refs = set(refs)
+        for depends_on_refs in [
+            *(item.depends_on_refs for item in self.create),
+            *(item.depends_on_refs or [] for item in self.update),
+        ]:
+            unknown = sorted(set(depends_on_refs) - known_refs)
+            if unknown:
+                raise ValueError(f"unknown depends_on_refs: {', '.join(unknown)}")
+        return self
+
+
+class TaskBulkRead(SQLModel):
+    """Tasks created and updated by a bulk request, in request order."""
+
+    created: list[TaskRead] = Field(default_factory=list)
+    updated: list[TaskRead] = Field(default_factory=list)
+
+
 class TaskCommentCreate(SQLModel):
     """Payload for creating a task comment."""
 
@@ -0,0 +1,339 @@
+"""Redis-backed agent presence with batched write-behind to Postgres.
+
+Heartbeats and authenticated agent requests that leave an agent's status
+unchanged only move `last_seen_at` forward. Rather than a write transaction per
+touch, those updates are recorded in Redis:
+
+- `mc:agent-presence:last-seen` (sorted set, score = epoch seconds) is the fast
+  read path overlaid onto agent rows loaded from the database.
+- `mc:agent-presence:pending` (hash) holds touches not yet persisted; the
+  flusher drains it into one `UPDATE agents ... FROM (VALUES ...)` every
+  `AGENT_PRESENCE_FLUSH_SECONDS`.
+- `mc:agent-presence:heartbeats` (hash) holds the latest buffered heartbeat per
+  agent; the same flush writes one `agent.heartbeat` activity row for each, so
+  activity consumers still see heartbeats, at most one per agent per flush.
+
+Redis is an optimization, not the source of truth: when it is unreachable the
+store reports itself unavailable for a short backoff window, callers write
+presence straight to the database, and reads use database values.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, cast
+from uuid import UUID, uuid4
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError, ResponseError
+from sqlalchemy import DateTime, Uuid, bindparam, column, or_, update, values
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import SQLModel, col, select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+
+LAST_SEEN_KEY = "mc:agent-presence:last-seen"
+PENDING_KEY = "mc:agent-presence:pending"
+HEARTBEATS_KEY = "mc:agent-presence:heartbeats"
+REDIS_BACKOFF_SECONDS = 30.0
+REDIS_TIMEOUT_SECONDS = 1.0
+# Fast-store entries older than this are already persisted and can be trimmed.
+LAST_SEEN_RETENTION = timedelta(days=1)
+# Orphaned in-flight batches (flusher crashed mid-write) expire on their own.
+PROCESSING_TTL_SECONDS = 3600
+
+
+def _to_score(value: datetime) -> float:
+    return value.replace(tzinfo=UTC).timestamp()
+
+
+def _from_score(score: float) -> datetime:
+    return datetime.fromtimestamp(score, UTC).replace(tzinfo=None)
+
+
+class AgentPresenceStore:
+    """Fast presence store with a Postgres write-behind flush."""
+
+    def __init__(
+        self,
+        client: aioredis.Redis | None = None,
+        *,
+        flush_seconds: float | None = None,
+    ) -> None:
+        self._client = client
+        self._flush_seconds = flush_seconds
+        self._unavailable_until = 0.0
+
+    @property
+    def flush_seconds(self) -> float:
+        """Interval between write-behind flushes; 0 disables the fast store."""
+        if self._flush_seconds is not None:
+            return self._flush_seconds
+        return settings.agent_presence_flush_seconds
+
+    @property
+    def available(self) -> bool:
+        """Whether presence touches should go to Redis instead of the database."""
+        return self.flush_seconds > 0 and time.monotonic() >= self._unavailable_until
+
+    def _redis(self) -> aioredis.Redis:
+        if self._client is None:
+            self._client = aioredis.Redis.from_url(
+                settings.rq_redis_url,
+                socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+                socket_timeout=REDIS_TIMEOUT_SECONDS,
+            )
+        return self._client
+
+    def _mark_unavailable(self, action: str, exc: Exception) -> None:
+        self._unavailable_until = time.monotonic() + REDIS_BACKOFF_SECONDS
+        logger.warning(
+            "agent_presence.redis_unavailable action=%s backoff_s=%s error=%s",
+            action,
+            REDIS_BACKOFF_SECONDS,
+            exc,
+        )
+
+    async def record(self, agent_id: UUID, seen_at: datetime, *, heartbeat: bool = False) -> bool:
+        """Buffer a presence touch; return False when the caller must persist it.
+
+        Heartbeats are also queued for an `agent.heartbeat` activity row.
+        """
+        if not self.available:
+            return False
+        score = _to_score(seen_at)
+        try:
+            async with self._redis().pipeline(transaction=False) as pipe:
+                pipe.zadd(LAST_SEEN_KEY, {str(agent_id): score}, gt=True)
+                pipe.hset(PENDING_KEY, str(agent_id), str(score))
+                if heartbeat:
+                    pipe.hset(HEARTBEATS_KEY, str(agent_id), str(score))
+                await pipe.execute()
+        except RedisError as exc:
+            self._mark_unavailable("record", exc)
+            return False
+        return True
+
+    async def last_seen(self, agent_ids: Iterable[UUID]) -> dict[UUID, datetime]:
+        """Return buffered last-seen timestamps for the given agents."""
+        ids = list(dict.fromkeys(agent_ids))
+        if not ids or not self.available:
+            return {}
+        try:
+            scores = await self._redis().zmscore(
+                LAST_SEEN_KEY,
+                [str(agent_id) for agent_id in ids],
+            )
+        except RedisError as exc:
+            self._mark_unavailable("last_seen", exc)
+            return {}
+        return {
+            agent_id: _from_score(float(score))
+            for agent_id, score in zip(ids, scores, strict=True)
+            if score is not None
+        }
+
+    async def seen_between(self, start: datetime, end: datetime) -> set[UUID]:
+        """Return agents whose buffered last-seen time falls within [start, end]."""
+        if not self.available:
+            return set()
+        try:
+            members = await self._redis().zrangebyscore(
+                LAST_SEEN_KEY,
+                _to_score(start),
+                _to_score(end),
+            )
+        except RedisError as exc:
+            self._mark_unavailable("seen_between", exc)
+            return set()
+        return {
+            UUID(member.decode() if isinstance(member, bytes) else str(member))
+            for member in members
+        }
+
+    async def overlay(self, agents: Sequence[Agent]) -> None:
+        """Advance `last_seen_at` on loaded agents to any fresher buffered value.
+
+        Values are applied as committed state so read paths never turn the
+        overlay into an accidental write.
+        """
+        buffered = await self.last_seen(agent.id for agent in agents)
+        for agent in agents:
+            seen_at = buffered.get(agent.id)
+            if seen_at is not None and (agent.last_seen_at is None or seen_at > agent.last_seen_at):
+                set_committed_value(agent, "last_seen_at", seen_at)
+
+    async def flush(self, session: AsyncSession) -> int:
+        """Persist pending touches and heartbeats in one transaction; return touches submitted."""
+        if self.flush_seconds <= 0:
+            return 0
+        client = self._redis()
+        try:
+            pending = await _take(client, PENDING_KEY)
+            beats = await _take(client, HEARTBEATS_KEY)
+        except RedisError as exc:
+            self._mark_unavailable("flush", exc)
+            return 0
+        batches = dict(batch for batch in (pending, beats) if batch is not None)
+        rows = _decode(pending[1]) if pending else []
+        heartbeats = _decode(beats[1]) if beats else []
+        if rows or heartbeats:
+            try:
+                if rows:
+                    await _persist(session, rows)
+                if heartbeats:
+                    await _record_heartbeats(session, heartbeats)
+                await session.commit()
+            except SQLAlchemyError:
+                await session.rollback()
+                logger.exception(
+                    "agent_presence.flush_failed count=%s heartbeats=%s",
+                    len(rows),
+                    len(heartbeats),
+                )
+                await self._restore(batches)
+                return 0
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for processing_key in batches:
+                    pipe.delete(processing_key)
+                pipe.zremrangebyscore(
+                    LAST_SEEN_KEY,
+                    "-inf",
+                    time.time() - LAST_SEEN_RETENTION.total_seconds(),
+                )
+                await pipe.execute()
+        except RedisError as exc:
+            self._mark_unavailable("flush_cleanup", exc)
+        return len(rows)
+
+    async def _restore(self, batches: dict[str, dict[bytes, bytes]]) -> None:
+        # Put the batches back without clobbering entries recorded since the rename.
+        try:
+            async with self._redis().pipeline(transaction=False) as pipe:
+                for processing_key, raw in batches.items():
+                    live_key = processing_key.rsplit(":", 1)[0]
+                    for key, value in raw.items():
+                        pipe.hsetnx(live_key, key, value)
+                    pipe.delete(processing_key)
+                await pipe.execute()
+        except RedisError as exc:
+            self._mark_unavailable("flush_restore", exc)
+
+
+async def _take(client: aioredis.Redis, key: str) -> tuple[str, dict[bytes, bytes]] | None:
+    """Move `key` aside and return (processing key, contents), or None when it is empty."""
+    processing_key = f"{key}:{uuid4().hex}"
+    try:
+        # RENAME is atomic, so concurrent flushers on other replicas each take a
+        # disjoint batch and entries arriving now start a new hash.
+        await client.rename(key, processing_key)
+    except ResponseError:
+        return None
+    await client.expire(processing_key, PROCESSING_TTL_SECONDS)
+    return processing_key, cast(dict[bytes, bytes], await client.hgetall(processing_key))
+
+
+def _decode(raw: dict[bytes, bytes]) -> list[tuple[UUID, datetime]]:
+    return [(UUID(key.decode()), _from_score(float(value))) for key, value in raw.items()]
+
+
+async def _record_heartbeats(session: AsyncSession, rows: list[tuple[UUID, datetime]]) -> None:
+    # Same row the direct heartbeat path writes, timestamped when it was received.
+    names = dict(
+        (
+            await session.exec(
+                select(col(Agent.id), col(Agent.name)).where(
+                    col(Agent.id).in_([agent_id for agent_id, _ in rows]),
+                ),
+            )
+        ).all(),
+    )
+    session.add_all(
+        [
+            ActivityEvent(
+                event_type="agent.heartbeat",
+                message=f"Heartbeat received from {names[agent_id]}.",
+                agent_id=agent_id,
+                created_at=seen_at,
+            )
+            for agent_id, seen_at in rows
+            if agent_id in names
+        ],
+    )
+
+
+async def _persist(session: AsyncSession, rows: list[tuple[UUID, datetime]]) -> None:
+    table = SQLModel.metadata.tables[str(Agent.__tablename__)]
+    conn = await session.connection()
+    if conn.dialect.name == "postgresql":
+        presence = values(
+            column("id", Uuid()),
+            column("last_seen_at", DateTime()),
+            name="presence",
+        ).data(rows)
+        await conn.execute(
+            update(table)
+            .where(table.c.id == presence.c.id)
+            .where(
+                or_(
+                    table.c.last_seen_at.is_(None),
+                    table.c.last_seen_at < presence.c.last_seen_at,
+                ),
+            )
+            .values(last_seen_at=presence.c.last_seen_at),
+        )
+        return
+    # Dialects without `UPDATE ... FROM (VALUES ...)` (SQLite) get one
+    # executemany statement in the same single transaction.
+    await conn.execute(
+        update(table)
+        .where(table.c.id == bindparam("agent_id"))
+        .where(
+            or_(
+                table.c.last_seen_at.is_(None),
+                table.c.last_seen_at < bindparam("seen_at"),
+            ),
+        )
+        .values(last_seen_at=bindparam("seen_at")),
+        [{"agent_id": agent_id, "seen_at": seen_at} for agent_id, seen_at in rows],
+    )
+
+
+async def run_presence_flusher(
+    store: AgentPresenceStore,
+    session_maker: async_sessionmaker[Any],
+) -> None:
+    """Flush buffered presence every `flush_seconds` until cancelled."""
+    try:
+        while True:
+            await asyncio.sleep(store.flush_seconds)
+            try:
+                async with session_maker() as session:
+                    await store.flush(session)
+            except Exception:
+                logger.exception("agent_presence.flush_loop_failed")
+    finally:
+        # Persist whatever is buffered so a clean shutdown loses no touches.
+        try:
+            async with session_maker() as session:
+                await store.flush(session)
+        except Exception:
+            logger.exception("agent_presence.final_flush_failed")
+
+
+agent_presence = AgentPresenceStore()
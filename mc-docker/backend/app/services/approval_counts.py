@@ -0,0 +1,165 @@
+"""Cached per-board approval aggregates shared by approval stream subscribers.
+
+Pending totals and per-task approval counts are loaded once per board and then
+adjusted in place when approvals are created or resolved through the API, so
+stream subscribers do not re-run aggregate queries for every emitted event.
+Entries expire after a short TTL to reconcile changes made by other replicas or
+by cascade deletes that bypass the approval endpoints.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from sqlalchemy import func
+from sqlmodel import col, select
+
+from app.models.approvals import Approval
+from app.services.approval_task_links import task_counts_for_board
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+APPROVAL_COUNTS_TTL_SECONDS = 30.0
+PENDING_STATUS = "pending"
+
+
+@dataclass(slots=True)
+class _BoardApprovalCounts:
+    pending: int
+    loaded_at: float
+    by_task: dict[UUID, tuple[int, int]] = field(default_factory=dict)
+
+
+class ApprovalCountsCache:
+    """In-process aggregate cache keyed by board id."""
+
+    def __init__(self, ttl_seconds: float = APPROVAL_COUNTS_TTL_SECONDS) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._boards: dict[UUID, _BoardApprovalCounts] = {}
+        # Bumped on every local mutation so loads that raced a write are not cached.
+        self._versions: dict[UUID, int] = {}
+
+    def _fresh_entry(self, board_id: UUID) -> _BoardApprovalCounts | None:
+        entry = self._boards.get(board_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.loaded_at >= self._ttl_seconds:
+            del self._boards[board_id]
+            return None
+        return entry
+
+    async def pending_count(self, session: AsyncSession, *, board_id: UUID) -> int:
+        """Return the number of pending approvals on a board."""
+        entry = self._fresh_entry(board_id)
+        if entry is not None:
+            return entry.pending
+        version = self._versions.get(board_id, 0)
+        pending = int(
+            (
+                await session.exec(
+                    select(func.count(col(Approval.id)))
+                    .where(col(Approval.board_id) == board_id)
+                    .where(col(Approval.status) == PENDING_STATUS),
+                )
+            ).one(),
+        )
+        if self._versions.get(board_id, 0) == version:
+            self._boards[board_id] = _BoardApprovalCounts(
+                pending=pending,
+                loaded_at=time.monotonic(),
+            )
+        return pending
+
+    async def task_counts(
+        self,
+        session: AsyncSession,
+        *,
+        board_id: UUID,
+        task_ids: set[UUID],
+    ) -> dict[UUID, tuple[int, int]]:
+        """Return `(total, pending)` approval counts for the requested tasks."""
+        if not task_ids:
+            return {}
+        entry = self._fresh_entry(board_id)
+        known = entry.by_task if entry is not None else {}
+        missing = {task_id for task_id in task_ids if task_id not in known}
+        loaded: dict[UUID, tuple[int, int]] = {}
+        if missing:
+            version = self._versions.get(board_id, 0)
+            loaded = await task_counts_for_board(session, board_id=board_id, task_ids=missing)
+            # Tasks without approvals are cached as zero so they are not re-queried.
+            loaded = {task_id: loaded.get(task_id, (0, 0)) for task_id in missing}
+            current = self._fresh_entry(board_id)
+            if current is not None and self._versions.get(board_id, 0) == version:
+                current.by_task.update(loaded)
+        return {
+            task_id: counts
+            for task_id in task_ids
+            if (counts := known.get(task_id) or loaded.get(task_id)) is not None and counts[0] > 0
+        }
+
+    def _apply(
+        self,
+        board_id: UUID,
+        *,
+        task_ids: Iterable[UUID],
+        total_delta: int,
+        pending_delta: int,
+    ) -> None:
+        self._versions[board_id] = self._versions.get(board_id, 0) + 1
+        entry = self._fresh_entry(board_id)
+        if entry is None:
+            return
+        entry.pending = max(0, entry.pending + pending_delta)
+        for task_id in task_ids:
+            counts = entry.by_task.get(task_id)
+            if counts is None:
+                continue
+            total, pending = counts
+            entry.by_task[task_id] = (
+                max(0, total + total_delta),
+                max(0, pending + pending_delta),
+            )
+
+    def record_created(
+        self,
+        board_id: UUID,
+        *,
+        task_ids: Iterable[UUID],
+        status: str,
+    ) -> None:
+        """Account for a newly committed approval."""
+        self._apply(
+            board_id,
+            task_ids=task_ids,
+            total_delta=1,
+            pending_delta=1 if status == PENDING_STATUS else 0,
+        )
+
+    def record_status_change(
+        self,
+        board_id: UUID,
+        *,
+        task_ids: Iterable[UUID],
+        prior_status: str,
+        status: str,
+    ) -> None:
+        """Account for a committed approval status transition."""
+        pending_delta = int(status == PENDING_STATUS) - int(prior_status == PENDING_STATUS)
+        if pending_delta == 0:
+            return
+        self._apply(board_id, task_ids=task_ids, total_delta=0, pending_delta=pending_delta)
+
+    def invalidate(self, board_id: UUID) -> None:
+        """Drop cached aggregates for a board."""
+        self._versions[board_id] = self._versions.get(board_id, 0) + 1
+        self._boards.pop(board_id, None)
+
+
+approval_counts_cache = ApprovalCountsCache()
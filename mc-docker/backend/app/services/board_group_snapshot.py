@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 from collections import defaultdict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from sqlalchemy import case, func
@@ -22,9 +23,11 @@ from app.schemas.view_models import (
     BoardGroupTaskSummary,
 )
 from app.services.tags import TagState, load_tag_state
+from app.services.task_counts import task_counts_cache
 
 if TYPE_CHECKING:
     from sqlalchemy.sql.elements import ColumnElement
+    from sqlmodel.sql.expression import Select
 
 _STATUS_ORDER = {"in_progress": 0, "review": 1, "inbox": 2, "done": 3}
 _PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
@@ -60,42 +63,41 @@ async def _boards_for_group(
     )
 
 
-async def _task_counts_by_board(
-    session: AsyncSession,
-    board_ids: list[UUID],
-) -> dict[UUID, dict[str, int]]:
-    """Return per-board task counts keyed by task status."""
-    task_counts: dict[UUID, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    for board_id, status_value, total in list(
-        await session.exec(
-            select(col(Task.board_id), col(Task.status), func.count(col(Task.id)))
-            .where(col(Task.board_id).in_(board_ids))
-            .group_by(col(Task.board_id), col(Task.status)),
-        ),
-    ):
-        if board_id is None:
-            continue
-        task_counts[board_id][str(status_value)] = int(total or 0)
-    return task_counts
-
-
 async def _ordered_tasks_for_boards(
     session: AsyncSession,
     board_ids: list[UUID],
     *,
     include_done: bool,
+    per_board_task_limit: int,
 ) -> list[Task]:
-    """Return sorted tasks for boards, optionally excluding completed tasks."""
-    task_statement = select(Task).where(col(Task.board_id).in_(board_ids))
-    if not include_done:
-        task_statement = task_statement.where(col(Task.status) != "done")
-    task_statement = task_statement.order_by(
-        col(Task.board_id).asc(),
+    """Return the top tasks of each board in display order.
+
+    Rows are ranked per board in SQL so only `per_board_task_limit` tasks per
+    board are loaded, however large the boards are.
+    """
+    if per_board_task_limit <= 0:
+        return []
+    ordering = (
         _status_weight_expr().asc(),
         _priority_weight_expr().asc(),
         col(Task.updated_at).desc(),
         col(Task.created_at).desc(),
     )
+    ranked: Select[Any] = select(
+        col(Task.id).label("task_id"),
+        func.row_number()
+        .over(partition_by=col(Task.board_id), order_by=ordering)
+        .label("board_rank"),
+    ).where(col(Task.board_id).in_(board_ids))
+    if not include_done:
+        ranked = ranked.where(col(Task.status) != "done")
+    ranked_subquery = ranked.subquery()
+    task_statement = (
+        select(Task)
+        .join(ranked_subquery, ranked_subquery.c.task_id == col(Task.id))
+        .where(ranked_subquery.c.board_rank <= per_board_task_limit)
+        .order_by(col(Task.board_id).asc(), ranked_subquery.c.board_rank.asc())
+    )
     return list(await session.exec(task_statement))
 
 
@@ -184,11 +186,12 @@ async def build_group_snapshot(
         )
     boards_by_id = {board.id: board for board in boards}
     board_ids = list(boards_by_id.keys())
-    task_counts = await _task_counts_by_board(session, board_ids)
+    task_counts = await task_counts_cache.counts_by_board(session, board_ids)
     tasks = await _ordered_tasks_for_boards(
         session,
         board_ids,
         include_done=include_done,
+        per_board_task_limit=per_board_task_limit,
     )
     agent_name_by_id = await _agent_names(session, tasks)
     tag_state_by_task_id = await load_tag_state(
@@ -216,6 +219,12 @@ async def build_group_snapshot(
     )
 
 
+def snapshot_etag(snapshot: BoardGroupSnapshot) -> str:
+    """Return a strong ETag for the serialized snapshot."""
+    digest = hashlib.sha256(snapshot.model_dump_json().encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
 async def build_board_group_snapshot(
     session: AsyncSession,
     *,
@@ -15,6 +15,7 @@ from app.schemas.approvals import ApprovalRead
 from app.schemas.board_memory import BoardMemoryRead
 from app.schemas.boards import BoardRead
 from app.schemas.view_models import BoardSnapshot, TaskCardRead
+from app.services.agent_presence import agent_presence
 from app.services.approval_task_links import load_task_ids_by_approval, task_counts_for_board
 from app.services.openclaw.provisioning_db import AgentLifecycleService
 from app.services.tags import TagState, load_tag_state
@@ -121,6 +122,7 @@ async def build_board_snapshot(session: AsyncSession, board: Board) -> BoardSnap
         .order_by(col(Agent.created_at).desc())
         .all(session)
     )
+    await agent_presence.overlay(agents)
     agent_reads = [
         AgentLifecycleService.to_agent_read(AgentLifecycleService.with_computed_status(agent))
         for agent in agents
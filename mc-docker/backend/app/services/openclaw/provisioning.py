@@ -7,14 +7,24 @@ DB-backed workflows (template sync, lead-agent record creation) live in
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+    select_autoescape,
+)
 
 from app.core.config import settings
 from app.models.agents import Agent
@@ -65,6 +75,8 @@ class ProvisionOptions:
 
 
 _ROLE_SOUL_MAX_CHARS = 24_000
+_OVERRIDE_TEMPLATE_CACHE_SIZE = 256
+_WORKSPACE_FILE_DIGEST_CACHE_SIZE = 50_000
 _ROLE_SOUL_WORD_RE = re.compile(r"[a-z0-9]+")
 
 
@@ -130,16 +142,67 @@ def _channel_heartbeat_visibility_patch(config_data: dict[str, Any]) -> dict[str
     return {"defaults": {"heartbeat": merged}}
 
 
+@lru_cache(maxsize=1)
 def _template_env() -> Environment:
+    """Return the process-wide template environment.
+
+    Compiled templates are reused across renders; the bytecode cache lets new worker
+    processes skip recompiling unchanged templates. Outside dev, templates ship with
+    the image, so per-render freshness checks are disabled.
+    """
     return Environment(
         loader=FileSystemLoader(_templates_root()),
         # Render markdown verbatim (HTML escaping makes it harder for agents to read).
         autoescape=select_autoescape(default=False),
         undefined=StrictUndefined,
         keep_trailing_newline=True,
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=settings.environment == "dev",
     )
 
 
+@lru_cache(maxsize=1)
+def _shipped_template_manifest() -> frozenset[str]:
+    return frozenset(_template_env().list_templates())
+
+
+def _template_manifest() -> frozenset[str]:
+    """Return the names of all templates in the templates directory.
+
+    The listing is cached unless the environment auto-reloads (dev), where
+    templates added while the process runs must be picked up.
+    """
+    env = _template_env()
+    if env.auto_reload:
+        return frozenset(env.list_templates())
+    return _shipped_template_manifest()
+
+
+# Compiled agent-level overrides keyed by the SHA-256 of their source, LRU-evicted.
+_override_templates: OrderedDict[str, Template] = OrderedDict()
+
+
+def _override_template(source: str) -> Template:
+    """Compile an agent-level template override, reusing compiled content by hash."""
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    template = _override_templates.get(digest)
+    if template is not None:
+        _override_templates.move_to_end(digest)
+        return template
+    template = _template_env().from_string(source)
+    _override_templates[digest] = template
+    while len(_override_templates) > _OVERRIDE_TEMPLATE_CACHE_SIZE:
+        _override_templates.popitem(last=False)
+    return template
+
+
+def _manifest_template(env: Environment, template_name: str) -> Template:
+    if template_name not in _template_manifest():
+        msg = f"Missing template file: {template_name}"
+        raise FileNotFoundError(msg)
+    return env.get_template(template_name)
+
+
 def _heartbeat_template_name(agent: Agent) -> str:
     return HEARTBEAT_LEAD_TEMPLATE if agent.is_board_lead else HEARTBEAT_AGENT_TEMPLATE
 
@@ -410,15 +473,11 @@ def _render_agent_files(
                 if template_overrides and name in template_overrides
                 else _heartbeat_template_name(agent)
             )
-            heartbeat_path = _templates_root() / heartbeat_template
-            if not heartbeat_path.exists():
-                msg = f"Missing template file: {heartbeat_template}"
-                raise FileNotFoundError(msg)
-            rendered[name] = env.get_template(heartbeat_template).render(**context).strip()
+            rendered[name] = _manifest_template(env, heartbeat_template).render(**context).strip()
             continue
         override = overrides.get(name)
         if override:
-            rendered[name] = env.from_string(override).render(**context).strip()
+            rendered[name] = _override_template(override).render(**context).strip()
             continue
         template_name = (
             template_overrides[name] if template_overrides and name in template_overrides else name
@@ -426,11 +485,7 @@ def _render_agent_files(
         if template_name == "SOUL.md":
             # Use shared Jinja soul template as the default implementation.
             template_name = "BOARD_SOUL.md.j2"
-        path = _templates_root() / template_name
-        if not path.exists():
-            msg = f"Missing template file: {template_name}"
-            raise FileNotFoundError(msg)
-        rendered[name] = env.get_template(template_name).render(**context).strip()
+        rendered[name] = _manifest_template(env, template_name).render(**context).strip()
     return rendered
 
 
@@ -681,6 +736,55 @@ def _updated_agent_list(
     return new_list
 
 
+def _content_digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class WorkspaceFileDigests:
+    """Bounded record of content last written per (gateway, agent, file).
+
+    A write is only skipped when the recorded digest matches the rendered content
+    and the gateway still reports the file with the byte size we wrote, so files
+    edited or reset on the gateway side are rewritten.
+    """
+
+    def __init__(self, max_entries: int = _WORKSPACE_FILE_DIGEST_CACHE_SIZE) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str, str], tuple[str, int]] = OrderedDict()
+
+    def is_current(
+        self,
+        key: tuple[str, str, str],
+        *,
+        content: str,
+        gateway_entry: dict[str, Any] | None,
+    ) -> bool:
+        recorded = self._entries.get(key)
+        if recorded is None or not gateway_entry or bool(gateway_entry.get("missing")):
+            return False
+        digest, size = recorded
+        reported_size = gateway_entry.get("size")
+        if not isinstance(reported_size, int) or reported_size != size:
+            return False
+        return digest == _content_digest(content)
+
+    def record(self, key: tuple[str, str, str], *, content: str) -> None:
+        self._entries[key] = (_content_digest(content), len(content.encode("utf-8")))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: tuple[str, str, str]) -> None:
+        self._entries.pop(key, None)
+
+    def discard_agent(self, gateway_id: str, agent_id: str) -> None:
+        for key in [k for k in self._entries if k[0] == gateway_id and k[1] == agent_id]:
+            del self._entries[key]
+
+
+_workspace_file_digests = WorkspaceFileDigests()
+
+
 class BaseAgentLifecycleManager(ABC):
     """Base class for scalable board/main agent lifecycle managers."""
 
@@ -748,6 +852,7 @@ class BaseAgentLifecycleManager(ABC):
         )
         target_file_names = desired_file_names or set(rendered.keys())
         unsupported_names: list[str] = []
+        gateway_id = str(self._gateway.id)
 
         for name, content in rendered.items():
             if content == "":
@@ -759,6 +864,17 @@ class BaseAgentLifecycleManager(ABC):
                 entry = existing_files.get(name)
                 if entry and not bool(entry.get("missing")):
                     continue
+            digest_key = (gateway_id, agent_id, name)
+            if (
+                action == "update"
+                and not overwrite
+                and _workspace_file_digests.is_current(
+                    digest_key,
+                    content=content,
+                    gateway_entry=existing_files.get(name),
+                )
+            ):
+                continue
             try:
                 await self._control_plane.set_agent_file(
                     agent_id=agent_id,
@@ -766,10 +882,12 @@ class BaseAgentLifecycleManager(ABC):
                     content=content,
                 )
             except OpenClawGatewayError as exc:
+                _workspace_file_digests.discard(digest_key)
                 if "unsupported file" in str(exc).lower():
                     unsupported_names.append(name)
                     continue
                 raise
+            _workspace_file_digests.record(digest_key, content=content)
 
         if agent is not None and agent.is_board_lead and unsupported_names:
             unsupported_sorted = ", ".join(sorted(set(unsupported_names)))
@@ -786,6 +904,7 @@ class BaseAgentLifecycleManager(ABC):
             set(existing_files.keys()) & self._stale_file_candidates(agent)
         ) - target_file_names
         for name in sorted(stale_names):
+            _workspace_file_digests.discard((gateway_id, agent_id, name))
             try:
                 await self._control_plane.delete_agent_file(agent_id=agent_id, name=name)
             except OpenClawGatewayError as exc:
@@ -1143,6 +1262,7 @@ class OpenClawGatewayProvisioner:
             agent_gateway_id = GatewayAgentIdentity.openclaw_agent_id(gateway)
         else:
             agent_gateway_id = _agent_key(agent)
+        _workspace_file_digests.discard_agent(str(gateway.id), agent_gateway_id)
         try:
             await control_plane.delete_agent(agent_gateway_id, delete_files=delete_files)
         except OpenClawGatewayError as exc:
@@ -18,6 +18,7 @@ from uuid import UUID, uuid4
 
 from fastapi import HTTPException, Request, status
 from sqlalchemy import asc, func, or_
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import col, select
 from sse_starlette.sse import EventSourceResponse
 
@@ -26,7 +27,7 @@ from app.core.logging import TRACE_LEVEL
 from app.core.time import utcnow
 from app.db import crud
 from app.db.pagination import paginate
-from app.db.session import async_session_maker
+from app.db.session import async_read_session_maker
 from app.models.activity_events import ActivityEvent
 from app.models.agents import Agent
 from app.models.approvals import Approval
@@ -46,6 +47,7 @@ from app.schemas.agents import (
 from app.schemas.common import OkResponse
 from app.schemas.gateways import GatewayTemplatesSyncError, GatewayTemplatesSyncResult
 from app.services.activity_log import record_activity
+from app.services.agent_presence import agent_presence
 from app.services.openclaw.constants import (
     _TOOLS_KV_RE,
     DEFAULT_HEARTBEAT_CONFIG,
@@ -1431,12 +1433,18 @@ class AgentLifecycleService(OpenClawDBService):
         agent: Agent,
         status_value: str | None,
     ) -> AgentRead:
-        if status_value:
-            agent.status = status_value
-        elif agent.status == "provisioning":
-            agent.status = "online"
-        agent.last_seen_at = utcnow()
-        agent.updated_at = utcnow()
+        now = utcnow()
+        next_status = status_value or ("online" if agent.status == "provisioning" else agent.status)
+        routine = next_status == agent.status and not (self.session.new or self.session.dirty)
+        if routine and await agent_presence.record(agent.id, now, heartbeat=True):
+            # Routine heartbeat with nothing else to persist: buffer last_seen and
+            # the agent.heartbeat activity row for the batched presence flush
+            # instead of a write transaction per heartbeat.
+            set_committed_value(agent, "last_seen_at", now)
+            return self.to_agent_read(self.with_computed_status(agent))
+        agent.status = next_status
+        agent.last_seen_at = now
+        agent.updated_at = now
         self.record_heartbeat(self.session, agent)
         self.session.add(agent)
         await self.session.commit()
@@ -1489,8 +1497,9 @@ class AgentLifecycleService(OpenClawDBService):
             )
         statement = statement.order_by(col(Agent.created_at).desc())
 
-        def _transform(items: Sequence[Any]) -> Sequence[Any]:
+        async def _transform(items: Sequence[Any]) -> Sequence[Any]:
             agents = self.coerce_agent_items(items)
+            await agent_presence.overlay(agents)
             return [self.to_agent_read(self.with_computed_status(agent)) for agent in agents]
 
         return await paginate(self.session, statement, transformer=_transform)
@@ -1509,13 +1518,15 @@ class AgentLifecycleService(OpenClawDBService):
         allowed_ids = set(board_ids)
         if board_id is not None:
             OpenClawAuthorizationPolicy.require_board_write_access(allowed=board_id in allowed_ids)
+        # Return the auth/lookup connection to the pool; the stream polls on its own.
+        await self.session.close()
 
         async def event_generator() -> AsyncIterator[dict[str, str]]:
             nonlocal last_seen
             while True:
                 if await request.is_disconnected():
                     break
-                async with async_session_maker() as stream_session:
+                async with async_read_session_maker() as stream_session:
                     stream_service = AgentLifecycleService(stream_session)
                     stream_service.logger = self.logger
                     if board_id is not None:
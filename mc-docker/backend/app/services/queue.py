@@ -16,6 +16,7 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 
 _SCHEDULED_SUFFIX = ":scheduled"
+_DEAD_LETTER_SUFFIX = ":dead"
 _DRY_RUN_BATCH_SIZE = 100
 
 
@@ -48,6 +49,11 @@ def _scheduled_queue_name(queue_name: str) -> str:
     return f"{queue_name}{_SCHEDULED_SUFFIX}"
 
 
+def dead_letter_queue_name(queue_name: str) -> str:
+    """Redis list keeping tasks that ran out of retries or could not be decoded."""
+    return f"{queue_name}{_DEAD_LETTER_SUFFIX}"
+
+
 def _now_seconds() -> float:
     return time.time()
 
@@ -150,6 +156,34 @@ def enqueue_task(
         return False
 
 
+def dead_letter_task(
+    task: QueuedTask,
+    queue_name: str,
+    *,
+    redis_url: str | None = None,
+) -> bool:
+    """Park a task on the queue's dead-letter list for manual inspection or replay."""
+    try:
+        client = _redis_client(redis_url=redis_url)
+        client.lpush(dead_letter_queue_name(queue_name), task.to_json())
+    except Exception as exc:
+        logger.error(
+            "rq.queue.dead_letter_failed",
+            extra={
+                "task_type": task.task_type,
+                "queue_name": queue_name,
+                "task": task.to_json(),
+                "error": str(exc),
+            },
+        )
+        return False
+    logger.warning(
+        "rq.queue.dead_lettered",
+        extra={"task_type": task.task_type, "queue_name": queue_name, "attempts": task.attempts},
+    )
+    return True
+
+
 def _coerce_datetime(raw: object | None) -> datetime:
     if raw is None:
         return datetime.now(UTC)
@@ -199,6 +233,30 @@ def dequeue_task(
     return _decode_task(raw, queue_name)
 
 
+def dequeue_task_batch(
+    queue_name: str,
+    *,
+    count: int,
+    redis_url: str | None = None,
+) -> list[QueuedTask]:
+    """Pop up to `count` task envelopes (oldest first) in one round trip.
+
+    Delayed retries that are due are moved onto the queue first. Envelopes that
+    fail to decode go to the dead-letter list so one bad item does not discard
+    the rest of the batch.
+    """
+    client = _redis_client(redis_url=redis_url)
+    _drain_ready_scheduled_tasks(client, queue_name, max_items=count)
+    raw_items = cast(list[str | bytes] | None, client.rpop(queue_name, count))
+    tasks: list[QueuedTask] = []
+    for raw in raw_items or []:
+        try:
+            tasks.append(_decode_task(raw, queue_name))
+        except Exception:
+            client.lpush(dead_letter_queue_name(queue_name), raw)
+    return tasks
+
+
 def _decode_task(raw: str | bytes, queue_name: str) -> QueuedTask:
     if isinstance(raw, bytes):
         raw = raw.decode("utf-8")
@@ -244,13 +302,18 @@ def requeue_if_failed(
     max_retries: int,
     redis_url: str | None = None,
     delay_seconds: float = 0,
+    dead_letter: bool = False,
 ) -> bool:
     """Requeue a failed task with capped retries.
 
-    Returns True if requeued.
+    Past the cap the task is dropped, or parked on the dead-letter list when
+    `dead_letter` is set. Returns True if requeued.
     """
     requeued_task = _requeue_with_attempt(task)
     if requeued_task.attempts > max_retries:
+        if dead_letter:
+            dead_letter_task(requeued_task, queue_name, redis_url=redis_url)
+            return False
         logger.warning(
             "rq.queue.drop_failed_task",
             extra={
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import random
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
@@ -14,6 +15,7 @@ from app.services.webhooks.dispatch import (
     process_webhook_queue_task,
     requeue_webhook_queue_task,
 )
+from app.services.webhooks.ingest import flush_webhook_ingest_buffer
 from app.services.webhooks.queue import TASK_TYPE as WEBHOOK_TASK_TYPE
 
 logger = get_logger(__name__)
@@ -42,6 +44,26 @@ def _compute_jitter(base_delay: float) -> float:
     return random.uniform(0, min(settings.rq_dispatch_retry_max_seconds / 10, base_delay * 0.1))
 
 
+@dataclass
+class _IngestDrainClock:
+    last_drained: float = float("-inf")
+
+    def due(self) -> bool:
+        elapsed = time.monotonic() - self.last_drained
+        return elapsed >= settings.webhook_ingest_poll_seconds
+
+
+_ingest_drain_clock = _IngestDrainClock()
+
+
+async def _drain_webhook_ingest() -> None:
+    _ingest_drain_clock.last_drained = time.monotonic()
+    try:
+        await flush_webhook_ingest_buffer()
+    except Exception:
+        logger.exception("queue.worker.webhook_ingest_failed")
+
+
 async def flush_queue(*, block: bool = False, block_timeout: float = 0) -> int:
     """Consume one queue batch and dispatch by task type."""
     processed = 0
@@ -103,6 +125,10 @@ async def flush_queue(*, block: bool = False, block_timeout: float = 0) -> int:
                         "attempt": task.attempts,
                     },
                 )
+        # Keep buffered webhook requests flowing while a long delivery backlog
+        # drains, at most once per poll interval rather than after every task.
+        if _ingest_drain_clock.due():
+            await _drain_webhook_ingest()
         await asyncio.sleep(settings.rq_dispatch_throttle_seconds)
 
     if processed > 0:
@@ -112,10 +138,13 @@ async def flush_queue(*, block: bool = False, block_timeout: float = 0) -> int:
 
 async def _run_worker_loop() -> None:
     while True:
+        await _drain_webhook_ingest()
         try:
+            # Wake up periodically so buffered webhook ingest is persisted even
+            # when the delivery queue stays empty.
             await flush_queue(
                 block=True,
-                block_timeout=0,
+                block_timeout=settings.webhook_ingest_poll_seconds,
             )
         except Exception:
             logger.exception(
@@ -0,0 +1,203 @@
+"""Dependency checks backing the `/readyz` readiness probe.
+
+Each check runs with a strict timeout and all checks run concurrently, so a
+probe never takes longer than `READINESS_CHECK_TIMEOUT_SECONDS`. Results are
+cached for `READINESS_CACHE_SECONDS` and concurrent probes share one in-flight
+run, which keeps orchestrator probe traffic from turning into load on the
+dependencies it is checking.
+
+Redis only backs buffering and caches that fall back to the database, so its
+check is reported but does not make the service unready. Failure details are
+logged, never returned from the unauthenticated endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import redis.asyncio as aioredis
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db import session as db_session
+
+logger = get_logger(__name__)
+
+ReadinessCheck = Callable[[], Awaitable[None]]
+_DEFAULT_PORTS = {"ws": 80, "http": 80, "wss": 443, "https": 443}
+NON_CRITICAL_CHECKS = frozenset({"redis"})
+
+
+@dataclass(frozen=True, slots=True)
+class CheckResult:
+    """Outcome of one dependency check."""
+
+    ok: bool
+    latency_ms: float
+    error: str | None = None
+    critical: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class ReadinessReport:
+    """Combined readiness outcome; `ok` only when every critical check passed."""
+
+    ok: bool
+    checks: dict[str, CheckResult]
+    checked_at: float
+
+
+async def _check_database() -> None:
+    async with db_session.async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _check_read_database() -> None:
+    async with db_session.read_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+class _RedisCheck:
+    def __init__(self) -> None:
+        self._client: aioredis.Redis | None = None
+
+    async def __call__(self) -> None:
+        if self._client is None:
+            self._client = aioredis.Redis.from_url(
+                settings.rq_redis_url,
+                socket_connect_timeout=settings.readiness_check_timeout_seconds,
+                socket_timeout=settings.readiness_check_timeout_seconds,
+            )
+        await self._client.ping()
+
+    async def aclose(self) -> None:
+        client = self._client
+        self._client = None
+        if client is not None:
+            await client.aclose()
+
+
+async def _check_gateway() -> None:
+    parts = urlsplit(settings.readiness_gateway_url)
+    if not parts.hostname:
+        raise ValueError("READINESS_GATEWAY_URL has no host")
+    port = parts.port or _DEFAULT_PORTS.get(parts.scheme, 443)
+    _, writer = await asyncio.open_connection(parts.hostname, port)
+    writer.close()
+    await writer.wait_closed()
+
+
+def default_checks() -> dict[str, ReadinessCheck]:
+    """Return the checks configured for this process."""
+    checks: dict[str, ReadinessCheck] = {
+        "database": _check_database,
+        "redis": _RedisCheck(),
+    }
+    if db_session.read_engine is not db_session.async_engine:
+        checks["database_read"] = _check_read_database
+    if settings.readiness_gateway_url:
+        checks["gateway"] = _check_gateway
+    return checks
+
+
+class ReadinessProbe:
+    """Runs dependency checks with timeouts and caches the combined report."""
+
+    def __init__(
+        self,
+        checks: dict[str, ReadinessCheck] | None = None,
+        *,
+        non_critical: frozenset[str] = NON_CRITICAL_CHECKS,
+        timeout_seconds: float | None = None,
+        cache_seconds: float | None = None,
+    ) -> None:
+        self._checks = checks
+        self._non_critical = non_critical
+        self._timeout_seconds = timeout_seconds
+        self._cache_seconds = cache_seconds
+        self._report: ReadinessReport | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def timeout_seconds(self) -> float:
+        """Per-check deadline."""
+        if self._timeout_seconds is not None:
+            return self._timeout_seconds
+        return settings.readiness_check_timeout_seconds
+
+    @property
+    def cache_seconds(self) -> float:
+        """How long a report is reused before checks run again."""
+        if self._cache_seconds is not None:
+            return self._cache_seconds
+        return settings.readiness_cache_seconds
+
+    def _cached(self) -> ReadinessReport | None:
+        report = self._report
+        if report is None or time.monotonic() - report.checked_at >= self.cache_seconds:
+            return None
+        return report
+
+    async def _run_check(self, name: str, check: ReadinessCheck) -> CheckResult:
+        started = time.perf_counter()
+        error: str | None = None
+        try:
+            await asyncio.wait_for(check(), timeout=self.timeout_seconds)
+        except TimeoutError:
+            error = f"timed out after {self.timeout_seconds:g}s"
+            logger.warning("readiness.check_failed check=%s error=%s", name, error)
+        except Exception as exc:
+            # Exception text can carry DSNs and hostnames; keep it in the logs.
+            error = "check failed"
+            logger.warning(
+                "readiness.check_failed check=%s error=%s: %s",
+                name,
+                type(exc).__name__,
+                exc,
+            )
+        latency_ms = round((time.perf_counter() - started) * 1000, 3)
+        return CheckResult(
+            ok=error is None,
+            latency_ms=latency_ms,
+            error=error,
+            critical=name not in self._non_critical,
+        )
+
+    async def report(self) -> ReadinessReport:
+        """Return a fresh-enough readiness report, running checks when needed."""
+        cached = self._cached()
+        if cached is not None:
+            return cached
+        async with self._lock:
+            # Another probe may have refreshed the report while this one waited.
+            cached = self._cached()
+            if cached is not None:
+                return cached
+            if self._checks is None:
+                self._checks = default_checks()
+            names = list(self._checks)
+            results = await asyncio.gather(
+                *(self._run_check(name, self._checks[name]) for name in names),
+            )
+            checks = dict(zip(names, results, strict=True))
+            self._report = ReadinessReport(
+                ok=all(result.ok or not result.critical for result in results),
+                checks=checks,
+                checked_at=time.monotonic(),
+            )
+            return self._report
+
+    async def aclose(self) -> None:
+        """Close clients held by the checks; they reconnect lazily if probed again."""
+        for check in (self._checks or {}).values():
+            close = getattr(check, "aclose", None)
+            if close is not None:
+                await close()
+
+
+readiness_probe = ReadinessProbe()
@@ -1,15 +1,34 @@
-"""Service helpers for querying and caching souls.directory content."""
+"""Service helpers for querying and caching souls.directory content.
+
+All outbound requests share one pooled `httpx.AsyncClient`. Concurrent lookups for
+the same URL are collapsed into a single in-flight request, soul markdown is kept
+in a bounded LRU that is revalidated with `ETag`/`If-Modified-Since`, and both the
+sitemap and markdown are mirrored to an on-disk cache so restarts and offline
+deployments can still resolve souls.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import os
 import re
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from html import unescape
-from typing import Final
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, TypeVar, cast
 
 import httpx
 
+from app.core.config import settings
+from app.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 SOULS_DIRECTORY_BASE_URL: Final[str] = "https://souls.directory"
 SOULS_DIRECTORY_SITEMAP_URL: Final[str] = f"{SOULS_DIRECTORY_BASE_URL}/sitemap.xml"
 
@@ -19,6 +38,19 @@ _LOC_PATTERN: Final[re.Pattern[str]] = re.compile(
     r"<(?:[A-Za-z0-9_]+:)?loc>(.*?)</(?:[A-Za-z0-9_]+:)?loc>",
     flags=re.IGNORECASE | re.DOTALL,
 )
+_USER_AGENT: Final[str] = "openclaw-mission-control/1.0"
+_HTTP_TIMEOUT: Final[httpx.Timeout] = httpx.Timeout(15.0, connect=5.0)
+_HTTP_LIMITS: Final[httpx.Limits] = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=5,
+    keepalive_expiry=30.0,
+)
+_SITEMAP_DISK_FILE: Final[str] = "sitemap.json"
+_SOULS_DISK_DIR: Final[str] = "souls"
+_SITEMAP_REF_FIELDS: Final[int] = 2
+
+logger = get_logger(__name__)
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True, slots=True)
@@ -39,6 +71,22 @@ class SoulRef:
         return f"{SOULS_DIRECTORY_BASE_URL}/api/souls/{self.handle}/{self.slug}.md"
 
 
+@dataclass(frozen=True, slots=True)
+class _CachedSitemap:
+    refs: list[SoulRef]
+    loaded_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedSoul:
+    content: str
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
 def _parse_sitemap_soul_refs(sitemap_xml: str) -> list[SoulRef]:
     """Parse sitemap XML and extract valid souls.directory handle/slug refs."""
     # Extract <loc> values without XML entity expansion.
@@ -60,40 +108,293 @@ def _parse_sitemap_soul_refs(sitemap_xml: str) -> list[SoulRef]:
     return refs
 
 
-_sitemap_cache: dict[str, object] = {
-    "loaded_at": 0.0,
-    "refs": [],
-}
+@dataclass(slots=True)
+class _ClientState:
+    """Process-wide HTTP client, in-flight requests, and in-memory caches."""
+
+    client: httpx.AsyncClient | None = None
+    sitemap: _CachedSitemap | None = None
+    markdown: OrderedDict[str, _CachedSoul] = field(default_factory=OrderedDict)
+    inflight: dict[str, asyncio.Future[object]] = field(default_factory=dict)
+
+
+_state = _ClientState()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled client, creating it on first use."""
+    if _state.client is None or _state.client.is_closed:
+        _state.client = httpx.AsyncClient(
+            timeout=_HTTP_TIMEOUT,
+            limits=_HTTP_LIMITS,
+            headers={"User-Agent": _USER_AGENT},
+        )
+    return _state.client
+
+
+async def close_souls_directory_client() -> None:
+    """Close the shared HTTP client; a new one is created lazily on next use."""
+    client = _state.client
+    _state.client = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+def _clear_memory_caches() -> None:
+    """Drop in-memory sitemap/markdown caches (disk cache is left intact)."""
+    _state.sitemap = None
+    _state.markdown.clear()
+    _state.inflight.clear()
+
+
+async def _single_flight(key: str, factory: Callable[[], Awaitable[_T]]) -> _T:
+    """Run `factory` once per key, sharing its result with concurrent callers."""
+    while (existing := _state.inflight.get(key)) is not None:
+        # `wait` neither cancels the shared fetch when this waiter is cancelled
+        # nor raises the leader's cancellation here.
+        await asyncio.wait({existing})
+        if not existing.cancelled():
+            return cast("_T", existing.result())
+        # The leader was cancelled; loop so one waiter takes over the fetch.
+
+    future: asyncio.Future[object] = asyncio.get_running_loop().create_future()
+    _state.inflight[key] = future
+    try:
+        result = await factory()
+    except Exception as exc:
+        future.set_exception(exc)
+        # Mark retrieved so lone callers do not trigger "exception never retrieved".
+        future.exception()
+        raise
+    except BaseException:
+        # Cancellation belongs to the leader alone; waiters retry instead.
+        future.cancel()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        if _state.inflight.get(key) is future:
+            del _state.inflight[key]
+
+
+def _conditional_headers(etag: str | None, last_modified: str | None) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _cache_dir() -> Path | None:
+    raw = settings.souls_directory_cache_dir.strip()
+    return Path(raw) if raw else None
+
+
+def _soul_disk_path(root: Path, key: str) -> Path:
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return root / _SOULS_DISK_DIR / f"{digest}.json"
+
+
+def _read_disk_json(path: Path) -> dict[str, object] | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("souls_directory.disk_cache.read_failed path=%s", path)
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _write_disk_json(path: Path, payload: dict[str, object]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        # Best effort: a read-only or full disk must not break lookups.
+        logger.warning("souls_directory.disk_cache.write_failed path=%s", path)
+
+
+def _optional_str(value: object) -> str | None:
+    return value if isinstance(value, str) and value else None
+
+
+def _load_sitemap_from_disk() -> _CachedSitemap | None:
+    root = _cache_dir()
+    if root is None:
+        return None
+    payload = _read_disk_json(root / _SITEMAP_DISK_FILE)
+    if payload is None:
+        return None
+    raw_refs = payload.get("refs")
+    loaded_at = payload.get("loaded_at")
+    if not isinstance(raw_refs, list) or not isinstance(loaded_at, (int, float)):
+        return None
+    refs = [
+        SoulRef(handle=item[0], slug=item[1])
+        for item in raw_refs
+        if isinstance(item, list) and len(item) == _SITEMAP_REF_FIELDS
+    ]
+    return _CachedSitemap(
+        refs=refs,
+        loaded_at=float(loaded_at),
+        etag=_optional_str(payload.get("etag")),
+        last_modified=_optional_str(payload.get("last_modified")),
+    )
+
+
+def _store_sitemap(entry: _CachedSitemap) -> None:
+    _state.sitemap = entry
+    root = _cache_dir()
+    if root is None:
+        return
+    _write_disk_json(
+        root / _SITEMAP_DISK_FILE,
+        {
+            "refs": [[ref.handle, ref.slug] for ref in entry.refs],
+            "loaded_at": entry.loaded_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        },
+    )
+
+
+def _load_soul_from_disk(key: str) -> _CachedSoul | None:
+    root = _cache_dir()
+    if root is None:
+        return None
+    payload = _read_disk_json(_soul_disk_path(root, key))
+    if payload is None:
+        return None
+    content = payload.get("content")
+    fetched_at = payload.get("fetched_at")
+    if not isinstance(content, str) or not isinstance(fetched_at, (int, float)):
+        return None
+    return _CachedSoul(
+        content=content,
+        fetched_at=float(fetched_at),
+        etag=_optional_str(payload.get("etag")),
+        last_modified=_optional_str(payload.get("last_modified")),
+    )
+
+
+def _remember_soul(key: str, entry: _CachedSoul) -> None:
+    _state.markdown[key] = entry
+    _state.markdown.move_to_end(key)
+    while len(_state.markdown) > settings.souls_directory_markdown_cache_size:
+        _state.markdown.popitem(last=False)
+
+
+def _store_soul(key: str, entry: _CachedSoul) -> None:
+    _remember_soul(key, entry)
+    root = _cache_dir()
+    if root is None:
+        return
+    _write_disk_json(
+        _soul_disk_path(root, key),
+        {
+            "url": key,
+            "content": entry.content,
+            "fetched_at": entry.fetched_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        },
+    )
+
+
+async def _refresh_sitemap(
+    client: httpx.AsyncClient,
+    stale: _CachedSitemap | None,
+) -> list[SoulRef]:
+    headers = _conditional_headers(stale.etag, stale.last_modified) if stale else {}
+    try:
+        resp = await client.get(SOULS_DIRECTORY_SITEMAP_URL, headers=headers)
+        if resp.status_code == httpx.codes.NOT_MODIFIED and stale is not None:
+            _store_sitemap(
+                _CachedSitemap(
+                    refs=stale.refs,
+                    loaded_at=time.time(),
+                    etag=resp.headers.get("etag") or stale.etag,
+                    last_modified=resp.headers.get("last-modified") or stale.last_modified,
+                ),
+            )
+            return stale.refs
+        resp.raise_for_status()
+    except httpx.HTTPError:
+        if stale is None or not stale.refs:
+            raise
+        logger.warning("souls_directory.sitemap.serving_stale loaded_at=%s", stale.loaded_at)
+        return stale.refs
+    refs = _parse_sitemap_soul_refs(resp.text)
+    _store_sitemap(
+        _CachedSitemap(
+            refs=refs,
+            loaded_at=time.time(),
+            etag=resp.headers.get("etag"),
+            last_modified=resp.headers.get("last-modified"),
+        ),
+    )
+    return refs
 
 
 async def list_souls_directory_refs(
     *,
     client: httpx.AsyncClient | None = None,
 ) -> list[SoulRef]:
-    """Return cached sitemap-derived soul refs, refreshing when TTL expires."""
-    now = time.time()
-    loaded_raw = _sitemap_cache.get("loaded_at")
-    loaded_at = loaded_raw if isinstance(loaded_raw, (int, float)) else 0.0
-    cached = _sitemap_cache.get("refs")
-    if cached and isinstance(cached, list) and now - loaded_at < _SITEMAP_TTL_SECONDS:
-        return cached
-
-    owns_client = client is None
-    if client is None:
-        client = httpx.AsyncClient(
-            timeout=httpx.Timeout(10.0, connect=5.0),
-            headers={"User-Agent": "openclaw-mission-control/1.0"},
-        )
+    """Return cached sitemap-derived soul refs, revalidating when TTL expires."""
+    if _state.sitemap is None:
+        _state.sitemap = _load_sitemap_from_disk()
+    cached = _state.sitemap
+    if cached is not None and cached.refs and time.time() - cached.loaded_at < _SITEMAP_TTL_SECONDS:
+        return cached.refs
+
+    http = client or _get_client()
+    return await _single_flight(
+        SOULS_DIRECTORY_SITEMAP_URL,
+        lambda: _refresh_sitemap(http, cached),
+    )
+
+
+async def _refresh_soul_markdown(
+    client: httpx.AsyncClient,
+    url: str,
+    stale: _CachedSoul | None,
+) -> str:
+    headers = _conditional_headers(stale.etag, stale.last_modified) if stale else {}
     try:
-        resp = await client.get(SOULS_DIRECTORY_SITEMAP_URL)
+        resp = await client.get(url, headers=headers)
+        if resp.status_code == httpx.codes.NOT_MODIFIED and stale is not None:
+            _store_soul(
+                url,
+                _CachedSoul(
+                    content=stale.content,
+                    fetched_at=time.time(),
+                    etag=resp.headers.get("etag") or stale.etag,
+                    last_modified=resp.headers.get("last-modified") or stale.last_modified,
+                ),
+            )
+            return stale.content
         resp.raise_for_status()
-        refs = _parse_sitemap_soul_refs(resp.text)
-        _sitemap_cache["loaded_at"] = now
-        _sitemap_cache["refs"] = refs
-        return refs
-    finally:
-        if owns_client:
-            await client.aclose()
+    except httpx.HTTPError:
+        if stale is None:
+            raise
+        logger.warning("souls_directory.markdown.serving_stale url=%s", url)
+        _remember_soul(url, stale)
+        return stale.content
+    _store_soul(
+        url,
+        _CachedSoul(
+            content=resp.text,
+            fetched_at=time.time(),
+            etag=resp.headers.get("etag"),
+            last_modified=resp.headers.get("last-modified"),
+        ),
+    )
+    return resp.text
 
 
 async def fetch_soul_markdown(
@@ -109,19 +410,18 @@ async def fetch_soul_markdown(
         normalized_slug = normalized_slug[: -len(".md")]
     url = f"{SOULS_DIRECTORY_BASE_URL}/api/souls/" f"{normalized_handle}/{normalized_slug}.md"
 
-    owns_client = client is None
-    if client is None:
-        client = httpx.AsyncClient(
-            timeout=httpx.Timeout(15.0, connect=5.0),
-            headers={"User-Agent": "openclaw-mission-control/1.0"},
-        )
-    try:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.text
-    finally:
-        if owns_client:
-            await client.aclose()
+    cached = _state.markdown.get(url)
+    if cached is None:
+        cached = _load_soul_from_disk(url)
+    if (
+        cached is not None
+        and time.time() - cached.fetched_at < settings.souls_directory_markdown_ttl_seconds
+    ):
+        _remember_soul(url, cached)
+        return cached.content
+
+    http = client or _get_client()
+    return await _single_flight(url, lambda: _refresh_soul_markdown(http, url, cached))
 
 
 def search_souls(refs: list[SoulRef], *, query: str, limit: int = 20) -> list[SoulRef]:
@@ -0,0 +1,216 @@
+"""Cached per-board task counts by status, maintained from committed task changes.
+
+Counts are loaded once per board with a single grouped query and then adjusted
+in place: task inserts, deletes and status or board moves flushed through the
+ORM are collected on the session and applied when it commits. Bulk `UPDATE` or
+`DELETE` statements against tasks cannot be attributed to boards and drop the
+cached counts instead. Entries expire after a short TTL to reconcile writes
+made by other replicas.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import instance_state
+from sqlmodel import col, select
+
+from app.models.tasks import Task
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.orm import ORMExecuteState
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+TASK_COUNTS_TTL_SECONDS = 30.0
+_SESSION_DELTAS_KEY = "task_count_deltas"
+_SESSION_RESET_KEY = "task_count_reset"
+_UNKNOWN = object()
+
+
+@dataclass(slots=True)
+class _BoardTaskCounts:
+    loaded_at: float
+    by_status: dict[str, int] = field(default_factory=dict)
+
+
+class TaskCountsCache:
+    """In-process task-count aggregates keyed by board id."""
+
+    def __init__(self, ttl_seconds: float = TASK_COUNTS_TTL_SECONDS) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._boards: dict[UUID, _BoardTaskCounts] = {}
+        # Bumped on every applied change so loads that raced a write are not cached.
+        self._versions: dict[UUID, int] = {}
+        self._epoch = 0
+
+    def _version(self, board_id: UUID) -> tuple[int, int]:
+        return self._epoch, self._versions.get(board_id, 0)
+
+    def _fresh_entry(self, board_id: UUID) -> _BoardTaskCounts | None:
+        entry = self._boards.get(board_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.loaded_at >= self._ttl_seconds:
+            del self._boards[board_id]
+            return None
+        return entry
+
+    async def counts_by_board(
+        self,
+        session: AsyncSession,
+        board_ids: Sequence[UUID],
+    ) -> dict[UUID, dict[str, int]]:
+        """Return non-zero task counts keyed by status for each requested board."""
+        result: dict[UUID, dict[str, int]] = {}
+        missing: list[UUID] = []
+        for board_id in dict.fromkeys(board_ids):
+            entry = self._fresh_entry(board_id)
+            if entry is None:
+                missing.append(board_id)
+            else:
+                result[board_id] = entry.by_status
+        if missing:
+            versions = {board_id: self._version(board_id) for board_id in missing}
+            loaded: dict[UUID, dict[str, int]] = {board_id: {} for board_id in missing}
+            for row_board_id, status_value, total in await session.exec(
+                select(col(Task.board_id), col(Task.status), func.count(col(Task.id)))
+                .where(col(Task.board_id).in_(missing))
+                .group_by(col(Task.board_id), col(Task.status)),
+            ):
+                if row_board_id is not None:
+                    loaded[row_board_id][str(status_value)] = int(total or 0)
+            # A session holding its own uncommitted task changes must not seed
+            # the cache: those changes are applied again as deltas on commit.
+            cacheable = not (
+                session.info.get(_SESSION_DELTAS_KEY) or session.info.get(_SESSION_RESET_KEY)
+            )
+            now = time.monotonic()
+            for board_id, by_status in loaded.items():
+                if cacheable and self._version(board_id) == versions[board_id]:
+                    self._boards[board_id] = _BoardTaskCounts(loaded_at=now, by_status=by_status)
+            result.update(loaded)
+        return {
+            board_id: {status: total for status, total in by_status.items() if total > 0}
+            for board_id, by_status in result.items()
+        }
+
+    def apply(self, deltas: dict[UUID, dict[str, int] | None]) -> None:
+        """Apply committed per-board status deltas; None drops the board's counts."""
+        for board_id, by_status in deltas.items():
+            self._versions[board_id] = self._versions.get(board_id, 0) + 1
+            entry = self._fresh_entry(board_id)
+            if entry is None:
+                continue
+            if by_status is None:
+                del self._boards[board_id]
+                continue
+            for status, delta in by_status.items():
+                entry.by_status[status] = max(0, entry.by_status.get(status, 0) + delta)
+
+    def invalidate(self, board_id: UUID) -> None:
+        """Drop cached counts for a board."""
+        self.apply({board_id: None})
+
+    def invalidate_after_commit(self, session: AsyncSession, board_id: UUID) -> None:
+        """Drop a board's counts once `session` commits; for task writes outside the ORM."""
+        deltas: dict[UUID, dict[str, int] | None] = session.info.setdefault(
+            _SESSION_DELTAS_KEY,
+            {},
+        )
+        deltas[board_id] = None
+
+    def clear(self) -> None:
+        """Drop every cached board."""
+        self._epoch += 1
+        self._boards.clear()
+
+
+def _committed_value(task: Task, attribute: str) -> object:
+    history = instance_state(task).attrs[attribute].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return _UNKNOWN
+
+
+def _collect_task_deltas(sync_session: Session, _flush_context: object) -> None:
+    deltas: dict[UUID, dict[str, int] | None] = sync_session.info.setdefault(
+        _SESSION_DELTAS_KEY,
+        {},
+    )
+
+    def _add(board_id: object, status: object, delta: int) -> None:
+        if not isinstance(board_id, UUID):
+            return
+        if board_id in deltas and deltas[board_id] is None:
+            return
+        if not isinstance(status, str):
+            deltas[board_id] = None
+            return
+        by_status = deltas.setdefault(board_id, defaultdict(int))
+        if by_status is not None:
+            by_status[status] += delta
+
+    for obj in sync_session.new:
+        if isinstance(obj, Task):
+            _add(obj.board_id, obj.status, 1)
+    for obj in sync_session.deleted:
+        if isinstance(obj, Task):
+            _add(_committed_value(obj, "board_id"), _committed_value(obj, "status"), -1)
+    for obj in sync_session.dirty:
+        if not isinstance(obj, Task):
+            continue
+        state = instance_state(obj)
+        if not (
+            state.attrs.status.history.has_changes() or state.attrs.board_id.history.has_changes()
+        ):
+            continue
+        old_board_id = _committed_value(obj, "board_id")
+        if old_board_id is _UNKNOWN:
+            # Without the prior board the change cannot be attributed; reload both sides.
+            sync_session.info[_SESSION_RESET_KEY] = True
+            continue
+        _add(old_board_id, _committed_value(obj, "status"), -1)
+        _add(obj.board_id, obj.status, 1)
+
+
+def _reset_on_bulk_task_statement(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is Task:
+        orm_execute_state.session.info[_SESSION_RESET_KEY] = True
+
+
+def _apply_committed_deltas(sync_session: Session) -> None:
+    deltas = sync_session.info.pop(_SESSION_DELTAS_KEY, None)
+    if sync_session.info.pop(_SESSION_RESET_KEY, False):
+        task_counts_cache.clear()
+        return
+    if deltas:
+        task_counts_cache.apply(deltas)
+
+
+def _discard_deltas(sync_session: Session, previous_transaction: Any) -> None:
+    # A rolled-back savepoint leaves earlier writes of the outer transaction intact.
+    if not previous_transaction.nested:
+        sync_session.info.pop(_SESSION_DELTAS_KEY, None)
+        sync_session.info.pop(_SESSION_RESET_KEY, None)
+
+
+event.listen(Session, "after_flush", _collect_task_deltas)
+event.listen(Session, "do_orm_execute", _reset_on_bulk_task_statement)
+event.listen(Session, "after_commit", _apply_committed_deltas)
+event.listen(Session, "after_soft_rollback", _discard_deltas)
+
+
+task_counts_cache = TaskCountsCache()
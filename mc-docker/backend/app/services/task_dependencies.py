@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Collection, Mapping, Sequence
 from typing import Final
 from uuid import UUID
 
@@ -14,9 +14,10 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.db import crud
 from app.models.task_dependencies import TaskDependency
 from app.models.tasks import Task
+from app.services.task_hydration import task_hydration_cache
 
 DONE_STATUS: Final[str] = "done"
-_RUNTIME_TYPE_REFERENCES = (UUID, AsyncSession, Mapping, Sequence)
+_RUNTIME_TYPE_REFERENCES = (UUID, AsyncSession, Collection, Mapping, Sequence)
 
 
 def _dedupe_uuid_list(values: Sequence[UUID]) -> list[UUID]:
@@ -129,43 +130,60 @@ def _has_cycle(nodes: Sequence[UUID], edges: Mapping[UUID, set[UUID]]) -> bool:
     return any(dfs(start_node) for start_node in nodes)
 
 
-async def validate_dependency_update(
+async def validate_dependency_batch(
     session: AsyncSession,
     *,
     board_id: UUID,
-    task_id: UUID,
-    depends_on_task_ids: Sequence[UUID],
-) -> list[UUID]:
-    """Validate a dependency update and return normalized dependency ids."""
-    normalized = _dedupe_uuid_list(depends_on_task_ids)
-    if task_id in normalized:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-            detail="Task cannot depend on itself.",
-        )
-    if not normalized:
-        return []
+    depends_on_by_task_id: Mapping[UUID, Sequence[UUID]],
+    new_task_ids: Collection[UUID] = (),
+) -> dict[UUID, list[UUID]]:
+    """Validate dependency edits for several tasks at once.
 
-    # Ensure all dependency tasks exist on this board.
-    existing_ids = set(
-        await session.exec(
-            select(col(Task.id))
-            .where(col(Task.board_id) == board_id)
-            .where(col(Task.id).in_(normalized)),
-        ),
+    `new_task_ids` are tasks created alongside the edits; they count as existing
+    dependency targets and graph nodes. Returns normalized ids keyed by task id.
+    """
+    normalized_by_task_id = {
+        task_id: _dedupe_uuid_list(depends_on)
+        for task_id, depends_on in depends_on_by_task_id.items()
+    }
+    for task_id, normalized in normalized_by_task_id.items():
+        if task_id in normalized:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="Task cannot depend on itself.",
+            )
+    new_ids = set(new_task_ids)
+    referenced = _dedupe_uuid_list(
+        [
+            dep_id
+            for normalized in normalized_by_task_id.values()
+            for dep_id in normalized
+            if dep_id not in new_ids
+        ],
     )
-    missing = [dep_id for dep_id in normalized if dep_id not in existing_ids]
-    if missing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "message": "One or more dependency tasks were not found on this board.",
-                "missing_task_ids": [str(value) for value in missing],
-            },
+    if referenced:
+        # Ensure all dependency tasks exist on this board.
+        existing_ids = set(
+            await session.exec(
+                select(col(Task.id))
+                .where(col(Task.board_id) == board_id)
+                .where(col(Task.id).in_(referenced)),
+            ),
         )
+        missing = [dep_id for dep_id in referenced if dep_id not in existing_ids]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={
+                    "message": "One or more dependency tasks were not found on this board.",
+                    "missing_task_ids": [str(value) for value in missing],
+                },
+            )
+    if not any(normalized_by_task_id.values()):
+        return normalized_by_task_id
 
-    # Rebuild the board-wide graph and overlay the pending edit for this task so
-    # validation catches indirect cycles created through existing edges.
+    # Rebuild the board-wide graph and overlay the pending edits so validation
+    # catches indirect cycles created through existing edges or within the batch.
     task_ids = list(
         await session.exec(
             select(col(Task.id)).where(col(Task.board_id) == board_id),
@@ -182,15 +200,32 @@ async def validate_dependency_update(
     edges: dict[UUID, set[UUID]] = defaultdict(set)
     for src, dst in rows:
         edges[src].add(dst)
-    edges[task_id] = set(normalized)
+    for task_id, normalized in normalized_by_task_id.items():
+        edges[task_id] = set(normalized)
 
-    if _has_cycle(task_ids, edges):
+    if _has_cycle([*task_ids, *new_ids], edges):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Dependency cycle detected. Remove the cycle before saving.",
         )
 
-    return normalized
+    return normalized_by_task_id
+
+
+async def validate_dependency_update(
+    session: AsyncSession,
+    *,
+    board_id: UUID,
+    task_id: UUID,
+    depends_on_task_ids: Sequence[UUID],
+) -> list[UUID]:
+    """Validate a dependency update and return normalized dependency ids."""
+    normalized_by_task_id = await validate_dependency_batch(
+        session,
+        board_id=board_id,
+        depends_on_by_task_id={task_id: depends_on_task_ids},
+    )
+    return normalized_by_task_id[task_id]
 
 
 async def replace_task_dependencies(
@@ -214,6 +249,7 @@ async def replace_task_dependencies(
         col(TaskDependency.task_id) == task_id,
         commit=False,
     )
+    task_hydration_cache.invalidate_after_commit(session, board_id)
     for dep_id in normalized:
         session.add(
             TaskDependency(
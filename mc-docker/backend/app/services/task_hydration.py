@@ -0,0 +1,277 @@
+"""Versioned per-board cache of task relations used to hydrate task payloads.
+
+Task lists and the task SSE stream attach tag state, custom field values and
+dependency ids to every task. Those relations change far less often than they
+are read, so they are cached in-process per board and reused until the board's
+version is bumped.
+
+Writers call `invalidate_after_commit` while mutating tags, custom field
+values or dependencies; the bump happens once the transaction commits, so a
+concurrent reader can never cache pre-commit rows under the new version.
+Invalidations are also published on a Redis channel and applied by every
+replica running `run_task_hydration_listener`. Entries expire after
+`TASK_HYDRATION_CACHE_TTL_SECONDS` regardless, which bounds staleness when
+Redis is unreachable.
+
+Dependency *status* is not cached: it changes with every task transition and
+is always read live by callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.schemas.task_custom_fields import TaskCustomFieldValues
+    from app.services.tags import TagState
+
+logger = get_logger(__name__)
+
+INVALIDATION_CHANNEL = "mc:task-hydration:invalidate"
+REDIS_TIMEOUT_SECONDS = 1.0
+LISTENER_RETRY_SECONDS = 5.0
+# Entries for boards nobody reads anymore are swept once the cache grows past this.
+PRUNE_THRESHOLD = 256
+_SESSION_INFO_KEY = "task_hydration_invalidations"
+_ALL_BOARDS = "*"
+
+
+@dataclass(frozen=True, slots=True)
+class TaskHydration:
+    """Relations attached to a task payload, excluding live dependency status."""
+
+    tag_state: TagState
+    dependency_ids: list[UUID]
+    custom_field_values: TaskCustomFieldValues
+
+
+HydrationLoader = Callable[["AsyncSession", UUID, list[UUID]], Awaitable[dict[UUID, TaskHydration]]]
+
+
+@dataclass(slots=True)
+class _BoardHydration:
+    loaded_at: float
+    by_task: dict[UUID, TaskHydration] = field(default_factory=dict)
+
+
+class TaskHydrationCache:
+    """In-process hydration cache keyed by board id with versioned invalidation."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float | None = None,
+        client: aioredis.Redis | None = None,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._client = client
+        self._origin = uuid4().hex
+        self._boards: dict[UUID, _BoardHydration] = {}
+        self._versions: dict[UUID, int] = {}
+        # Bumped by whole-cache invalidations (org-level tag or field changes).
+        self._epoch = 0
+        self._publishes: set[asyncio.Task[None]] = set()
+
+    @property
+    def ttl_seconds(self) -> float:
+        """Maximum entry age; 0 disables caching."""
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return settings.task_hydration_cache_ttl_seconds
+
+    def _redis(self) -> aioredis.Redis:
+        if self._client is None:
+            self._client = aioredis.Redis.from_url(
+                settings.rq_redis_url,
+                socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+                socket_timeout=REDIS_TIMEOUT_SECONDS,
+            )
+        return self._client
+
+    def _subscriber(self) -> aioredis.Redis:
+        if self._client is not None:
+            return self._client
+        # No read timeout: the subscription sits idle between invalidations.
+        return aioredis.Redis.from_url(
+            settings.rq_redis_url,
+            socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+            health_check_interval=30,
+        )
+
+    def _version(self, board_id: UUID) -> tuple[int, int]:
+        return self._epoch, self._versions.get(board_id, 0)
+
+    def _fresh_entry(self, board_id: UUID) -> _BoardHydration | None:
+        entry = self._boards.get(board_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.loaded_at >= self.ttl_seconds:
+            del self._boards[board_id]
+            return None
+        return entry
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        for board_id in [key for key, entry in self._boards.items() if entry.loaded_at <= cutoff]:
+            del self._boards[board_id]
+
+    async def get_many(
+        self,
+        session: AsyncSession,
+        *,
+        board_id: UUID,
+        task_ids: Sequence[UUID],
+        loader: HydrationLoader,
+    ) -> dict[UUID, TaskHydration]:
+        """Return hydration for the requested tasks, loading only uncached ones."""
+        unique_ids = list(dict.fromkeys(task_ids))
+        if not unique_ids:
+            return {}
+        if self.ttl_seconds <= 0:
+            return await loader(session, board_id, unique_ids)
+        entry = self._fresh_entry(board_id)
+        known = entry.by_task if entry is not None else {}
+        missing = [task_id for task_id in unique_ids if task_id not in known]
+        loaded: dict[UUID, TaskHydration] = {}
+        if missing:
+            version = self._version(board_id)
+            loaded = await loader(session, board_id, missing)
+            if self._version(board_id) == version:
+                current = self._fresh_entry(board_id)
+                if current is None:
+                    if len(self._boards) >= PRUNE_THRESHOLD:
+                        self._prune()
+                    current = self._boards[board_id] = _BoardHydration(loaded_at=time.monotonic())
+                current.by_task.update(loaded)
+        return {
+            task_id: hydration
+            for task_id in unique_ids
+            if (hydration := known.get(task_id) or loaded.get(task_id)) is not None
+        }
+
+    def _invalidate_local(self, board_ids: Sequence[UUID], *, all_boards: bool) -> None:
+        if all_boards:
+            self._epoch += 1
+            self._boards.clear()
+            return
+        for board_id in board_ids:
+            self._versions[board_id] = self._versions.get(board_id, 0) + 1
+            self._boards.pop(board_id, None)
+
+    def invalidate(self, board_id: UUID) -> None:
+        """Drop cached hydration for a board on every replica."""
+        self._invalidate_local([board_id], all_boards=False)
+        self._publish({"boards": [str(board_id)]})
+
+    def invalidate_all(self) -> None:
+        """Drop every cached board, e.g. after an org-level tag or field change."""
+        self._invalidate_local([], all_boards=True)
+        self._publish({"all": True})
+
+    def clear(self) -> None:
+        """Drop local entries without notifying other replicas."""
+        self._invalidate_local([], all_boards=True)
+
+    def invalidate_after_commit(
+        self,
+        session: AsyncSession,
+        board_id: UUID | None = None,
+    ) -> None:
+        """Invalidate a board (or all boards when `board_id` is None) once `session` commits."""
+        pending: set[object] = session.info.setdefault(_SESSION_INFO_KEY, set())
+        pending.add(board_id if board_id is not None else _ALL_BOARDS)
+
+    def _publish(self, message: dict[str, Any]) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._send({"origin": self._origin, **message}))
+        self._publishes.add(task)
+        task.add_done_callback(self._publishes.discard)
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        try:
+            await self._redis().publish(INVALIDATION_CHANNEL, json.dumps(message))
+        except (RedisError, OSError) as exc:
+            logger.warning("task_hydration.publish_failed error=%s", exc)
+
+    def apply_remote(self, raw: bytes | str) -> None:
+        """Apply an invalidation published by another replica."""
+        try:
+            message = json.loads(raw)
+            if message.get("origin") == self._origin:
+                return
+            board_ids = [UUID(value) for value in message.get("boards", [])]
+        except (TypeError, ValueError, AttributeError):
+            logger.warning("task_hydration.invalid_message raw=%r", raw)
+            return
+        self._invalidate_local(board_ids, all_boards=bool(message.get("all")))
+
+
+def _flush_session_invalidations(sync_session: Session) -> None:
+    pending = sync_session.info.pop(_SESSION_INFO_KEY, None)
+    if not pending:
+        return
+    if _ALL_BOARDS in pending:
+        task_hydration_cache.invalidate_all()
+        return
+    for board_id in pending:
+        task_hydration_cache.invalidate(board_id)
+
+
+def _discard_session_invalidations(sync_session: Session, previous_transaction: Any) -> None:
+    # A rolled-back savepoint leaves earlier writes of the outer transaction intact.
+    if not previous_transaction.nested:
+        sync_session.info.pop(_SESSION_INFO_KEY, None)
+
+
+event.listen(Session, "after_commit", _flush_session_invalidations)
+event.listen(Session, "after_soft_rollback", _discard_session_invalidations)
+
+
+async def run_task_hydration_listener(cache: TaskHydrationCache) -> None:
+    """Apply invalidations published by other replicas until cancelled."""
+    while True:
+        client = cache._subscriber()
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            # Anything published while unsubscribed was missed.
+            cache.clear()
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    cache.apply_remote(message["data"])
+        except (RedisError, OSError) as exc:
+            logger.warning(
+                "task_hydration.listener_unavailable retry_s=%s error=%s",
+                LISTENER_RETRY_SECONDS,
+                exc,
+            )
+            cache.clear()
+        finally:
+            await pubsub.reset()
+            if client is not cache._client:
+                await client.aclose()
+        await asyncio.sleep(LISTENER_RETRY_SECONDS)
+
+
+task_hydration_cache = TaskHydrationCache()
@@ -4,6 +4,11 @@ Prefer importing from this package when used by other modules.
 """
 
 from app.services.webhooks.dispatch import run_flush_webhook_delivery_queue
+from app.services.webhooks.ingest import (
+    QueuedWebhookIngest,
+    enqueue_webhook_ingest,
+    flush_webhook_ingest_buffer,
+)
 from app.services.webhooks.queue import (
     QueuedInboundDelivery,
     dequeue_webhook_delivery,
@@ -13,8 +18,11 @@ from app.services.webhooks.queue import (
 
 __all__ = [
     "QueuedInboundDelivery",
+    "QueuedWebhookIngest",
     "dequeue_webhook_delivery",
     "enqueue_webhook_delivery",
+    "enqueue_webhook_ingest",
+    "flush_webhook_ingest_buffer",
     "requeue_if_failed",
     "run_flush_webhook_delivery_queue",
 ]
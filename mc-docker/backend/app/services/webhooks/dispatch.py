@@ -184,6 +184,11 @@ def _compute_webhook_retry_jitter(base_delay: float) -> float:
     return float(random.uniform(0.0, upper_bound))
 
 
+async def deliver_webhook_payload(item: QueuedInboundDelivery) -> None:
+    """Notify the webhook's target agent about one persisted payload."""
+    await _process_single_item(item)
+
+
 async def process_webhook_queue_task(task: QueuedTask) -> None:
     item = decode_webhook_task(task)
     await _process_single_item(item)
@@ -0,0 +1,340 @@
+"""Deferred webhook ingest: buffer raw payloads in Redis, persist them in batches.
+
+The ingest endpoint pushes each accepted request onto a dedicated Redis list
+and answers 202 without touching the database. The queue worker drains that
+list in batches, writing every `BoardWebhookPayload` and `BoardMemory` row of a
+batch with one multi-row `INSERT` each, and then enqueues the usual lead
+delivery tasks. When a batch fails its items are retried one by one, so one bad
+request cannot hold back the rest; requests that keep failing are retried with
+backoff and finally parked on the ingest dead-letter list.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlmodel import SQLModel, col, select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.session import async_session_maker
+from app.models.board_memory import BoardMemory
+from app.models.board_webhook_payloads import BoardWebhookPayload
+from app.models.board_webhooks import BoardWebhook
+from app.services.queue import (
+    QueuedTask,
+    dead_letter_task,
+    dequeue_task_batch,
+    enqueue_task,
+    requeue_if_failed,
+)
+from app.services.webhooks.dispatch import deliver_webhook_payload
+from app.services.webhooks.queue import QueuedInboundDelivery, enqueue_webhook_delivery
+
+if TYPE_CHECKING:
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = get_logger(__name__)
+TASK_TYPE = "webhook_ingest"
+
+PayloadValue = dict[str, object] | list[object] | str | int | float | bool | None
+
+
+def ingest_queue_name() -> str:
+    """Redis list holding raw webhook requests awaiting persistence."""
+    return f"{settings.rq_queue_name}:webhook-ingest"
+
+
+def decode_payload(raw_body: bytes | str, *, content_type: str | None) -> PayloadValue:
+    """Decode an inbound body, parsing JSON when declared or when it looks like JSON."""
+    if not raw_body:
+        return {}
+
+    if isinstance(raw_body, bytes):
+        body_text = raw_body.decode("utf-8", errors="replace")
+    else:
+        body_text = raw_body
+    normalized_content_type = (content_type or "").lower()
+    should_parse_json = "application/json" in normalized_content_type
+    if not should_parse_json:
+        should_parse_json = body_text.startswith(("{", "[", '"')) or body_text in {"true", "false"}
+
+    if should_parse_json:
+        try:
+            parsed = json.loads(body_text)
+        except json.JSONDecodeError:
+            return body_text
+        if isinstance(parsed, (dict, list, str, int, float, bool)) or parsed is None:
+            return parsed
+    return body_text
+
+
+def payload_preview(value: PayloadValue) -> str:
+    """Render a stored payload as text for memory entries and lead messages."""
+    if isinstance(value, str):
+        preview = value
+    else:
+        try:
+            preview = json.dumps(value, indent=2, ensure_ascii=True)
+        except TypeError:
+            preview = str(value)
+    return preview
+
+
+def webhook_memory_content(
+    *,
+    board_id: UUID,
+    webhook_id: UUID,
+    description: str,
+    payload_id: UUID,
+    payload_value: PayloadValue,
+) -> str:
+    """Render the board memory entry recorded for one webhook payload."""
+    preview = payload_preview(payload_value)
+    inspect_path = f"/api/v1/boards/{board_id}/webhooks/{webhook_id}/payloads/{payload_id}"
+    return (
+        "WEBHOOK PAYLOAD RECEIVED\n"
+        f"Webhook ID: {webhook_id}\n"
+        f"Payload ID: {payload_id}\n"
+        f"Instruction: {description}\n"
+        f"Inspect (admin API): {inspect_path}\n\n"
+        "Payload preview:\n"
+        f"{preview}"
+    )
+
+
+def webhook_memory_tags(*, webhook_id: UUID, payload_id: UUID) -> list[str]:
+    """Tags attached to the board memory entry for a webhook payload."""
+    return ["webhook", f"webhook:{webhook_id}", f"payload:{payload_id}"]
+
+
+@dataclass(frozen=True)
+class QueuedWebhookIngest:
+    """Raw inbound webhook request buffered for deferred persistence."""
+
+    board_id: UUID
+    webhook_id: UUID
+    payload_id: UUID
+    received_at: datetime
+    body: str
+    content_type: str | None
+    headers: dict[str, str] | None
+    source_ip: str | None
+    attempts: int = 0
+
+    def to_task(self) -> QueuedTask:
+        return QueuedTask(
+            task_type=TASK_TYPE,
+            payload={
+                "board_id": str(self.board_id),
+                "webhook_id": str(self.webhook_id),
+                "payload_id": str(self.payload_id),
+                "received_at": self.received_at.isoformat(),
+                "body": self.body,
+                "content_type": self.content_type,
+                "headers": self.headers,
+                "source_ip": self.source_ip,
+            },
+            created_at=self.received_at,
+            attempts=self.attempts,
+        )
+
+    @classmethod
+    def from_task(cls, task: QueuedTask) -> QueuedWebhookIngest:
+        if task.task_type != TASK_TYPE:
+            raise ValueError(f"Unexpected task_type={task.task_type!r}; expected {TASK_TYPE!r}")
+        payload: dict[str, Any] = task.payload
+        return cls(
+            board_id=UUID(payload["board_id"]),
+            webhook_id=UUID(payload["webhook_id"]),
+            payload_id=UUID(payload["payload_id"]),
+            received_at=datetime.fromisoformat(payload["received_at"]),
+            body=str(payload.get("body") or ""),
+            content_type=payload.get("content_type"),
+            headers=payload.get("headers"),
+            source_ip=payload.get("source_ip"),
+            attempts=task.attempts,
+        )
+
+
+def enqueue_webhook_ingest(item: QueuedWebhookIngest) -> bool:
+    """Buffer a raw webhook request; False means the caller must persist it inline."""
+    return enqueue_task(item.to_task(), ingest_queue_name(), redis_url=settings.rq_redis_url)
+
+
+async def persist_webhook_batch(
+    session: AsyncSession,
+    items: list[QueuedWebhookIngest],
+) -> list[QueuedInboundDelivery]:
+    """Insert payload and memory rows for a batch; return deliveries to enqueue.
+
+    Items whose webhook was deleted after the request was accepted are dropped.
+    The caller owns the transaction.
+    """
+    webhooks = {
+        webhook_id: (board_id, description)
+        for webhook_id, board_id, description in (
+            await session.exec(
+                select(
+                    col(BoardWebhook.id),
+                    col(BoardWebhook.board_id),
+                    col(BoardWebhook.description),
+                ).where(col(BoardWebhook.id).in_({item.webhook_id for item in items})),
+            )
+        ).all()
+    }
+    payload_rows: list[dict[str, Any]] = []
+    memory_rows: list[dict[str, Any]] = []
+    deliveries: list[QueuedInboundDelivery] = []
+    for item in items:
+        board_id, description = webhooks.get(item.webhook_id, (None, ""))
+        if board_id != item.board_id:
+            logger.warning(
+                "webhook.ingest.webhook_missing",
+                extra={"webhook_id": str(item.webhook_id), "payload_id": str(item.payload_id)},
+            )
+            continue
+        payload_value = decode_payload(item.body, content_type=item.content_type)
+        payload_rows.append(
+            {
+                "id": item.payload_id,
+                "board_id": item.board_id,
+                "webhook_id": item.webhook_id,
+                "payload": payload_value,
+                "headers": item.headers,
+                "source_ip": item.source_ip,
+                "content_type": item.content_type,
+                "received_at": item.received_at,
+            },
+        )
+        memory_rows.append(
+            {
+                "id": uuid4(),
+                "board_id": item.board_id,
+                "content": webhook_memory_content(
+                    board_id=item.board_id,
+                    webhook_id=item.webhook_id,
+                    description=description,
+                    payload_id=item.payload_id,
+                    payload_value=payload_value,
+                ),
+                "tags": webhook_memory_tags(webhook_id=item.webhook_id, payload_id=item.payload_id),
+                "is_chat": False,
+                "source": "webhook",
+                "created_at": item.received_at,
+            },
+        )
+        deliveries.append(
+            QueuedInboundDelivery(
+                board_id=item.board_id,
+                webhook_id=item.webhook_id,
+                payload_id=item.payload_id,
+                received_at=item.received_at,
+            ),
+        )
+    if payload_rows:
+        tables = SQLModel.metadata.tables
+        await session.exec(
+            insert(tables[str(BoardWebhookPayload.__tablename__)]).values(payload_rows),
+        )
+        await session.exec(insert(tables[str(BoardMemory.__tablename__)]).values(memory_rows))
+    return deliveries
+
+
+def _retry_delay_seconds(attempts: int) -> float:
+    base = settings.rq_dispatch_retry_base_seconds * (2 ** max(0, attempts))
+    return float(min(base, settings.rq_dispatch_retry_max_seconds))
+
+
+def _retry_later(item: QueuedWebhookIngest) -> None:
+    """Schedule a failed request for another attempt, or dead-letter it."""
+    try:
+        requeue_if_failed(
+            item.to_task(),
+            ingest_queue_name(),
+            max_retries=settings.webhook_ingest_max_retries,
+            redis_url=settings.rq_redis_url,
+            delay_seconds=_retry_delay_seconds(item.attempts),
+            dead_letter=True,
+        )
+    except Exception:
+        logger.exception(
+            "webhook.ingest.requeue_failed",
+            extra={"payload_id": str(item.payload_id), "task": item.to_task().to_json()},
+        )
+
+
+async def _persist(items: list[QueuedWebhookIngest]) -> list[QueuedInboundDelivery]:
+    async with async_session_maker() as session:
+        deliveries = await persist_webhook_batch(session, items)
+        await session.commit()
+    return deliveries
+
+
+async def _persist_one_by_one(items: list[QueuedWebhookIngest]) -> list[QueuedInboundDelivery]:
+    """Persist each item in its own transaction; failed items are retried later."""
+    deliveries: list[QueuedInboundDelivery] = []
+    for item in items:
+        try:
+            deliveries.extend(await _persist([item]))
+        except Exception:
+            logger.exception(
+                "webhook.ingest.item_failed",
+                extra={"payload_id": str(item.payload_id), "attempt": item.attempts},
+            )
+            _retry_later(item)
+    return deliveries
+
+
+def _decode_items(tasks: list[QueuedTask]) -> list[QueuedWebhookIngest]:
+    items: list[QueuedWebhookIngest] = []
+    for task in tasks:
+        try:
+            items.append(QueuedWebhookIngest.from_task(task))
+        except (KeyError, TypeError, ValueError):
+            logger.exception("webhook.ingest.task_invalid", extra={"task_type": task.task_type})
+            dead_letter_task(task, ingest_queue_name(), redis_url=settings.rq_redis_url)
+    return items
+
+
+async def flush_webhook_ingest_buffer(*, batch_size: int | None = None) -> int:
+    """Drain buffered webhook requests into the database; return rows persisted."""
+    size = batch_size or settings.webhook_ingest_batch_size
+    persisted = 0
+    while True:
+        tasks = dequeue_task_batch(
+            ingest_queue_name(),
+            count=size,
+            redis_url=settings.rq_redis_url,
+        )
+        if not tasks:
+            break
+        items = _decode_items(tasks)
+        batch_failed = False
+        try:
+            deliveries = await _persist(items) if items else []
+        except Exception:
+            logger.exception("webhook.ingest.batch_failed", extra={"count": len(items)})
+            batch_failed = True
+            deliveries = await _persist_one_by_one(items)
+        persisted += len(deliveries)
+        logger.info("webhook.ingest.batch_persisted", extra={"count": len(deliveries)})
+        for delivery in deliveries:
+            if enqueue_webhook_delivery(delivery):
+                continue
+            # Same fallback as inline ingest: notify directly when queueing fails.
+            try:
+                await deliver_webhook_payload(delivery)
+            except Exception:
+                logger.exception(
+                    "webhook.ingest.delivery_failed",
+                    extra={"payload_id": str(delivery.payload_id)},
+                )
+        if batch_failed or len(tasks) < size:
+            break
+    return persisted
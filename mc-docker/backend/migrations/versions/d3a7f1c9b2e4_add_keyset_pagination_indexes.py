@@ -0,0 +1,56 @@
+"""Add composite indexes backing keyset pagination.
+
+Revision ID: d3a7f1c9b2e4
+Revises: b497b348ebb4
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d3a7f1c9b2e4"
+down_revision = "b497b348ebb4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create `(scope, created_at, id)` indexes for cursor-paged list endpoints."""
+    # Cursor pages compare `(created_at, id) < (:created_at, :id)` and order by
+    # both columns descending, so the id tie-breaker must be part of the index
+    # for the row-value comparison to become a single backward range scan.
+    op.create_index(
+        "ix_tasks_board_id_created_at_id",
+        "tasks",
+        ["board_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_activity_events_created_at_id",
+        "activity_events",
+        ["created_at", "id"],
+    )
+    op.create_index(
+        "ix_activity_events_agent_id_created_at_id",
+        "activity_events",
+        ["agent_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_board_memory_board_id_created_at_id",
+        "board_memory",
+        ["board_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop keyset pagination indexes."""
+    op.drop_index("ix_board_memory_board_id_created_at_id", table_name="board_memory")
+    op.drop_index(
+        "ix_activity_events_agent_id_created_at_id",
+        table_name="activity_events",
+    )
+    op.drop_index("ix_activity_events_created_at_id", table_name="activity_events")
+    op.drop_index("ix_tasks_board_id_created_at_id", table_name="tasks")
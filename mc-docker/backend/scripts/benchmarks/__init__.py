@@ -0,0 +1 @@
+"""API performance benchmark harness (seeding, fake gateway, scenarios)."""
@@ -0,0 +1,175 @@
+"""Local websocket stand-in for the OpenClaw gateway (protocol v3).
+
+The fake gateway implements just enough of the real handshake for
+`app.services.openclaw.gateway_rpc` to treat it as a live gateway:
+
+1. On connect the server pushes a `connect.challenge` event carrying a nonce.
+2. The client answers with a `connect` request; the server replies with a
+   `hello` payload that advertises protocol v3 and the known base methods.
+3. Every later `req` frame is answered with a `res` frame. `agents.files.*`
+   keep per-agent files in memory so provisioning round-trips behave like a
+   real gateway; other methods return small canned payloads.
+
+An optional per-request latency lets benchmarks approximate a remote gateway.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Self
+from uuid import uuid4
+
+import websockets
+
+from app.services.openclaw.gateway_rpc import GATEWAY_METHODS, PROTOCOL_VERSION
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from websockets.asyncio.server import Server, ServerConnection
+
+
+class FakeGateway:
+    """In-process OpenClaw gateway server for benchmarks and local smoke runs."""
+
+    def __init__(self, *, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0) -> None:
+        self._host = host
+        self._port = port
+        self._latency_seconds = max(0.0, latency_ms) / 1000
+        self._server: Server | None = None
+        self.calls: Counter[str] = Counter()
+        self.connections = 0
+        self.files: dict[str, dict[str, str]] = {}
+        self.sessions: dict[str, dict[str, Any]] = {}
+
+    @property
+    def url(self) -> str:
+        """Return the `ws://` URL clients should connect to."""
+        if self._server is None:
+            message = "Fake gateway is not running."
+            raise RuntimeError(message)
+        host, port = next(iter(self._server.sockets)).getsockname()[:2]
+        return f"ws://{host}:{port}"
+
+    async def start(self) -> None:
+        """Start listening for websocket connections."""
+        self._server = await websockets.serve(
+            self._handle_connection,
+            self._host,
+            self._port,
+            ping_interval=None,
+        )
+
+    async def stop(self) -> None:
+        """Stop the server and close open connections."""
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    async def _handle_connection(self, ws: ServerConnection) -> None:
+        self.connections += 1
+        await ws.send(
+            json.dumps(
+                {
+                    "type": "event",
+                    "event": "connect.challenge",
+                    "payload": {"nonce": uuid4().hex},
+                },
+            ),
+        )
+        try:
+            async for raw in ws:
+                frame = json.loads(raw)
+                if frame.get("type") != "req":
+                    continue
+                method = str(frame.get("method") or "")
+                params = frame.get("params") or {}
+                self.calls[method] += 1
+                if self._latency_seconds:
+                    await asyncio.sleep(self._latency_seconds)
+                await ws.send(json.dumps(self._respond(frame.get("id"), method, params)))
+        except websockets.ConnectionClosed:
+            return
+
+    def _respond(self, request_id: object, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        try:
+            payload = self._dispatch(method, params)
+        except KeyError as exc:
+            return {
+                "type": "res",
+                "id": request_id,
+                "ok": False,
+                "error": {"message": f"not found: {exc.args[0]}"},
+            }
+        return {"type": "res", "id": request_id, "ok": True, "payload": payload}
+
+    def _dispatch(self, method: str, params: dict[str, Any]) -> object:
+        if method == "connect":
+            return {
+                "type": "hello",
+                "protocol": PROTOCOL_VERSION,
+                "server": {"version": "fake-gateway", "connId": uuid4().hex},
+                "features": {"methods": GATEWAY_METHODS},
+            }
+        if method == "health":
+            return {"ok": True}
+        if method == "agents.list":
+            return {"agents": [{"id": agent_id} for agent_id in sorted(self.files)]}
+        if method in {"agents.create", "agents.update"}:
+            agent_id = str(params.get("agentId") or params.get("name") or uuid4().hex)
+            self.files.setdefault(agent_id, {})
+            return {"agentId": agent_id}
+        if method == "agents.delete":
+            self.files.pop(str(params.get("agentId")), None)
+            return {"ok": True}
+        if method == "agents.files.list":
+            files = self.files.get(str(params.get("agentId")), {})
+            return {
+                "files": [
+                    {"name": name, "size": len(content.encode("utf-8")), "missing": False}
+                    for name, content in sorted(files.items())
+                ],
+            }
+        if method == "agents.files.get":
+            agent_id = str(params.get("agentId"))
+            name = str(params.get("name"))
+            content = self.files[agent_id][name]
+            return {"file": {"name": name, "content": content}}
+        if method == "agents.files.set":
+            agent_id = str(params.get("agentId"))
+            name = str(params.get("name"))
+            self.files.setdefault(agent_id, {})[name] = str(params.get("content") or "")
+            return {"ok": True}
+        if method == "agents.files.delete":
+            self.files.get(str(params.get("agentId")), {}).pop(str(params.get("name")), None)
+            return {"ok": True}
+        if method == "sessions.patch":
+            key = str(params.get("key"))
+            self.sessions.setdefault(key, {}).update(params)
+            return {"ok": True, "key": key}
+        if method in {"sessions.delete", "sessions.reset"}:
+            self.sessions.pop(str(params.get("key")), None)
+            return {"ok": True}
+        if method == "chat.send":
+            return {"runId": uuid4().hex, "status": "started"}
+        if method == "chat.history":
+            return {"messages": []}
+        if method == "config.get":
+            return {"config": {}, "hash": "fake"}
+        return {}
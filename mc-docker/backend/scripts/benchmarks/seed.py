@@ -0,0 +1,323 @@
+"""Deterministic bulk seeding of a benchmark database.
+
+Seeding recreates every table in the target database, so it must only ever be
+pointed at a dedicated benchmark database. Small fixtures (organization, user,
+gateway, boards, agents, webhooks) go through the ORM; tasks and activity
+events are inserted with batched Core `INSERT`s so the `full` profile (100k
+tasks, 1M events) seeds in minutes rather than hours.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.agent_tokens import generate_agent_token, hash_agent_token
+from app.core.auth import LOCAL_AUTH_EMAIL, LOCAL_AUTH_NAME, LOCAL_AUTH_USER_ID
+from app.core.time import utcnow
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.board_webhooks import BoardWebhook
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organization_members import OrganizationMember
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.models.users import User
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+INSERT_BATCH_SIZE = 5_000
+SEED_HISTORY_DAYS = 30
+TASK_STATUS_WEIGHTS: dict[str, int] = {
+    "inbox": 30,
+    "in_progress": 20,
+    "review": 15,
+    "done": 35,
+}
+TASK_PRIORITIES = ("low", "medium", "high")
+EVENT_TYPE_WEIGHTS: dict[str, int] = {
+    "task.created": 10,
+    "task.updated": 30,
+    "task.status_changed": 25,
+    "task.comment": 30,
+    "task.run_failed": 5,
+}
+
+
+@dataclass(frozen=True)
+class SeedVolumes:
+    """Row counts for a benchmark dataset."""
+
+    boards: int
+    tasks: int
+    events: int
+    agents_per_board: int
+
+
+PROFILES: dict[str, SeedVolumes] = {
+    "smoke": SeedVolumes(boards=5, tasks=2_000, events=20_000, agents_per_board=2),
+    "full": SeedVolumes(boards=50, tasks=100_000, events=1_000_000, agents_per_board=3),
+}
+
+
+@dataclass(frozen=True)
+class SeedManifest:
+    """Identifiers and credentials the benchmark scenarios need after seeding."""
+
+    profile: str
+    volumes: SeedVolumes
+    organization_id: UUID
+    gateway_id: UUID
+    board_ids: list[UUID]
+    agent_token: str
+    lead_agent_id: UUID
+    webhook_board_id: UUID
+    webhook_id: UUID
+
+    def to_json(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        data = asdict(self)
+        for key, value in data.items():
+            if isinstance(value, UUID):
+                data[key] = str(value)
+        data["board_ids"] = [str(board_id) for board_id in self.board_ids]
+        return data
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> SeedManifest:
+        """Build a manifest from `to_json` output."""
+        return cls(
+            profile=str(data["profile"]),
+            volumes=SeedVolumes(**data["volumes"]),
+            organization_id=UUID(data["organization_id"]),
+            gateway_id=UUID(data["gateway_id"]),
+            board_ids=[UUID(value) for value in data["board_ids"]],
+            agent_token=str(data["agent_token"]),
+            lead_agent_id=UUID(data["lead_agent_id"]),
+            webhook_board_id=UUID(data["webhook_board_id"]),
+            webhook_id=UUID(data["webhook_id"]),
+        )
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _weighted(rng: random.Random, weights: dict[str, int], count: int) -> list[str]:
+    return rng.choices(list(weights), weights=list(weights.values()), k=count)
+
+
+async def _insert_batches(
+    engine: AsyncEngine,
+    model: type[SQLModel],
+    rows: list[dict[str, Any]],
+) -> None:
+    table = SQLModel.metadata.tables[str(model.__tablename__)]
+    async with engine.begin() as conn:
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            await conn.execute(table.insert(), rows[start : start + INSERT_BATCH_SIZE])
+
+
+async def seed_database(
+    engine: AsyncEngine,
+    *,
+    profile: str,
+    volumes: SeedVolumes,
+    gateway_url: str,
+    seed: int = 1337,
+) -> SeedManifest:
+    """Drop and recreate all tables, then fill them with a deterministic dataset."""
+    rng = random.Random(seed)
+    now = utcnow()
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        organization = Organization(name="Benchmark Org")
+        session.add(organization)
+        await session.flush()
+        user = User(
+            clerk_user_id=LOCAL_AUTH_USER_ID,
+            email=LOCAL_AUTH_EMAIL,
+            name=LOCAL_AUTH_NAME,
+            active_organization_id=organization.id,
+        )
+        session.add(user)
+        await session.flush()
+        session.add(
+            OrganizationMember(
+                organization_id=organization.id,
+                user_id=user.id,
+                role="owner",
+                all_boards_read=True,
+                all_boards_write=True,
+            ),
+        )
+        gateway = Gateway(
+            organization_id=organization.id,
+            name="Benchmark Gateway",
+            url=gateway_url,
+            workspace_root="/srv/openclaw-bench",
+        )
+        session.add(gateway)
+        await session.flush()
+
+        boards: list[Board] = []
+        agents_by_board: dict[UUID, list[UUID]] = {}
+        agent_token = generate_agent_token()
+        token_agent_index = rng.randrange(volumes.boards * volumes.agents_per_board)
+        for board_index in range(volumes.boards):
+            board = Board(
+                organization_id=organization.id,
+                gateway_id=gateway.id,
+                name=f"Benchmark Board {board_index:03d}",
+                slug=f"benchmark-board-{board_index:03d}",
+                require_approval_for_done=False,
+                max_agents=volumes.agents_per_board,
+            )
+            session.add(board)
+            await session.flush()
+            boards.append(board)
+            for agent_index in range(volumes.agents_per_board):
+                ordinal = board_index * volumes.agents_per_board + agent_index
+                token = agent_token if ordinal == token_agent_index else generate_agent_token()
+                agent = Agent(
+                    board_id=board.id,
+                    gateway_id=gateway.id,
+                    name=f"bench-agent-{ordinal:04d}",
+                    status="online",
+                    is_board_lead=agent_index == 0,
+                    openclaw_session_id=f"agent:bench-{ordinal:04d}:main",
+                    agent_token_hash=hash_agent_token(token),
+                    last_seen_at=now,
+                )
+                session.add(agent)
+                await session.flush()
+                agents_by_board.setdefault(board.id, []).append(agent.id)
+
+        webhook_board = boards[0]
+        webhook = BoardWebhook(
+            board_id=webhook_board.id,
+            agent_id=agents_by_board[webhook_board.id][0],
+            description="Benchmark ingest webhook",
+        )
+        session.add(webhook)
+        await session.commit()
+
+    task_rows, task_ids, task_created = _task_rows(
+        rng,
+        volumes=volumes,
+        boards=boards,
+        agents_by_board=agents_by_board,
+        now=now,
+    )
+    await _insert_batches(engine, Task, task_rows)
+    await _insert_event_batches(
+        engine,
+        rng,
+        events=volumes.events,
+        task_ids=task_ids,
+        task_created=task_created,
+        now=now,
+    )
+
+    return SeedManifest(
+        profile=profile,
+        volumes=volumes,
+        organization_id=organization.id,
+        gateway_id=gateway.id,
+        board_ids=[board.id for board in boards],
+        agent_token=agent_token,
+        lead_agent_id=agents_by_board[webhook_board.id][0],
+        webhook_board_id=webhook_board.id,
+        webhook_id=webhook.id,
+    )
+
+
+def _task_rows(
+    rng: random.Random,
+    *,
+    volumes: SeedVolumes,
+    boards: list[Board],
+    agents_by_board: dict[UUID, list[UUID]],
+    now: datetime,
+) -> tuple[list[dict[str, Any]], list[UUID], list[datetime]]:
+    history_seconds = SEED_HISTORY_DAYS * 24 * 3600
+    statuses = _weighted(rng, TASK_STATUS_WEIGHTS, volumes.tasks)
+    rows: list[dict[str, Any]] = []
+    task_ids: list[UUID] = []
+    created: list[datetime] = []
+    for index, status in enumerate(statuses):
+        board = boards[index % len(boards)]
+        created_at = now - timedelta(seconds=rng.randrange(history_seconds))
+        updated_at = min(now, created_at + timedelta(seconds=rng.randrange(3 * 24 * 3600)))
+        in_progress_at = None
+        if status != "inbox":
+            in_progress_at = created_at + (updated_at - created_at) / 4
+        task_id = _uuid(rng)
+        agents = agents_by_board[board.id]
+        rows.append(
+            {
+                "id": task_id,
+                "board_id": board.id,
+                "title": f"Benchmark task {index}",
+                "description": "Seeded by scripts/benchmarks.",
+                "status": status,
+                "priority": rng.choice(TASK_PRIORITIES),
+                "due_at": None,
+                "in_progress_at": in_progress_at,
+                "previous_in_progress_at": None,
+                "created_by_user_id": None,
+                "assigned_agent_id": rng.choice(agents) if status != "inbox" else None,
+                "auto_created": False,
+                "auto_reason": None,
+                "created_at": created_at,
+                "updated_at": updated_at,
+            },
+        )
+        task_ids.append(task_id)
+        created.append(created_at)
+    return rows, task_ids, created
+
+
+async def _insert_event_batches(
+    engine: AsyncEngine,
+    rng: random.Random,
+    *,
+    events: int,
+    task_ids: list[UUID],
+    task_created: list[datetime],
+    now: datetime,
+) -> None:
+    table = SQLModel.metadata.tables[str(ActivityEvent.__tablename__)]
+    async with engine.begin() as conn:
+        remaining = events
+        while remaining > 0:
+            size = min(INSERT_BATCH_SIZE, remaining)
+            remaining -= size
+            event_types = _weighted(rng, EVENT_TYPE_WEIGHTS, size)
+            batch: list[dict[str, Any]] = []
+            for event_type in event_types:
+                task_index = rng.randrange(len(task_ids))
+                span = max(1, int((now - task_created[task_index]).total_seconds()))
+                batch.append(
+                    {
+                        "id": _uuid(rng),
+                        "event_type": event_type,
+                        "message": f"Benchmark {event_type}",
+                        "agent_id": None,
+                        "task_id": task_ids[task_index],
+                        "created_at": task_created[task_index]
+                        + timedelta(seconds=rng.randrange(span)),
+                    },
+                )
+            await conn.execute(table.insert(), batch)
@@ -0,0 +1,310 @@
+# ruff: noqa: INP001
+"""Redis presence store and write-behind flush tests."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import metrics as metrics_api
+from app.core import agent_auth
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.services.agent_presence import (
+    HEARTBEATS_KEY,
+    LAST_SEEN_KEY,
+    PENDING_KEY,
+    AgentPresenceStore,
+)
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> _FakePipeline:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        def _queue(*args: Any, **kwargs: Any) -> None:
+            self._ops.append((name, args, kwargs))
+
+        return _queue
+
+    async def execute(self) -> list[Any]:
+        return [
+            await getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in self._ops
+        ]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+
+    def pipeline(self, *, transaction: bool = True) -> _FakePipeline:
+        del transaction
+        return _FakePipeline(self)
+
+    async def zadd(self, key: str, mapping: dict[str, float], *, gt: bool = False) -> None:
+        zset = self.zsets.setdefault(key, {})
+        for member, score in mapping.items():
+            if not gt or score > zset.get(member, float("-inf")):
+                zset[member] = score
+
+    async def zmscore(self, key: str, members: list[str]) -> list[float | None]:
+        zset = self.zsets.get(key, {})
+        return [zset.get(member) for member in members]
+
+    async def zrangebyscore(self, key: str, low: float, high: float) -> list[bytes]:
+        zset = self.zsets.get(key, {})
+        return [member.encode() for member, score in zset.items() if low <= score <= high]
+
+    async def zremrangebyscore(self, key: str, _low: str, high: float) -> None:
+        zset = self.zsets.get(key, {})
+        for member in [member for member, score in zset.items() if score <= high]:
+            del zset[member]
+
+    async def hset(self, key: str, field: str, value: str) -> None:
+        self.hashes.setdefault(key, {})[field.encode()] = value.encode()
+
+    async def hsetnx(self, key: str, field: bytes, value: bytes) -> None:
+        self.hashes.setdefault(key, {}).setdefault(field, value)
+
+    async def hgetall(self, key: str) -> dict[bytes, bytes]:
+        return dict(self.hashes.get(key, {}))
+
+    async def rename(self, src: str, dst: str) -> None:
+        if src not in self.hashes:
+            raise ResponseError("no such key")
+        self.hashes[dst] = self.hashes.pop(src)
+
+    async def expire(self, _key: str, _seconds: int) -> None:
+        return None
+
+    async def delete(self, key: str) -> None:
+        self.hashes.pop(key, None)
+
+
+class _DownRedis:
+    def pipeline(self, *, transaction: bool = True) -> _DownRedis:
+        del transaction
+        return self
+
+    async def __aenter__(self) -> _DownRedis:
+        raise RedisConnectionError("connection refused")
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_flush_persists_buffered_touches_in_one_batch() -> None:
+    redis = _FakeRedis()
+    store = AgentPresenceStore(redis, flush_seconds=5)  # type: ignore[arg-type]
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    base = datetime(2026, 5, 1, 12, 0, 0)
+    try:
+        async with session_maker() as session:
+            stale = Agent(name="stale", gateway_id=uuid4(), last_seen_at=base)
+            fresh = Agent(name="fresh", gateway_id=uuid4(), last_seen_at=base)
+            session.add_all([stale, fresh])
+            await session.commit()
+
+            assert await store.record(stale.id, base + timedelta(minutes=5))
+            # A buffered value older than the persisted one must not win.
+            assert await store.record(fresh.id, base - timedelta(minutes=5))
+            assert await store.flush(session) == 2
+            assert await store.flush(session) == 0
+
+            rows = dict(
+                (await session.exec(select(col(Agent.name), col(Agent.last_seen_at)))).all(),
+            )
+    finally:
+        await engine.dispose()
+
+    assert rows == {"stale": base + timedelta(minutes=5), "fresh": base}
+    assert PENDING_KEY not in redis.hashes
+    # Both timestamps are older than the retention window, so the fast store is trimmed.
+    assert redis.zsets[LAST_SEEN_KEY] == {}
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_one_activity_row_per_buffered_heartbeat() -> None:
+    redis = _FakeRedis()
+    store = AgentPresenceStore(redis, flush_seconds=5)  # type: ignore[arg-type]
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    base = datetime(2026, 5, 1, 12, 0, 0)
+    try:
+        async with session_maker() as session:
+            agent = Agent(name="worker", gateway_id=uuid4())
+            session.add(agent)
+            await session.commit()
+
+            await store.record(agent.id, base, heartbeat=True)
+            await store.record(agent.id, base + timedelta(seconds=30), heartbeat=True)
+            # Plain API touches move last_seen but are not heartbeats.
+            await store.record(agent.id, base + timedelta(seconds=40))
+            assert await store.flush(session) == 1
+
+            events = (
+                await session.exec(
+                    select(col(ActivityEvent.message), col(ActivityEvent.created_at)).where(
+                        col(ActivityEvent.event_type) == "agent.heartbeat",
+                    ),
+                )
+            ).all()
+    finally:
+        await engine.dispose()
+
+    assert events == [("Heartbeat received from worker.", base + timedelta(seconds=30))]
+    assert HEARTBEATS_KEY not in redis.hashes
+
+
+@pytest.mark.asyncio
+async def test_active_agents_counts_persisted_and_buffered_presence(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis = _FakeRedis()
+    store = AgentPresenceStore(redis, flush_seconds=5)  # type: ignore[arg-type]
+    monkeypatch.setattr(metrics_api, "agent_presence", store)
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    start = datetime(2026, 5, 1, 12, 0, 0)
+    range_spec = metrics_api.RangeSpec(
+        key="24h",
+        start=start,
+        end=start + timedelta(hours=1),
+        bucket="hour",
+        duration=timedelta(hours=1),
+    )
+    try:
+        async with session_maker() as session:
+            board = Board(organization_id=uuid4(), gateway_id=uuid4(), name="b", slug="b")
+            persisted = Agent(
+                name="persisted",
+                board_id=board.id,
+                gateway_id=uuid4(),
+                last_seen_at=start + timedelta(minutes=5),
+            )
+            buffered = Agent(
+                name="buffered",
+                board_id=board.id,
+                gateway_id=uuid4(),
+                last_seen_at=start - timedelta(days=1),
+            )
+            idle = Agent(name="idle", board_id=board.id, gateway_id=uuid4())
+            session.add_all([board, persisted, buffered, idle])
+            await session.commit()
+            await store.record(buffered.id, start + timedelta(minutes=10))
+
+            active = await metrics_api._active_agents(session, range_spec, [board.id])
+    finally:
+        await engine.dispose()
+
+    assert active == 2
+
+
+@pytest.mark.asyncio
+async def test_overlay_applies_fresher_values_without_dirtying_rows() -> None:
+    redis = _FakeRedis()
+    store = AgentPresenceStore(redis, flush_seconds=5)  # type: ignore[arg-type]
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    base = datetime(2026, 5, 1, 12, 0, 0)
+    try:
+        async with session_maker() as session:
+            agent = Agent(name="a", gateway_id=uuid4(), last_seen_at=base)
+            session.add(agent)
+            await session.commit()
+            await store.record(agent.id, base + timedelta(seconds=30))
+
+            await store.overlay([agent])
+
+            assert agent.last_seen_at == base + timedelta(seconds=30)
+            assert agent not in session.dirty
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_touch_falls_back_to_database_when_redis_is_down(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = AgentPresenceStore(_DownRedis(), flush_seconds=5)  # type: ignore[arg-type]
+    monkeypatch.setattr(agent_auth, "agent_presence", store)
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    class _Request:
+        method = "GET"
+
+    try:
+        async with session_maker() as session:
+            agent = Agent(name="a", gateway_id=uuid4(), status="online")
+            session.add(agent)
+            await session.commit()
+
+            await agent_auth._touch_agent_presence(_Request(), session, agent)  # type: ignore[arg-type]
+
+            persisted = (
+                await session.exec(select(col(Agent.last_seen_at)).where(col(Agent.id) == agent.id))
+            ).one()
+    finally:
+        await engine.dispose()
+
+    assert persisted is not None
+    assert store.available is False
+
+
+@pytest.mark.asyncio
+async def test_touch_buffers_unchanged_status_in_redis(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = _FakeRedis()
+    store = AgentPresenceStore(redis, flush_seconds=5)  # type: ignore[arg-type]
+    monkeypatch.setattr(agent_auth, "agent_presence", store)
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    class _Request:
+        method = "GET"
+
+    try:
+        async with session_maker() as session:
+            agent = Agent(name="a", gateway_id=uuid4(), status="online")
+            session.add(agent)
+            await session.commit()
+
+            await agent_auth._touch_agent_presence(_Request(), session, agent)  # type: ignore[arg-type]
+
+            assert agent.last_seen_at is not None
+            assert agent not in session.dirty
+            persisted = (
+                await session.exec(select(col(Agent.last_seen_at)).where(col(Agent.id) == agent.id))
+            ).one()
+    finally:
+        await engine.dispose()
+
+    assert persisted is None
+    assert str(agent.id).encode() in redis.hashes[PENDING_KEY]
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
+from pathlib import Path
 from types import SimpleNamespace
 from uuid import UUID, uuid4
 
 import pytest
+from jinja2 import Environment, FileSystemLoader
 
 import app.services.openclaw.internal.agent_key as agent_key_mod
 import app.services.openclaw.provisioning as agent_provisioning
@@ -78,6 +81,69 @@ def test_templates_root_points_to_repo_templates_dir():
     assert (root / "BOARD_AGENTS.md.j2").exists()
 
 
+def test_template_env_and_manifest_are_reused_across_renders():
+    env = agent_provisioning._template_env()
+    assert agent_provisioning._template_env() is env
+    assert "BOARD_AGENTS.md.j2" in agent_provisioning._template_manifest()
+    assert "BOARD_SOUL.md.j2" in agent_provisioning._template_manifest()
+
+
+def test_template_manifest_sees_new_templates_when_auto_reloading(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "A.md.j2").write_text("a")
+    env = Environment(loader=FileSystemLoader(tmp_path), auto_reload=True)
+    monkeypatch.setattr(agent_provisioning, "_template_env", lambda: env)
+
+    assert agent_provisioning._template_manifest() == {"A.md.j2"}
+    (tmp_path / "B.md.j2").write_text("b")
+    assert agent_provisioning._template_manifest() == {"A.md.j2", "B.md.j2"}
+
+
+def test_render_agent_files_reuses_compiled_identity_override(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    agent_provisioning._override_templates.clear()
+    env = agent_provisioning._template_env()
+    compiled: list[str] = []
+    from_string = env.from_string
+
+    def _counting_from_string(source: str) -> object:
+        compiled.append(source)
+        return from_string(source)
+
+    monkeypatch.setattr(env, "from_string", _counting_from_string)
+    agent = _AgentStub(name="Alice", identity_template="Name: {{ agent_name }}")
+
+    for _ in range(3):
+        rendered = agent_provisioning._render_agent_files(
+            {"agent_name": "Alice"},
+            agent,
+            {"IDENTITY.md"},
+            include_bootstrap=False,
+        )
+        assert rendered == {"IDENTITY.md": "Name: Alice"}
+
+    assert compiled == ["Name: {{ agent_name }}"]
+    assert list(agent_provisioning._override_templates) == [
+        hashlib.sha256(b"Name: {{ agent_name }}").hexdigest(),
+    ]
+
+
+def test_render_agent_files_raises_for_template_missing_from_manifest():
+    agent = _AgentStub(name="Alice")
+
+    with pytest.raises(FileNotFoundError, match="Missing template file: NOPE.md.j2"):
+        agent_provisioning._render_agent_files(
+            {},
+            agent,
+            {"TOOLS.md"},
+            include_bootstrap=False,
+            template_overrides={"TOOLS.md": "NOPE.md.j2"},
+        )
+
+
 def test_user_context_uses_email_fallback_when_name_is_missing():
     user = SimpleNamespace(
         name=None,
@@ -462,6 +528,66 @@ async def test_set_agent_files_update_overwrite_writes_preserved_user_md():
     assert ("USER.md", "filled") in cp.writes
 
 
+@pytest.mark.asyncio
+async def test_set_agent_files_update_skips_unchanged_content():
+    class _ControlPlaneStub:
+        def __init__(self):
+            self.writes: list[tuple[str, str]] = []
+
+        async def set_agent_file(self, *, agent_id, name, content):
+            self.writes.append((name, content))
+
+    @dataclass
+    class _GatewayTiny:
+        id: UUID
+        name: str = "G"
+        url: str = "ws://x"
+        token: str | None = None
+        workspace_root: str = "/tmp"
+
+    class _Manager(agent_provisioning.BaseAgentLifecycleManager):
+        def _agent_id(self, agent):
+            return "agent-x"
+
+        def _build_context(self, *, agent, auth_token, user, board):
+            return {}
+
+    cp = _ControlPlaneStub()
+    mgr = _Manager(_GatewayTiny(id=uuid4()), cp)  # type: ignore[arg-type]
+    rendered = {"TOOLS.md": "tools", "AGENTS.md": "agents"}
+
+    await mgr._set_agent_files(
+        agent_id="agent-x",
+        rendered=rendered,
+        existing_files={},
+        action="update",
+    )
+    assert sorted(cp.writes) == [("AGENTS.md", "agents"), ("TOOLS.md", "tools")]
+
+    cp.writes.clear()
+    await mgr._set_agent_files(
+        agent_id="agent-x",
+        rendered=rendered,
+        existing_files={
+            "TOOLS.md": {"name": "TOOLS.md", "missing": False, "size": 5},
+            # Gateway-side size drift forces a rewrite even if MC's digest matches.
+            "AGENTS.md": {"name": "AGENTS.md", "missing": False, "size": 99},
+        },
+        action="update",
+    )
+    assert cp.writes == [("AGENTS.md", "agents")]
+
+    cp.writes.clear()
+    await mgr._set_agent_files(
+        agent_id="agent-x",
+        rendered={"TOOLS.md": "tools"},
+        existing_files={"TOOLS.md": {"name": "TOOLS.md", "missing": False, "size": 5}},
+        action="update",
+        overwrite=True,
+    )
+    assert cp.writes == [("TOOLS.md", "tools")]
+
+
 @pytest.mark.asyncio
 async def test_control_plane_upsert_agent_create_then_update(monkeypatch):
     calls: list[tuple[str, dict[str, object] | None]] = []
@@ -0,0 +1,142 @@
+# ruff: noqa: INP001
+"""Tests for cached per-board approval aggregates."""
+
+from __future__ import annotations
+
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import approvals as approvals_api
+from app.models.boards import Board
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.schemas.approvals import ApprovalCreate, ApprovalUpdate
+from app.services.approval_counts import ApprovalCountsCache, approval_counts_cache
+from app.services.approval_task_links import task_counts_for_board
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_board_with_tasks(
+    session: AsyncSession,
+    *,
+    task_count: int,
+) -> tuple[Board, list[UUID]]:
+    org_id = uuid4()
+    board = Board(id=uuid4(), organization_id=org_id, name="b", slug="b")
+    task_ids = [uuid4() for _ in range(task_count)]
+    session.add(Organization(id=org_id, name=f"org-{org_id}"))
+    session.add(board)
+    for task_id in task_ids:
+        session.add(Task(id=task_id, board_id=board.id, title=f"task-{task_id}"))
+    await session.commit()
+    return board, task_ids
+
+
+class _CountingSession:
+    """Session proxy that counts executed statements."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self.queries = 0
+
+    async def exec(self, statement):  # type: ignore[no-untyped-def]
+        self.queries += 1
+        return await self._session.exec(statement)
+
+
+@pytest.mark.asyncio
+async def test_cached_counts_track_create_and_resolve_without_requery() -> None:
+    engine = await _make_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, task_ids = await _seed_board_with_tasks(session, task_count=2)
+            first = await approvals_api.create_approval(
+                payload=ApprovalCreate(
+                    action_type="task.execute",
+                    task_id=task_ids[0],
+                    payload={"reason": "Needs confirmation."},
+                    confidence=80,
+                    status="pending",
+                ),
+                board=board,
+                session=session,
+            )
+
+            counting = _CountingSession(session)
+            assert await approval_counts_cache.pending_count(counting, board_id=board.id) == 1
+            counts = await approval_counts_cache.task_counts(
+                counting,
+                board_id=board.id,
+                task_ids=set(task_ids),
+            )
+            assert counts == {task_ids[0]: (1, 1)}
+            loaded_queries = counting.queries
+
+            await approvals_api.create_approval(
+                payload=ApprovalCreate(
+                    action_type="task.execute",
+                    task_id=task_ids[1],
+                    payload={"reason": "Needs confirmation."},
+                    confidence=80,
+                    status="pending",
+                ),
+                board=board,
+                session=session,
+            )
+            await approvals_api.update_approval(
+                approval_id=first.id,  # type: ignore[arg-type]
+                payload=ApprovalUpdate(status="approved"),
+                board=board,
+                session=session,
+            )
+
+            assert await approval_counts_cache.pending_count(counting, board_id=board.id) == 1
+            counts = await approval_counts_cache.task_counts(
+                counting,
+                board_id=board.id,
+                task_ids=set(task_ids),
+            )
+            assert counts == {task_ids[0]: (1, 0), task_ids[1]: (1, 1)}
+            assert counting.queries == loaded_queries
+            assert counts == await task_counts_for_board(
+                session,
+                board_id=board.id,
+                task_ids=set(task_ids),
+            )
+    finally:
+        approval_counts_cache.invalidate(board.id)
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_expired_counts_are_reloaded_from_database() -> None:
+    engine = await _make_engine()
+    cache = ApprovalCountsCache(ttl_seconds=0)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            board, task_ids = await _seed_board_with_tasks(session, task_count=1)
+            assert await cache.pending_count(session, board_id=board.id) == 0
+            await approvals_api.create_approval(
+                payload=ApprovalCreate(
+                    action_type="task.execute",
+                    task_id=task_ids[0],
+                    payload={"reason": "Needs confirmation."},
+                    confidence=80,
+                    status="pending",
+                ),
+                board=board,
+                session=session,
+            )
+            assert await cache.pending_count(session, board_id=board.id) == 1
+    finally:
+        await engine.dispose()
@@ -0,0 +1,106 @@
+# ruff: noqa: INP001
+"""Smoke tests for the benchmark fake gateway and result helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.services.openclaw.gateway_rpc import GatewayConfig, OpenClawGatewayError, openclaw_call
+from scripts.benchmarks.fake_gateway import FakeGateway
+from scripts.benchmarks.runner import (
+    BenchmarkOptions,
+    ScenarioResult,
+    find_regressions,
+    load_baselines,
+    measure,
+    skipped_scenarios,
+    write_baselines,
+)
+
+
+@pytest.mark.asyncio
+async def test_fake_gateway_speaks_protocol_v3(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setenv("OPENCLAW_GATEWAY_DEVICE_IDENTITY_PATH", str(tmp_path / "device.json"))
+    async with FakeGateway() as gateway:
+        config = GatewayConfig(url=gateway.url)
+        await openclaw_call(
+            "agents.files.set",
+            {"agentId": "a1", "name": "TOOLS.md", "content": "hello"},
+            config=config,
+        )
+        listing = await openclaw_call("agents.files.list", {"agentId": "a1"}, config=config)
+        fetched = await openclaw_call(
+            "agents.files.get",
+            {"agentId": "a1", "name": "TOOLS.md"},
+            config=config,
+        )
+        with pytest.raises(OpenClawGatewayError):
+            await openclaw_call(
+                "agents.files.get",
+                {"agentId": "a1", "name": "missing.md"},
+                config=config,
+            )
+
+    assert listing == {"files": [{"name": "TOOLS.md", "size": 5, "missing": False}]}
+    assert fetched == {"file": {"name": "TOOLS.md", "content": "hello"}}
+    assert gateway.connections == 4
+    assert gateway.calls["connect"] == 4
+
+
+@pytest.mark.asyncio
+async def test_measure_reports_percentiles_and_errors() -> None:
+    calls = 0
+
+    async def _op() -> None:
+        nonlocal calls
+        calls += 1
+        if calls % 5 == 0:
+            raise RuntimeError("boom")
+
+    result = await measure("noop", _op, BenchmarkOptions(iterations=20, concurrency=2, warmup=0))
+
+    assert result.iterations == 16
+    assert result.errors == 4
+    assert 0 <= result.p50_ms <= result.p95_ms <= result.p99_ms
+    assert result.throughput_rps > 0
+
+
+def test_find_regressions_compares_p95_and_throughput(tmp_path: Path) -> None:
+    baseline_path = tmp_path / "baselines.json"
+    write_baselines(
+        baseline_path,
+        key="smoke:postgresql",
+        results=[
+            ScenarioResult(name="list_tasks", p50_ms=5, p95_ms=10, throughput_rps=100),
+            ScenarioResult(name="agent_auth", p50_ms=5, p95_ms=10, throughput_rps=100),
+            ScenarioResult(name="dashboard_metrics", skipped="requires postgresql"),
+        ],
+    )
+    baseline = load_baselines(baseline_path)["smoke:postgresql"]
+    assert set(baseline) == {"list_tasks", "agent_auth"}
+    assert skipped_scenarios(
+        [
+            ScenarioResult(name="list_tasks", p95_ms=10),
+            ScenarioResult(name="webhook_flush_queue", skipped="requires redis"),
+        ],
+    ) == ["webhook_flush_queue"]
+
+    regressions = find_regressions(
+        [
+            ScenarioResult(name="list_tasks", p95_ms=14, throughput_rps=90),
+            ScenarioResult(name="agent_auth", p95_ms=20, throughput_rps=40),
+            ScenarioResult(name="dashboard_metrics", skipped="requires postgresql"),
+        ],
+        baseline,
+        tolerance=0.5,
+    )
+
+    assert regressions == [
+        "agent_auth: p95 20.0ms > baseline 10.0ms",
+        "agent_auth: throughput 40.0/s < baseline 100.0/s",
+    ]
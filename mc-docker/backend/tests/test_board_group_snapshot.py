@@ -0,0 +1,169 @@
+# ruff: noqa: INP001
+"""Board-group snapshot assembly and incremental task-count tests."""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.board_groups import _etag_matches
+from app.db import crud
+from app.models.board_groups import BoardGroup
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.models.tasks import Task
+from app.services import board_group_snapshot, task_counts
+from app.services.board_group_snapshot import build_group_snapshot, snapshot_etag
+from app.services.task_counts import TaskCountsCache
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_group(session: AsyncSession) -> tuple[BoardGroup, list[Board]]:
+    organization = Organization(name="org")
+    gateway = Gateway(
+        organization_id=organization.id,
+        name="gateway",
+        url="https://gateway.example.local",
+        workspace_root="/tmp/workspace",
+    )
+    group = BoardGroup(organization_id=organization.id, name="group", slug="group")
+    boards = [
+        Board(
+            organization_id=organization.id,
+            gateway_id=gateway.id,
+            board_group_id=group.id,
+            name=name,
+            slug=name,
+        )
+        for name in ("alpha", "beta")
+    ]
+    session.add_all([organization, gateway, group, *boards])
+    await session.commit()
+    return group, boards
+
+
+@pytest.fixture
+def counts_cache(monkeypatch: pytest.MonkeyPatch) -> TaskCountsCache:
+    cache = TaskCountsCache(ttl_seconds=60)
+    monkeypatch.setattr(task_counts, "task_counts_cache", cache)
+    monkeypatch.setattr(board_group_snapshot, "task_counts_cache", cache)
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_task_counts_follow_committed_changes_without_reloading(
+    counts_cache: TaskCountsCache,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            _, (board, _) = await _seed_group(session)
+            board_id = board.id
+            first = Task(board_id=board_id, title="first")
+            second = Task(board_id=board_id, title="second", status="in_progress")
+            session.add_all([first, second])
+            await session.commit()
+
+            assert await counts_cache.counts_by_board(session, [board_id]) == {
+                board_id: {"inbox": 1, "in_progress": 1},
+            }
+            loaded_at = counts_cache._boards[board_id].loaded_at
+
+            first.status = "done"
+            session.add(first)
+            session.add(Task(board_id=board_id, title="third"))
+            await session.commit()
+            await session.delete(second)
+            await session.commit()
+
+            # A rolled-back change is never applied.
+            first.status = "review"
+            session.add(first)
+            await session.flush()
+            await session.rollback()
+
+            counts = await counts_cache.counts_by_board(session, [board_id])
+            assert counts == {board_id: {"inbox": 1, "done": 1}}
+            assert counts_cache._boards[board_id].loaded_at == loaded_at
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_task_update_drops_cached_counts(counts_cache: TaskCountsCache) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            _, (board, _) = await _seed_group(session)
+            session.add(Task(board_id=board.id, title="task", status="in_progress"))
+            await session.commit()
+            await counts_cache.counts_by_board(session, [board.id])
+
+            await crud.update_where(
+                session,
+                Task,
+                col(Task.board_id) == board.id,
+                status="inbox",
+                commit=True,
+            )
+
+            assert board.id not in counts_cache._boards
+            assert await counts_cache.counts_by_board(session, [board.id]) == {
+                board.id: {"inbox": 1},
+            }
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_group_snapshot_keeps_top_tasks_per_board_in_display_order(
+    counts_cache: TaskCountsCache,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            group, (alpha, beta) = await _seed_group(session)
+            session.add_all(
+                [
+                    Task(board_id=alpha.id, title="a-low", priority="low"),
+                    Task(board_id=alpha.id, title="a-done", status="done"),
+                    Task(board_id=alpha.id, title="a-high", priority="high"),
+                    Task(board_id=alpha.id, title="a-progress", status="in_progress"),
+                    Task(board_id=beta.id, title="b-review", status="review"),
+                ],
+            )
+            await session.commit()
+
+            snapshot = await build_group_snapshot(session, group=group, per_board_task_limit=2)
+            again = await build_group_snapshot(session, group=group, per_board_task_limit=2)
+    finally:
+        await engine.dispose()
+
+    by_board: dict[UUID, list[str]] = {
+        item.board.id: [task.title for task in item.tasks] for item in snapshot.boards
+    }
+    assert by_board == {alpha.id: ["a-progress", "a-high"], beta.id: ["b-review"]}
+    assert snapshot.boards[0].task_counts == {"inbox": 2, "done": 1, "in_progress": 1}
+    assert snapshot_etag(snapshot) == snapshot_etag(again)
+
+
+def test_etag_matching_accepts_lists_weak_tags_and_wildcard() -> None:
+    assert _etag_matches('"abc"', '"abc"')
+    assert _etag_matches('"x", W/"abc"', '"abc"')
+    assert _etag_matches("*", '"abc"')
+    assert not _etag_matches('"x"', '"abc"')
+    assert not _etag_matches(None, '"abc"')
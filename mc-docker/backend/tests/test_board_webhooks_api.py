@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 import pytest
@@ -23,6 +25,9 @@ from app.models.board_webhooks import BoardWebhook
 from app.models.boards import Board
 from app.models.gateways import Gateway
 from app.models.organizations import Organization
+from app.services import queue as generic_queue
+from app.services.webhooks import ingest
+from app.services.webhooks.ingest import QueuedWebhookIngest, persist_webhook_batch
 from app.services.webhooks.queue import QueuedInboundDelivery
 
 
@@ -159,6 +164,7 @@ async def test_ingest_board_webhook_stores_payload_and_enqueues_for_lead_dispatc
         )
         return None
 
+    monkeypatch.setattr(board_webhooks.settings, "webhook_ingest_deferred", False)
     monkeypatch.setattr(
         board_webhooks,
         "enqueue_webhook_delivery",
@@ -288,3 +294,194 @@ async def test_ingest_board_webhook_rejects_disabled_endpoint(
         assert sent_messages == []
     finally:
         await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_ingest_board_webhook_defers_persistence_to_batch_writer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    app = _build_test_app(session_maker)
+    buffered: list[QueuedWebhookIngest] = []
+
+    async with session_maker() as session:
+        board, webhook = await _seed_webhook(session, enabled=True)
+
+    def _fake_enqueue_ingest(item: QueuedWebhookIngest) -> bool:
+        buffered.append(QueuedWebhookIngest.from_task(item.to_task()))
+        return True
+
+    monkeypatch.setattr(board_webhooks.settings, "webhook_ingest_deferred", True)
+    monkeypatch.setattr(board_webhooks, "enqueue_webhook_ingest", _fake_enqueue_ingest)
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            response = await client.post(
+                f"/api/v1/boards/{board.id}/webhooks/{webhook.id}",
+                json={"event": "deploy", "service": "api"},
+            )
+
+        assert response.status_code == 202
+        payload_id = UUID(response.json()["payload_id"])
+        assert [item.payload_id for item in buffered] == [payload_id]
+
+        async with session_maker() as session:
+            stored = (await session.exec(select(BoardWebhookPayload))).all()
+            assert stored == []
+
+            # A buffered request for a webhook deleted in the meantime is dropped.
+            orphan = QueuedWebhookIngest(
+                board_id=board.id,
+                webhook_id=uuid4(),
+                payload_id=uuid4(),
+                received_at=buffered[0].received_at,
+                body="{}",
+                content_type="application/json",
+                headers=None,
+                source_ip=None,
+            )
+            deliveries = await persist_webhook_batch(session, [*buffered, orphan])
+            await session.commit()
+
+        assert [delivery.payload_id for delivery in deliveries] == [payload_id]
+        async with session_maker() as session:
+            payloads = (await session.exec(select(BoardWebhookPayload))).all()
+            memory_items = (await session.exec(select(BoardMemory))).all()
+        assert [payload.id for payload in payloads] == [payload_id]
+        assert payloads[0].payload == {"event": "deploy", "service": "api"}
+        assert payloads[0].received_at == buffered[0].received_at
+        assert len(memory_items) == 1
+        assert memory_items[0].tags is not None
+        assert f"payload:{payload_id}" in memory_items[0].tags
+        assert f"Instruction: {webhook.description}" in memory_items[0].content
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_flush_retries_failed_batch_items_individually(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    async with session_maker() as session:
+        board, webhook = await _seed_webhook(session, enabled=True)
+
+    def _item(payload_id: UUID) -> QueuedWebhookIngest:
+        return QueuedWebhookIngest(
+            board_id=board.id,
+            webhook_id=webhook.id,
+            payload_id=payload_id,
+            received_at=datetime.now(UTC).replace(tzinfo=None),
+            body='{"event": "deploy"}',
+            content_type="application/json",
+            headers=None,
+            source_ip=None,
+        )
+
+    good, duplicate = _item(uuid4()), _item(uuid4())
+    async with session_maker() as session:
+        await persist_webhook_batch(session, [duplicate])
+        await session.commit()
+    malformed = generic_queue.QueuedTask(
+        task_type=ingest.TASK_TYPE,
+        payload={"board_id": "not-a-uuid"},
+        created_at=datetime.now(UTC),
+    )
+    batches = [[good.to_task(), malformed, duplicate.to_task()]]
+    requeued: list[tuple[generic_queue.QueuedTask, dict[str, object]]] = []
+    dead_lettered: list[generic_queue.QueuedTask] = []
+    enqueued: list[QueuedInboundDelivery] = []
+
+    def _requeue(task: generic_queue.QueuedTask, _queue_name: str, **kwargs: object) -> bool:
+        requeued.append((task, kwargs))
+        return True
+
+    def _dead_letter(task: generic_queue.QueuedTask, _queue_name: str, **_: object) -> bool:
+        dead_lettered.append(task)
+        return True
+
+    def _enqueue(delivery: QueuedInboundDelivery) -> bool:
+        enqueued.append(delivery)
+        return True
+
+    monkeypatch.setattr(
+        ingest,
+        "dequeue_task_batch",
+        lambda *_args, **_kwargs: batches.pop() if batches else [],
+    )
+    monkeypatch.setattr(ingest, "async_session_maker", session_maker)
+    monkeypatch.setattr(ingest, "requeue_if_failed", _requeue)
+    monkeypatch.setattr(ingest, "dead_letter_task", _dead_letter)
+    monkeypatch.setattr(ingest, "enqueue_webhook_delivery", _enqueue)
+
+    try:
+        assert await ingest.flush_webhook_ingest_buffer(batch_size=3) == 1
+
+        assert [delivery.payload_id for delivery in enqueued] == [good.payload_id]
+        assert dead_lettered == [malformed]
+        ((task, kwargs),) = requeued
+        assert QueuedWebhookIngest.from_task(task).payload_id == duplicate.payload_id
+        assert kwargs["dead_letter"] is True
+        assert kwargs["delay_seconds"] == ingest.settings.rq_dispatch_retry_base_seconds
+        async with session_maker() as session:
+            stored = (await session.exec(select(col(BoardWebhookPayload.id)))).all()
+        assert set(stored) == {good.payload_id, duplicate.payload_id}
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunked", [False, True])
+async def test_ingest_board_webhook_rejects_oversized_body(
+    monkeypatch: pytest.MonkeyPatch,
+    chunked: bool,
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    app = _build_test_app(session_maker)
+    buffered: list[QueuedWebhookIngest] = []
+
+    async with session_maker() as session:
+        board, webhook = await _seed_webhook(session, enabled=True)
+
+    monkeypatch.setattr(board_webhooks.settings, "webhook_max_payload_bytes", 64)
+    monkeypatch.setattr(board_webhooks, "enqueue_webhook_ingest", buffered.append)
+
+    async def _chunks() -> AsyncIterator[bytes]:
+        for _ in range(10):
+            yield b"x" * 16
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as client:
+            response = await client.post(
+                f"/api/v1/boards/{board.id}/webhooks/{webhook.id}",
+                content=_chunks() if chunked else b"x" * 160,
+            )
+
+        assert response.status_code == 413
+        assert buffered == []
+        async with session_maker() as session:
+            stored = (await session.exec(select(BoardWebhookPayload))).all()
+            assert stored == []
+    finally:
+        await engine.dispose()
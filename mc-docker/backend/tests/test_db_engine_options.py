@@ -0,0 +1,57 @@
+# ruff: noqa: INP001
+"""Database engine pool and statement-timeout option tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.core.auth_mode import AuthMode
+from app.core.config import Settings
+from app.db.session import _engine_options
+
+
+def _settings(**overrides: Any) -> Settings:
+    return Settings(
+        _env_file=None,
+        auth_mode=AuthMode.LOCAL,
+        local_auth_token="x" * 50,
+        **overrides,
+    )
+
+
+def test_postgres_engine_gets_pool_sizing_and_statement_timeout() -> None:
+    options = _engine_options(
+        "postgresql+psycopg://user:pw@db:5432/app",
+        _settings(
+            db_pool_size=4,
+            db_max_overflow=2,
+            db_pool_timeout_seconds=5,
+            db_pool_recycle_seconds=0,
+            db_statement_timeout_ms=2500,
+        ),
+    )
+
+    assert options == {
+        "pool_pre_ping": True,
+        "pool_size": 4,
+        "max_overflow": 2,
+        "pool_timeout": 5,
+        "pool_recycle": -1,
+        "connect_args": {"options": "-c statement_timeout=2500"},
+    }
+
+
+def test_statement_timeout_is_omitted_when_disabled() -> None:
+    options = _engine_options("postgresql+psycopg://user:pw@db/app", _settings())
+
+    assert "connect_args" not in options
+    assert options["pool_recycle"] == 1800
+
+
+def test_sqlite_engine_skips_pool_arguments() -> None:
+    options = _engine_options(
+        "sqlite+aiosqlite:///:memory:",
+        _settings(db_statement_timeout_ms=1000),
+    )
+
+    assert options == {"pool_pre_ping": True}
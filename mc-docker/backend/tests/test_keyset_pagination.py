@@ -0,0 +1,139 @@
+# ruff: noqa: INP001
+"""Keyset (cursor) pagination helper tests."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.pagination import KeysetParams, decode_cursor, encode_cursor, paginate_keyset
+from app.models.activity_events import ActivityEvent
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+async def _seed_events(session: AsyncSession, count: int) -> list[ActivityEvent]:
+    base = datetime(2026, 1, 1)
+    # Pairs of events share a timestamp so the id tie-breaker is exercised.
+    events = [
+        ActivityEvent(event_type="task.updated", created_at=base + timedelta(minutes=index // 2))
+        for index in range(count)
+    ]
+    session.add_all(events)
+    await session.commit()
+    return events
+
+
+def _expected_order(events: list[ActivityEvent]) -> list[object]:
+    ordered = sorted(events, key=lambda event: (event.created_at, event.id.hex), reverse=True)
+    return [event.id for event in ordered]
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2026, 3, 4, 5, 6, 7, 890)
+    row_id = uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_walk_every_row_once_without_count() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            events = await _seed_events(session, 11)
+            statement = select(ActivityEvent)
+            seen: list[object] = []
+            cursor: str | None = None
+            pages = 0
+            while True:
+                page = await paginate_keyset(
+                    session,
+                    statement,
+                    params=KeysetParams(limit=4, cursor=cursor, include_total=False),
+                    sort_column=col(ActivityEvent.created_at),
+                    id_column=col(ActivityEvent.id),
+                )
+                pages += 1
+                assert page.total is None
+                seen.extend(item.id for item in page.items)
+                if page.next_cursor is None:
+                    break
+                cursor = page.next_cursor
+    finally:
+        await engine.dispose()
+
+    assert pages == 3
+    assert seen == _expected_order(events)
+
+
+@pytest.mark.asyncio
+async def test_offset_pages_keep_exact_total_and_emit_cursor() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            events = await _seed_events(session, 5)
+            statement = select(ActivityEvent)
+            first = await paginate_keyset(
+                session,
+                statement,
+                params=KeysetParams(limit=2, offset=1),
+                sort_column=col(ActivityEvent.created_at),
+                id_column=col(ActivityEvent.id),
+            )
+            assert first.next_cursor is not None
+            follow = await paginate_keyset(
+                session,
+                statement,
+                params=KeysetParams(limit=10, cursor=first.next_cursor, include_total=True),
+                sort_column=col(ActivityEvent.created_at),
+                id_column=col(ActivityEvent.id),
+                transformer=lambda rows: [row.id for row in rows],
+            )
+    finally:
+        await engine.dispose()
+
+    expected = _expected_order(events)
+    assert first.total == 5
+    assert first.offset == 1
+    assert [item.id for item in first.items] == expected[1:3]
+    assert list(follow.items) == expected[3:]
+    assert follow.next_cursor is None
+    # SQLite has no planner estimate, so cursor totals fall back to an exact count.
+    assert follow.total == 5
+    assert follow.total_is_estimate is False
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_is_rejected() -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            with pytest.raises(HTTPException) as exc_info:
+                await paginate_keyset(
+                    session,
+                    select(ActivityEvent),
+                    params=KeysetParams(cursor="%%%"),
+                    sort_column=col(ActivityEvent.created_at),
+                    id_column=col(ActivityEvent.id),
+                )
+    finally:
+        await engine.dispose()
+
+    assert exc_info.value.status_code == 422
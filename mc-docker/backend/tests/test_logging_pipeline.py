@@ -0,0 +1,108 @@
+# ruff: noqa: INP001, S101
+"""Tests for the queued, non-blocking logging pipeline."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import queue
+import sys
+from logging.handlers import QueueListener
+
+from app.core import logging as app_logging
+from app.core.logging import (
+    TRACE_LEVEL,
+    AppLogFilter,
+    BoundedQueueHandler,
+    DebugSamplingFilter,
+    JsonFormatter,
+)
+
+
+def _record(level: int = logging.INFO, msg: str = "event", args: tuple = ()) -> logging.LogRecord:
+    return logging.LogRecord("tests.logging", level, __file__, 1, msg, args, None)
+
+
+def test_bounded_queue_handler_drops_and_reports_overflow() -> None:
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue)
+
+    for _ in range(5):
+        handler.emit(_record())
+
+    assert handler.dropped == 3
+    assert log_queue.qsize() == 2
+
+    log_queue.get_nowait()
+    log_queue.get_nowait()
+    handler.emit(_record())
+
+    queued = [log_queue.get_nowait() for _ in range(log_queue.qsize())]
+    assert queued[-1].getMessage() == "logging.queue.dropped count=3 total=3"
+    assert queued[-1].levelno == logging.WARNING
+
+
+def test_bounded_queue_handler_renders_message_before_enqueueing() -> None:
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = BoundedQueueHandler(log_queue)
+    payload = {"value": 42}
+
+    handler.emit(_record(msg="payload=%s", args=(payload,)))
+    payload["value"] = 0
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        failed = _record(msg="failed")
+        failed.exc_info = sys.exc_info()
+    handler.emit(failed)
+
+    record = log_queue.get_nowait()
+    assert record.getMessage() == "payload={'value': 42}"
+    assert record.args is None
+    failed_record = log_queue.get_nowait()
+    assert failed_record.exc_info is None
+    assert "ValueError: boom" in (failed_record.exc_text or "")
+    assert "ValueError: boom" in json.loads(JsonFormatter().format(failed_record))["exception"]
+
+
+def test_debug_sampling_filter_keeps_the_configured_fraction() -> None:
+    sampler = DebugSamplingFilter(0.25)
+
+    kept = [sampler.filter(_record(logging.DEBUG)) for _ in range(8)]
+    trace_kept = sampler.filter(_record(TRACE_LEVEL))
+
+    assert kept.count(True) == 2
+    assert isinstance(trace_kept, bool)
+    assert all(sampler.filter(_record(logging.INFO)) for _ in range(4))
+    assert not DebugSamplingFilter(0.0).filter(_record(logging.DEBUG))
+    for rate, expected in ((0.7, 700), (0.4, 400), (0.33, 330)):
+        fractional = DebugSamplingFilter(rate)
+        assert sum(fractional.filter(_record(logging.DEBUG)) for _ in range(1000)) == expected
+
+
+def test_queue_listener_writes_json_with_context_from_producer() -> None:
+    stream = io.StringIO()
+    sink = logging.StreamHandler(stream)
+    sink.setFormatter(JsonFormatter())
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = BoundedQueueHandler(log_queue)
+    handler.addFilter(AppLogFilter("mission-control", "test"))
+    listener = QueueListener(log_queue, sink)
+    listener.start()
+
+    logger = logging.getLogger("tests.logging.pipeline")
+    logger.propagate = False
+    logger.addHandler(handler)
+    token = app_logging.set_request_id("req-123")
+    try:
+        logger.warning("queued %s", "message")
+    finally:
+        app_logging.reset_request_id(token)
+        logger.removeHandler(handler)
+        listener.stop()
+
+    payload = json.loads(stream.getvalue().strip())
+    assert payload["message"] == "queued message"
+    assert payload["request_id"] == "req-123"
+    assert payload["app"] == "mission-control"
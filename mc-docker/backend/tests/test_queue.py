@@ -8,22 +8,66 @@ from datetime import UTC, datetime
 
 import pytest
 
-from app.services.queue import QueuedTask, dequeue_task, enqueue_task, requeue_if_failed
+from app.services.queue import (
+    QueuedTask,
+    dead_letter_queue_name,
+    dequeue_task,
+    dequeue_task_batch,
+    enqueue_task,
+    requeue_if_failed,
+)
 
 
 class _FakeRedis:
     def __init__(self) -> None:
-        self.values: list[str] = []
-
-    def lpush(self, key: str, value: str) -> None:
-        del key
-        self.values.insert(0, value)
-
-    def rpop(self, key: str) -> str | None:
-        del key
-        if not self.values:
+        self.lists: dict[str, list[str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    @property
+    def values(self) -> list[str]:
+        return self.lists.setdefault("generic-queue", [])
+
+    def lpush(self, key: str, *values: str) -> None:
+        for value in values:
+            self.lists.setdefault(key, []).insert(0, value)
+
+    def rpop(self, key: str, count: int | None = None) -> str | list[str] | None:
+        values = self.lists.setdefault(key, [])
+        if count is not None:
+            popped = [values.pop() for _ in range(min(count, len(values)))]
+            return popped or None
+        if not values:
             return None
-        return self.values.pop()
+        return values.pop()
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zrangebyscore(
+        self,
+        key: str,
+        low: float | str,
+        high: float | str,
+        *,
+        start: int = 0,
+        num: int | None = None,
+        withscores: bool = False,
+    ) -> list[str] | list[tuple[str, float]]:
+        def _bound(value: float | str) -> float:
+            return float(value.replace("inf", "Infinity")) if isinstance(value, str) else value
+
+        members = sorted(
+            (score, member)
+            for member, score in self.zsets.get(key, {}).items()
+            if _bound(low) <= score <= _bound(high)
+        )[start : None if num is None else start + num]
+        if withscores:
+            return [(member, score) for score, member in members]
+        return [member for _, member in members]
+
+    def zrem(self, key: str, *members: str) -> None:
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
 
 
 @pytest.mark.parametrize("attempts", [0, 1, 2])
@@ -103,3 +147,67 @@ def test_dequeue_task_tolerates_legacy_payload_without_envelope(
     assert task.task_type == "legacy"
     assert task.attempts == 2
     assert task.payload["board_id"] == "6f3ab1ec-3ef6-4f4d-a6a7-e2d6e5d6f7a8"
+
+
+def test_dequeue_task_batch_pops_oldest_first_and_dead_letters_bad_items(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake = _FakeRedis()
+
+    def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
+        return fake
+
+    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
+    for index in range(3):
+        enqueue_task(
+            QueuedTask(
+                task_type="generic-task",
+                payload={"index": index},
+                created_at=datetime.now(UTC),
+            ),
+            "generic-queue",
+        )
+    fake.lpush("generic-queue", "not-json")
+    enqueue_task(
+        QueuedTask(task_type="generic-task", payload={"index": 3}, created_at=datetime.now(UTC)),
+        "generic-queue",
+    )
+
+    first = dequeue_task_batch("generic-queue", count=4)
+    rest = dequeue_task_batch("generic-queue", count=4)
+
+    assert [task.payload["index"] for task in first] == [0, 1, 2]
+    assert [task.payload["index"] for task in rest] == [3]
+    assert dequeue_task_batch("generic-queue", count=4) == []
+    assert fake.lists[dead_letter_queue_name("generic-queue")] == ["not-json"]
+
+
+def test_requeue_past_retry_cap_can_dead_letter_and_delayed_retries_return(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    fake = _FakeRedis()
+    clock = [1000.0]
+
+    def _fake_redis(*, redis_url: str | None = None) -> _FakeRedis:
+        return fake
+
+    monkeypatch.setattr("app.services.queue._redis_client", _fake_redis)
+    monkeypatch.setattr("app.services.queue._now_seconds", lambda: clock[0])
+    retried = QueuedTask(task_type="generic-task", payload={"n": 1}, created_at=datetime.now(UTC))
+    exhausted = QueuedTask(
+        task_type="generic-task",
+        payload={"n": 2},
+        created_at=datetime.now(UTC),
+        attempts=3,
+    )
+
+    assert requeue_if_failed(retried, "generic-queue", max_retries=3, delay_seconds=30) is True
+    assert requeue_if_failed(exhausted, "generic-queue", max_retries=3, dead_letter=True) is False
+    assert dequeue_task_batch("generic-queue", count=10) == []
+
+    clock[0] += 31
+    (task,) = dequeue_task_batch("generic-queue", count=10)
+    assert task.payload == {"n": 1}
+    assert task.attempts == 1
+    (parked,) = fake.lists[dead_letter_queue_name("generic-queue")]
+    assert json.loads(parked)["attempts"] == 4
@@ -0,0 +1,54 @@
+# ruff: noqa: INP001
+"""Queue worker dispatch loop tests."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.services import queue_worker
+from app.services.queue import QueuedTask
+from app.services.webhooks.queue import TASK_TYPE as WEBHOOK_TASK_TYPE
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_drains_ingest_once_per_poll_interval(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tasks = [
+        QueuedTask(task_type=WEBHOOK_TASK_TYPE, payload={}, created_at=datetime.now(UTC))
+        for _ in range(5)
+    ]
+    drains: list[int] = []
+    clock = [100.0]
+
+    async def _handle(_task: QueuedTask) -> None:
+        clock[0] += 0.4
+
+    async def _flush_ingest() -> int:
+        drains.append(len(tasks))
+        return 0
+
+    monkeypatch.setattr(
+        queue_worker, "dequeue_task", lambda *_a, **_k: tasks.pop(0) if tasks else None
+    )
+    monkeypatch.setitem(
+        queue_worker._TASK_HANDLERS,
+        WEBHOOK_TASK_TYPE,
+        queue_worker._TaskHandler(
+            handler=_handle,
+            attempts_to_delay=lambda _attempts: 0,
+            requeue=lambda _task, _delay: True,
+        ),
+    )
+    monkeypatch.setattr(queue_worker, "flush_webhook_ingest_buffer", _flush_ingest)
+    monkeypatch.setattr(queue_worker.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(queue_worker.settings, "rq_dispatch_throttle_seconds", 0)
+    monkeypatch.setattr(queue_worker.settings, "webhook_ingest_poll_seconds", 1.0)
+    monkeypatch.setattr(queue_worker, "_ingest_drain_clock", queue_worker._IngestDrainClock())
+
+    assert await queue_worker.flush_queue() == 5
+
+    # Due after the first task, then once a full poll interval has passed.
+    assert drains == [4, 1]
@@ -0,0 +1,93 @@
+# ruff: noqa: INP001, S101
+"""Tests for per-route latency histograms and per-request SQL accounting."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.error_handling import install_error_handling
+from app.core.request_metrics import (
+    MetricsRegistry,
+    RequestDbStats,
+    begin_request_db_stats,
+    end_request_db_stats,
+    instrument_engine,
+    metrics_registry,
+)
+
+
+def test_registry_renders_cumulative_prometheus_histograms() -> None:
+    registry = MetricsRegistry()
+    for seconds in (0.004, 0.03, 3.0):
+        registry.observe_request(
+            method="GET",
+            route="/api/v1/boards/{board_id}/tasks",
+            status_code=200,
+            duration_seconds=seconds,
+            db_stats=RequestDbStats(statements=4, seconds=0.002),
+        )
+
+    body = registry.render_prometheus(extra_counters={"x_total": ("help", 2)})
+    labels = 'method="GET",route="/api/v1/boards/{board_id}/tasks",status="200"'
+
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.005"}} 1' in body
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.05"}} 2' in body
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in body
+    assert f"http_request_duration_seconds_count{{{labels}}} 3" in body
+    assert f'http_request_db_statements_bucket{{{labels},le="5"}} 3' in body
+    assert "x_total 2" in body
+
+
+@pytest.mark.asyncio
+async def test_engine_hooks_count_statements_for_active_request() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_engine(engine.sync_engine)
+    stats, token = begin_request_db_stats()
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+    finally:
+        end_request_db_stats(token)
+        await engine.dispose()
+
+    assert stats.statements == 2
+    assert stats.seconds >= 0.0
+
+
+def test_middleware_records_route_template_not_raw_path() -> None:
+    metrics_registry.reset()
+    app = FastAPI()
+    install_error_handling(app)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: str) -> dict[str, str]:
+        return {"id": item_id}
+
+    client = TestClient(app)
+    client.get("/items/a")
+    client.get("/items/b")
+    client.get("/missing")
+
+    body = metrics_registry.render_prometheus()
+    metrics_registry.reset()
+
+    route_labels = 'method="GET",route="/items/{item_id}",status="200"'
+    assert f"http_request_duration_seconds_count{{{route_labels}}} 2" in body
+    assert 'route="unmatched",status="404"' in body
+    assert "/items/a" not in body
+
+
+def test_metrics_endpoint_serves_prometheus_text() -> None:
+    from app.main import app
+
+    resp = TestClient(app).get("/metrics")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert "# TYPE http_request_duration_seconds histogram" in resp.text
+    assert "app_log_records_dropped_total" in resp.text
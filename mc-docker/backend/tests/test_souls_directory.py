@@ -1,10 +1,28 @@
 # ruff: noqa: INP001, S101
-"""Unit tests for souls-directory parsing and search helpers."""
+"""Unit tests for souls-directory parsing, search, and caching helpers."""
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.services import souls_directory
 from app.services.souls_directory import SoulRef, _parse_sitemap_soul_refs, search_souls
 
+_SOUL_URL = "https://souls.directory/api/souls/team/data-scientist.md"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[Path]:
+    monkeypatch.setattr(souls_directory.settings, "souls_directory_cache_dir", str(tmp_path))
+    souls_directory._clear_memory_caches()
+    yield tmp_path
+    souls_directory._clear_memory_caches()
+
 
 def test_parse_sitemap_extracts_soul_refs() -> None:
     """Sitemap parser should emit only valid soul handle/slug refs."""
@@ -31,3 +49,156 @@ def test_search_souls_matches_handle_or_slug() -> None:
     ]
     assert search_souls(refs, query="writer", limit=20) == [refs[1]]
     assert search_souls(refs, query="thedaviddias", limit=20) == [refs[0], refs[1]]
+
+
+@pytest.mark.asyncio
+async def test_fetch_soul_markdown_single_flights_concurrent_misses() -> None:
+    """Concurrent misses for the same soul should share one upstream request."""
+    calls: list[str] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text="# SOUL", headers={"ETag": '"v1"'})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+        results = await asyncio.gather(
+            *[
+                souls_directory.fetch_soul_markdown(
+                    handle="team",
+                    slug="data-scientist",
+                    client=client,
+                )
+                for _ in range(5)
+            ],
+        )
+        cached = await souls_directory.fetch_soul_markdown(
+            handle="team",
+            slug="data-scientist.md",
+            client=client,
+        )
+
+    assert results == ["# SOUL"] * 5
+    assert cached == "# SOUL"
+    assert calls == [_SOUL_URL]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_waiters_survive_leader_cancellation() -> None:
+    """A cancelled leader should hand the fetch to a waiter, not cancel everyone."""
+    started = asyncio.Event()
+    calls = 0
+
+    async def _factory() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await asyncio.sleep(10)
+        await asyncio.sleep(0.01)
+        return "# SOUL"
+
+    leader = asyncio.create_task(souls_directory._single_flight("soul", _factory))
+    await started.wait()
+    waiters = [
+        asyncio.create_task(souls_directory._single_flight("soul", _factory)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.gather(*waiters) == ["# SOUL"] * 3
+    assert leader.cancelled()
+    assert calls == 2
+    assert souls_directory._state.inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_fetch_soul_markdown_revalidates_with_etag(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Expired entries should be revalidated and reused on 304 Not Modified."""
+    monkeypatch.setattr(souls_directory.settings, "souls_directory_markdown_ttl_seconds", 0)
+    seen_headers: list[str | None] = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="# SOUL v1", headers={"ETag": '"v1"'})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+        first = await souls_directory.fetch_soul_markdown(
+            handle="team",
+            slug="data-scientist",
+            client=client,
+        )
+        second = await souls_directory.fetch_soul_markdown(
+            handle="team",
+            slug="data-scientist",
+            client=client,
+        )
+
+    assert first == second == "# SOUL v1"
+    assert seen_headers == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_serves_souls_after_restart_when_offline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A cold process should fall back to the disk cache when upstream is unreachable."""
+    sitemap = (
+        "<urlset><url><loc>https://souls.directory/souls/team/data-scientist</loc></url></urlset>"
+    )
+
+    async def _online(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/sitemap.xml":
+            return httpx.Response(200, text=sitemap)
+        return httpx.Response(200, text="# SOUL")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_online)) as client:
+        await souls_directory.list_souls_directory_refs(client=client)
+        await souls_directory.fetch_soul_markdown(
+            handle="team",
+            slug="data-scientist",
+            client=client,
+        )
+
+    souls_directory._clear_memory_caches()
+    monkeypatch.setattr(souls_directory, "_SITEMAP_TTL_SECONDS", 0)
+    monkeypatch.setattr(souls_directory.settings, "souls_directory_markdown_ttl_seconds", 0)
+
+    async def _offline(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("offline", request=request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_offline)) as client:
+        refs = await souls_directory.list_souls_directory_refs(client=client)
+        content = await souls_directory.fetch_soul_markdown(
+            handle="team",
+            slug="data-scientist",
+            client=client,
+        )
+
+    assert refs == [SoulRef(handle="team", slug="data-scientist")]
+    assert content == "# SOUL"
+
+
+@pytest.mark.asyncio
+async def test_markdown_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The in-memory markdown cache should stay within its configured size."""
+    monkeypatch.setattr(souls_directory.settings, "souls_directory_cache_dir", "")
+    monkeypatch.setattr(souls_directory.settings, "souls_directory_markdown_cache_size", 2)
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=request.url.path)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+        for slug in ("a", "b", "c"):
+            await souls_directory.fetch_soul_markdown(handle="team", slug=slug, client=client)
+
+    assert list(souls_directory._state.markdown) == [
+        "https://souls.directory/api/souls/team/b.md",
+        "https://souls.directory/api/souls/team/c.md",
+    ]
@@ -0,0 +1,266 @@
+# ruff: noqa: INP001
+"""Bulk task create/update validation, writes and coalesced notifications."""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel, col, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import tasks as tasks_api
+from app.api.deps import ActorContext
+from app.models.activity_events import ActivityEvent
+from app.models.agents import Agent
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.models.tags import Tag
+from app.models.task_dependencies import TaskDependency
+from app.models.tasks import Task
+from app.schemas.tasks import TaskBulkRequest
+from app.services import task_counts, task_hydration
+from app.services.openclaw.gateway_rpc import GatewayConfig as GatewayClientConfig
+from app.services.openclaw.gateway_rpc import OpenClawGatewayError
+from app.services.task_counts import TaskCountsCache
+from app.services.task_hydration import TaskHydrationCache
+
+
+class _FakeRedis:
+    async def publish(self, _channel: str, _message: str) -> None:
+        return None
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+@pytest.fixture
+def sent(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    hydration_cache = TaskHydrationCache(ttl_seconds=60, client=_FakeRedis())  # type: ignore[arg-type]
+    monkeypatch.setattr(tasks_api, "task_hydration_cache", hydration_cache)
+    monkeypatch.setattr(task_hydration, "task_hydration_cache", hydration_cache)
+    counts_cache = TaskCountsCache(ttl_seconds=60)
+    monkeypatch.setattr(tasks_api, "task_counts_cache", counts_cache)
+    monkeypatch.setattr(task_counts, "task_counts_cache", counts_cache)
+    messages: list[dict[str, Any]] = []
+
+    async def _fake_optional_gateway_config_for_board(
+        self: tasks_api.GatewayDispatchService,
+        _board: Board,
+    ) -> GatewayClientConfig:
+        _ = self
+        return GatewayClientConfig(url="ws://gateway.example/ws", token=None)
+
+    async def _fake_try_send_agent_message(
+        self: tasks_api.GatewayDispatchService,
+        **kwargs: Any,
+    ) -> OpenClawGatewayError | None:
+        _ = self
+        messages.append(kwargs)
+        return None
+
+    monkeypatch.setattr(
+        tasks_api.GatewayDispatchService,
+        "optional_gateway_config_for_board",
+        _fake_optional_gateway_config_for_board,
+    )
+    monkeypatch.setattr(
+        tasks_api.GatewayDispatchService,
+        "try_send_agent_message",
+        _fake_try_send_agent_message,
+    )
+    return messages
+
+
+async def _seed(session: AsyncSession) -> tuple[Board, Agent, Agent]:
+    organization = Organization(name="org")
+    gateway = Gateway(
+        organization_id=organization.id,
+        name="gateway",
+        url="https://gateway.example.local",
+        workspace_root="/tmp/workspace",
+    )
+    board = Board(
+        organization_id=organization.id,
+        gateway_id=gateway.id,
+        name="board",
+        slug="board",
+    )
+    lead = Agent(
+        name="Lead",
+        board_id=board.id,
+        gateway_id=gateway.id,
+        is_board_lead=True,
+        openclaw_session_id="agent:lead:session",
+    )
+    worker = Agent(
+        name="Worker",
+        board_id=board.id,
+        gateway_id=gateway.id,
+        openclaw_session_id="agent:worker:session",
+    )
+    session.add_all([organization, gateway, board, lead, worker])
+    await session.commit()
+    return board, lead, worker
+
+
+async def _count(session: AsyncSession, model: type[SQLModel]) -> int:
+    return (await session.exec(select(func.count()).select_from(model))).one()
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_links_refs_and_sends_one_message_per_agent(
+    sent: list[dict[str, Any]],
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            board, _lead, worker = await _seed(session)
+            tag = Tag(organization_id=board.organization_id, name="infra", slug="infra")
+            session.add(tag)
+            await session.commit()
+            payload = TaskBulkRequest.model_validate(
+                {
+                    "create": [
+                        {"ref": "design", "title": "Design", "tag_ids": [str(tag.id)]},
+                        {
+                            "title": "Build",
+                            "depends_on_refs": ["design"],
+                            "tag_ids": [str(tag.id), str(tag.id)],
+                        },
+                        {"title": "Docs", "assigned_agent_id": str(worker.id)},
+                        {"title": "Ops", "assigned_agent_id": str(worker.id)},
+                    ],
+                },
+            )
+
+            result = await tasks_api.apply_task_bulk(
+                session,
+                board=board,
+                payload=payload,
+                actor=ActorContext(actor_type="user"),
+            )
+
+            design, build, _docs, _ops = result.created
+            assert build.depends_on_task_ids == [design.id]
+            assert build.is_blocked is True
+            assert build.tag_ids == [tag.id]
+            assert await _count(session, Task) == 4
+            assert await _count(session, TaskDependency) == 1
+            created_events = await session.exec(
+                select(func.count()).where(col(ActivityEvent.event_type) == "task.created"),
+            )
+            assert created_events.one() == 4
+            assert tasks_api.task_counts_cache._boards.get(board.id) is None
+    finally:
+        await engine.dispose()
+
+    assert sorted(item["agent_name"] for item in sent) == ["Lead Agent", "Worker"]
+    lead_message = next(item["message"] for item in sent if item["agent_name"] == "Lead Agent")
+    assert "NEW TASKS ADDED (4)" in lead_message
+    worker_message = next(item["message"] for item in sent if item["agent_name"] == "Worker")
+    assert "TASKS ASSIGNED (2)" in worker_message
+    assert "- Docs" in worker_message and "- Ops" in worker_message
+
+
+@pytest.mark.asyncio
+async def test_bulk_request_with_a_cycle_writes_nothing(sent: list[dict[str, Any]]) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            board, _lead, _worker = await _seed(session)
+            existing = Task(board_id=board.id, title="existing")
+            session.add(existing)
+            await session.commit()
+            existing_id = existing.id
+            payload = TaskBulkRequest.model_validate(
+                {
+                    "create": [
+                        {"ref": "new", "title": "new", "depends_on_task_ids": [str(existing_id)]}
+                    ],
+                    "update": [{"id": str(existing_id), "depends_on_refs": ["new"]}],
+                },
+            )
+
+            with pytest.raises(HTTPException) as exc:
+                await tasks_api.apply_task_bulk(
+                    session,
+                    board=board,
+                    payload=payload,
+                    actor=ActorContext(actor_type="user"),
+                )
+            await session.rollback()
+
+            assert exc.value.status_code == 409
+            assert await _count(session, Task) == 1
+            assert await _count(session, TaskDependency) == 0
+    finally:
+        await engine.dispose()
+    assert sent == []
+
+
+@pytest.mark.asyncio
+async def test_lead_bulk_update_gates_fields_and_blocked_assignment(
+    sent: list[dict[str, Any]],
+) -> None:
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            board, lead, worker = await _seed(session)
+            dependency = Task(board_id=board.id, title="dependency")
+            task = Task(board_id=board.id, title="task")
+            session.add_all([dependency, task])
+            await session.commit()
+            actor = ActorContext(actor_type="agent", agent=lead)
+
+            def _request(update: dict[str, object]) -> TaskBulkRequest:
+                return TaskBulkRequest.model_validate({"update": [{"id": str(task.id), **update}]})
+
+            with pytest.raises(HTTPException) as gated:
+                await tasks_api.apply_task_bulk(
+                    session,
+                    board=board,
+                    payload=_request({"title": "renamed"}),
+                    actor=actor,
+                )
+            assert gated.value.status_code == 403
+
+            with pytest.raises(HTTPException) as blocked:
+                await tasks_api.apply_task_bulk(
+                    session,
+                    board=board,
+                    payload=_request(
+                        {
+                            "depends_on_task_ids": [str(dependency.id)],
+                            "assigned_agent_id": str(worker.id),
+                        },
+                    ),
+                    actor=actor,
+                )
+            assert blocked.value.status_code == 409
+            assert blocked.value.detail["blocked_by_task_ids"] == [str(dependency.id)]  # type: ignore[index]
+
+            result = await tasks_api.apply_task_bulk(
+                session,
+                board=board,
+                payload=_request({"depends_on_task_ids": [str(dependency.id)]}),
+                actor=actor,
+            )
+            updated_ids: list[UUID] = [item.id for item in result.updated]
+    finally:
+        await engine.dispose()
+
+    assert updated_ids == [task.id]
+    assert result.updated[0].blocked_by_task_ids == [dependency.id]
+    assert sent == []
@@ -68,6 +68,7 @@ class _FakeSession:
     exec_results: list[object]
     executed: list[object] = field(default_factory=list)
     added: list[object] = field(default_factory=list)
+    info: dict[str, object] = field(default_factory=dict)
 
     async def exec(self, _query):
         is_dml = _query.__class__.__name__ in {"Delete", "Update", "Insert"}
@@ -0,0 +1,162 @@
+# ruff: noqa: INP001
+"""Task hydration cache and invalidation tests."""
+
+from __future__ import annotations
+
+import json
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api import tasks as tasks_api
+from app.models.boards import Board
+from app.models.gateways import Gateway
+from app.models.organizations import Organization
+from app.models.tag_assignments import TagAssignment
+from app.models.tags import Tag
+from app.models.tasks import Task
+from app.services import task_hydration
+from app.services.tags import TagState
+from app.services.task_hydration import TaskHydration, TaskHydrationCache
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.published: list[dict[str, object]] = []
+
+    async def publish(self, _channel: str, message: str) -> None:
+        self.published.append(json.loads(message))
+
+
+async def _make_engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn, conn.begin():
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def _counting_loader(calls: list[list[UUID]]) -> task_hydration.HydrationLoader:
+    async def _load(
+        _session: AsyncSession,
+        _board_id: UUID,
+        task_ids: list[UUID],
+    ) -> dict[UUID, TaskHydration]:
+        calls.append(list(task_ids))
+        return {
+            task_id: TaskHydration(
+                tag_state=TagState(),
+                dependency_ids=[],
+                custom_field_values={"calls": len(calls)},
+            )
+            for task_id in task_ids
+        }
+
+    return _load
+
+
+@pytest.mark.asyncio
+async def test_cache_loads_only_missing_tasks_until_board_is_invalidated() -> None:
+    redis = _FakeRedis()
+    cache = TaskHydrationCache(ttl_seconds=60, client=redis)  # type: ignore[arg-type]
+    board_id = uuid4()
+    first, second = uuid4(), uuid4()
+    calls: list[list[UUID]] = []
+    loader = _counting_loader(calls)
+
+    await cache.get_many(None, board_id=board_id, task_ids=[first], loader=loader)  # type: ignore[arg-type]
+    hydrated = await cache.get_many(
+        None,  # type: ignore[arg-type]
+        board_id=board_id,
+        task_ids=[first, second],
+        loader=loader,
+    )
+    assert calls == [[first], [second]]
+    assert hydrated[first].custom_field_values == {"calls": 1}
+
+    cache.invalidate(board_id)
+    await cache.get_many(None, board_id=board_id, task_ids=[first], loader=loader)  # type: ignore[arg-type]
+    assert calls[-1] == [first]
+    # Let the fire-and-forget publish run.
+    for pending in list(cache._publishes):
+        await pending
+    assert redis.published[0]["boards"] == [str(board_id)]
+
+
+@pytest.mark.asyncio
+async def test_load_racing_an_invalidation_is_not_cached() -> None:
+    cache = TaskHydrationCache(ttl_seconds=60, client=_FakeRedis())  # type: ignore[arg-type]
+    board_id = uuid4()
+    task_id = uuid4()
+    calls: list[list[UUID]] = []
+    inner = _counting_loader(calls)
+
+    async def _racing_loader(
+        session: AsyncSession,
+        loaded_board_id: UUID,
+        task_ids: list[UUID],
+    ) -> dict[UUID, TaskHydration]:
+        result = await inner(session, loaded_board_id, task_ids)
+        cache.apply_remote(json.dumps({"origin": "other-replica", "boards": [str(board_id)]}))
+        return result
+
+    await cache.get_many(None, board_id=board_id, task_ids=[task_id], loader=_racing_loader)  # type: ignore[arg-type]
+    await cache.get_many(None, board_id=board_id, task_ids=[task_id], loader=inner)  # type: ignore[arg-type]
+
+    assert calls == [[task_id], [task_id]]
+
+
+@pytest.mark.asyncio
+async def test_task_pages_reuse_hydration_until_commit_invalidates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = TaskHydrationCache(ttl_seconds=60, client=_FakeRedis())  # type: ignore[arg-type]
+    monkeypatch.setattr(tasks_api, "task_hydration_cache", cache)
+    monkeypatch.setattr(task_hydration, "task_hydration_cache", cache)
+    engine = await _make_engine()
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            organization = Organization(name="org")
+            gateway = Gateway(
+                organization_id=organization.id,
+                name="gateway",
+                url="https://gateway.example.local",
+                workspace_root="/tmp/workspace",
+            )
+            board = Board(
+                organization_id=organization.id,
+                gateway_id=gateway.id,
+                name="board",
+                slug="board",
+            )
+            task = Task(board_id=board.id, title="task")
+            alpha = Tag(organization_id=organization.id, name="alpha", slug="alpha")
+            beta = Tag(organization_id=organization.id, name="beta", slug="beta")
+            session.add_all([organization, gateway, board, task, alpha, beta])
+            session.add(TagAssignment(task_id=task.id, tag_id=alpha.id))
+            await session.commit()
+
+            page = await tasks_api._task_read_page(session=session, board_id=board.id, tasks=[task])
+            assert page[0].tag_ids == [alpha.id]
+
+            # A write that skips invalidation is not visible: the page is served from cache.
+            session.add(TagAssignment(task_id=task.id, tag_id=beta.id))
+            await session.commit()
+            page = await tasks_api._task_read_page(session=session, board_id=board.id, tasks=[task])
+            assert page[0].tag_ids == [alpha.id]
+
+            # A rolled-back transaction drops its pending invalidation.
+            cache.invalidate_after_commit(session, board.id)
+            await session.rollback()
+            page = await tasks_api._task_read_page(session=session, board_id=board.id, tasks=[task])
+            assert page[0].tag_ids == [alpha.id]
+
+            cache.invalidate_after_commit(session, board.id)
+            await session.commit()
+            page = await tasks_api._task_read_page(session=session, board_id=board.id, tasks=[task])
+            assert page[0].tag_ids == [alpha.id, beta.id]
+    finally:
+        await engine.dispose()
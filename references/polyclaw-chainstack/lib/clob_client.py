@@ -4,14 +4,29 @@ Wraps py_clob_client_v2 for order execution with proxy support.
 Includes retry logic for Cloudflare blocks when using rotating proxies.
 """
 
+import asyncio
+import functools
 import os
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
 
 import httpx
 
 CLOB_MAX_RETRIES = int(os.environ.get("CLOB_MAX_RETRIES", "5"))
 CLOB_HTTP_TIMEOUT = float(os.environ.get("CLOB_HTTP_TIMEOUT", "30"))
+CLOB_CALL_TIMEOUT = float(os.environ.get("CLOB_CALL_TIMEOUT", "20"))
+CLOB_EXECUTOR_WORKERS = int(os.environ.get("CLOB_EXECUTOR_WORKERS", "4"))
+CLOB_RETRY_BACKOFF = float(os.environ.get("CLOB_RETRY_BACKOFF", "1"))
+CLOB_RETRY_BACKOFF_MAX = 8.0
+
+T = TypeVar("T")
+
+
+def retry_delay(attempt: int) -> float:
+    """Exponential backoff before retry `attempt` (1-based), capped."""
+    return min(CLOB_RETRY_BACKOFF * 2 ** (attempt - 1), CLOB_RETRY_BACKOFF_MAX)
 
 
 class ClobClientWrapper:
@@ -25,6 +40,7 @@ class ClobClientWrapper:
         self.api_secret = api_secret or os.environ.get("POLYMARKET_API_SECRET")
         self.api_passphrase = api_passphrase or os.environ.get("POLYMARKET_API_PASSPHRASE")
         self._client = None
+        self._client_lock = threading.Lock()
 
     def _init_client(self):
         """Initialize CLOB V2 client."""
@@ -41,7 +57,7 @@ class ClobClientWrapper:
                 api_passphrase=self.api_passphrase,
             )
 
-        self._client = ClobClient(
+        client = ClobClient(
             host="https://clob.polymarket.com",
             chain_id=137,
             key=self.private_key,
@@ -51,65 +67,79 @@ class ClobClientWrapper:
         )
 
         if creds is None:
-            derived = self._client.create_or_derive_api_key()
-            self._client.set_api_creds(derived)
+            client.set_api_creds(client.create_or_derive_api_key())
+        # Only publish a fully initialized client; a failed derivation is retried.
+        self._client = client
 
     @property
     def client(self):
-        if self._client is None:
-            self._init_client()
+        # Pool threads may race on first use; derive API creds only once.
+        with self._client_lock:
+            if self._client is None:
+                self._init_client()
         return self._client
 
     def _is_cloudflare_block(self, error_msg: str) -> bool:
         return "403" in error_msg and ("cloudflare" in error_msg.lower() or "blocked" in error_msg.lower())
 
-    def sell_fok(
-        self,
-        token_id: str,
-        amount: float,
-        price: float,
-    ) -> tuple[Optional[str], bool, Optional[str]]:
-        """Sell tokens via CLOB using FOK order."""
+    def _post_order(self, token_id: str, amount: float, price: float, side: str, order_type: str) -> dict:
+        """Sign and post one order; blocking."""
         from py_clob_client_v2 import OrderArgs, OrderType, PartialCreateOrderOptions, Side
 
-        sell_price = round(max(price * 0.90, 0.01), 2)
-        last_error = None
+        return self.client.create_and_post_order(
+            order_args=OrderArgs(
+                token_id=token_id,
+                price=price,
+                size=amount,
+                side=getattr(Side, side),
+            ),
+            options=PartialCreateOrderOptions(tick_size="0.01"),
+            order_type=getattr(OrderType, order_type),
+        )
+
+    @staticmethod
+    def _order_outcome(result: dict) -> tuple[Optional[str], Optional[str]]:
+        if result.get("success"):
+            return result.get("orderID", str(result)[:40]), None
+        return None, result.get("errorMsg", str(result))
 
+    @staticmethod
+    def _fok_sell_price(price: float) -> float:
+        return round(max(price * 0.90, 0.01), 2)
+
+    @staticmethod
+    def _fok_sell_error(last_error: Optional[str], sell_price: float) -> Optional[str]:
+        if last_error and ("no match" in last_error.lower() or "insufficient" in last_error.lower()):
+            return f"No liquidity at ${sell_price:.2f} - tokens kept, sell manually"
+        return last_error
+
+    def _post_with_retries(self, *order) -> tuple[Optional[str], Optional[str]]:
+        """Post an order, retrying only on Cloudflare blocks."""
+        last_error = None
         for attempt in range(CLOB_MAX_RETRIES):
             try:
                 if attempt > 0:
-                    time.sleep(1)
-
-                result = self.client.create_and_post_order(
-                    order_args=OrderArgs(
-                        token_id=token_id,
-                        price=sell_price,
-                        size=amount,
-                        side=Side.SELL,
-                    ),
-                    options=PartialCreateOrderOptions(tick_size="0.01"),
-                    order_type=OrderType.FOK,
-                )
-
-                if result.get("success"):
-                    order_id = result.get("orderID", str(result)[:40])
-                    return order_id, True, None
-                else:
-                    last_error = result.get("errorMsg", str(result))
-                    break
-
+                    time.sleep(retry_delay(attempt))
+                return self._order_outcome(self._post_order(*order))
             except Exception as e:
                 last_error = str(e)
                 if self._is_cloudflare_block(last_error):
                     continue
                 break
+        return None, last_error
 
-        if last_error and ("no match" in last_error.lower() or "insufficient" in last_error.lower()):
-            error_msg = f"No liquidity at ${sell_price:.2f} - tokens kept, sell manually"
-        else:
-            error_msg = last_error
-
-        return None, False, error_msg
+    def sell_fok(
+        self,
+        token_id: str,
+        amount: float,
+        price: float,
+    ) -> tuple[Optional[str], bool, Optional[str]]:
+        """Sell tokens via CLOB using FOK order."""
+        sell_price = self._fok_sell_price(price)
+        order_id, error = self._post_with_retries(token_id, amount, sell_price, "SELL", "FOK")
+        if order_id:
+            return order_id, True, None
+        return None, False, self._fok_sell_error(error, sell_price)
 
     def buy_gtc(
         self,
@@ -118,40 +148,7 @@ class ClobClientWrapper:
         price: float,
     ) -> tuple[Optional[str], Optional[str]]:
         """Place GTC buy order."""
-        from py_clob_client_v2 import OrderArgs, OrderType, PartialCreateOrderOptions, Side
-
-        last_error = None
-
-        for attempt in range(CLOB_MAX_RETRIES):
-            try:
-                if attempt > 0:
-                    time.sleep(1)
-
-                result = self.client.create_and_post_order(
-                    order_args=OrderArgs(
-                        token_id=token_id,
-                        price=round(price, 2),
-                        size=amount,
-                        side=Side.BUY,
-                    ),
-                    options=PartialCreateOrderOptions(tick_size="0.01"),
-                    order_type=OrderType.GTC,
-                )
-
-                if result.get("success"):
-                    order_id = result.get("orderID", str(result)[:40])
-                    return order_id, None
-                else:
-                    last_error = result.get("errorMsg", str(result))
-                    break
-
-            except Exception as e:
-                last_error = str(e)
-                if self._is_cloudflare_block(last_error):
-                    continue
-                break
-
-        return None, last_error
+        return self._post_with_retries(token_id, amount, round(price, 2), "BUY", "GTC")
 
     def sell_gtc(
         self,
@@ -160,34 +157,7 @@ class ClobClientWrapper:
         price: float,
     ) -> tuple[Optional[str], Optional[str]]:
         """Place GTC sell order."""
-        from py_clob_client_v2 import OrderArgs, OrderType, PartialCreateOrderOptions, Side
-
-        last_error = None
-        for attempt in range(CLOB_MAX_RETRIES):
-            try:
-                if attempt > 0:
-                    time.sleep(1)
-                result = self.client.create_and_post_order(
-                    order_args=OrderArgs(
-                        token_id=token_id,
-                        price=round(max(price, 0.01), 2),
-                        size=amount,
-                        side=Side.SELL,
-                    ),
-                    options=PartialCreateOrderOptions(tick_size="0.01"),
-                    order_type=OrderType.GTC,
-                )
-                if result.get("success"):
-                    order_id = result.get("orderID", str(result)[:40])
-                    return order_id, None
-                last_error = result.get("errorMsg", str(result))
-                break
-            except Exception as e:
-                last_error = str(e)
-                if self._is_cloudflare_block(last_error):
-                    continue
-                break
-        return None, last_error
+        return self._post_with_retries(token_id, amount, round(max(price, 0.01), 2), "SELL", "GTC")
 
     def get_order_book(self, token_id: str) -> dict:
         return self.client.get_order_book(token_id)
@@ -201,3 +171,115 @@ class ClobClientWrapper:
             return True
         except Exception:
             return False
+
+
+class AsyncClobExecutor:
+    """Runs ClobClientWrapper calls on a bounded thread pool for async callers.
+
+    Signing and posting stay off the event loop, Cloudflare retries back off
+    with `asyncio.sleep`, and every attempt has its own timeout. The timeout
+    only starts once a pool thread is free, so waiting behind other calls never
+    turns into "order status unknown". A timed-out post is not retried: the
+    order may still have reached the exchange.
+    """
+
+    def __init__(
+        self,
+        wrapper: ClobClientWrapper,
+        max_workers: int = CLOB_EXECUTOR_WORKERS,
+        call_timeout: float = CLOB_CALL_TIMEOUT,
+        max_retries: int = CLOB_MAX_RETRIES,
+    ):
+        self.wrapper = wrapper
+        self.call_timeout = call_timeout
+        self.max_retries = max_retries
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="clob")
+        # One slot per pool thread, released when the thread finishes (not when
+        # the caller times out), so a submitted call always starts right away.
+        self._slots = asyncio.Semaphore(max_workers)
+
+    def _release_slot(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            loop.call_soon_threadsafe(self._slots.release)
+        except RuntimeError:
+            pass  # loop already closed
+
+    async def run(self, fn: Callable[..., T], *args, timeout: Optional[float] = None) -> T:
+        """Run a blocking call on the pool, bounded by `timeout` (default `call_timeout`).
+
+        Time spent waiting for a free pool thread does not count toward the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        await self._slots.acquire()
+        try:
+            future = self._pool.submit(functools.partial(fn, *args))
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._release_slot(loop))
+        return await asyncio.wait_for(
+            asyncio.wrap_future(future),
+            timeout=self.call_timeout if timeout is None else timeout,
+        )
+
+    async def warm_up(self) -> None:
+        """Build the CLOB client and derive API creds now instead of inside an order's timeout."""
+        await self.run(lambda: self.wrapper.client)
+
+    async def _post_with_retries(self, *order) -> tuple[Optional[str], Optional[str]]:
+        last_error = None
+        for attempt in range(self.max_retries):
+            if attempt > 0:
+                await asyncio.sleep(retry_delay(attempt))
+            try:
+                result = await self.run(self.wrapper._post_order, *order)
+            except asyncio.TimeoutError:
+                return None, f"CLOB order timed out after {self.call_timeout:g}s; order status unknown"
+            except Exception as e:
+                last_error = str(e)
+                if self.wrapper._is_cloudflare_block(last_error):
+                    continue
+                break
+            return self.wrapper._order_outcome(result)
+        return None, last_error
+
+    async def sell_fok(
+        self,
+        token_id: str,
+        amount: float,
+        price: float,
+    ) -> tuple[Optional[str], bool, Optional[str]]:
+        """Sell tokens via CLOB using FOK order."""
+        sell_price = self.wrapper._fok_sell_price(price)
+        order_id, error = await self._post_with_retries(token_id, amount, sell_price, "SELL", "FOK")
+        if order_id:
+            return order_id, True, None
+        return None, False, self.wrapper._fok_sell_error(error, sell_price)
+
+    async def buy_gtc(
+        self,
+        token_id: str,
+        amount: float,
+        price: float,
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Place GTC buy order."""
+        return await self._post_with_retries(token_id, amount, round(price, 2), "BUY", "GTC")
+
+    async def sell_gtc(
+        self,
+        token_id: str,
+        amount: float,
+        price: float,
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Place GTC sell order."""
+        return await self._post_with_retries(token_id, amount, round(max(price, 0.01), 2), "SELL", "GTC")
+
+    async def cancel_order(self, order_id: str) -> bool:
+        try:
+            return await self.run(self.wrapper.cancel_order, order_id)
+        except asyncio.TimeoutError:
+            return False
+
+    def shutdown(self) -> None:
+        """Stop accepting work; calls already running finish in their threads."""
+        self._pool.shutdown(wait=False)
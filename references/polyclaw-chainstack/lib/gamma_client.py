@@ -1,14 +1,23 @@
 """Polymarket Gamma API client for market browsing."""
 
+import importlib.util
 import json
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional
 
 import httpx
 import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 
 
 GAMMA_API_BASE = "https://gamma-api.polymarket.com"
+CLOB_API_BASE = "https://clob.polymarket.com"
+MARKET_CACHE_TTL_SECONDS = 30
+LOCAL_CACHE_MAX_ENTRIES = 2048
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to HTTP/1.1 without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 @dataclass
@@ -45,26 +54,113 @@ class MarketGroup:
 
 
 class GammaClient:
-    """HTTP client for Polymarket Gamma API."""
+    """HTTP client for Polymarket Gamma API.
 
-    def __init__(self, timeout: float = 30.0, redis_client: Optional[aioredis.Redis] = None):
+    Requests share one pooled keep-alive connection set for the client's
+    lifetime. Use it as an async context manager or call `aclose()` when done.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        redis_client: Optional[aioredis.Redis] = None,
+        cache_ttl: float = MARKET_CACHE_TTL_SECONDS,
+        *,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        base_url: str = GAMMA_API_BASE,
+        clob_base_url: str = CLOB_API_BASE,
+    ):
         self.timeout = timeout
         self.redis = redis_client
+        self.cache_ttl = cache_ttl
+        self.base_url = base_url.rstrip("/")
+        self.clob_base_url = clob_base_url.rstrip("/")
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._transport = transport
+        self._http: Optional[httpx.AsyncClient] = None
+        # In-process LRU fallback used when Redis is not configured or not reachable.
+        self._local_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self.cache_stats = {"hits": 0, "misses": 0, "redis_errors": 0}
+
+    async def __aenter__(self) -> "GammaClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Shared pooled client, created on first use and after `aclose()`."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self._transport,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _cache_get(self, key: str) -> Optional[dict]:
+        """Return cached market JSON from Redis, or the local cache without Redis."""
+        if self.redis:
+            try:
+                cached = await self.redis.get(key)
+            except (RedisError, OSError):
+                self.cache_stats["redis_errors"] += 1
+            else:
+                self.cache_stats["hits" if cached else "misses"] += 1
+                return json.loads(cached) if cached else None
+        entry = self._local_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            self._local_cache.move_to_end(key)
+            self.cache_stats["hits"] += 1
+            return entry[1]
+        self._local_cache.pop(key, None)
+        self.cache_stats["misses"] += 1
+        return None
+
+    async def _cache_set(self, key: str, data: dict) -> None:
+        if self.cache_ttl <= 0:
+            return
+        if self.redis:
+            try:
+                await self.redis.setex(key, int(self.cache_ttl), json.dumps(data))
+                return
+            except (RedisError, OSError):
+                self.cache_stats["redis_errors"] += 1
+        self._local_cache[key] = (time.monotonic() + self.cache_ttl, data)
+        self._local_cache.move_to_end(key)
+        while len(self._local_cache) > LOCAL_CACHE_MAX_ENTRIES:
+            self._local_cache.popitem(last=False)
 
     async def get_trending_markets(self, limit: int = 20) -> list[Market]:
         """Get trending markets by volume."""
-        async with httpx.AsyncClient(timeout=self.timeout) as http:
-            resp = await http.get(
-                f"{GAMMA_API_BASE}/markets",
-                params={
-                    "closed": "false",
-                    "limit": limit,
-                    "order": "volume24hr",
-                    "ascending": "false",
-                },
-            )
-            resp.raise_for_status()
-            return [self._parse_market(m) for m in resp.json()]
+        resp = await self.http.get(
+            f"{self.base_url}/markets",
+            params={
+                "closed": "false",
+                "limit": limit,
+                "order": "volume24hr",
+                "ascending": "false",
+            },
+        )
+        resp.raise_for_status()
+        return [self._parse_market(m) for m in resp.json()]
 
     async def search_markets(self, query: str, limit: int = 20) -> list[Market]:
         """Search markets by keyword.
@@ -75,104 +171,97 @@ class GammaClient:
         # Fetch more markets to search through
         fetch_limit = max(500, limit * 10)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as http:
-            resp = await http.get(
-                f"{GAMMA_API_BASE}/markets",
-                params={
-                    "closed": "false",
-                    "limit": fetch_limit,
-                    "order": "volume24hr",
-                    "ascending": "false",
-                },
-            )
-            resp.raise_for_status()
+        resp = await self.http.get(
+            f"{self.base_url}/markets",
+            params={
+                "closed": "false",
+                "limit": fetch_limit,
+                "order": "volume24hr",
+                "ascending": "false",
+            },
+        )
+        resp.raise_for_status()
 
-            # Client-side filter by query in question or slug
-            query_lower = query.lower()
-            matches = []
-            for m in resp.json():
-                question = m.get("question", "").lower()
-                slug = m.get("slug", "").lower()
-                if query_lower in question or query_lower in slug:
-                    matches.append(self._parse_market(m))
-                    if len(matches) >= limit:
-                        break
+        # Client-side filter by query in question or slug
+        query_lower = query.lower()
+        matches = []
+        for m in resp.json():
+            question = m.get("question", "").lower()
+            slug = m.get("slug", "").lower()
+            if query_lower in question or query_lower in slug:
+                matches.append(self._parse_market(m))
+                if len(matches) >= limit:
+                    break
 
-            return matches
+        return matches
 
     async def get_market(self, market_id: str) -> Market:
         """Get market by ID."""
         cache_key = f"polymarket:market:{market_id}"
-        if self.redis:
-            cached_data = await self.redis.get(cache_key)
-            if cached_data:
-                return self._parse_market(json.loads(cached_data))
+        cached_data = await self._cache_get(cache_key)
+        if cached_data is not None:
+            return self._parse_market(cached_data)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as http:
-            if market_id.startswith("0x"):
-                resp = await http.get(f"{GAMMA_API_BASE}/markets", params={"condition_id": market_id})
-            else:
-                resp = await http.get(f"{GAMMA_API_BASE}/markets/{market_id}")
-            try:
-                resp.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 422:
-                    raise ValueError(
-                        f"Invalid market ID {market_id!r}: Gamma API returned 422 Unprocessable Entity. "
-                        "Use a valid condition ID (0x + 64 hex chars) or numeric market ID."
-                    ) from e
-                raise
-                
-            market_data = resp.json()
-            if isinstance(market_data, list):
-                if not market_data:
-                    raise ValueError(f"Market not found for condition_id {market_id}")
-                market_data = market_data[0]
-                
-            if self.redis:
-                await self.redis.setex(cache_key, 30, json.dumps(market_data))  # Cache for 30 seconds
-            return self._parse_market(market_data)
+        if market_id.startswith("0x"):
+            resp = await self.http.get(f"{self.base_url}/markets", params={"condition_id": market_id})
+        else:
+            resp = await self.http.get(f"{self.base_url}/markets/{market_id}")
+        try:
+            resp.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 422:
+                raise ValueError(
+                    f"Invalid market ID {market_id!r}: Gamma API returned 422 Unprocessable Entity. "
+                    "Use a valid condition ID (0x + 64 hex chars) or numeric market ID."
+                ) from e
+            raise
+
+        market_data = resp.json()
+        if isinstance(market_data, list):
+            if not market_data:
+                raise ValueError(f"Market not found for condition_id {market_id}")
+            market_data = market_data[0]
+
+        await self._cache_set(cache_key, market_data)
+        return self._parse_market(market_data)
 
     async def get_market_by_slug(self, slug: str) -> Market:
         """Get market by slug."""
-        async with httpx.AsyncClient(timeout=self.timeout) as http:
-            resp = await http.get(
-                f"{GAMMA_API_BASE}/markets",
-                params={"slug": slug},
-            )
-            resp.raise_for_status()
-            markets = resp.json()
-            if not markets:
-                raise ValueError(f"Market not found: {slug}")
-            return self._parse_market(markets[0])
+        resp = await self.http.get(
+            f"{self.base_url}/markets",
+            params={"slug": slug},
+        )
+        resp.raise_for_status()
+        markets = resp.json()
+        if not markets:
+            raise ValueError(f"Market not found: {slug}")
+        return self._parse_market(markets[0])
 
     async def get_events(self, limit: int = 20) -> list[MarketGroup]:
         """Get events/groups with their markets."""
-        async with httpx.AsyncClient(timeout=self.timeout) as http:
-            resp = await http.get(
-                f"{GAMMA_API_BASE}/events",
-                params={
-                    "closed": "false",
-                    "limit": limit,
-                    "order": "volume24hr",
-                    "ascending": "false",
-                },
-            )
-            resp.raise_for_status()
-            return [self._parse_event(e) for e in resp.json()]
+        resp = await self.http.get(
+            f"{self.base_url}/events",
+            params={
+                "closed": "false",
+                "limit": limit,
+                "order": "volume24hr",
+                "ascending": "false",
+            },
+        )
+        resp.raise_for_status()
+        return [self._parse_event(e) for e in resp.json()]
 
     async def get_prices(self, token_ids: list[str]) -> dict[str, float]:
         """Get current prices for token IDs."""
         if not token_ids:
             return {}
 
-        async with httpx.AsyncClient(timeout=self.timeout) as http:
-            resp = await http.get(
-                "https://clob.polymarket.com/prices",
-                params={"token_ids": ",".join(token_ids)},
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self.http.get(
+            f"{self.clob_base_url}/prices",
+            params={"token_ids": ",".join(token_ids)},
+        )
+        resp.raise_for_status()
+        return resp.json()
 
     def _parse_market(self, data: dict) -> Market:
         """Parse market JSON into Market dataclass."""
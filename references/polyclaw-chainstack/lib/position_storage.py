@@ -1,9 +1,17 @@
-"""Position storage - JSON file with atomic writes."""
+"""Position storage - SQLite database in WAL mode.
+
+Each position is one row keyed by `position_id`, with indexes on market,
+token and status, so lookups and updates touch a single row instead of
+rewriting the whole file. WAL mode lets readers (`positions list`) run while
+trades and hedges write. Positions from the old `positions.json` are imported
+the first time the database is opened.
+"""
 
 import json
+import sqlite3
+import sys
 import threading
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import dataclass, asdict, fields
 from pathlib import Path
 from typing import Optional
 
@@ -14,15 +22,13 @@ def get_storage_dir() -> Path:
     return storage_dir
 
 
-POSITIONS_FILE = get_storage_dir() / "positions.json"
-
-# Global lock for thread-safe file operations
-_storage_lock = threading.Lock()
+POSITIONS_DB = get_storage_dir() / "positions.db"
+POSITIONS_FILE = get_storage_dir() / "positions.json"  # legacy JSON store, imported once
 
 
 @dataclass
 class PositionEntry:
-    """Position entry stored in JSON file."""
+    """Position entry stored in the positions database."""
 
     position_id: str
 
@@ -47,85 +53,224 @@ class PositionEntry:
     notes: Optional[str] = None
 
 
+_FIELDS = [f.name for f in fields(PositionEntry)]
+
+# Column defaults from _SCHEMA, applied to missing or null fields: an explicit
+# NULL would bypass SQLite's DEFAULT and fail the NOT NULL constraint.
+_DEFAULTS = {
+    "market_id": "",
+    "question": "",
+    "position": "",
+    "token_id": "",
+    "entry_time": "",
+    "entry_amount": 0.0,
+    "entry_price": 0.0,
+    "split_tx": "",
+    "clob_order_id": None,
+    "clob_filled": False,
+    "status": "open",
+    "notes": None,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    position_id TEXT PRIMARY KEY,
+    market_id TEXT NOT NULL DEFAULT '',
+    question TEXT NOT NULL DEFAULT '',
+    position TEXT NOT NULL DEFAULT '',
+    token_id TEXT NOT NULL DEFAULT '',
+    entry_time TEXT NOT NULL DEFAULT '',
+    entry_amount REAL NOT NULL DEFAULT 0,
+    entry_price REAL NOT NULL DEFAULT 0,
+    split_tx TEXT NOT NULL DEFAULT '',
+    clob_order_id TEXT,
+    clob_filled INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'open',
+    notes TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_positions_market ON positions (market_id);
+CREATE INDEX IF NOT EXISTS ix_positions_token ON positions (token_id);
+CREATE INDEX IF NOT EXISTS ix_positions_status ON positions (status);
+
+CREATE TABLE IF NOT EXISTS storage_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_UPSERT = (
+    f"INSERT INTO positions ({', '.join(_FIELDS)}, extra) "
+    f"VALUES ({', '.join('?' for _ in _FIELDS)}, ?) "
+    f"ON CONFLICT(position_id) DO UPDATE SET "
+    + ", ".join(f"{name} = excluded.{name}" for name in _FIELDS[1:] + ["extra"])
+)
+
+
+def _row_values(position: dict) -> tuple:
+    """Column values for a position dict; unknown keys are kept in `extra`.
+
+    Missing fields take the column defaults. Raises ValueError without a `position_id`.
+    """
+    if not position.get("position_id"):
+        raise ValueError("position has no position_id")
+    values = [
+        position["position_id"],
+        *(
+            _DEFAULTS[name] if position.get(name) is None else position[name]
+            for name in _FIELDS[1:]
+        ),
+    ]
+    values[_FIELDS.index("clob_filled")] = int(bool(values[_FIELDS.index("clob_filled")]))
+    extra = {k: v for k, v in position.items() if k not in _FIELDS}
+    return (*values, json.dumps(extra) if extra else None)
+
+
+def _row_dict(row: sqlite3.Row) -> dict:
+    position = {name: row[name] for name in _FIELDS}
+    position["clob_filled"] = bool(position["clob_filled"])
+    if row["extra"]:
+        position.update(json.loads(row["extra"]))
+    return position
+
+
 class PositionStorage:
-    """Manage positions.json file with atomic writes."""
+    """Manage the positions database with single-row atomic writes."""
 
-    def __init__(self, path: Path = POSITIONS_FILE):
-        self.path = path
+    def __init__(self, path: Path = POSITIONS_DB, json_path: Optional[Path] = POSITIONS_FILE):
+        self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; multi-statement writes use explicit transactions.
+        self._db = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()  # serializes this connection across threads
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        if json_path is not None:
+            self.import_json(json_path, only_once=True)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> list[dict]:
+        with self._lock:
+            return [_row_dict(row) for row in self._db.execute(sql, params)]
+
+    def _write(self, sql: str, params: tuple = ()) -> int:
+        """Run one statement (atomic on its own) and return the affected row count."""
+        with self._lock:
+            return self._db.execute(sql, params).rowcount
+
+    def import_json(self, path: Path = POSITIONS_FILE, only_once: bool = False) -> int:
+        """Upsert positions from a legacy JSON file; returns how many were imported.
+
+        With `only_once`, a file that was already imported is skipped. Entries
+        that cannot be stored are reported on stderr and skipped.
+        """
+        path = Path(path)
+        if not path.exists():
+            return 0
+        key = f"imported:{path.resolve()}"
+        with self._lock:
+            if only_once and self._db.execute(
+                "SELECT 1 FROM storage_meta WHERE key = ?", (key,)
+            ).fetchone():
+                return 0
+            try:
+                positions = json.loads(path.read_text())
+            except json.JSONDecodeError:
+                positions = []
+            if not isinstance(positions, list):
+                positions = []
+            imported = 0
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for index, position in enumerate(positions):
+                    try:
+                        if not isinstance(position, dict):
+                            raise ValueError("not an object")
+                        self._db.execute(_UPSERT, _row_values(position))
+                    except (ValueError, TypeError, sqlite3.Error) as e:
+                        print(f"Skipping position #{index} in {path}: {e}", file=sys.stderr)
+                        continue
+                    imported += 1
+                self._db.execute(
+                    "INSERT OR REPLACE INTO storage_meta (key, value) VALUES (?, ?)",
+                    (key, str(imported)),
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+        return imported
 
     def load_all(self) -> list[dict]:
-        """Load all positions from JSON file."""
-        if not self.path.exists():
-            return []
-        try:
-            return json.loads(self.path.read_text())
-        except json.JSONDecodeError:
-            return []
+        """Load all positions, oldest first."""
+        return self._query("SELECT * FROM positions ORDER BY rowid")
 
     def save_all(self, positions: list[dict]) -> None:
-        """Atomic write all positions to file."""
-        temp = self.path.with_suffix(".tmp")
-        temp.write_text(json.dumps(positions, indent=2))
-        temp.replace(self.path)
+        """Atomically replace all positions."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute("DELETE FROM positions")
+                self._db.executemany(_UPSERT, [_row_values(p) for p in positions])
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
 
     def add(self, entry: PositionEntry) -> None:
-        """Add new position entry (thread-safe)."""
-        with _storage_lock:
-            positions = self.load_all()
-            positions.append(asdict(entry))
-            self.save_all(positions)
+        """Add a position entry, replacing any existing one with the same ID."""
+        self.upsert(asdict(entry))
+
+    def upsert(self, position: dict) -> None:
+        """Insert or replace one position dict; missing fields take the column defaults."""
+        self._write(_UPSERT, _row_values(position))
 
     def get(self, position_id: str) -> Optional[dict]:
         """Get position by ID."""
-        positions = self.load_all()
-        for p in positions:
-            if p.get("position_id") == position_id:
-                return p
-        return None
+        rows = self._query("SELECT * FROM positions WHERE position_id = ?", (position_id,))
+        return rows[0] if rows else None
+
+    def find_by_prefix(self, prefix: str) -> list[dict]:
+        """Get positions whose ID starts with `prefix`."""
+        # GLOB is case-sensitive like str.startswith and can use the primary key index.
+        escaped = "".join(f"[{c}]" if c in "*?[" else c for c in prefix)
+        return self._query(
+            "SELECT * FROM positions WHERE position_id GLOB ? ORDER BY rowid", (escaped + "*",)
+        )
 
     def get_by_market(self, market_id: str) -> list[dict]:
         """Get all positions for a market."""
-        positions = self.load_all()
-        return [p for p in positions if p.get("market_id") == market_id]
+        return self._query("SELECT * FROM positions WHERE market_id = ? ORDER BY rowid", (market_id,))
+
+    def get_by_token(self, token_id: str) -> list[dict]:
+        """Get all positions holding a token."""
+        return self._query("SELECT * FROM positions WHERE token_id = ? ORDER BY rowid", (token_id,))
 
     def get_open(self) -> list[dict]:
         """Get all open positions."""
-        positions = self.load_all()
-        return [p for p in positions if p.get("status") == "open"]
+        return self._query("SELECT * FROM positions WHERE status = 'open' ORDER BY rowid")
 
     def update_status(self, position_id: str, status: str) -> bool:
-        """Update position status (thread-safe)."""
-        with _storage_lock:
-            positions = self.load_all()
-            for p in positions:
-                if p.get("position_id") == position_id:
-                    p["status"] = status
-                    self.save_all(positions)
-                    return True
-            return False
+        """Update position status."""
+        return self._write(
+            "UPDATE positions SET status = ? WHERE position_id = ?", (status, position_id)
+        ) > 0
 
     def update_notes(self, position_id: str, notes: str) -> bool:
-        """Update position notes (thread-safe)."""
-        with _storage_lock:
-            positions = self.load_all()
-            for p in positions:
-                if p.get("position_id") == position_id:
-                    p["notes"] = notes
-                    self.save_all(positions)
-                    return True
-            return False
+        """Update position notes."""
+        return self._write(
+            "UPDATE positions SET notes = ? WHERE position_id = ?", (notes, position_id)
+        ) > 0
 
     def delete(self, position_id: str) -> bool:
-        """Delete position by ID (thread-safe)."""
-        with _storage_lock:
-            positions = self.load_all()
-            filtered = [p for p in positions if p.get("position_id") != position_id]
-            if len(filtered) < len(positions):
-                self.save_all(filtered)
-                return True
-            return False
+        """Delete position by ID."""
+        return self._write("DELETE FROM positions WHERE position_id = ?", (position_id,)) > 0
 
     def count(self) -> int:
         """Get total position count."""
-        return len(self.load_all())
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
@@ -16,7 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / ".env")
 
-from lib.position_storage import PositionStorage, PositionEntry
+from lib.position_storage import POSITIONS_FILE, PositionStorage, PositionEntry
 from lib.gamma_client import GammaClient
 
 
@@ -149,8 +149,7 @@ async def cmd_show(args):
     gamma = GammaClient()
 
     # Find position by ID prefix
-    positions = storage.load_all()
-    matches = [p for p in positions if p["position_id"].startswith(args.position_id)]
+    matches = storage.find_by_prefix(args.position_id)
 
     if not matches:
         print(f"Position not found: {args.position_id}")
@@ -203,8 +202,7 @@ def cmd_close(args):
     storage = PositionStorage()
 
     # Find by prefix
-    positions = storage.load_all()
-    matches = [p for p in positions if p["position_id"].startswith(args.position_id)]
+    matches = storage.find_by_prefix(args.position_id)
 
     if not matches:
         print(f"Position not found: {args.position_id}")
@@ -225,8 +223,7 @@ def cmd_delete(args):
     storage = PositionStorage()
 
     # Find by prefix
-    positions = storage.load_all()
-    matches = [p for p in positions if p["position_id"].startswith(args.position_id)]
+    matches = storage.find_by_prefix(args.position_id)
 
     if not matches:
         print(f"Position not found: {args.position_id}")
@@ -249,6 +246,18 @@ def cmd_delete(args):
     return 0
 
 
+def cmd_import(args):
+    """Import positions from a legacy positions.json file."""
+    storage = PositionStorage()
+    path = Path(args.file) if args.file else POSITIONS_FILE
+    if not path.exists():
+        print(f"File not found: {path}")
+        return 1
+    imported = storage.import_json(path)
+    print(f"Imported {imported} positions from {path} ({storage.count()} total)")
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(description="Position tracking")
     parser.add_argument("--json", action="store_true", help="JSON output")
@@ -281,6 +290,10 @@ def main():
     delete_parser.add_argument("position_id", help="Position ID (prefix match)")
     delete_parser.add_argument("--force", "-f", action="store_true", help="Skip confirmation")
 
+    # Import
+    import_parser = subparsers.add_parser("import", help="Import positions from a positions.json file")
+    import_parser.add_argument("--file", help="JSON file (default: ~/.openclaw/polyclaw/positions.json)")
+
     args = parser.parse_args()
 
     if args.command == "list":
@@ -293,6 +306,8 @@ def main():
         return cmd_close(args)
     elif args.command == "delete":
         return cmd_delete(args)
+    elif args.command == "import":
+        return cmd_import(args)
     else:
         # Default to list
         args.all = False
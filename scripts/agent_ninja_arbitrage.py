@@ -8,6 +8,9 @@ import logging
 from datetime import datetime, timezone
 import sys
 import time
+from typing import Optional
+
+import numpy as np
 
 # Configure path so we can import clawd libraries
 from pathlib import Path
@@ -17,6 +20,7 @@ sys.path.insert(0, str(POLYCLAW_ROOT))
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from lib.gamma_client import GammaClient
+from scripts.lib.tick_store import TickRecorder
 import redis.asyncio as aioredis
 
 logger = logging.getLogger("ArbitrageNinja")
@@ -24,99 +28,361 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(me
 
 DRY_RUN = os.environ.get("DRY_RUN", "true").lower() == "true"
 MIN_SPREAD = float(os.environ.get("MIN_SPREAD", "0.02"))  # 2 cents default
+NINJA_SIZE_USD = float(os.environ.get("NINJA_SIZE_USD", "1.0"))  # simulated order size
+TICK = 0.001  # improvement over the best quotes when capturing the spread
 WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
 DATA_DIR = PROJECT_ROOT / "data"
 NINJA_LOG = DATA_DIR / "ninja_trades.jsonl"
 
-# Performance counters
-stats = {
-    "ticks": 0,
-    "opportunities": 0,
-    "simulated_trades": 0,
-    "simulated_pnl": 0.0,
-    "max_spread": 0.0,
-    "avg_spread": 0.0,
-    "spreads": [],
-}
-
-def log_ninja_trade(trade_data):
-    """Append a ninja trade to the JSONL file."""
+SPREAD_WINDOW = 4096  # spreads kept for rolling stats
+LOG_FLUSH_ENTRIES = 100
+LOG_FLUSH_SECONDS = 2.0
+
+
+class RingBuffer:
+    """Fixed-capacity float ring buffer backed by a numpy array."""
+
+    def __init__(self, capacity: int):
+        self._data = np.zeros(capacity, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value: float) -> None:
+        self._data[self._next] = value
+        self._next = (self._next + 1) % len(self._data)
+        self._count = min(self._count + 1, len(self._data))
+
+    def last(self, n: Optional[int] = None) -> np.ndarray:
+        """The most recent `n` values (all when None), oldest first."""
+        n = self._count if n is None else min(n, self._count)
+        if n == 0:
+            return self._data[:0]
+        start = (self._next - n) % len(self._data)
+        if start < self._next:
+            return self._data[start:self._next]
+        return np.concatenate((self._data[start:], self._data[:self._next]))
+
+    def mean(self, n: Optional[int] = None) -> float:
+        values = self.last(n)
+        return float(values.mean()) if len(values) else 0.0
+
+
+class OrderBook:
+    """L2 book for one asset: price -> size on each side."""
+
+    __slots__ = ("bids", "asks", "in_opportunity")
+
+    def __init__(self):
+        self.bids: dict[float, float] = {}
+        self.asks: dict[float, float] = {}
+        self.in_opportunity = False
+
+    @staticmethod
+    def _levels(levels) -> dict[float, float]:
+        book = {}
+        for level in levels or []:
+            size = float(level["size"])
+            if size > 0:
+                book[float(level["price"])] = size
+        return book
+
+    def apply_snapshot(self, bids, asks) -> None:
+        self.bids = self._levels(bids)
+        self.asks = self._levels(asks)
+
+    def apply_change(self, side: str, price: float, size: float) -> None:
+        levels = self.bids if side.upper() in ("BUY", "BID") else self.asks
+        if size > 0:
+            levels[price] = size
+        else:
+            levels.pop(price, None)
+
+    def best_bid(self) -> Optional[float]:
+        return max(self.bids) if self.bids else None
+
+    def best_ask(self) -> Optional[float]:
+        return min(self.asks) if self.asks else None
+
+    def depth(self, side: str) -> float:
+        """Total shares resting on a side."""
+        return sum((self.bids if side == "bids" else self.asks).values())
+
+
+class TradeLogBuffer:
+    """Buffers JSONL entries and appends them in batches."""
+
+    def __init__(self, path: Path, max_entries: int = LOG_FLUSH_ENTRIES, max_age: float = LOG_FLUSH_SECONDS):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._lines: list[str] = []
+        self._oldest = 0.0
+
+    def append(self, entry: dict) -> None:
+        if not self._lines:
+            self._oldest = time.monotonic()
+        self._lines.append(json.dumps(entry) + "\n")
+        if len(self._lines) >= self.max_entries:
+            self.flush()
+
+    def maybe_flush(self) -> None:
+        if self._lines and time.monotonic() - self._oldest >= self.max_age:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._lines:
+            return
+        chunk = "".join(self._lines)
+        self._lines.clear()
+        try:
+            self.path.parent.mkdir(exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(chunk)
+        except PermissionError:
+            with open(Path("/tmp") / self.path.name, "a") as f:
+                f.write(chunk)
+
+
+class NinjaEngine:
+    """Multi-market book state and spread-capture detection.
+
+    Opportunities capture the spread by quoting one tick inside the top of
+    book on each side, so the edge is the top-of-book spread less two ticks.
+    Depth only gates the trade: the book must hold at least the configured
+    size in shares on each side. An asset is counted once per opportunity,
+    when its edge first crosses `min_spread`.
+    """
+
+    def __init__(
+        self,
+        asset_markets: dict[str, str],
+        log: Optional[TradeLogBuffer] = None,
+        min_spread: float = MIN_SPREAD,
+        size_usd: float = NINJA_SIZE_USD,
+    ):
+        self.asset_markets = asset_markets
+        self.log = log
+        self.min_spread = min_spread
+        self.size_usd = size_usd
+        self.books: dict[str, OrderBook] = {}
+        self.spreads = RingBuffer(SPREAD_WINDOW)
+        self.stats = {
+            "ticks": 0,
+            "opportunities": 0,
+            "simulated_trades": 0,
+            "simulated_pnl": 0.0,
+            "max_spread": 0.0,
+        }
+
+    def _book(self, asset_id: str) -> OrderBook:
+        book = self.books.get(asset_id)
+        if book is None:
+            book = self.books[asset_id] = OrderBook()
+        return book
+
+    def process_event(self, data: dict, now: Optional[float] = None) -> list[dict]:
+        """Apply one websocket event and return the opportunities it opened."""
+        updated: list[str] = []
+        try:
+            if "price_changes" in data:
+                for change in data["price_changes"]:
+                    asset_id = change.get("asset_id", "")
+                    self._book(asset_id).apply_change(
+                        change["side"], float(change["price"]), float(change["size"])
+                    )
+                    updated.append(asset_id)
+            elif "changes" in data:
+                asset_id = data.get("asset_id", "")
+                book = self._book(asset_id)
+                for change in data["changes"]:
+                    book.apply_change(change["side"], float(change["price"]), float(change["size"]))
+                updated.append(asset_id)
+            elif ("bids" in data and "asks" in data) or ("buys" in data and "sells" in data):
+                asset_id = data.get("asset_id", "")
+                self._book(asset_id).apply_snapshot(
+                    data.get("bids", data.get("buys")), data.get("asks", data.get("sells"))
+                )
+                updated.append(asset_id)
+        except (KeyError, TypeError, ValueError):
+            return []
+
+        opportunities = []
+        for asset_id in dict.fromkeys(updated):
+            opportunity = self._evaluate(asset_id, data, now)
+            if opportunity:
+                opportunities.append(opportunity)
+        return opportunities
+
+    def quote(self, asset_id: str, shares: float) -> Optional[tuple[float, float]]:
+        """Buy and sell prices one tick inside the top of book, None if either side holds under `shares`."""
+        book = self.books.get(asset_id)
+        if book is None or not book.bids or not book.asks:
+            return None
+        if book.depth("bids") < shares or book.depth("asks") < shares:
+            return None
+        return book.best_bid() + TICK, book.best_ask() - TICK
+
+    def _evaluate(self, asset_id: str, data: dict, now: Optional[float]) -> Optional[dict]:
+        book = self.books[asset_id]
+        best_bid, best_ask = book.best_bid(), book.best_ask()
+        if best_bid is None or best_ask is None:
+            return None
+        spread = best_ask - best_bid
+        stats = self.stats
+        stats["ticks"] += 1
+        self.spreads.append(spread)
+        if spread > stats["max_spread"]:
+            stats["max_spread"] = spread
+
+        # Log every 500 ticks for visibility
+        if stats["ticks"] % 500 == 0:
+            logger.info(
+                f"📊 Tick #{stats['ticks']} | Spread: ${spread:.4f} | Avg(500): ${self.spreads.mean(500):.4f} | "
+                f"Books: {len(self.books)} | Opps: {stats['opportunities']}"
+            )
+
+        shares = self.size_usd / max((best_bid + best_ask) / 2, TICK)
+        quote = self.quote(asset_id, shares)
+        if quote is None:
+            book.in_opportunity = False
+            return None
+        buy_price, sell_price = quote
+        edge = sell_price - buy_price
+        if edge <= self.min_spread:
+            book.in_opportunity = False
+            return None
+        if book.in_opportunity:
+            return None
+        book.in_opportunity = True
+
+        pnl = edge * shares
+        stats["opportunities"] += 1
+        stats["simulated_trades"] += 1
+        stats["simulated_pnl"] += pnl
+        logger.info(
+            f"🤑 SPREAD #{stats['opportunities']}: ${edge:.4f} (top ${spread:.4f}) on {asset_id[:12]}... | "
+            f"BUY@{buy_price:.3f} SELL@{sell_price:.3f} x{shares:.1f} | Profit: ${pnl:.4f}"
+        )
+
+        ts = datetime.fromtimestamp(event_time(data, now), tz=timezone.utc)
+        trade = {
+            "timestamp": ts.isoformat(),
+            "type": "spread_capture",
+            "market": self.asset_markets.get(asset_id, ""),
+            "asset_id": asset_id[:20],
+            "best_bid": best_bid,
+            "best_ask": best_ask,
+            "spread": round(spread, 4),
+            "executable_spread": round(edge, 4),
+            "buy_price": round(buy_price, 4),
+            "sell_price": round(sell_price, 4),
+            "profit": round(edge, 4),
+            "size_usd": self.size_usd,
+            "shares": round(shares, 4),
+            "pnl": round(pnl, 4),
+            "cumulative_pnl": round(stats["simulated_pnl"], 4),
+            "dry_run": DRY_RUN,
+            "execution_mode": "dry" if DRY_RUN else "live",
+            "tick": stats["ticks"],
+        }
+        if self.log:
+            self.log.append(trade)
+        return trade
+
+
+def event_time(data: dict, default: Optional[float] = None) -> float:
+    """Event time in epoch seconds from its millisecond `timestamp`, else `default` or now."""
     try:
-        DATA_DIR.mkdir(exist_ok=True)
-        with open(NINJA_LOG, "a") as f:
-            f.write(json.dumps(trade_data) + "\n")
-    except PermissionError:
-        with open(Path("/tmp/ninja_trades.jsonl"), "a") as f:
-            f.write(json.dumps(trade_data) + "\n")
-
-async def ninja_bot(market_id: str, duration: int = 0):
+        return int(float(data["timestamp"])) / 1000
+    except (KeyError, TypeError, ValueError):
+        return default if default is not None else time.time()
+
+
+async def _resolve_markets(gamma: GammaClient, market_ids: list[str], top: int) -> list:
+    if market_ids == ["auto"]:
+        logger.info(f"Fetching trending markets to find {top} liquid target(s)...")
+        return await gamma.get_trending_markets(limit=top)
+    logger.info("Fetching market token IDs from Gamma API...")
+    markets = []
+    for market_id in market_ids:
+        try:
+            markets.append(await gamma.get_market(market_id))
+        except Exception as e:
+            logger.error(f"Market {market_id} skipped: {e}")
+    return markets
+
+
+async def ninja_bot(market_ids: list[str], duration: int = 0, top: int = 1, record_dir: Optional[Path] = None):
     logger.info(f"🥷 Starting ArbitrageNinja in DRY_RUN={DRY_RUN}")
-    logger.info(f"🎯 Target Market: {market_id}")
+    logger.info(f"🎯 Target Market(s): {', '.join(market_ids)}")
     if duration:
         logger.info(f"⏱️  Running for {duration} seconds (quick-sim mode)")
-    
+    if record_dir:
+        logger.info(f"📼 Recording book events to {record_dir}")
+
     redis_client = aioredis.from_url(os.environ.get("REDIS_URL", "redis://localhost:6379/0"))
-    gamma = GammaClient(redis_client=redis_client)
-    
-    if market_id.lower() == "auto":
-        logger.info("Fetching trending markets to find a liquid target...")
-        trending = await gamma.get_trending_markets(limit=5)
-        if not trending:
-            logger.error("No trending markets found!")
-            return
-        market = trending[0]
-        logger.info(f"Auto-selected trending market: {market.question}")
-    else:
-        logger.info("Fetching market token IDs from Gamma API...")
-        market = await gamma.get_market(market_id)
-        
-    if not market:
+    try:
+        async with GammaClient(redis_client=redis_client) as gamma:
+            markets = await _resolve_markets(gamma, market_ids, top)
+    finally:
+        await redis_client.aclose()
+
+    if not markets:
         logger.error("Market not found!")
         return
-        
-    assets = [market.yes_token_id, market.no_token_id]
-    assets = [a for a in assets if a]
-    
-    logger.info(f"✅ Market found: {market.question}")
-    logger.info(f"   YES Token: {market.yes_token_id}")
-    logger.info(f"   NO Token:  {market.no_token_id}")
-    logger.info(f"   YES Price: ${market.yes_price:.4f} | NO Price: ${market.no_price:.4f}")
-    
-    logger.info(f"Connecting to Polymarket CLOB WebSocket...")
-    
+
+    asset_markets: dict[str, str] = {}
+    for market in markets:
+        logger.info(f"✅ Market found: {market.question}")
+        logger.info(f"   YES Token: {market.yes_token_id} | NO Token: {market.no_token_id}")
+        for token_id in (market.yes_token_id, market.no_token_id):
+            if token_id:
+                asset_markets[token_id] = market.question
+    assets = list(asset_markets)
+
+    logger.info(f"Connecting to Polymarket CLOB WebSocket ({len(markets)} markets, {len(assets)} books)...")
+
     import ssl, certifi
     ssl_context = ssl.create_default_context(cafile=certifi.where())
-    
+
+    trade_log = TradeLogBuffer(NINJA_LOG)
+    engine = NinjaEngine(asset_markets, log=trade_log)
+    recorder = TickRecorder(record_dir) if record_dir else None
+    stats = engine.stats
     start_time = time.time()
-    market_question = market.question
-    
+    market_question = markets[0].question if len(markets) == 1 else f"{len(markets)} markets"
+
     try:
         async with websockets.connect(WS_URL, ssl=ssl_context) as ws:
             sub_msg = {"assets_ids": assets, "type": "market"}
             await ws.send(json.dumps(sub_msg))
             logger.info("✅ Successfully subscribed to real-time Orderbook stream!")
-            
+
             while True:
                 # Check duration limit
                 if duration and (time.time() - start_time) >= duration:
                     logger.info(f"⏱️  Duration limit ({duration}s) reached. Stopping.")
                     break
-                
+
                 try:
                     msg = await asyncio.wait_for(ws.recv(), timeout=5.0)
                 except asyncio.TimeoutError:
+                    trade_log.maybe_flush()
                     if duration and (time.time() - start_time) >= duration:
                         break
                     continue
-                    
+
                 data = json.loads(msg)
-                
-                if isinstance(data, list):
-                    for evt in data:
-                        process_event(evt, market_question)
-                else:
-                    process_event(data, market_question)
-                    
+                events = data if isinstance(data, list) else [data]
+                for evt in events:
+                    if recorder:
+                        recorder.record(evt)
+                    engine.process_event(evt)
+                trade_log.maybe_flush()
+
     except websockets.exceptions.ConnectionClosed:
         logger.error("WebSocket connection closed by server!")
     except Exception as e:
@@ -124,25 +390,26 @@ async def ninja_bot(market_id: str, duration: int = 0):
     finally:
         # Print final report
         elapsed = time.time() - start_time
+        avg_s = engine.spreads.mean(100)
         logger.info("━" * 50)
         logger.info("🥷 RELATÓRIO FINAL DO NINJA")
         logger.info("━" * 50)
         logger.info(f"   Mercado: {market_question}")
         logger.info(f"   Duração: {elapsed:.1f}s")
         logger.info(f"   Ticks recebidos: {stats['ticks']}")
-        logger.info(f"   Oportunidades (spread > {MIN_SPREAD}): {stats['opportunities']}")
+        logger.info(f"   Oportunidades (spread > {engine.min_spread}): {stats['opportunities']}")
         logger.info(f"   Trades simulados: {stats['simulated_trades']}")
         logger.info(f"   PnL simulado: ${stats['simulated_pnl']:.4f}")
-        avg_s = sum(stats['spreads'][-100:]) / max(len(stats['spreads'][-100:]), 1)
         logger.info(f"   Spread médio: ${avg_s:.4f}")
         logger.info(f"   Maior spread: ${stats['max_spread']:.4f}")
         logger.info("━" * 50)
-        
+
         # Save summary
         summary = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "type": "session_summary",
             "market": market_question,
+            "markets": len(markets),
             "duration_s": round(elapsed, 1),
             "ticks": stats["ticks"],
             "opportunities": stats["opportunities"],
@@ -151,73 +418,28 @@ async def ninja_bot(market_id: str, duration: int = 0):
             "avg_spread": round(avg_s, 4),
             "max_spread": round(stats["max_spread"], 4),
         }
-        log_ninja_trade(summary)
-
-def process_event(data, market_question=""):
-    if "bids" in data and "asks" in data:
-        bids = data["bids"]
-        asks = data["asks"]
-        if bids and asks:
-            try:
-                best_bid = float(bids[0]["price"])
-                best_ask = float(asks[0]["price"])
-                spread = best_ask - best_bid
-                asset_id = data.get("asset_id", "")
-                
-                stats["ticks"] += 1
-                stats["spreads"].append(spread)
-                if spread > stats["max_spread"]:
-                    stats["max_spread"] = spread
-                
-                # Log every 50 ticks for visibility
-                if stats["ticks"] % 50 == 0:
-                    avg = sum(stats["spreads"][-50:]) / 50
-                    logger.info(f"📊 Tick #{stats['ticks']} | Spread: ${spread:.4f} | Avg(50): ${avg:.4f} | Opps: {stats['opportunities']}")
-                
-                if spread > MIN_SPREAD:
-                    stats["opportunities"] += 1
-                    buy_price = best_bid + 0.001
-                    sell_price = best_ask - 0.001
-                    profit = sell_price - buy_price
-                    size_usd = 1.0  # Simulated $1 trade
-                    
-                    stats["simulated_trades"] += 1
-                    stats["simulated_pnl"] += profit * size_usd
-                    
-                    logger.info(f"🤑 SPREAD #{stats['opportunities']}: ${spread:.4f} on {asset_id[:12]}... | BUY@{buy_price:.3f} SELL@{sell_price:.3f} | Profit: ${profit:.4f}")
-                    
-                    trade = {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                        "type": "spread_capture",
-                        "market": market_question,
-                        "asset_id": asset_id[:20],
-                        "best_bid": best_bid,
-                        "best_ask": best_ask,
-                        "spread": round(spread, 4),
-                        "buy_price": round(buy_price, 4),
-                        "sell_price": round(sell_price, 4),
-                        "profit": round(profit, 4),
-                        "size_usd": size_usd,
-                        "cumulative_pnl": round(stats["simulated_pnl"], 4),
-                        "dry_run": DRY_RUN,
-                        "execution_mode": "dry" if DRY_RUN else "live",
-                        "tick": stats["ticks"],
-                    }
-                    log_ninja_trade(trade)
-                    
-            except (ValueError, IndexError):
-                pass
+        trade_log.append(summary)
+        trade_log.flush()
+        if recorder:
+            recorder.close()
+            logger.info(f"📼 Recorded {recorder.events} events ({recorder.rows} rows) to {record_dir}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="High-Frequency Arbitrage Ninja Agent")
-    parser.add_argument("--market", type=str, required=True, help="Market ID to arbitrage on")
+    parser.add_argument("--market", type=str, required=True,
+                        help="Market ID(s) to arbitrage on, comma-separated, or 'auto' for trending markets")
+    parser.add_argument("--top", type=int, default=1, help="With --market auto: number of trending markets to watch")
     parser.add_argument("--duration", type=int, default=0, help="Run for N seconds then stop (0=forever)")
     parser.add_argument("--daemon", action="store_true", help="Run continuously (same as duration=0)")
+    parser.add_argument("--record", type=Path, default=None, metavar="DIR",
+                        help="Also record raw book events under DIR for scripts/ninja_replay.py")
     args = parser.parse_args()
 
     duration = args.duration
     if args.daemon:
         duration = 0
 
-    asyncio.run(ninja_bot(args.market, duration))
-
+    market_ids = [m.strip() for m in args.market.split(",") if m.strip()]
+    if [m.lower() for m in market_ids] == ["auto"]:
+        market_ids = ["auto"]
+    asyncio.run(ninja_bot(market_ids, duration, top=args.top, record_dir=args.record))
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Brimo — Sell Specialist Agent
-Monitors open positions and executes sell orders based on:
+Monitors open positions on a live price feed and executes sell orders based on:
 - Take-Profit (TP): auto-sell when position gains >= TP%
 - Stop-Loss (SL): auto-sell when position loses >= SL%
 - Trailing Stop: tracks peak PnL, sells when price drops TRAILING% from peak
@@ -22,9 +22,10 @@ import logging
 import os
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -32,7 +33,9 @@ sys.path.insert(0, str(PROJECT_ROOT))
 sys.path.insert(0, str(PROJECT_ROOT / "references" / "polyclaw-chainstack"))
 
 from lib.gamma_client import GammaClient
-from lib.clob_client import ClobClientWrapper
+from lib.clob_client import AsyncClobExecutor, ClobClientWrapper
+from scripts.lib.jsonl_tail import JsonlTail
+from scripts.lib.trade_ledger import TradeLedger
 
 # Setup logging
 LOG_DIR = PROJECT_ROOT / "logs"
@@ -77,18 +80,59 @@ TAKE_PROFIT_PCT = float(os.environ.get("TAKE_PROFIT_PCT", "20.0"))
 STOP_LOSS_PCT = float(os.environ.get("STOP_LOSS_PCT", "15.0"))
 TRAILING_STOP_PCT = float(os.environ.get("TRAILING_STOP_PCT", "10.0"))
 MAX_DAILY_EXPOSURE_USD = float(os.environ.get("MAX_DAILY_EXPOSURE_USD", "20.0"))
-MONITOR_INTERVAL = int(os.environ.get("BRIMO_INTERVAL", "60"))  # seconds
+MONITOR_INTERVAL = int(os.environ.get("BRIMO_INTERVAL", "60"))  # seconds between position refreshes
+PRICE_POLL_INTERVAL = float(os.environ.get("BRIMO_PRICE_POLL", "5"))  # seconds, while the websocket is down
+REFRESH_CONCURRENCY = int(os.environ.get("BRIMO_REFRESH_CONCURRENCY", "8"))  # concurrent market lookups
+WS_RECONNECT_MAX = 60  # seconds, cap on websocket reconnect backoff
+
+WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+DATA_API_POSITIONS = "https://data-api.polymarket.com/positions"
 
 # Data files
 DATA_DIR = PROJECT_ROOT / "data"
 DATA_DIR.mkdir(exist_ok=True)
 CONFIG_FILE = DATA_DIR / "dashboard-config.json"
-RISK_EVENTS_FILE = DATA_DIR / "risk-events.jsonl"
 POSITIONS_FILE = DATA_DIR / "brimo-positions.json"
-EXECUTIONS_FILE = DATA_DIR / "executions.jsonl"
 
 # ─── Global State ────────────────────────────────────────────────
 peak_prices: dict[str, float] = {}  # token_id -> highest price seen
+_ledger: Optional[TradeLedger] = None
+# SQLite writes wait on the ledger lock; keep them off the event loop.
+ledger_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ledger")
+T = TypeVar("T")
+
+
+def get_ledger() -> TradeLedger:
+    """Shared trade ledger (mirrors risk-events.jsonl and executions.jsonl).
+
+    Only call this on `ledger_thread`; use `submit_ledger` / `ledger_call`.
+    """
+    global _ledger
+    if _ledger is None:
+        _ledger = TradeLedger()
+    return _ledger
+
+
+def _close_ledger() -> None:
+    global _ledger
+    if _ledger:
+        _ledger.close()
+        _ledger = None
+
+
+def _log_ledger_failure(future: Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Trade ledger write failed: {future.exception()}")
+
+
+def submit_ledger(fn: Callable[[TradeLedger], Any]) -> None:
+    """Queue a ledger write without waiting for it."""
+    ledger_thread.submit(lambda: fn(get_ledger())).add_done_callback(_log_ledger_failure)
+
+
+async def ledger_call(fn: Callable[[TradeLedger], T]) -> T:
+    """Run a ledger call on the ledger thread, after any queued writes, and await its result."""
+    return await asyncio.wrap_future(ledger_thread.submit(lambda: fn(get_ledger())))
 
 
 def load_config() -> dict:
@@ -120,11 +164,7 @@ def log_risk_event(event_type: str, details: dict, success: bool = True, error:
         "error": error,
     }
     logger.info(f"EVENT: {event_type} | {json.dumps(details, default=str)}")
-    try:
-        with open(RISK_EVENTS_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
-    except Exception as e:
-        logger.error(f"Failed to write risk event: {e}")
+    submit_ledger(lambda ledger: ledger.record_risk_event(entry))
 
 
 def log_execution(action: str, details: dict, success: bool, error: str = None):
@@ -136,11 +176,7 @@ def log_execution(action: str, details: dict, success: bool, error: str = None):
         "success": success,
         "error": error,
     }
-    try:
-        with open(EXECUTIONS_FILE, "a") as f:
-            f.write(json.dumps(entry) + "\n")
-    except Exception as e:
-        logger.error(f"Failed to write execution: {e}")
+    submit_ledger(lambda ledger: ledger.record_execution(entry))
 
 
 def load_position_state() -> dict:
@@ -174,6 +210,14 @@ def get_clob_client() -> ClobClientWrapper:
     )
 
 
+async def warm_up_clob(clob: AsyncClobExecutor) -> None:
+    """Derive CLOB API creds at startup so the first sell doesn't spend its timeout on it."""
+    try:
+        await clob.warm_up()
+    except Exception as e:
+        logger.warning(f"⚠️ CLOB client warm-up failed: {e} — retrying on first sell")
+
+
 async def get_balance(gamma: GammaClient) -> float:
     """Get current USDC balance."""
     # In real implementation, this queries on-chain balance
@@ -185,153 +229,298 @@ async def get_balance(gamma: GammaClient) -> float:
         return 0.0
 
 
-async def check_positions(clob: ClobClientWrapper, gamma: GammaClient):
-    """
-    Core Brimo logic: check all positions against TP/SL/trailing rules.
-    """
-    config = load_config()
-    tp_pct = float(config.get("takeProfit", TAKE_PROFIT_PCT))
-    sl_pct = float(config.get("stopLoss", STOP_LOSS_PCT))
-    ts_pct = float(config.get("trailingStop", TRAILING_STOP_PCT))
-    reserve = float(config.get("reserveFloor", RESERVE_FLOOR_USD))
+def _mid_price(bid, ask) -> Optional[float]:
+    """Midpoint when both sides are quoted, else the best bid (what a sell would hit)."""
+    try:
+        bid = float(bid) if bid not in (None, "") else 0.0
+        ask = float(ask) if ask not in (None, "") else 0.0
+    except (TypeError, ValueError):
+        return None
+    if bid > 0 and ask > 0:
+        return (bid + ask) / 2
+    return bid if bid > 0 else None
+
+
+def tick_prices(data) -> list[tuple[str, float]]:
+    """(token_id, price) pairs from a CLOB market-channel message."""
+    prices = []
+    for evt in data if isinstance(data, list) else [data]:
+        try:
+            if "price_changes" in evt:
+                for change in evt["price_changes"]:
+                    price = _mid_price(change.get("best_bid"), change.get("best_ask"))
+                    if price:
+                        prices.append((change.get("asset_id", ""), price))
+            elif "bids" in evt or "buys" in evt:
+                bids = evt.get("bids", evt.get("buys")) or []
+                asks = evt.get("asks", evt.get("sells")) or []
+                best_bid = max((float(l["price"]) for l in bids if float(l["size"]) > 0), default=None)
+                best_ask = min((float(l["price"]) for l in asks if float(l["size"]) > 0), default=None)
+                price = _mid_price(best_bid, best_ask)
+                if price:
+                    prices.append((evt.get("asset_id", ""), price))
+            elif evt.get("event_type") == "last_trade_price" and evt.get("price"):
+                prices.append((evt.get("asset_id", ""), float(evt["price"])))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            continue
+    return prices
+
+
+def _price_value(value) -> Optional[float]:
+    """A price from the CLOB /prices response: a number, or a BUY/SELL quote pair."""
+    if isinstance(value, dict):
+        return _mid_price(value.get("BUY"), value.get("SELL"))
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
-    state = load_position_state()
 
-    # Reset daily exposure if new day
-    today = datetime.utcnow().strftime("%Y-%m-%d")
-    if state.get("daily_date") != today:
-        state["daily_exposure"] = 0
-        state["daily_date"] = today
+class PositionMonitor:
+    """
+    Evaluates TP/SL/trailing rules on every price tick for held positions.
 
-    # Get open positions via Data API instead of Clob Limit Orders
-    try:
-        proxy_addr = clob.proxy_address or clob.address
-        if not proxy_addr:
-            logger.info("📊 No proxy address found")
-            return
-            
-        import httpx
-        url = f"https://data-api.polymarket.com/positions?user={proxy_addr}"
-        with httpx.Client() as c:
-            r = c.get(url, timeout=10.0)
-            
-        if r.status_code != 200:
-            logger.error(f"Failed to fetch Gamma positions: {r.text}")
+    `refresh()` reloads positions from the Data API and resolves their token
+    IDs with at most REFRESH_CONCURRENCY concurrent Gamma lookups, then checks
+    all of them at once against a single batched `get_prices` call.
+    `price_feed()` streams prices from the CLOB websocket for the held tokens,
+    and `poll_prices()` falls back to batched polling while it is down.
+    """
+
+    def __init__(self, clob: AsyncClobExecutor, gamma: GammaClient):
+        self.clob = clob
+        self.gamma = gamma
+        self.state = load_position_state()
+        self.positions: dict[str, dict] = {}  # token_id -> tracked entry in state["positions"]
+        self.limits: dict[str, float] = {}
+        self.feed_live = False
+        self._tokens: dict[tuple[str, str], str] = {}  # (market_id, outcome) -> token_id
+        self._selling: set[str] = set()
+        self._sells: set[asyncio.Task] = set()
+        self._assets_changed = asyncio.Event()
+        self._load_limits()
+
+    def _load_limits(self):
+        config = load_config()
+        self.limits = {
+            "tp": float(config.get("takeProfit", TAKE_PROFIT_PCT)),
+            "sl": float(config.get("stopLoss", STOP_LOSS_PCT)),
+            "ts": float(config.get("trailingStop", TRAILING_STOP_PCT)),
+        }
+
+    async def _fetch_positions(self) -> Optional[list]:
+        """Open positions from the Data API, None on failure."""
+        try:
+            proxy_addr = self.clob.wrapper.proxy_address or self.clob.wrapper.address
+            if not proxy_addr:
+                logger.info("📊 No proxy address found")
+                return None
+            r = await self.gamma.http.get(DATA_API_POSITIONS, params={"user": proxy_addr}, timeout=10.0)
+            if r.status_code != 200:
+                logger.error(f"Failed to fetch Gamma positions: {r.text}")
+                return None
+            return r.json() or []
+        except Exception as e:
+            logger.error(f"Failed to fetch positions: {e}")
+            log_risk_event("position_fetch_error", {}, False, str(e))
+            return None
+
+    async def _resolve_token(self, row: dict, semaphore: asyncio.Semaphore) -> Optional[str]:
+        """CLOB token ID for a Data API position; token IDs never change, so they are cached."""
+        market_id = row.get("conditionId", "")
+        outcome = str(row.get("outcome", ""))
+        key = (market_id, outcome.lower())
+        if key not in self._tokens:
+            async with semaphore:
+                market = await self.gamma.get_market(market_id)
+            if "outcomeIndex" in row:
+                is_yes = int(row["outcomeIndex"]) == 0
+            else:
+                is_yes = outcome.lower() == "yes"
+            token_id = market.yes_token_id if is_yes else market.no_token_id
+            if not token_id:
+                return None
+            self._tokens[key] = token_id
+        return self._tokens[key]
+
+    async def refresh(self):
+        """Reload held positions and check them all at the current batched prices."""
+        self._load_limits()
+        state = self.state
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+        if state.get("daily_date") != today:
+            state["daily_exposure"] = 0
+            state["daily_date"] = today
+
+        rows = await self._fetch_positions()
+        if rows is None:
             return
-            
-        orders = r.json()
-        if not orders:
+        if not rows:
             logger.info("📊 No open positions found")
-            return
-    except Exception as e:
-        logger.error(f"Failed to fetch positions: {e}")
-        log_risk_event("position_fetch_error", {}, False, str(e))
-        return
 
-    logger.info(f"📊 Checking {len(orders)} positions | TP: {tp_pct}% | SL: {sl_pct}% | Trailing: {ts_pct}%")
+        semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
 
-    for order in orders:
-        try:
-            market_id = order.get("conditionId", "")
-            side = order.get("outcome", "buy")
-            size = float(order.get("size", 0))
-            entry_price = float(order.get("avgPrice", 0))
-            
-            # The Data API doesn't expose token_id directly, but we can look it up
-            # Actually Gamma API gives us asset (which IS the token_id theoretically!)
-            # The token_id in CTF is the long integer string, but py-clob-client uses the padded hex!
-            # We MUST resolve the token_id from the market info so clob knows what to sell!
-            
-            market = await gamma.get_market(market_id)
-            if market is None:
+        async def resolve(row: dict):
+            try:
+                return row, await self._resolve_token(row, semaphore)
+            except Exception as e:
+                logger.error(f"Error resolving position {row.get('conditionId', '')[:16]}: {e}")
+                return row, None
+
+        held: dict[str, dict] = {}
+        for row, token_id in await asyncio.gather(*(resolve(row) for row in rows)):
+            try:
+                size = float(row.get("size", 0))
+                entry_price = float(row.get("avgPrice", 0))
+            except (TypeError, ValueError):
                 continue
-            
-            # Match outcome name to resolve side and token
-            is_yes = (side.lower() == "yes" or side == market.yes_outcome)
-            token_id = market.yes_token_id if is_yes else market.no_token_id
-            
             if not token_id or entry_price <= 0 or size <= 0:
                 continue
-
-            # Track position in state
             pos_key = token_id[:16]
-            if pos_key not in state["positions"]:
-                state["positions"][pos_key] = {
-                    "token_id": token_id,
-                    "market_id": market_id,
-                    "entry_price": entry_price,
-                    "size": size,
-                    "peak_price": entry_price,
-                    "entered_at": datetime.utcnow().isoformat(),
-                }
-
-            tracked = state["positions"][pos_key]
-
-            # Get current market price
-            try:
-                current_price = market.yes_price if is_yes else market.no_price
-                if not current_price or current_price <= 0:
-                    continue
-            except Exception:
-                # If we can't get price, skip this position
-                continue
+            tracked = state["positions"].setdefault(pos_key, {
+                "token_id": token_id,
+                "market_id": row.get("conditionId", ""),
+                "entry_price": entry_price,
+                "size": size,
+                "peak_price": entry_price,
+                "entered_at": datetime.utcnow().isoformat(),
+            })
+            tracked["entry_price"] = entry_price
+            tracked["size"] = size
+            held[token_id] = tracked
+
+        if held.keys() != self.positions.keys():
+            self._assets_changed.set()
+        self.positions = held
+
+        limits = self.limits
+        logger.info(f"📊 Checking {len(held)} positions | TP: {limits['tp']}% | SL: {limits['sl']}% | Trailing: {limits['ts']}%")
+        for token_id, price in (await self.fetch_prices(list(held))).items():
+            self.on_price(token_id, price, verbose=True)
+        save_position_state(state)
+
+    async def fetch_prices(self, token_ids: list[str]) -> dict[str, float]:
+        """Current prices for all `token_ids` in one CLOB request."""
+        if not token_ids:
+            return {}
+        try:
+            raw = await self.gamma.get_prices(token_ids)
+        except Exception as e:
+            logger.error(f"Failed to fetch prices: {e}")
+            return {}
+        prices = {}
+        for token_id, value in raw.items():
+            price = _price_value(value)
+            if price and price > 0:
+                prices[token_id] = price
+        return prices
+
+    def on_price(self, token_id: str, price: float, verbose: bool = False):
+        """Check one position against TP/SL/trailing at `price`; a triggered rule starts its sell."""
+        tracked = self.positions.get(token_id)
+        if tracked is None or token_id in self._selling or not price or price <= 0:
+            return
+        entry_price = tracked["entry_price"]
+        size = tracked["size"]
+        pnl_pct = ((price - entry_price) / entry_price) * 100
+        pnl_usd = (price - entry_price) * size
+
+        # Update peak price (for trailing stop)
+        if price > tracked.get("peak_price", entry_price):
+            tracked["peak_price"] = price
+        peak = tracked.get("peak_price", entry_price)
+        drop_from_peak = ((peak - price) / peak) * 100 if peak > 0 else 0
+
+        pos_key = token_id[:16]
+        tp_pct, sl_pct, ts_pct = self.limits["tp"], self.limits["sl"], self.limits["ts"]
+        if pnl_pct >= tp_pct:
+            logger.info(f"🎯 TAKE PROFIT triggered on {pos_key} | PnL: {pnl_pct:.1f}% (≥{tp_pct}%)")
+            reason = f"take_profit_{pnl_pct:.1f}%"
+        elif pnl_pct <= -sl_pct:
+            logger.info(f"🛑 STOP LOSS triggered on {pos_key} | PnL: {pnl_pct:.1f}% (≤-{sl_pct}%)")
+            reason = f"stop_loss_{pnl_pct:.1f}%"
+        elif pnl_pct > 0 and drop_from_peak >= ts_pct:
+            logger.info(f"📉 TRAILING STOP triggered on {pos_key} | Drop: {drop_from_peak:.1f}% from peak")
+            reason = f"trailing_stop_{drop_from_peak:.1f}%_from_peak"
+        else:
+            if verbose:
+                logger.info(f"  ✅ {pos_key} | Entry: ${entry_price:.3f} → ${price:.3f} | PnL: {pnl_pct:+.1f}% (${pnl_usd:+.2f})")
+            return
 
-            # Calculate PnL percentage and absolute
-            pnl_pct = float(order.get("percentPnl", ((current_price - entry_price) / entry_price) * 100))
-            pnl_usd = float(order.get("cashPnl", (current_price - entry_price) * size))
-
-            # Update peak price (for trailing stop)
-            if current_price > tracked.get("peak_price", entry_price):
-                tracked["peak_price"] = current_price
-                state["positions"][pos_key] = tracked
-
-            peak = tracked.get("peak_price", entry_price)
-            drop_from_peak = ((peak - current_price) / peak) * 100 if peak > 0 else 0
-
-            # ─── TAKE PROFIT ───
-            if pnl_pct >= tp_pct:
-                logger.info(f"🎯 TAKE PROFIT triggered on {pos_key} | PnL: {pnl_pct:.1f}% (≥{tp_pct}%)")
-                await execute_sell(
-                    clob, token_id, size, current_price,
-                    reason=f"take_profit_{pnl_pct:.1f}%",
-                    market_id=market_id, pnl_usd=pnl_usd
-                )
-                state["positions"].pop(pos_key, None)
-                continue
+        self._selling.add(token_id)
+        task = asyncio.create_task(self._sell(token_id, tracked, price, reason, pnl_usd))
+        self._sells.add(task)
+        task.add_done_callback(self._sells.discard)
 
-            # ─── STOP LOSS ───
-            if pnl_pct <= -sl_pct:
-                logger.info(f"🛑 STOP LOSS triggered on {pos_key} | PnL: {pnl_pct:.1f}% (≤-{sl_pct}%)")
-                await execute_sell(
-                    clob, token_id, size, current_price,
-                    reason=f"stop_loss_{pnl_pct:.1f}%",
-                    market_id=market_id, pnl_usd=pnl_usd
-                )
-                state["positions"].pop(pos_key, None)
+    async def _sell(self, token_id: str, tracked: dict, price: float, reason: str, pnl_usd: float):
+        try:
+            await execute_sell(
+                self.clob, token_id, tracked["size"], price,
+                reason=reason, market_id=tracked.get("market_id", ""), pnl_usd=pnl_usd,
+            )
+            # A failed sell is retried when the next refresh finds the position still held.
+            self.state["positions"].pop(token_id[:16], None)
+            self.positions.pop(token_id, None)
+            self._assets_changed.set()
+            save_position_state(self.state)
+        except Exception as e:
+            logger.error(f"Error selling {token_id[:16]}: {e}")
+        finally:
+            self._selling.discard(token_id)
+
+    async def wait_for_sells(self):
+        """Wait for sells started by price checks to finish."""
+        if self._sells:
+            await asyncio.gather(*self._sells, return_exceptions=True)
+
+    async def price_feed(self):
+        """Evaluate positions on every websocket tick; resubscribes when held tokens change."""
+        import ssl
+        import certifi
+        import websockets
+
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+        backoff = 1
+        while True:
+            self._assets_changed.clear()
+            assets = list(self.positions)
+            if not assets:
+                await self._assets_changed.wait()
                 continue
-
-            # ─── TRAILING STOP ───
-            if pnl_pct > 0 and drop_from_peak >= ts_pct:
-                logger.info(f"📉 TRAILING STOP triggered on {pos_key} | Drop: {drop_from_peak:.1f}% from peak")
-                await execute_sell(
-                    clob, token_id, size, current_price,
-                    reason=f"trailing_stop_{drop_from_peak:.1f}%_from_peak",
-                    market_id=market_id, pnl_usd=pnl_usd
-                )
-                state["positions"].pop(pos_key, None)
+            try:
+                async with websockets.connect(WS_URL, ssl=ssl_context) as ws:
+                    await ws.send(json.dumps({"assets_ids": assets, "type": "market"}))
+                    logger.info(f"📡 Price feed subscribed to {len(assets)} token(s)")
+                    self.feed_live = True
+                    backoff = 1
+                    while not self._assets_changed.is_set():
+                        try:
+                            msg = await asyncio.wait_for(ws.recv(), timeout=PRICE_POLL_INTERVAL)
+                        except asyncio.TimeoutError:
+                            continue
+                        for token_id, price in tick_prices(json.loads(msg)):
+                            self.on_price(token_id, price)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"📡 Price feed down ({e}); polling prices every {PRICE_POLL_INTERVAL}s, retry in {backoff}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, WS_RECONNECT_MAX)
+            finally:
+                self.feed_live = False
+
+    async def poll_prices(self):
+        """Batched price polling while the websocket feed is not connected."""
+        while True:
+            await asyncio.sleep(PRICE_POLL_INTERVAL)
+            if self.feed_live or not self.positions:
                 continue
-
-            # Position is fine, log status
-            logger.info(f"  ✅ {pos_key} | Entry: ${entry_price:.3f} → ${current_price:.3f} | PnL: {pnl_pct:+.1f}% (${pnl_usd:+.2f})")
-
-        except Exception as e:
-            logger.error(f"Error checking position: {e}")
-
-    save_position_state(state)
+            for token_id, price in (await self.fetch_prices(list(self.positions))).items():
+                self.on_price(token_id, price)
 
 
 async def execute_sell(
-    clob: ClobClientWrapper,
+    clob: AsyncClobExecutor,
     token_id: str,
     amount: float,
     current_price: float,
@@ -356,7 +545,7 @@ async def execute_sell(
         return
 
     try:
-        order_id, filled, error = clob.sell_fok(token_id, amount, current_price)
+        order_id, filled, error = await clob.sell_fok(token_id, amount, current_price)
         if filled and order_id:
             logger.info(f"  💰 SOLD {amount:.2f} tokens at ~${current_price:.3f} | Order: {order_id} | PnL: ${pnl_usd:+.2f}")
             log_risk_event(f"sell_{reason}", {**details, "order_id": order_id})
@@ -371,60 +560,62 @@ async def execute_sell(
         log_execution(f"brimo_sell_error ({reason})", details, False, str(e))
 
 
-async def process_sell_recommendations(gamma: GammaClient, clob: ClobClientWrapper):
+async def process_sell_recommendations(gamma: GammaClient, clob: AsyncClobExecutor):
     """Process SELL recommendations from other agents."""
     rec_file = DATA_DIR / "recommendations.jsonl"
     if not rec_file.exists():
         return
 
-    processed_file = DATA_DIR / "recommendations_processed.txt"
-    processed = set()
-    if processed_file.exists():
-        processed = set(processed_file.read_text().splitlines())
+    tail = JsonlTail(rec_file, DATA_DIR / "recommendations_offset_brimo.json")
+    recs = tail.read_new()
+    # Processed IDs are shared with the executor through the ledger.
+    processed = await ledger_call(
+        lambda ledger: ledger.processed_recommendations(
+            rec.get("id") or rec.get("market_id", "") for rec in recs
+        )
+    )
 
-    with open(rec_file, "r") as f:
-        for line in f:
-            if not line.strip():
-                continue
-            try:
-                rec = json.loads(line)
-                rec_id = rec.get("id") or rec.get("market_id", "")
-                decision = rec.get("decision", "")
+    for rec in recs:
+        try:
+            rec_id = rec.get("id") or rec.get("market_id", "")
+            decision = rec.get("decision", "")
 
-                # Only process SELL decisions
-                if rec_id in processed or "SELL" not in decision:
-                    continue
+            # Only process SELL decisions
+            if rec_id in processed or "SELL" not in decision:
+                continue
 
-                market_id = rec.get("market_id", "")
-                outcome = "YES" if "YES" in decision else "NO"
-                size = float(rec.get("sizeUsd", 1))
+            market_id = rec.get("market_id", "")
+            outcome = "YES" if "YES" in decision else "NO"
+            size = float(rec.get("sizeUsd", 1))
 
-                logger.info(f"📋 Processing sell recommendation: {decision} on {market_id[:16]}")
+            logger.info(f"📋 Processing sell recommendation: {decision} on {market_id[:16]}")
 
-                try:
-                    market = await gamma.get_market(market_id)
-                    token_id = market.yes_token_id if outcome == "YES" else market.no_token_id
-                    price = market.yes_price if outcome == "YES" else market.no_price
-
-                    if token_id and price and price > 0:
-                        import math
-                        token_amount = math.ceil(size / price)
-                        await execute_sell(
-                            clob, token_id, token_amount, price,
-                            reason=f"recommendation_{decision}",
-                            market_id=market_id,
-                        )
-                except Exception as e:
-                    logger.error(f"Failed to process sell rec {rec_id}: {e}")
-                    log_execution("brimo_sell_rec_error", {"market_id": market_id}, False, str(e))
+            try:
+                market = await gamma.get_market(market_id)
+                token_id = market.yes_token_id if outcome == "YES" else market.no_token_id
+                price = market.yes_price if outcome == "YES" else market.no_price
+
+                if token_id and price and price > 0:
+                    import math
+                    token_amount = math.ceil(size / price)
+                    await execute_sell(
+                        clob, token_id, token_amount, price,
+                        reason=f"recommendation_{decision}",
+                        market_id=market_id,
+                    )
+            except Exception as e:
+                logger.error(f"Failed to process sell rec {rec_id}: {e}")
+                log_execution("brimo_sell_rec_error", {"market_id": market_id}, False, str(e))
 
-                processed.add(rec_id)
+            await ledger_call(lambda ledger: ledger.mark_recommendation_processed(rec_id))
+            processed.add(rec_id)
 
-            except Exception as e:
-                logger.error(f"Failed to parse recommendation: {e}")
+        except Exception as e:
+            logger.error(f"Failed to parse recommendation: {e}")
+    if tail.errors:
+        logger.error(f"Failed to parse {tail.errors} recommendation line(s)")
 
-    # Save processed
-    processed_file.write_text("\n".join(sorted(processed)) + "\n")
+    tail.commit()
 
 
 async def check_reserve_floor() -> bool:
@@ -448,13 +639,7 @@ def get_status() -> dict:
     # Read recent risk events
     events = []
     try:
-        if RISK_EVENTS_FILE.exists():
-            lines = RISK_EVENTS_FILE.read_text().strip().split("\n")
-            for line in lines[-20:]:
-                try:
-                    events.append(json.loads(line))
-                except Exception:
-                    pass
+        events = ledger_thread.submit(lambda: get_ledger().recent("risk_events", limit=10)).result()
     except Exception:
         pass
 
@@ -478,7 +663,7 @@ def get_status() -> dict:
 
 
 async def monitor_loop():
-    """Main monitoring loop."""
+    """Main monitoring loop: TP/SL on every price tick, positions refreshed every interval."""
     logger.info("=" * 60)
     logger.info("🐻 BRIMO — Sell Specialist Agent Starting")
     logger.info(f"   Mode: {'DRY RUN 🧪' if DRY_RUN else 'LIVE 🔴'}")
@@ -486,62 +671,80 @@ async def monitor_loop():
     logger.info(f"   Stop Loss: {STOP_LOSS_PCT}%")
     logger.info(f"   Trailing Stop: {TRAILING_STOP_PCT}%")
     logger.info(f"   Reserve Floor: ${RESERVE_FLOOR_USD}")
-    logger.info(f"   Check Interval: {MONITOR_INTERVAL}s")
+    logger.info(f"   Refresh Interval: {MONITOR_INTERVAL}s")
     logger.info("=" * 60)
 
-    gamma = GammaClient(redis_client=None)
-
     try:
-        clob = get_clob_client()
+        clob = AsyncClobExecutor(get_clob_client())
     except Exception as e:
         logger.error(f"❌ Cannot initialize CLOB client: {e}")
         logger.info("Running in monitor-only mode (no sells)")
         clob = None
+    if clob:
+        await warm_up_clob(clob)
 
     log_risk_event("brimo_started", {
         "mode": "dry_run" if DRY_RUN else "live",
         "tp": TAKE_PROFIT_PCT, "sl": STOP_LOSS_PCT, "ts": TRAILING_STOP_PCT,
     })
 
-    cycle = 0
-    while True:
-        cycle += 1
-        logger.info(f"\n{'─' * 40} Cycle {cycle} {'─' * 40}")
-
+    async with GammaClient(redis_client=None) as gamma:
+        monitor = PositionMonitor(clob, gamma) if clob else None
+        feeds = [asyncio.create_task(monitor.price_feed()), asyncio.create_task(monitor.poll_prices())] if monitor else []
         try:
-            # 1. Check reserve floor
-            floor_ok = await check_reserve_floor()
-            if not floor_ok:
-                logger.warning("🚨 Balance below reserve floor — monitoring only, buys blocked")
+            cycle = 0
+            while True:
+                cycle += 1
+                logger.info(f"\n{'─' * 40} Cycle {cycle} {'─' * 40}")
 
-            # 2. Check positions for TP/SL/trailing
-            if clob:
-                await check_positions(clob, gamma)
+                try:
+                    # 1. Check reserve floor
+                    floor_ok = await check_reserve_floor()
+                    if not floor_ok:
+                        logger.warning("🚨 Balance below reserve floor — monitoring only, buys blocked")
 
-            # 3. Process sell recommendations from other agents
-            if clob:
-                await process_sell_recommendations(gamma, clob)
+                    # 2. Refresh positions; TP/SL/trailing also run on every price tick in between
+                    if monitor:
+                        await monitor.refresh()
 
-        except Exception as e:
-            logger.error(f"❌ Cycle error: {e}")
-            log_risk_event("cycle_error", {"cycle": cycle}, False, str(e))
+                    # 3. Process sell recommendations from other agents
+                    if clob:
+                        await process_sell_recommendations(gamma, clob)
 
-        logger.info(f"💤 Sleeping {MONITOR_INTERVAL}s until next check...")
-        await asyncio.sleep(MONITOR_INTERVAL)
+                except Exception as e:
+                    logger.error(f"❌ Cycle error: {e}")
+                    log_risk_event("cycle_error", {"cycle": cycle}, False, str(e))
+
+                logger.info(f"💤 Next position refresh in {MONITOR_INTERVAL}s")
+                await asyncio.sleep(MONITOR_INTERVAL)
+        finally:
+            for task in feeds:
+                task.cancel()
+            await asyncio.gather(*feeds, return_exceptions=True)
+            if monitor:
+                await monitor.wait_for_sells()
+            if clob:
+                clob.shutdown()
 
 
 async def single_check():
     """Run a single position check (for cron jobs)."""
-    gamma = GammaClient(redis_client=None)
     try:
-        clob = get_clob_client()
+        clob = AsyncClobExecutor(get_clob_client())
     except Exception as e:
         logger.error(f"Cannot initialize CLOB: {e}")
         return
 
-    await check_reserve_floor()
-    await check_positions(clob, gamma)
-    await process_sell_recommendations(gamma, clob)
+    try:
+        await warm_up_clob(clob)
+        async with GammaClient(redis_client=None) as gamma:
+            await check_reserve_floor()
+            monitor = PositionMonitor(clob, gamma)
+            await monitor.refresh()
+            await monitor.wait_for_sells()
+            await process_sell_recommendations(gamma, clob)
+    finally:
+        clob.shutdown()
 
 
 def main():
@@ -551,15 +754,19 @@ def main():
     parser.add_argument("--status", action="store_true", help="Print agent status")
     args = parser.parse_args()
 
-    if args.status:
-        status = get_status()
-        print(json.dumps(status, indent=2))
-    elif args.check_once:
-        asyncio.run(single_check())
-    elif args.monitor:
-        asyncio.run(monitor_loop())
-    else:
-        parser.print_help()
+    try:
+        if args.status:
+            status = get_status()
+            print(json.dumps(status, indent=2))
+        elif args.check_once:
+            asyncio.run(single_check())
+        elif args.monitor:
+            asyncio.run(monitor_loop())
+        else:
+            parser.print_help()
+    finally:
+        # Runs after any queued writes, so they reach the ledger before exit.
+        ledger_thread.submit(_close_ledger).result()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+"""Incremental JSONL reading with a persisted byte offset.
+
+`JsonlTail` remembers how far it has read a file (offset plus inode) so each
+call parses only lines appended since the last `commit()`. A new inode or a
+file shorter than the saved offset means the file was rotated or truncated,
+and reading restarts from the beginning. A trailing line without a newline is
+left for the next read, since its writer may still be appending to it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+class JsonlTail:
+    """Reads JSON objects appended to `path` since the last committed offset."""
+
+    def __init__(self, path: Path, state_path: Path):
+        self.path = Path(path)
+        self.state_path = Path(state_path)
+        self.state: dict[str, Any] = {}
+        if self.state_path.exists():
+            try:
+                self.state = json.loads(self.state_path.read_text())
+            except (OSError, json.JSONDecodeError):
+                self.state = {}
+        self._inode = self.state.get("inode")
+        self._offset = int(self.state.get("offset", 0))
+        self.errors = 0
+
+    def read_new(self) -> list[dict[str, Any]]:
+        """Parse complete lines appended since the last commit; unparsable lines are counted in `errors`."""
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return []
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            self._inode, self._offset = st.st_ino, 0
+        if st.st_size == self._offset:
+            return []
+        entries: list[dict[str, Any]] = []
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                self._offset += len(raw)
+                if not raw.strip():
+                    continue
+                try:
+                    entry = json.loads(raw)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    self.errors += 1
+                    continue
+                if isinstance(entry, dict):
+                    entries.append(entry)
+        return entries
+
+    def commit(self, **extra: Any) -> None:
+        """Persist the read position together with caller state (e.g. deferred entries)."""
+        self.state = {**extra, "inode": self._inode, "offset": self._offset}
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.state))
+        os.replace(tmp, self.state_path)
+
@@ -0,0 +1,209 @@
+"""Recorded CLOB book events in compressed, columnar, time-partitioned files.
+
+`TickRecorder` flattens websocket book events (snapshots and price-change
+deltas) into rows, one per price level, and writes them as column arrays to
+`<root>/<YYYY-MM-DD>/<HH>/part-<first ts>.npz` (numpy, zlib-compressed). A part
+is written when it reaches `flush_rows`, when the UTC hour changes, or on
+`close()`. `iter_events` reads the parts back in time order and rebuilds the
+events in the websocket message format, so replay can feed them through the
+same `process_event` code as the live bot.
+
+Columns: `ts` (event time, ms), `recv` (local receive time, ms), `event`
+(event number within the part), `asset` (index into the part's `assets`),
+`kind`, `side`, `price`, `size`.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import numpy as np
+
+KIND_SNAPSHOT = 0  # one per snapshot; marks the event even when the book is empty
+KIND_LEVEL = 1  # a snapshot price level
+KIND_CHANGE = 2  # a price-change delta
+SIDE_NONE, SIDE_BID, SIDE_ASK = -1, 0, 1
+
+_COLUMNS = {
+    "ts": np.int64,
+    "recv": np.int64,
+    "event": np.int64,
+    "asset": np.int32,
+    "kind": np.int8,
+    "side": np.int8,
+    "price": np.float64,
+    "size": np.float64,
+}
+
+
+def _side(value: str) -> int:
+    return SIDE_BID if str(value).upper() in ("BUY", "BID") else SIDE_ASK
+
+
+def _partition(ts_ms: int) -> tuple[str, str]:
+    moment = datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc)
+    return moment.strftime("%Y-%m-%d"), moment.strftime("%H")
+
+
+class TickRecorder:
+    """Buffers book events as rows and writes them as compressed column files."""
+
+    def __init__(self, root: Path, flush_rows: int = 200_000):
+        self.root = Path(root)
+        self.flush_rows = flush_rows
+        self.events = 0
+        self.rows = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._columns: dict[str, list] = {name: [] for name in _COLUMNS}
+        self._assets: dict[str, int] = {}
+        self._event = 0
+        self._partition: Optional[tuple[str, str]] = None
+
+    def _row(self, ts: int, recv: int, asset: int, kind: int, side: int, price: float, size: float) -> None:
+        columns = self._columns
+        columns["ts"].append(ts)
+        columns["recv"].append(recv)
+        columns["event"].append(self._event)
+        columns["asset"].append(asset)
+        columns["kind"].append(kind)
+        columns["side"].append(side)
+        columns["price"].append(price)
+        columns["size"].append(size)
+
+    def _asset(self, asset_id: str) -> int:
+        index = self._assets.get(asset_id)
+        if index is None:
+            index = self._assets[asset_id] = len(self._assets)
+        return index
+
+    def record(self, data: dict[str, Any], recv_ms: Optional[int] = None) -> None:
+        """Record one websocket event; events without book data are ignored."""
+        recv = int(time.time() * 1000) if recv_ms is None else recv_ms
+        try:
+            ts = int(float(data.get("timestamp", recv)))
+        except (TypeError, ValueError):
+            ts = recv
+        partition = _partition(ts)
+        if self._partition is not None and partition != self._partition:
+            self.flush()
+        self._partition = partition
+
+        before = len(self._columns["ts"])
+        try:
+            if "price_changes" in data:
+                for change in data["price_changes"]:
+                    self._row(ts, recv, self._asset(change.get("asset_id", "")), KIND_CHANGE,
+                              _side(change["side"]), float(change["price"]), float(change["size"]))
+            elif "changes" in data:
+                asset = self._asset(data.get("asset_id", ""))
+                for change in data["changes"]:
+                    self._row(ts, recv, asset, KIND_CHANGE, _side(change["side"]),
+                              float(change["price"]), float(change["size"]))
+            elif ("bids" in data and "asks" in data) or ("buys" in data and "sells" in data):
+                asset = self._asset(data.get("asset_id", ""))
+                self._row(ts, recv, asset, KIND_SNAPSHOT, SIDE_NONE, np.nan, 0.0)
+                for side, levels in ((SIDE_BID, data.get("bids", data.get("buys"))),
+                                     (SIDE_ASK, data.get("asks", data.get("sells")))):
+                    for level in levels or []:
+                        self._row(ts, recv, asset, KIND_LEVEL, side, float(level["price"]), float(level["size"]))
+            else:
+                return
+        except (KeyError, TypeError, ValueError):
+            # Drop a malformed event entirely rather than recording part of it.
+            for values in self._columns.values():
+                del values[before:]
+            return
+        self._event += 1
+        self.events += 1
+        if len(self._columns["ts"]) >= self.flush_rows:
+            self.flush()
+
+    def flush(self) -> Optional[Path]:
+        """Write buffered rows as one part file; returns its path."""
+        if not self._columns["ts"] or self._partition is None:
+            return None
+        day, hour = self._partition
+        first_ts = self._columns["ts"][0]
+        directory = self.root / day / hour
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"part-{first_ts:013d}-{self.rows:012d}.npz"
+        arrays = {name: np.asarray(self._columns[name], dtype=dtype) for name, dtype in _COLUMNS.items()}
+        assets = np.array(list(self._assets), dtype=str)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez_compressed(f, assets=assets, **arrays)
+        tmp.replace(path)
+        self.rows += len(self._columns["ts"])
+        self._reset()
+        return path
+
+    def close(self) -> None:
+        self.flush()
+
+
+def part_files(root: Path, start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> list[Path]:
+    """Part files under `root` overlapping [start_ms, end_ms], in time order."""
+    root = Path(root)
+    first = _partition(start_ms) if start_ms is not None else None
+    last = _partition(end_ms) if end_ms is not None else None
+    files = []
+    for path in sorted(root.glob("*/*/part-*.npz")):
+        partition = (path.parent.parent.name, path.parent.name)
+        if (first and partition < first) or (last and partition > last):
+            continue
+        files.append(path)
+    return sorted(files, key=lambda p: p.name)
+
+
+def iter_events(
+    root: Path,
+    start_ms: Optional[int] = None,
+    end_ms: Optional[int] = None,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield `(ts_ms, event)` pairs rebuilt in websocket message format."""
+    for path in part_files(root, start_ms, end_ms):
+        with np.load(path) as part:
+            assets = part["assets"].tolist()
+            ts, event, asset = part["ts"], part["event"], part["asset"]
+            kind, side, price, size = part["kind"], part["side"], part["price"], part["size"]
+        if not len(ts):
+            continue
+        # Row ranges sharing an event number form one event.
+        bounds = np.flatnonzero(np.diff(event)) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [len(ts)]))
+        for begin, end in zip(starts.tolist(), ends.tolist()):
+            event_ts = int(ts[begin])
+            if (start_ms is not None and event_ts < start_ms) or (end_ms is not None and event_ts > end_ms):
+                continue
+            if kind[begin] == KIND_CHANGE:
+                yield event_ts, {
+                    "event_type": "price_change",
+                    "timestamp": str(event_ts),
+                    "price_changes": [
+                        {
+                            "asset_id": assets[asset[i]],
+                            "price": float(price[i]),
+                            "size": float(size[i]),
+                            "side": "BUY" if side[i] == SIDE_BID else "SELL",
+                        }
+                        for i in range(begin, end)
+                    ],
+                }
+            else:
+                bids, asks = [], []
+                for i in range(begin + 1, end):
+                    level = {"price": float(price[i]), "size": float(size[i])}
+                    (bids if side[i] == SIDE_BID else asks).append(level)
+                yield event_ts, {
+                    "event_type": "book",
+                    "timestamp": str(event_ts),
+                    "asset_id": assets[asset[begin]],
+                    "bids": bids,
+                    "asks": asks,
+                }
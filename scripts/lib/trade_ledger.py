@@ -0,0 +1,437 @@
+"""SQLite trade ledger for executions, risk events and ArbitrageNinja trades.
+
+Replaces full-file reads of the JSONL logs in `data/`. The database runs in
+WAL mode so the executor and Brimo can write while dashboards read, and keeps
+running aggregates (last cumulative P&L, per-day P&L and loss) in the same
+transaction as each insert. Every record is still appended to its JSONL file,
+which dashboards and hooks tail, and `export` rebuilds a JSONL file from the
+ledger. Existing JSONL history is imported once, the first time a ledger is
+opened (or explicitly with `import`).
+
+The ledger also keeps every processed recommendation ID, shared by the
+executor and Brimo, in an indexed table. IDs are never evicted, so re-reading
+`recommendations.jsonl` from the start cannot execute a recommendation twice.
+The old `recommendations_processed.txt` is imported the same way as the logs.
+
+Usage:
+    python scripts/lib/trade_ledger.py import [--kind executions]
+    python scripts/lib/trade_ledger.py import --kind risk_events --file old-risk.jsonl
+    python scripts/lib/trade_ledger.py export ninja_trades out.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = PROJECT_ROOT / "data"
+LEDGER_DB = Path(os.environ.get("TRADE_LEDGER_DB", str(DATA_DIR / "trade-ledger.db")))
+
+# Ledger table -> JSONL log it mirrors.
+JSONL_FILES: dict[str, str] = {
+    "executions": "executions.jsonl",
+    "risk_events": "risk-events.jsonl",
+    "ninja_trades": "ninja_trades.jsonl",
+}
+PROCESSED_IDS_FILE = "recommendations_processed.txt"  # legacy processed-ID list
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    id INTEGER PRIMARY KEY,
+    ts TEXT NOT NULL,
+    market TEXT,
+    action TEXT,
+    success INTEGER,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_executions_ts ON executions (ts);
+CREATE INDEX IF NOT EXISTS ix_executions_market_ts ON executions (market, ts);
+
+CREATE TABLE IF NOT EXISTS risk_events (
+    id INTEGER PRIMARY KEY,
+    ts TEXT NOT NULL,
+    market TEXT,
+    event_type TEXT,
+    success INTEGER,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_risk_events_ts ON risk_events (ts);
+CREATE INDEX IF NOT EXISTS ix_risk_events_market_ts ON risk_events (market, ts);
+
+CREATE TABLE IF NOT EXISTS ninja_trades (
+    id INTEGER PRIMARY KEY,
+    ts TEXT NOT NULL,
+    market TEXT,
+    type TEXT,
+    pnl REAL NOT NULL DEFAULT 0,
+    cumulative_pnl REAL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_ninja_trades_ts ON ninja_trades (ts);
+CREATE INDEX IF NOT EXISTS ix_ninja_trades_market_ts ON ninja_trades (market, ts);
+
+CREATE TABLE IF NOT EXISTS daily_pnl (
+    day TEXT PRIMARY KEY,
+    pnl REAL NOT NULL DEFAULT 0,
+    loss REAL NOT NULL DEFAULT 0,
+    trades INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS processed_recommendations (
+    id TEXT PRIMARY KEY,
+    processed_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS ledger_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _utc_day() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def _market_of(entry: dict[str, Any]) -> str | None:
+    details = entry.get("details") if isinstance(entry.get("details"), dict) else {}
+    for source in (entry, details):
+        for key in ("market", "marketId", "market_id"):
+            value = source.get(key)
+            if value:
+                return str(value)
+    return None
+
+
+def _realized_pnl(table: str, entry: dict[str, Any]) -> float | None:
+    """P&L an entry realizes, or None when it does not count toward daily totals."""
+    try:
+        if table == "ninja_trades":
+            if entry.get("type") != "spread_capture":
+                return None
+            if "pnl" in entry:
+                return float(entry["pnl"])
+            if entry.get("exec_error"):
+                return 0.0
+            size = entry.get("size", entry.get("size_usd", 0)) or 0
+            return float(entry.get("profit", 0) or 0) * float(size)
+        if table == "risk_events" and entry.get("success"):
+            details = entry.get("details") or {}
+            if details.get("pnl_usd") is not None:
+                return float(details["pnl_usd"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+class TradeLedger:
+    """Append-only trade ledger backed by SQLite in WAL mode."""
+
+    def __init__(
+        self,
+        path: Path = LEDGER_DB,
+        data_dir: Path = DATA_DIR,
+        mirror_jsonl: bool = True,
+        auto_import: bool = True,
+    ):
+        self.path = Path(path)
+        self.data_dir = Path(data_dir)
+        self.mirror_jsonl = mirror_jsonl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; writes use explicit BEGIN IMMEDIATE transactions.
+        self._db = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._mirrors: dict[str, Any] = {}
+        if auto_import:
+            for table in JSONL_FILES:
+                self.import_jsonl(table, only_once=True)
+            self.import_processed_ids(only_once=True)
+
+    def close(self) -> None:
+        for handle in self._mirrors.values():
+            handle.close()
+        self._mirrors.clear()
+        self._db.close()
+
+    def jsonl_path(self, table: str) -> Path:
+        return self.data_dir / JSONL_FILES[table]
+
+    # ─── Writes ──────────────────────────────────────────────────
+
+    def _insert(self, table: str, entry: dict[str, Any], cumulative_pnl: float | None = None) -> None:
+        payload = json.dumps(entry, default=str)
+        ts = str(entry.get("timestamp") or datetime.now(timezone.utc).isoformat())
+        market = _market_of(entry)
+        if table == "executions":
+            self._db.execute(
+                "INSERT INTO executions (ts, market, action, success, payload) VALUES (?, ?, ?, ?, ?)",
+                (ts, market, entry.get("action"), entry.get("success"), payload),
+            )
+        elif table == "risk_events":
+            self._db.execute(
+                "INSERT INTO risk_events (ts, market, event_type, success, payload) VALUES (?, ?, ?, ?, ?)",
+                (ts, market, entry.get("event_type"), entry.get("success"), payload),
+            )
+        else:
+            self._db.execute(
+                "INSERT INTO ninja_trades (ts, market, type, pnl, cumulative_pnl, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (ts, market, entry.get("type"), _realized_pnl(table, entry) or 0.0, cumulative_pnl, payload),
+            )
+        pnl = _realized_pnl(table, entry)
+        if pnl is not None:
+            self._db.execute(
+                "INSERT INTO daily_pnl (day, pnl, loss, trades) VALUES (?, ?, ?, 1) "
+                "ON CONFLICT(day) DO UPDATE SET pnl = pnl + excluded.pnl, "
+                "loss = loss + excluded.loss, trades = trades + 1",
+                (ts[:10], pnl, max(0.0, -pnl)),
+            )
+
+    def _mirror(self, table: str, entry: dict[str, Any]) -> None:
+        if not self.mirror_jsonl:
+            return
+        handle = self._mirrors.get(table)
+        if handle is None:
+            path = self.jsonl_path(table)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = self._mirrors[table] = open(path, "a", buffering=1)
+        handle.write(json.dumps(entry, default=str) + "\n")
+
+    def _record(self, table: str, entry: dict[str, Any]) -> None:
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._insert(table, entry)
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+        self._mirror(table, entry)
+
+    def record_execution(self, entry: dict[str, Any]) -> None:
+        self._record("executions", entry)
+
+    def record_risk_event(self, entry: dict[str, Any]) -> None:
+        self._record("risk_events", entry)
+
+    def record_ninja_trade(self, entry: dict[str, Any], pnl: float) -> float:
+        """Record a trade realizing `pnl`; sets and returns its `cumulative_pnl`."""
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            cumulative = round(self._last_cumulative_pnl() + pnl, 4)
+            entry["pnl"] = pnl
+            entry["cumulative_pnl"] = cumulative
+            self._insert("ninja_trades", entry, cumulative_pnl=cumulative)
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+        self._mirror("ninja_trades", entry)
+        return cumulative
+
+    def mark_recommendation_processed(self, rec_id: str) -> None:
+        """Remember a recommendation as handled; it is never executed again."""
+        self._db.execute(
+            "INSERT OR IGNORE INTO processed_recommendations (id, processed_at) VALUES (?, ?)",
+            (rec_id, datetime.now(timezone.utc).isoformat()),
+        )
+
+    # ─── Reads ───────────────────────────────────────────────────
+
+    def _last_cumulative_pnl(self) -> float:
+        row = self._db.execute(
+            "SELECT cumulative_pnl FROM ninja_trades WHERE cumulative_pnl IS NOT NULL "
+            "ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        return float(row[0]) if row else 0.0
+
+    def cumulative_pnl(self) -> float:
+        """Cumulative P&L recorded on the latest ArbitrageNinja trade."""
+        return self._last_cumulative_pnl()
+
+    def daily_pnl(self, day: str | None = None) -> dict[str, float]:
+        """Realized P&L, loss and trade count for a UTC day (default today)."""
+        row = self._db.execute(
+            "SELECT pnl, loss, trades FROM daily_pnl WHERE day = ?", (day or _utc_day(),)
+        ).fetchone()
+        if row is None:
+            return {"pnl": 0.0, "loss": 0.0, "trades": 0}
+        return {"pnl": round(row["pnl"], 4), "loss": round(row["loss"], 4), "trades": row["trades"]}
+
+    def recent(self, table: str, limit: int = 20, market: str | None = None) -> list[dict[str, Any]]:
+        """Latest `limit` entries of a table, oldest first."""
+        if table not in JSONL_FILES:
+            raise ValueError(f"Unknown ledger table: {table}")
+        if market is None:
+            rows = self._db.execute(
+                f"SELECT payload FROM {table} ORDER BY ts DESC, id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        else:
+            rows = self._db.execute(
+                f"SELECT payload FROM {table} WHERE market = ? ORDER BY ts DESC, id DESC LIMIT ?",
+                (market, limit),
+            ).fetchall()
+        return [json.loads(row[0]) for row in reversed(rows)]
+
+    def processed_recommendations(self, rec_ids: Iterable[str]) -> set[str]:
+        """The subset of `rec_ids` already marked processed."""
+        pending = list(dict.fromkeys(rec_ids))
+        found: set[str] = set()
+        # Stay below SQLite's bound-parameter limit.
+        for start in range(0, len(pending), 500):
+            chunk = pending[start:start + 500]
+            rows = self._db.execute(
+                "SELECT id FROM processed_recommendations "
+                f"WHERE id IN ({', '.join('?' for _ in chunk)})",
+                chunk,
+            )
+            found.update(row[0] for row in rows)
+        return found
+
+    def iter_entries(self, table: str) -> Iterator[dict[str, Any]]:
+        if table not in JSONL_FILES:
+            raise ValueError(f"Unknown ledger table: {table}")
+        for row in self._db.execute(f"SELECT payload FROM {table} ORDER BY id"):
+            yield json.loads(row[0])
+
+    # ─── JSONL migration / export ────────────────────────────────
+
+    @staticmethod
+    def _import_marker(table: str, source: Path, default: Path) -> str:
+        # The default log keeps the original per-table key so ledgers that
+        # imported it before markers carried a path don't import it twice.
+        if source.resolve() == default.resolve():
+            return f"imported:{table}"
+        return f"imported:{table}:{source.resolve()}"
+
+    def import_jsonl(self, table: str, path: Path | None = None, only_once: bool = False) -> int:
+        """Import a JSONL log into `table`; returns the number of imported entries.
+
+        With `only_once`, a source file that has already been imported into
+        the table is skipped, so processes opening the ledger concurrently
+        import history once while other files can still be imported later.
+        """
+        if table not in JSONL_FILES:
+            raise ValueError(f"Unknown ledger table: {table}")
+        default = self.jsonl_path(table)
+        source = Path(path) if path else default
+        marker = self._import_marker(table, source, default)
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            if only_once and self._db.execute(
+                "SELECT 1 FROM ledger_meta WHERE key = ?", (marker,)
+            ).fetchone():
+                self._db.execute("ROLLBACK")
+                return 0
+            imported = 0
+            if source.exists():
+                with open(source) as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        if not isinstance(entry, dict):
+                            continue
+                        cumulative = entry.get("cumulative_pnl")
+                        self._insert(
+                            table,
+                            entry,
+                            cumulative_pnl=float(cumulative) if isinstance(cumulative, (int, float)) else None,
+                        )
+                        imported += 1
+            self._db.execute(
+                "INSERT OR REPLACE INTO ledger_meta (key, value) VALUES (?, ?)",
+                (marker, json.dumps({"source": str(source), "entries": imported})),
+            )
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+        return imported
+
+    def import_processed_ids(self, path: Path | None = None, only_once: bool = False) -> int:
+        """Import a legacy processed-ID list (one ID per line); returns the new IDs."""
+        default = self.data_dir / PROCESSED_IDS_FILE
+        source = Path(path) if path else default
+        marker = self._import_marker("processed_recommendations", source, default)
+        now = datetime.now(timezone.utc).isoformat()
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            if only_once and self._db.execute(
+                "SELECT 1 FROM ledger_meta WHERE key = ?", (marker,)
+            ).fetchone():
+                self._db.execute("ROLLBACK")
+                return 0
+            imported = 0
+            if source.exists():
+                with open(source) as f:
+                    for line in f:
+                        rec_id = line.strip()
+                        if rec_id:
+                            imported += self._db.execute(
+                                "INSERT OR IGNORE INTO processed_recommendations (id, processed_at) "
+                                "VALUES (?, ?)",
+                                (rec_id, now),
+                            ).rowcount
+            self._db.execute(
+                "INSERT OR REPLACE INTO ledger_meta (key, value) VALUES (?, ?)",
+                (marker, json.dumps({"source": str(source), "entries": imported})),
+            )
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+        return imported
+
+    def export_jsonl(self, table: str, path: Path) -> int:
+        """Write every entry of `table` to a JSONL file; returns the entry count."""
+        count = 0
+        path = Path(path)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "w") as f:
+            for entry in self.iter_entries(table):
+                f.write(json.dumps(entry, default=str) + "\n")
+                count += 1
+        tmp.replace(path)
+        return count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Trade ledger JSONL import/export")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="Import JSONL logs not imported yet")
+    imp.add_argument("--kind", choices=sorted(JSONL_FILES), help="Only this table")
+    imp.add_argument("--file", type=Path, help="Source JSONL (default: the table's log in data/)")
+    imp.add_argument("--force", action="store_true", help="Import again even if already imported")
+    exp = sub.add_parser("export", help="Export a table to JSONL")
+    exp.add_argument("kind", choices=sorted(JSONL_FILES))
+    exp.add_argument("output", type=Path)
+    args = parser.parse_args()
+    if args.command == "import" and args.file and not args.kind:
+        parser.error("--file needs --kind: a JSONL file only holds one table's entries")
+
+    ledger = TradeLedger(mirror_jsonl=False, auto_import=False)
+    try:
+        if args.command == "import":
+            for table in [args.kind] if args.kind else list(JSONL_FILES):
+                count = ledger.import_jsonl(table, path=args.file, only_once=not args.force)
+                print(f"{table}: imported {count} entries")
+        else:
+            count = ledger.export_jsonl(args.kind, args.output)
+            print(f"{args.kind}: exported {count} entries to {args.output}")
+    finally:
+        ledger.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
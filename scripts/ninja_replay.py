@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Replay recorded book events through the ArbitrageNinja engine.
+
+Reads the files written by `agent_ninja_arbitrage.py --record DIR` and feeds
+every event to `NinjaEngine.process_event` as fast as it can, so thresholds
+and sizing can be benchmarked offline. Each opportunity is re-quoted on the
+replayed book once each `--latency` has passed: it is a hit if the edge is
+still above `min_spread` by then, and its simulated P&L is that later edge
+times the shares, which is checked never to exceed the top-of-book spread
+times the shares. Opportunities whose latency runs past the end of the
+recording are reported as unresolved. Results depend only on the recording
+and the settings.
+
+    python scripts/ninja_replay.py data/ticks --min-spread 0.03 --size-usd 5 --latency 0,100,500
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from agent_ninja_arbitrage import MIN_SPREAD, NINJA_SIZE_USD, NinjaEngine, logger as engine_logger
+from scripts.lib.tick_store import iter_events
+
+DEFAULT_LATENCIES_MS = (0, 50, 100, 250, 500, 1000)
+
+
+def _parse_time(value: str) -> int:
+    """Epoch milliseconds from a raw ms value or an ISO timestamp (UTC when naive)."""
+    if value.isdigit():
+        return int(value)
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1000)
+
+
+def _event_assets(event: dict) -> list[str]:
+    if "price_changes" in event:
+        return [change.get("asset_id", "") for change in event["price_changes"]]
+    return [event.get("asset_id", "")]
+
+
+def replay(
+    root: Path,
+    min_spread: float = MIN_SPREAD,
+    size_usd: float = NINJA_SIZE_USD,
+    latencies_ms: tuple[int, ...] = DEFAULT_LATENCIES_MS,
+    start_ms: Optional[int] = None,
+    end_ms: Optional[int] = None,
+) -> dict:
+    """Run the recording under `root` through a fresh engine and return the report."""
+    engine = NinjaEngine({}, log=None, min_spread=min_spread, size_usd=size_usd)
+    outcomes = [{"latency_ms": latency, "hits": 0, "misses": 0, "unresolved": 0, "pnl": 0.0}
+                for latency in latencies_ms]
+    # (due ms, sequence, latency index, asset id, shares); the sequence keeps ties in order.
+    pending: list[tuple[int, int, int, str, float]] = []
+    sequence = 0
+
+    def settle(asset_id: str, shares: float, outcome: dict) -> None:
+        quote = engine.quote(asset_id, shares)
+        edge = quote[1] - quote[0] if quote else None
+        if edge is not None and edge > engine.min_spread:
+            book = engine.books[asset_id]
+            top_spread = book.best_ask() - book.best_bid()
+            # Capturing the spread can never earn more than the top of book offers.
+            assert edge * shares <= top_spread * shares + 1e-9, (
+                f"{asset_id}: P&L {edge * shares:.6f} above top-of-book {top_spread * shares:.6f}"
+            )
+            outcome["hits"] += 1
+            outcome["pnl"] += edge * shares
+        else:
+            outcome["misses"] += 1
+
+    events = 0
+    first_ts = last_ts = None
+    started = time.perf_counter()
+    for ts, event in iter_events(root, start_ms, end_ms):
+        # The book now reflects every event up to the previous timestamp.
+        while pending and pending[0][0] < ts:
+            _, _, index, asset_id, shares = heapq.heappop(pending)
+            settle(asset_id, shares, outcomes[index])
+        events += 1
+        if first_ts is None:
+            first_ts = ts
+        last_ts = ts
+
+        opportunities = engine.process_event(event, now=ts / 1000)
+        if not opportunities:
+            continue
+        # Opportunities carry a shortened asset ID; map it back to the event's assets.
+        assets = {asset_id[:20]: asset_id for asset_id in _event_assets(event)}
+        for opportunity in opportunities:
+            asset_id = assets.get(opportunity["asset_id"], opportunity["asset_id"])
+            for index, latency in enumerate(latencies_ms):
+                heapq.heappush(pending, (ts + latency, sequence, index, asset_id, opportunity["shares"]))
+                sequence += 1
+
+    for due, _, index, asset_id, shares in sorted(pending):
+        if due <= last_ts:
+            settle(asset_id, shares, outcomes[index])
+        else:
+            outcomes[index]["unresolved"] += 1
+    wall = time.perf_counter() - started
+
+    stats = engine.stats
+    span = (last_ts - first_ts) / 1000 if events else 0.0
+    for outcome in outcomes:
+        resolved = outcome["hits"] + outcome["misses"]
+        outcome["hit_rate"] = round(outcome["hits"] / resolved, 4) if resolved else None
+        outcome["pnl"] = round(outcome["pnl"], 4)
+    return {
+        "events": events,
+        "books": len(engine.books),
+        "span_s": round(span, 3),
+        "wall_s": round(wall, 3),
+        "events_per_sec": round(events / wall, 1) if wall > 0 else None,
+        "speedup": round(span / wall, 1) if wall > 0 else None,
+        "min_spread": min_spread,
+        "size_usd": size_usd,
+        "ticks": stats["ticks"],
+        "opportunities": stats["opportunities"],
+        "instant_pnl": round(stats["simulated_pnl"], 4),
+        "avg_spread": round(engine.spreads.mean(), 4),
+        "max_spread": round(stats["max_spread"], 4),
+        "latency": outcomes,
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"Events: {report['events']} on {report['books']} books over {report['span_s']}s recorded")
+    print(f"Replayed in {report['wall_s']}s: {report['events_per_sec']} events/s ({report['speedup']}x real time)")
+    print(f"Settings: min_spread={report['min_spread']} size_usd={report['size_usd']}")
+    print(f"Opportunities: {report['opportunities']} | Instant P&L: ${report['instant_pnl']:.4f} | "
+          f"Avg spread: ${report['avg_spread']:.4f} | Max spread: ${report['max_spread']:.4f}")
+    print(f"{'latency':>10} {'hits':>7} {'misses':>7} {'unres.':>7} {'hit rate':>9} {'P&L':>10}")
+    for outcome in report["latency"]:
+        rate = f"{outcome['hit_rate']:.1%}" if outcome["hit_rate"] is not None else "-"
+        print(f"{outcome['latency_ms']:>8}ms {outcome['hits']:>7} {outcome['misses']:>7} "
+              f"{outcome['unresolved']:>7} {rate:>9} {outcome['pnl']:>10.4f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay recorded order book events through ArbitrageNinja")
+    parser.add_argument("directory", type=Path, help="Recording directory (agent_ninja_arbitrage.py --record)")
+    parser.add_argument("--min-spread", type=float, default=MIN_SPREAD, help="Edge threshold (default: MIN_SPREAD)")
+    parser.add_argument("--size-usd", type=float, default=NINJA_SIZE_USD, help="Order size (default: NINJA_SIZE_USD)")
+    parser.add_argument("--latency", type=str, default=",".join(map(str, DEFAULT_LATENCIES_MS)),
+                        help="Comma-separated execution latencies in ms")
+    parser.add_argument("--start", type=str, default=None, help="Replay from this time (ISO or epoch ms)")
+    parser.add_argument("--end", type=str, default=None, help="Replay until this time (ISO or epoch ms)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Keep the engine's per-opportunity logging")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        engine_logger.setLevel(logging.WARNING)
+    latencies = tuple(sorted({int(v) for v in args.latency.split(",") if v.strip()}))
+    report = replay(
+        args.directory,
+        min_spread=args.min_spread,
+        size_usd=args.size_usd,
+        latencies_ms=latencies,
+        start_ms=_parse_time(args.start) if args.start else None,
+        end_ms=_parse_time(args.end) if args.end else None,
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
@@ -10,9 +10,12 @@ import json
 import logging
 import os
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 from collections import defaultdict
 
 from fastapi import FastAPI, HTTPException, Depends
@@ -27,7 +30,9 @@ sys.path.insert(0, str(PROJECT_ROOT))
 sys.path.insert(0, str(PROJECT_ROOT / "references" / "polyclaw-chainstack"))
 
 from lib.gamma_client import GammaClient
-from lib.clob_client import ClobClientWrapper
+from lib.clob_client import AsyncClobExecutor, ClobClientWrapper
+from scripts.lib.jsonl_tail import JsonlTail
+from scripts.lib.trade_ledger import TradeLedger
 
 # Setup logging
 LOG_DIR = PROJECT_ROOT / "logs"
@@ -56,8 +61,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# FastAPI app
-app = FastAPI(title="Polymarket Executor API")
 security = HTTPBearer()
 
 # Configuration
@@ -93,27 +96,59 @@ RESERVE_FLOOR_USD = float(os.environ.get("RESERVE_FLOOR_USD", "3.0"))
 MAX_DAILY_EXPOSURE_USD = float(os.environ.get("MAX_DAILY_EXPOSURE_USD", "20.0"))
 daily_exposure_usd = 0.0
 daily_exposure_date = ""
+BALANCE_CACHE_TTL_SECONDS = float(os.environ.get("BALANCE_CACHE_TTL_SECONDS", "15"))
+
+
+class _JsonFileCache:
+    """Parsed JSON file, re-read only when its mtime, size or inode changes.
+
+    Missing or unparsable files yield `default()`. Callers must not mutate
+    the returned value; it is shared until the file changes.
+    """
+
+    def __init__(self, path: Path, default: Callable[[], Any], parse: Callable[[Any], Any] = lambda data: data):
+        self.path = path
+        self.default = default
+        self.parse = parse
+        self._stamp: Optional[tuple[int, int, int]] = None
+        self._value: Any = default()
+
+    def get(self) -> Any:
+        try:
+            st = self.path.stat()
+        except OSError:
+            self._stamp = None
+            self._value = self.default()
+            return self._value
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if stamp != self._stamp:
+            try:
+                self._value = self.parse(json.loads(self.path.read_text()))
+            except Exception as e:
+                logger.warning(f"Could not load {self.path.name}: {e}")
+                self._value = self.default()
+            self._stamp = stamp
+        return self._value
+
+
+_risk_config_file = _JsonFileCache(PROJECT_ROOT / "data" / "dashboard-config.json", dict)
+_status_map_file = _JsonFileCache(PROJECT_ROOT / "data" / "recommendation-status.json", dict)
+# Optional valid-market cache (populated by CorrectionAgent)
+_valid_market_ids_file = _JsonFileCache(
+    PROJECT_ROOT / "data" / "valid_market_ids.json",
+    frozenset,
+    lambda data: frozenset(str(v) for v in data.get("ids", []) if v),
+)
+
 
 def _load_risk_config() -> dict:
-    """Load risk config from dashboard-config.json."""
-    try:
-        cfg_path = PROJECT_ROOT / "data" / "dashboard-config.json"
-        if cfg_path.exists():
-            return json.loads(cfg_path.read_text())
-    except Exception:
-        pass
-    return {}
+    """Load risk config from dashboard-config.json (cached until the file changes)."""
+    return _risk_config_file.get()
 
 
 def _load_status_map() -> dict:
-    """Load recommendation approval status from dashboard."""
-    try:
-        path = PROJECT_ROOT / "data" / "recommendation-status.json"
-        if path.exists():
-            return json.loads(path.read_text())
-    except Exception:
-        pass
-    return {}
+    """Load recommendation approval status from dashboard (cached until the file changes)."""
+    return _status_map_file.get()
 
 
 def _rec_id(rec: dict) -> str:
@@ -158,43 +193,181 @@ def _effective_max_trade_usd(risk_cfg: dict) -> float:
     return MAX_TRADE_USD
 
 
-def _fetch_usdc_balance() -> float:
-    """Sync USDC balance for reserve-floor checks."""
-    try:
-        wrapper = get_clob_client()
-        from py_clob_client.clob_types import BalanceAllowanceParams
-        res = wrapper.client.get_balance_allowance(BalanceAllowanceParams(asset_type="COLLATERAL"))
-        return float(res.get("balance", "0")) / 10**6
-    except Exception as e:
-        logger.warning(f"Balance fetch for validation failed: {e}")
-        return 0.0
+def _query_usdc_balance() -> float:
+    """Blocking CLOB query for the USDC (collateral) balance."""
+    wrapper = get_clob_client()
+    from py_clob_client.clob_types import BalanceAllowanceParams
+    res = wrapper.client.get_balance_allowance(BalanceAllowanceParams(asset_type="COLLATERAL"))
+    return float(res.get("balance", "0")) / 10**6
+
+
+class BalanceCache:
+    """Last known USDC balance for reserve-floor checks.
+
+    Reads are local; fills debit the cached value right away and a background
+    task reconciles it with the CLOB. `get()` returns None until a fetch has
+    succeeded, and balance-based limits are skipped only then; a known balance
+    of zero (or less, after reservations) blocks orders.
+    """
+
+    def __init__(self, ttl: float = BALANCE_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self.balance: Optional[float] = None
+        self.fetched_at = 0.0
+        self._debited = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def stale(self) -> bool:
+        return time.monotonic() - self.fetched_at >= self.ttl
+
+    def get(self) -> Optional[float]:
+        return self.balance
+
+    def debit(self, usd: float) -> None:
+        """Account for a fill until the next reconciliation (negative to release)."""
+        self._debited += usd
+        if self.balance is not None:
+            self.balance -= usd
+
+    async def _fetch(self) -> None:
+        debited_before = self._debited
+        try:
+            balance = await get_clob_executor().run(_query_usdc_balance)
+        except Exception as e:
+            logger.warning(f"Balance fetch for validation failed: {e}")
+        else:
+            # Fills recorded while the query was in flight may not be reflected yet.
+            self.balance = balance - (self._debited - debited_before)
+        # Failures also wait a TTL so orders do not each retry a slow fetch.
+        self.fetched_at = time.monotonic()
+
+    async def refresh(self) -> Optional[float]:
+        """Fetch the balance from the CLOB off the event loop."""
+        async with self._lock:
+            await self._fetch()
+        return self.get()
+
+    async def ensure_fresh(self) -> Optional[float]:
+        """Return the cached balance, fetching first only when it has expired."""
+        if self.stale:
+            async with self._lock:
+                # Concurrent callers share the fetch made by whoever got the lock first.
+                if self.stale:
+                    await self._fetch()
+        return self.get()
+
+
+balance_cache = BalanceCache()
+
+
+async def _reconcile_balance_forever() -> None:
+    while True:
+        await balance_cache.refresh()
+        await asyncio.sleep(balance_cache.ttl / 2)
 
 # Global clients
 redis_client: Optional[aioredis.Redis] = None
+# Rebound by executor_resources() once Redis is connected; until then (and when
+# Redis is down) market lookups use the client's in-process TTL cache.
+gamma_client = GammaClient()
+clob_client: Optional[ClobClientWrapper] = None
+clob_executor: Optional[AsyncClobExecutor] = None
+trade_ledger: Optional[TradeLedger] = None
+
+
+# Ledger writes can wait out SQLite's busy timeout while Brimo holds the write
+# lock, so every ledger call runs, in order, on this one thread instead of the
+# event loop. The connection is only ever used from here.
+ledger_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ledger")
+T = TypeVar("T")
+
+
+def get_ledger() -> TradeLedger:
+    """Open the trade ledger on first use (imports existing JSONL history once).
+
+    Only call this on `ledger_thread`; use `submit_ledger` / `ledger_call`.
+    """
+    global trade_ledger
+    if trade_ledger is None:
+        trade_ledger = TradeLedger()
+    return trade_ledger
+
+
+def _close_ledger() -> None:
+    global trade_ledger
+    if trade_ledger:
+        trade_ledger.close()
+        trade_ledger = None
+
 
-@app.on_event("startup")
-async def startup_event():
-    global redis_client
+def _log_ledger_failure(future: Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Trade ledger write failed: {future.exception()}")
+
+
+def submit_ledger(fn: Callable[[TradeLedger], Any]) -> None:
+    """Queue a ledger write without waiting for it."""
+    ledger_thread.submit(lambda: fn(get_ledger())).add_done_callback(_log_ledger_failure)
+
+
+async def ledger_call(fn: Callable[[TradeLedger], T]) -> T:
+    """Run a ledger call on the ledger thread, after any queued writes, and await its result."""
+    return await asyncio.wrap_future(ledger_thread.submit(lambda: fn(get_ledger())))
+
+
+async def _connect_redis() -> Optional[aioredis.Redis]:
+    client = aioredis.from_url(REDIS_URL, encoding="utf-8", decode_responses=True)
     try:
-        # Use from_url for modern redis-py
-        redis_client = aioredis.from_url(
-            REDIS_URL, encoding="utf-8", decode_responses=True
-        )
-        await redis_client.ping()
-        logger.info(f"Connected to Redis at {REDIS_URL}")
+        await client.ping()
     except Exception as e:
-        logger.warning(f"Could not connect to Redis: {e}. Running without cache.")
+        logger.warning(f"Could not connect to Redis: {e}. Using in-process market cache.")
+        await client.aclose()
+        return None
+    logger.info(f"Connected to Redis at {REDIS_URL}")
+    return client
+
+
+@asynccontextmanager
+async def executor_resources():
+    """Connect Redis and bind the shared Gamma client to it for the process lifetime."""
+    global redis_client, gamma_client
+    redis_client = await _connect_redis()
+    await gamma_client.aclose()
+    gamma_client = GammaClient(redis_client=redis_client)
+    reconcile_task: Optional[asyncio.Task] = None
+    try:
+        executor = get_clob_executor()
+    except ValueError as e:
+        logger.warning(f"{e}; order execution and balance reconciliation are disabled.")
+    else:
+        try:
+            await executor.warm_up()
+        except Exception as e:
+            logger.warning(f"CLOB client warm-up failed: {e}. Retrying on first use.")
+        reconcile_task = asyncio.create_task(_reconcile_balance_forever())
+    try:
+        yield
+    finally:
+        if reconcile_task:
+            reconcile_task.cancel()
+        await gamma_client.aclose()
+        if clob_executor:
+            clob_executor.shutdown()
+        await asyncio.wrap_future(ledger_thread.submit(_close_ledger))
+        if redis_client:
+            await redis_client.aclose()
+            redis_client = None
+            logger.info("Redis connection closed.")
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    global redis_client
-    if redis_client:
-        redis_client.close()
-        await redis_client.wait_closed()
-        logger.info("Redis connection closed.")
 
-gamma_client = GammaClient(redis_client=redis_client)
-clob_client: Optional[ClobClientWrapper] = None
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    async with executor_resources():
+        yield
+
+
+app = FastAPI(title="Polymarket Executor API", lifespan=lifespan)
 
 # Failure tracking
 consecutive_failures = 0
@@ -203,6 +376,12 @@ MAX_CONSECUTIVE_FAILURES = 3
 # Recommendation sizing default (used when recommendation only has risk_pct)
 DEFAULT_BALANCE_USD = float(os.environ.get("DEFAULT_BALANCE_USD", "1000"))
 
+# Recommendation processing: concurrency when the risk config sets no
+# maxConcurrentOrders, and the bound on persisted deferred recommendations.
+# Processed IDs live in the trade ledger and are never evicted.
+DEFAULT_MAX_CONCURRENT_ORDERS = 3
+DEFERRED_RECS_MAX = 1000
+
 # Rate limiting for external agents
 RATE_LIMIT_WINDOW = timedelta(minutes=1)
 RATE_LIMIT_MAX_REQUESTS = 1000
@@ -258,6 +437,14 @@ def get_clob_client() -> ClobClientWrapper:
     return clob_client
 
 
+def get_clob_executor() -> AsyncClobExecutor:
+    """Async order execution on top of the shared CLOB client."""
+    global clob_executor
+    if clob_executor is None:
+        clob_executor = AsyncClobExecutor(get_clob_client())
+    return clob_executor
+
+
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
     """Verify API token and check rate limit."""
     if credentials.credentials != EXEC_API_TOKEN:
@@ -297,11 +484,8 @@ def log_trade(action: str, details: dict, success: bool, error: Optional[str] =
     }
     logger.info(f"TRADE: {json.dumps(log_entry)}")
     
-    # Also write to recommendations log for tracking
-    rec_file = PROJECT_ROOT / "data" / "executions.jsonl"
-    rec_file.parent.mkdir(exist_ok=True)
-    with open(rec_file, "a") as f:
-        f.write(json.dumps(log_entry) + "\n")
+    # Also record in the ledger (mirrored to executions.jsonl) for tracking
+    submit_ledger(lambda ledger: ledger.record_execution(log_entry))
 
 
 # Obvious test / invalid market ID patterns (Gamma API returns 422 for these)
@@ -339,13 +523,13 @@ def _max_order_usd(risk_cfg: dict) -> tuple[float, Optional[str]]:
     daily_remaining = max(0.0, max_daily - daily_exposure_usd)
     cap = min(effective_max, daily_remaining)
 
-    balance = _fetch_usdc_balance()
-    if balance > 0:
+    balance = balance_cache.get()
+    if balance is not None:
         reserve_cap = max(0.0, balance - reserve)
         cap = min(cap, reserve_cap)
 
     if cap <= 0:
-        if balance > 0:
+        if balance is not None:
             return 0.0, (
                 f"Sem saldo para ordem após reserva ${reserve:.2f} "
                 f"(saldo ${balance:.2f})"
@@ -375,12 +559,13 @@ def _auto_fit_order_size(
 
     min_usd = _min_usd_for_shares(current_price)
     if max_usd < min_usd:
-        balance = _fetch_usdc_balance()
+        balance = balance_cache.get()
+        balance_text = f"${balance:.2f}" if balance is not None else "desconhecido"
         reserve = float(risk_cfg.get("reserveFloor", RESERVE_FLOOR_USD))
         return 0, 0, None, (
             f"Saldo insuficiente para mínimo {CLOB_MIN_SHARES} shares "
             f"(${min_usd:.2f} @ ${current_price:.2f}) — disponível ${max_usd:.2f} "
-            f"(saldo ${balance:.2f}, reserva ${reserve:.2f})"
+            f"(saldo {balance_text}, reserva ${reserve:.2f})"
         )
 
     fitted = min(float(requested_usd), max_usd)
@@ -447,16 +632,9 @@ def validate_order(market_id: str, size_usd: float, max_price: float) -> tuple[b
         if len(mid) < 5 or not mid.isdigit():
             return False, f"Market ID too short or invalid: {mid!r}"
 
-    # Optional valid-market cache (populated by CorrectionAgent)
-    valid_ids_path = PROJECT_ROOT / "data" / "valid_market_ids.json"
-    if valid_ids_path.exists():
-        try:
-            valid_data = json.loads(valid_ids_path.read_text())
-            valid_set = {str(v) for v in valid_data.get("ids", []) if v}
-            if valid_set and mid.isdigit() and mid not in valid_set:
-                return False, f"Market ID {mid} not in valid market cache"
-        except Exception:
-            pass
+    valid_set = _valid_market_ids_file.get()
+    if valid_set and mid.isdigit() and mid not in valid_set:
+        return False, f"Market ID {mid} not in valid market cache"
     
     # Check if executor is stopped due to failures
     if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
@@ -487,8 +665,8 @@ def validate_order(market_id: str, size_usd: float, max_price: float) -> tuple[b
     if daily_exposure_usd + size_usd > max_daily:
         return False, f"Daily exposure ${daily_exposure_usd + size_usd:.2f} would exceed limit ${max_daily}"
 
-    balance = _fetch_usdc_balance()
-    if balance > 0 and (balance - size_usd) < reserve:
+    balance = balance_cache.get()
+    if balance is not None and (balance - size_usd) < reserve:
         return False, (
             f"Would breach reserve floor ${reserve:.2f} "
             f"(balance ${balance:.2f}, order ${size_usd:.2f})"
@@ -505,7 +683,11 @@ async def health():
         "status": "ok",
         "dry_run": DRY_RUN,
         "max_trade_usd": _effective_max_trade_usd(risk_cfg),
-        "consecutive_failures": consecutive_failures
+        "consecutive_failures": consecutive_failures,
+        "market_cache": {
+            "backend": "redis" if gamma_client.redis else "memory",
+            **gamma_client.cache_stats,
+        },
     }
 
 
@@ -513,12 +695,8 @@ async def health():
 async def get_balance(_: bool = Depends(verify_token)):
     """Get wallet balance dynamically using py-clob-client."""
     try:
-        wrapper = get_clob_client()
-        from py_clob_client.clob_types import BalanceAllowanceParams
-        
         # 'COLLATERAL' correctly fetches the Polymarket USDC cash balance
-        res = wrapper.client.get_balance_allowance(BalanceAllowanceParams(asset_type="COLLATERAL"))
-        usdc_bal = float(res.get("balance", "0")) / 10**6
+        usdc_bal = await get_clob_executor().run(_query_usdc_balance)
         
         return {
             "usdc": usdc_bal,
@@ -587,6 +765,7 @@ async def place_order(
             raise HTTPException(status_code=400, detail=error)
 
         risk_cfg = _load_risk_config()
+        await balance_cache.ensure_fresh()
         size_usd, token_amount, resize_note, size_err = _auto_fit_order_size(
             size_usd, current_price, risk_cfg
         )
@@ -624,12 +803,12 @@ async def place_order(
             }
         
         # Execute order
-        client = get_clob_client()
-        
+        executor = get_clob_executor()
+
         if side.lower() == "buy":
-            order_id, error = client.buy_gtc(token_id, token_amount, max_price)
+            order_id, error = await executor.buy_gtc(token_id, token_amount, max_price)
         else:
-            order_id, filled, error = client.sell_fok(token_id, token_amount, current_price)
+            order_id, filled, error = await executor.sell_fok(token_id, token_amount, current_price)
             if filled:
                 order_id = order_id or "filled"
         
@@ -640,6 +819,8 @@ async def place_order(
         
         # Success
         consecutive_failures = 0
+        if side.lower() == "buy":
+            balance_cache.debit(size_usd)
         result = {
             "success": True,
             "order_id": order_id,
@@ -684,6 +865,7 @@ async def place_arbitrage(
                 ),
             )
 
+        await balance_cache.ensure_fresh()
         size, token_amount, resize_note, size_err = _auto_fit_order_size(
             requested_size, buy_price, risk_cfg
         )
@@ -708,29 +890,34 @@ async def place_arbitrage(
         if not DRY_RUN:
             logger.info("Executando arbitragem real (two-legged) via CLOB...")
             try:
-                client = get_clob_client()
+                executor = get_clob_executor()
                 market = await gamma_client.get_market(market_id)
                 token_id = market.yes_token_id
                 # size/token_amount already fitted above
 
                 logger.info(
-                    f"BUY GTC: token {token_id[:8]}... amount {token_amount} @ {buy_price}"
+                    f"BUY GTC: token {token_id[:8]}... amount {token_amount} @ {buy_price}; "
+                    f"SELL GTC: amount {token_amount} @ {sell_price}"
                 )
-                order_id_buy, error_buy = client.buy_gtc(token_id, token_amount, buy_price)
-                if error_buy:
-                    raise Exception(f"Buy leg failed: {error_buy}")
-                live_order_id_buy = order_id_buy
-
-                logger.info(
-                    f"SELL GTC: token {token_id[:8]}... amount {token_amount} @ {sell_price}"
+                # Both legs go out together; if one fails, cancel the one that landed.
+                (order_id_buy, error_buy), (order_id_sell, error_sell) = await asyncio.gather(
+                    executor.buy_gtc(token_id, token_amount, buy_price),
+                    executor.sell_gtc(token_id, token_amount, sell_price),
                 )
-                order_id_sell, error_sell = client.sell_gtc(token_id, token_amount, sell_price)
-                if error_sell:
-                    logger.warning(f"Sell leg failed, cancelling buy {order_id_buy}: {error_sell}")
-                    if order_id_buy:
-                        client.cancel_order(order_id_buy)
-                    raise Exception(f"Sell leg failed: {error_sell}")
+                if error_buy or error_sell:
+                    leg_errors = []
+                    if error_buy:
+                        leg_errors.append(f"Buy leg failed: {error_buy}")
+                    if error_sell:
+                        leg_errors.append(f"Sell leg failed: {error_sell}")
+                    for order_id in (order_id_buy, order_id_sell):
+                        if order_id:
+                            logger.warning(f"Cancelling order {order_id} after failed leg")
+                            await executor.cancel_order(order_id)
+                    raise Exception("; ".join(leg_errors))
+                live_order_id_buy = order_id_buy
                 live_order_id_sell = order_id_sell
+                balance_cache.debit(size)
             except Exception as e:
                 logger.error(f"Erro na execução da arbitragem real: {e}")
                 exec_error = str(e)
@@ -761,23 +948,8 @@ async def place_arbitrage(
         if exec_error:
             evt["exec_error"] = exec_error
 
-        ninja_file = PROJECT_ROOT / "data" / "ninja_trades.jsonl"
-        
-        # Recalculate true cumulative if trade history exists
-        cumulative = real_pnl
-        if ninja_file.exists():
-            lines = ninja_file.read_text().strip().split("\n")
-            if lines and lines[-1]:
-                try:
-                    last = json.loads(lines[-1])
-                    base = float(last.get("cumulative_pnl", 0))
-                    cumulative += base
-                except:
-                    pass
-        evt["cumulative_pnl"] = round(cumulative, 4)
-
-        with open(ninja_file, "a") as f:
-            f.write(json.dumps(evt) + "\n")
+        # Cumulative P&L continues from the ledger's last recorded trade
+        cumulative = await ledger_call(lambda ledger: ledger.record_ninja_trade(evt, real_pnl))
 
         log_trade("arbitrage_executed", details, True, None)
         return {"status": "success", "pnl": real_pnl, "cumulative": cumulative}
@@ -831,18 +1003,14 @@ async def get_positions(_: bool = Depends(verify_token)):
 async def risk_status(_: bool = Depends(verify_token)):
     """Get Brimo risk management status."""
     risk_cfg = _load_risk_config()
-    events = []
-    events_file = PROJECT_ROOT / "data" / "risk-events.jsonl"
-    if events_file.exists():
-        try:
-            lines = events_file.read_text().strip().split("\n")
-            for line in lines[-20:]:
-                try:
-                    events.append(json.loads(line))
-                except Exception:
-                    pass
-        except Exception:
-            pass
+    try:
+        events = await ledger_call(lambda ledger: ledger.recent("risk_events", limit=20))
+    except Exception as e:
+        logger.warning(f"Risk events read failed: {e}")
+        events = []
+    daily_pnl, cumulative_pnl = await ledger_call(
+        lambda ledger: (ledger.daily_pnl(), ledger.cumulative_pnl())
+    )
     return {
         "reserve_floor": float(risk_cfg.get("reserveFloor", RESERVE_FLOOR_USD)),
         "take_profit_pct": float(risk_cfg.get("takeProfit", 20)),
@@ -851,134 +1019,164 @@ async def risk_status(_: bool = Depends(verify_token)):
         "max_daily_exposure": float(risk_cfg.get("maxDailyExposure", MAX_DAILY_EXPOSURE_USD)),
         "daily_exposure_usd": daily_exposure_usd,
         "daily_exposure_date": daily_exposure_date,
+        "daily_pnl": daily_pnl,
+        "cumulative_pnl": cumulative_pnl,
         "dry_run": DRY_RUN,
         "recent_events": events,
     }
 
 
+async def _execute_recommendation(rec_id: str, order_data: dict) -> None:
+    """Validate and place one recommendation order (without the HTTP layer)."""
+    try:
+        if DRY_RUN:
+            logger.info(f"[DRY-RUN] Would execute recommendation {rec_id}: {order_data}")
+            log_trade("recommendation_executed (dry-run)", order_data, True, None)
+            return
+
+        # Actually execute the order
+        logger.info(f"Executing recommendation {rec_id}: {order_data}")
+        market_id = order_data.get("marketId")
+        gamma_id = order_data.get("gammaMarketId")
+        lookup_id = gamma_id if gamma_id else market_id
+        size_usd = float(order_data.get("sizeUsd", 0))
+        max_price = float(order_data.get("maxPrice", 0.5))
+        risk_cfg = _load_risk_config()
+
+        market = await gamma_client.get_market(lookup_id)
+        outcome_id = order_data.get("outcomeId", "YES")
+        token_id = market.yes_token_id if outcome_id.upper() == "YES" else market.no_token_id
+
+        if not token_id:
+            logger.warning(f"Recommendation {rec_id} skipped: no token")
+            return
+
+        current_price = market.yes_price if outcome_id.upper() == "YES" else market.no_price
+        if not current_price or current_price <= 0:
+            logger.warning(f"⚠️ Recommendation {rec_id} skipped: current_price is {current_price}")
+            log_trade("recommendation_skipped", order_data, False, f"price is {current_price}")
+            return
+
+        await balance_cache.ensure_fresh()
+        # No await between sizing, validation and the debit below, so concurrent
+        # recommendations see each other's reserved balance.
+        size_usd, token_amount, resize_note, size_err = _auto_fit_order_size(
+            size_usd, current_price, risk_cfg
+        )
+        if size_err:
+            logger.warning(f"Recommendation {rec_id} rejected: {size_err}")
+            log_trade("recommendation_failed", order_data, False, size_err)
+            return
+        if resize_note:
+            order_data["sizeUsd"] = size_usd
+            order_data["resizeNote"] = resize_note
+            logger.info(f"Rec {rec_id}: {resize_note}")
+
+        valid, error = validate_order(market_id, size_usd, max_price)
+        if not valid:
+            logger.warning(f"Recommendation {rec_id} rejected: {error}")
+            log_trade("recommendation_failed", order_data, False, error)
+            return
+
+        balance_cache.debit(size_usd)
+        order_id, exec_error = await get_clob_executor().buy_gtc(token_id, token_amount, max_price)
+        if order_id:
+            logger.info(f"✅ Recommendation {rec_id} executed: order {order_id}")
+            log_trade("recommendation_executed", order_data, True, None)
+        else:
+            balance_cache.debit(-size_usd)  # release the reservation
+            logger.error(f"❌ Recommendation {rec_id} failed: {exec_error}")
+            log_trade("recommendation_failed", order_data, False, exec_error)
+    except Exception as e:
+        logger.error(f"Failed to execute recommendation {rec_id}: {e}")
+        log_trade("recommendation_error", order_data, False, str(e))
+
+
 async def process_recommendations():
-    """Process recommendations from PolyWhale (only accepted or autoExecute+filters)."""
-    rec_file = PROJECT_ROOT / "data" / "recommendations.jsonl"
+    """Process new PolyWhale recommendations (only accepted or autoExecute+filters).
+
+    Only lines appended since the last run are parsed. Recommendations that
+    are not executable yet (e.g. pending approval) are kept and re-checked on
+    later runs. Eligible orders run concurrently, one at a time per market,
+    up to the risk config's `maxConcurrentOrders`.
+    """
+    data_dir = PROJECT_ROOT / "data"
+    rec_file = data_dir / "recommendations.jsonl"
     if not rec_file.exists():
         return
-    
-    processed = set()
-    processed_file = PROJECT_ROOT / "data" / "recommendations_processed.txt"
-    if processed_file.exists():
-        processed = set(processed_file.read_text().splitlines())
-    
+
+    tail = JsonlTail(rec_file, data_dir / "recommendations_offset.json")
+    deferred: dict[str, dict] = dict(tail.state.get("deferred", {}))
+
     status_map = _load_status_map()
     risk_cfg = _load_risk_config()
     effective_max = _effective_max_trade_usd(risk_cfg)
-    
+
     new_orders = []
-    with open(rec_file, "r") as f:
-        for line in f:
-            if not line.strip():
-                continue
-            try:
-                rec = json.loads(line)
-                rec_id = _rec_id(rec)
-                if rec_id and rec_id not in processed:
-                    should_run, reason = _should_execute_rec(rec, status_map, risk_cfg)
-                    if not should_run:
-                        logger.info(f"Skipping recommendation {rec_id}: {reason}")
-                        continue
-
-                    # Convert PolyWhale recommendation to order
-                    if rec.get("decision") in ["BUY_YES", "BUY_NO"]:
-                        raw_size = rec.get("sizeUsd")
-                        if raw_size is None:
-                            raw_size = float(rec.get("risk_pct", 0.05)) * DEFAULT_BALANCE_USD
-                        size_usd = min(float(raw_size), effective_max)
-                        raw_max = float(rec.get("targetPrice", 0.5) or 0.5)
-                        max_price = _clamp_clob_price(raw_max)
-
-                        order = {
-                            "marketId": rec.get("market_id"),
-                            "gammaMarketId": rec.get("gamma_market_id"),
-                            "outcomeId": "YES" if "YES" in rec.get("decision", "") else "NO",
-                            "side": "buy",
-                            "sizeUsd": size_usd,
-                            "maxPrice": max_price
-                        }
-                        new_orders.append((rec_id, order))
-            except Exception as e:
-                logger.error(f"Failed to parse recommendation: {e}")
-    
-    # Execute new orders (if authorized and not dry-run)
-    for rec_id, order_data in new_orders:
+    still_deferred: dict[str, dict] = {}
+    new_recs = tail.read_new()
+    if tail.errors:
+        logger.error(f"Failed to parse {tail.errors} recommendation line(s)")
+    candidates = [*deferred.values(), *new_recs]
+    # Also updated below, so a recommendation repeated in this batch runs once.
+    processed = await ledger_call(
+        lambda ledger: ledger.processed_recommendations(_rec_id(rec) for rec in candidates)
+    )
+    for rec in candidates:
         try:
-            if DRY_RUN:
-                logger.info(f"[DRY-RUN] Would execute recommendation {rec_id}: {order_data}")
-                log_trade("recommendation_executed (dry-run)", order_data, True, None)
+            rec_id = _rec_id(rec)
+            if not rec_id or rec_id in processed:
+                continue
+            should_run, reason = _should_execute_rec(rec, status_map, risk_cfg)
+            if not should_run:
+                logger.info(f"Skipping recommendation {rec_id}: {reason}")
+                # Approval status may still change; check again next run.
+                still_deferred[rec_id] = rec
+                continue
+
+            # Convert PolyWhale recommendation to order
+            if rec.get("decision") in ["BUY_YES", "BUY_NO"]:
+                raw_size = rec.get("sizeUsd")
+                if raw_size is None:
+                    raw_size = float(rec.get("risk_pct", 0.05)) * DEFAULT_BALANCE_USD
+                size_usd = min(float(raw_size), effective_max)
+                raw_max = float(rec.get("targetPrice", 0.5) or 0.5)
+                max_price = _clamp_clob_price(raw_max)
+
+                order = {
+                    "marketId": rec.get("market_id"),
+                    "gammaMarketId": rec.get("gamma_market_id"),
+                    "outcomeId": "YES" if "YES" in rec.get("decision", "") else "NO",
+                    "side": "buy",
+                    "sizeUsd": size_usd,
+                    "maxPrice": max_price
+                }
+                new_orders.append((rec_id, order))
                 processed.add(rec_id)
-            else:
-                # Actually execute the order
-                logger.info(f"Executing recommendation {rec_id}: {order_data}")
-                # Call place_order logic directly (without HTTP layer)
-                market_id = order_data.get("marketId")
-                gamma_id = order_data.get("gammaMarketId")
-                lookup_id = gamma_id if gamma_id else market_id
-                size_usd = float(order_data.get("sizeUsd", 0))
-                max_price = float(order_data.get("maxPrice", 0.5))
-                risk_cfg = _load_risk_config()
-
-                market = await gamma_client.get_market(lookup_id)
-                outcome_id = order_data.get("outcomeId", "YES")
-                token_id = market.yes_token_id if outcome_id.upper() == "YES" else market.no_token_id
-
-                if not token_id:
-                    logger.warning(f"Recommendation {rec_id} skipped: no token")
-                    processed.add(rec_id)
-                    continue
-
-                current_price = market.yes_price if outcome_id.upper() == "YES" else market.no_price
-                if not current_price or current_price <= 0:
-                    logger.warning(f"⚠️ Recommendation {rec_id} skipped: current_price is {current_price}")
-                    log_trade("recommendation_skipped", order_data, False, f"price is {current_price}")
-                    processed.add(rec_id)
-                    continue
-
-                size_usd, token_amount, resize_note, size_err = _auto_fit_order_size(
-                    size_usd, current_price, risk_cfg
-                )
-                if size_err:
-                    logger.warning(f"Recommendation {rec_id} rejected: {size_err}")
-                    log_trade("recommendation_failed", order_data, False, size_err)
-                    processed.add(rec_id)
-                    continue
-                if resize_note:
-                    order_data["sizeUsd"] = size_usd
-                    order_data["resizeNote"] = resize_note
-                    logger.info(f"Rec {rec_id}: {resize_note}")
-
-                valid, error = validate_order(market_id, size_usd, max_price)
-                if not valid:
-                    logger.warning(f"Recommendation {rec_id} rejected: {error}")
-                    log_trade("recommendation_failed", order_data, False, error)
-                    processed.add(rec_id)
-                    continue
-
-                if token_id:
-                    client = get_clob_client()
-                    order_id, exec_error = client.buy_gtc(token_id, token_amount, max_price)
-                    if order_id:
-                        logger.info(f"✅ Recommendation {rec_id} executed: order {order_id}")
-                        log_trade("recommendation_executed", order_data, True, None)
-                        processed.add(rec_id)
-                    else:
-                        logger.error(f"❌ Recommendation {rec_id} failed: {exec_error}")
-                        log_trade("recommendation_failed", order_data, False, exec_error)
-                        processed.add(rec_id)
         except Exception as e:
-            logger.error(f"Failed to execute recommendation {rec_id}: {e}")
-            log_trade("recommendation_error", order_data, False, str(e))
-            processed.add(rec_id)
-    
-    # Save processed IDs
-    if new_orders:
-        processed_file.write_text("\n".join(sorted(processed)) + "\n")
+            logger.error(f"Failed to parse recommendation: {e}")
+
+    # Execute new orders: serial per market, bounded overall
+    semaphore = asyncio.Semaphore(
+        max(1, int(risk_cfg.get("maxConcurrentOrders", DEFAULT_MAX_CONCURRENT_ORDERS)))
+    )
+    market_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def _run(rec_id: str, order_data: dict) -> None:
+        async with market_locks[str(order_data.get("marketId") or rec_id)]:
+            async with semaphore:
+                await _execute_recommendation(rec_id, order_data)
+        await ledger_call(lambda ledger: ledger.mark_recommendation_processed(rec_id))
+
+    await asyncio.gather(*(_run(rec_id, order_data) for rec_id, order_data in new_orders))
+
+    # Keep only the most recent deferred recommendations
+    tail.commit(deferred=dict(list(still_deferred.items())[-DEFERRED_RECS_MAX:]))
+
+
+async def _process_recommendations_once():
+    async with executor_resources():
+        await process_recommendations()
 
 
 def main():
@@ -996,7 +1194,7 @@ def main():
         EXEC_API_TOKEN = args.token
     
     if args.process_recs:
-        asyncio.run(process_recommendations())
+        asyncio.run(_process_recommendations_once())
     elif args.serve:
         logger.info(f"Starting Polymarket Executor API on port {args.port}")
         logger.info(f"Dry run mode: {DRY_RUN}")